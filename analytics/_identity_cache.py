@@ -0,0 +1,34 @@
+"""Identity-keyed memo for values derived from a weakly held object.
+
+``FeatureFrame.of`` and ``FundingIndex.of`` hand every caller given the same
+DataFrame / Series one derived value. ``IdentityCache`` keys on ``id(obj)``,
+holds ``obj`` through a weak reference (its entry drops when ``obj`` is
+collected, so a recycled id never hits) and also requires the object's length
+to be unchanged; beyond that, cached values assume ``obj`` is not modified in
+place.
+"""
+
+import weakref
+from collections.abc import Callable, Sized
+
+
+class IdentityCache[K: Sized, V]:
+    """``id(obj)`` → (weak reference to obj, its length, derived value)."""
+
+    def __init__(self) -> None:
+        self._entries: dict[int, tuple[weakref.ref[K], int, V]] = {}
+
+    def get(self, obj: K, build: Callable[[K], V]) -> V:
+        """The value derived from ``obj`` (``build(obj)`` on first request)."""
+        key = id(obj)
+        hit = self._entries.get(key)
+        if hit is not None and hit[0]() is obj and hit[1] == len(obj):
+            return hit[2]
+        value = build(obj)
+
+        def _forget(ref: weakref.ref[K]) -> None:
+            if key in self._entries and self._entries[key][0] is ref:
+                del self._entries[key]
+
+        self._entries[key] = (weakref.ref(obj, _forget), len(obj), value)
+        return value
@@ -0,0 +1,36 @@
+"""Sparse-table range min / max queries over a 1-D float array.
+
+``sparse_table(values, op)`` precomputes ``op`` (``np.maximum`` /
+``np.minimum``) over every power-of-two run of bars in O(n log n); each
+``range_extreme`` query is then O(1), vectorised over arrays of windows.
+Shared by the excursion study (``analytics.exits.mfe_mae``) and the
+structural touch / entry simulators.
+"""
+
+import numpy as np
+import numpy.typing as npt
+
+
+def sparse_table(
+    values: npt.NDArray[np.float64], op: np.ufunc
+) -> npt.NDArray[np.float64]:
+    """Sparse table for O(1) range queries: row k holds op over [i, i + 2**k)."""
+    n = len(values)
+    table = np.empty((max(n.bit_length(), 1), n))
+    table[0] = values
+    for k in range(1, len(table)):
+        half = 1 << (k - 1)
+        table[k] = table[k - 1]  # tails cover a truncated range and are never read
+        table[k, : n - half] = op(table[k - 1, : n - half], table[k - 1, half:])
+    return table
+
+
+def range_extreme(
+    table: npt.NDArray[np.float64],
+    op: np.ufunc,
+    lo: npt.NDArray[np.intp],
+    hi: npt.NDArray[np.intp],
+) -> npt.NDArray[np.float64]:
+    """op over ``values[lo:hi]`` for every (lo, hi) pair; requires hi > lo."""
+    k = np.log2(hi - lo).astype(np.intp)
+    return np.asarray(op(table[k, lo], table[k, hi - (1 << k)]), dtype=np.float64)
@@ -31,7 +31,7 @@ from typing import Literal
 import numpy as np
 import numpy.typing as npt
 
-from analytics.research_guards import block_bootstrap_ci, haircut_sharpe
+from analytics.research_guards import batch_mean, block_bootstrap_ci, haircut_sharpe
 
 DEFAULT_BAR = 0.05
 DEFAULT_ALPHA = 0.05
@@ -79,10 +79,6 @@ class CellVerdict:
     reasons: list[str]
 
 
-def _mean(arr: npt.NDArray[np.float64]) -> float:
-    return float(np.mean(arr))
-
-
 def _slice_sharpe(arr: npt.NDArray[np.float64]) -> float:
     """Per-trade Sharpe ``mean / std(ddof=1)``; ``0.0`` with no dispersion.
 
@@ -158,7 +154,12 @@ def evaluate_audit_cells(
         )
         adj_by_idx[e.idx] = hr.adjusted_pvalue
         ci = block_bootstrap_ci(
-            e.arr, _mean, n_boot=n_boot, alpha=alpha, method=boot_method, seed=seed
+            e.arr,
+            n_boot=n_boot,
+            alpha=alpha,
+            method=boot_method,
+            seed=seed,
+            batch_stat=batch_mean,
         )
         ci_by_idx[e.idx] = (ci.lo, ci.hi)
 
@@ -1,6 +1,10 @@
 """Backtest package — split from analytics/backtest_lib.py."""
 
-from analytics.backtest.combo import ComboBacktestResult, run_combo_backtest
+from analytics.backtest.combo import (
+    CofireIndex,
+    ComboBacktestResult,
+    run_combo_backtest,
+)
 from analytics.backtest.cross_tf import (
     CrossTfComboBacktestResult,
     run_cross_tf_combo_backtest,
@@ -22,6 +26,7 @@ from analytics.backtest.gates import filter_signals_by_day
 
 __all__ = [
     "BacktestResult",
+    "CofireIndex",
     "ComboBacktestResult",
     "CrossTfComboBacktestResult",
     "Trade",
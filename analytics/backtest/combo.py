@@ -1,11 +1,17 @@
 """Same-TF co-firing confluence backtest."""
 
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
+from typing import Any
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
 from analytics.backtest.engine import BacktestResult, run_backtest
 
+_CARRIED = ("reason", "sl_price", "context", "low_volume", "tp_price")
+
 
 @dataclass
 class ComboBacktestResult:
@@ -17,6 +23,207 @@ class ComboBacktestResult:
     result: BacktestResult  # underlying result; result.strategy = "a+b"
 
 
+def _price(value: Any) -> float:
+    """SL/TP column value as carried onto a combo signal (missing / falsy → 0.0)."""
+    return float(value) if value else 0.0
+
+
+def _columns(signals: pd.DataFrame) -> dict[str, list[Any] | None]:
+    """Per-row values of the carried signal columns (None for an absent column)."""
+    return {
+        c: signals[c].tolist() if c in signals.columns else None
+        for c in ("open_time", *_CARRIED)
+    }
+
+
+def _value(
+    cols: Mapping[str, list[Any] | None], name: str, row: int, default: Any
+) -> Any:
+    values = cols[name]
+    return default if values is None else values[row]
+
+
+@dataclass(frozen=True)
+class CofireIndex:
+    """Signals of every strategy on one (symbol, TF), laid out for window joins.
+
+    Built once per (symbol, TF) by ``build``; every strategy pair (or k-way
+    set) is then matched against it by ``cofire_signals`` with binary searches
+    instead of an all-pairs scan. Signals whose ``open_time`` is not a bar of
+    the OHLCV frame can anchor nothing and match nothing.
+
+    - *bars* / *dirs*: per strategy, the bar index (-1 when off-frame) and the
+      direction code of each signal, in the signal frame's row order.
+    - *key*: one sorted array over all strategies' on-frame signals, encoding
+      (strategy, direction, bar); *bar* / *row* are aligned with it, ties on
+      the key ordered by the signal's row.
+    """
+
+    strategies: tuple[str, ...]
+    n_bars: int
+    n_dirs: int
+    direction_codes: dict[str, int]
+    counts: dict[str, int]
+    bars: dict[str, npt.NDArray[np.int64]]
+    dirs: dict[str, npt.NDArray[np.int64]]
+    key: npt.NDArray[np.int64]
+    bar: npt.NDArray[np.int64]
+    row: npt.NDArray[np.int64]
+    columns: dict[str, dict[str, list[Any] | None]]
+
+    @classmethod
+    def build(
+        cls, ohlcv: pd.DataFrame, signals: Mapping[str, pd.DataFrame]
+    ) -> "CofireIndex":
+        """Index ``signals`` (strategy → signals frame) against ``ohlcv``'s bars."""
+        times = pd.Index(ohlcv["open_time"].to_numpy(dtype=np.int64))
+        # A repeated bar time maps to its last row.
+        last = ~times.duplicated(keep="last")
+        bar_of = np.flatnonzero(last)
+        unique_times = times[last]
+
+        strategies = tuple(signals)
+        frames = {s: signals[s] for s in strategies}
+        directions = [
+            f["direction"].astype(str) for f in frames.values() if not f.empty
+        ]
+        labels = pd.unique(pd.concat(directions)).tolist() if directions else []
+        direction_codes = {str(d): i for i, d in enumerate(labels)}
+        n_dirs = max(len(direction_codes), 1)
+        n_bars = max(len(times), 1)
+
+        bars: dict[str, npt.NDArray[np.int64]] = {}
+        dirs: dict[str, npt.NDArray[np.int64]] = {}
+        keys, sorted_bars, rows = [], [], []
+        for code, (s, frame) in enumerate(frames.items()):
+            if frame.empty:
+                bars[s] = dirs[s] = np.empty(0, dtype=np.int64)
+                continue
+            pos = unique_times.get_indexer(frame["open_time"].to_numpy(dtype=np.int64))
+            bars[s] = np.where(pos >= 0, bar_of[np.maximum(pos, 0)], -1)
+            dirs[s] = np.array(
+                [direction_codes[d] for d in frame["direction"].astype(str)],
+                dtype=np.int64,
+            )
+            on = np.flatnonzero(bars[s] >= 0)
+            keys.append((code * n_dirs + dirs[s][on]) * n_bars + bars[s][on])
+            sorted_bars.append(bars[s][on])
+            rows.append(on)
+
+        key = np.concatenate(keys) if keys else np.empty(0, dtype=np.int64)
+        bar = np.concatenate(sorted_bars) if keys else np.empty(0, dtype=np.int64)
+        row = np.concatenate(rows) if keys else np.empty(0, dtype=np.int64)
+        order = np.lexsort((row, key))
+        return cls(
+            strategies=strategies,
+            n_bars=n_bars,
+            n_dirs=n_dirs,
+            direction_codes=direction_codes,
+            counts={s: len(f) for s, f in frames.items()},
+            bars=bars,
+            dirs=dirs,
+            key=key[order],
+            bar=bar[order],
+            row=row[order],
+            columns={s: _columns(f) for s, f in frames.items()},
+        )
+
+    def cofire_signals(
+        self,
+        strategies: Sequence[str],
+        window: int = 5,
+        min_signals: int = 3,
+    ) -> pd.DataFrame:
+        """Signals where all of ``strategies`` fire in the same direction within ±window.
+
+        The first strategy anchors: for each of its signals (in row order) every
+        other strategy must have an unused same-direction signal within ±window
+        candles of the anchor; the nearest one is taken (ties → earliest row).
+        A complete match consumes those signals; an incomplete one consumes
+        nothing. Entry uses the latest signal's candle (open_time, sl_price,
+        tp_price; ties → the later strategy in ``strategies``). Returns an empty
+        DataFrame when any strategy has fewer than min_signals signals.
+        """
+        from analytics.strategies import SIGNAL_COLUMNS
+
+        empty = pd.DataFrame(columns=SIGNAL_COLUMNS)
+        if any(self.counts[s] == 0 or self.counts[s] < min_signals for s in strategies):
+            return empty
+
+        anchor, *others = strategies
+        labels = list(self.direction_codes)
+        bar, row = self.bar.tolist(), self.row.tolist()
+        used = [False] * len(self.key)
+
+        # Candidate span [lo, hi) in the sorted key of every other strategy,
+        # for every anchor signal at once.
+        at_all, d_all = self.bars[anchor], self.dirs[anchor]
+        lo_bar = np.maximum(at_all - window, 0)
+        hi_bar = np.minimum(at_all + window, self.n_bars - 1)
+        spans: dict[str, tuple[list[int], list[int]]] = {}
+        for s in others:
+            base = (self.strategies.index(s) * self.n_dirs + d_all) * self.n_bars
+            spans[s] = (
+                np.searchsorted(self.key, base + lo_bar, side="left").tolist(),
+                np.searchsorted(self.key, base + hi_bar, side="right").tolist(),
+            )
+
+        def nearest(lo: int, hi: int, at: int) -> int | None:
+            best: tuple[int, int, int] | None = None
+            for i in range(lo, hi):
+                if used[i]:
+                    continue
+                cand = (abs(bar[i] - at), row[i], i)
+                if best is None or cand < best:
+                    best = cand
+            return None if best is None else best[2]
+
+        out: dict[str, list[Any]] = {c: [] for c in SIGNAL_COLUMNS}
+        anchor_cols = self.columns[anchor]
+        for row_a, (at, d) in enumerate(
+            zip(self.bars[anchor].tolist(), self.dirs[anchor].tolist(), strict=True)
+        ):
+            if at < 0:
+                continue
+            picks: list[int] = []
+            for s in others:
+                i = nearest(spans[s][0][row_a], spans[s][1][row_a], at)
+                if i is None:
+                    break
+                picks.append(i)
+            else:
+                for i in picks:
+                    used[i] = True
+                legs = [(anchor, row_a)] + [
+                    (s, row[i]) for s, i in zip(others, picks, strict=True)
+                ]
+                times = [
+                    int(_value(self.columns[s], "open_time", r, 0)) for s, r in legs
+                ]
+                later = max(range(len(legs)), key=lambda k: (times[k], k))
+                s_later, r_later = legs[later]
+                cols = self.columns[s_later]
+                out["open_time"].append(times[later])
+                out["direction"].append(labels[d])
+                out["reason"].append(
+                    " ↔ ".join(
+                        f"{_value(self.columns[s], 'reason', r, '')}" for s, r in legs
+                    )
+                )
+                out["sl_price"].append(_price(_value(cols, "sl_price", r_later, 0.0)))
+                out["context"].append(
+                    f"combo|{_value(anchor_cols, 'context', row_a, '')}"
+                )
+                out["low_volume"].append(
+                    bool(_value(cols, "low_volume", r_later, False))
+                )
+                out["tp_price"].append(_price(_value(cols, "tp_price", r_later, 0.0)))
+
+        if not out["open_time"]:
+            return empty
+        return pd.DataFrame(out)[SIGNAL_COLUMNS].reset_index(drop=True)
+
+
 def _find_cofire_signals(
     signals_a: pd.DataFrame,
     signals_b: pd.DataFrame,
@@ -26,76 +233,14 @@ def _find_cofire_signals(
 ) -> pd.DataFrame:
     """Return a signals DataFrame from co-firing pairs within ±window candles.
 
-    For each signal in A (sorted by time), find the nearest unused signal in B
-    with the same direction within ±window candles. Entry uses the later signal's
-    candle (open_time, sl_price, tp_price). Each B signal is matched at most once.
+    For each signal in A, find the nearest unused signal in B with the same
+    direction within ±window candles. Entry uses the later signal's candle
+    (open_time, sl_price, tp_price). Each B signal is matched at most once.
     Returns an empty DataFrame when either strategy has fewer than min_signals.
+    One-off form of ``CofireIndex.cofire_signals``.
     """
-    from analytics.strategies import SIGNAL_COLUMNS
-
-    empty = pd.DataFrame(columns=SIGNAL_COLUMNS)
-    if signals_a.empty or signals_b.empty:
-        return empty
-    if len(signals_a) < min_signals or len(signals_b) < min_signals:
-        return empty
-
-    # Positional index: open_time → row position in ohlcv for distance calculation.
-    time_to_idx: dict[int, int] = {int(t): i for i, t in enumerate(ohlcv["open_time"])}
-
-    b_times = [int(t) for t in signals_b["open_time"]]
-    b_dirs = list(signals_b["direction"])
-    b_indices = [time_to_idx.get(t) for t in b_times]
-
-    used_b: set[int] = set()
-    matched: list[dict[str, object]] = []
-
-    for _, row_a in signals_a.iterrows():
-        t_a = int(row_a["open_time"])
-        dir_a = str(row_a["direction"])
-        idx_a = time_to_idx.get(t_a)
-        if idx_a is None:
-            continue
-
-        best_j: int | None = None
-        best_dist = window + 1
-        for j, (_t_b, dir_b, idx_b) in enumerate(
-            zip(b_times, b_dirs, b_indices, strict=False)
-        ):
-            if j in used_b or dir_b != dir_a or idx_b is None:
-                continue
-            dist = abs(idx_b - idx_a)
-            if dist <= window and dist < best_dist:
-                best_j = j
-                best_dist = dist
-
-        if best_j is None:
-            continue
-
-        used_b.add(best_j)
-        row_b = signals_b.iloc[best_j]
-        t_b = b_times[best_j]
-
-        # Entry at the later signal's next open — carry its SL/TP metadata.
-        later = row_b if t_b >= t_a else row_a
-        matched.append(
-            {
-                "open_time": int(later["open_time"]),
-                "direction": dir_a,
-                "reason": f"{row_a.get('reason', '')} ↔ {row_b.get('reason', '')}",
-                "sl_price": float(later["sl_price"])
-                if "sl_price" in later.index and later["sl_price"]
-                else 0.0,
-                "context": f"combo|{row_a.get('context', '')}",
-                "low_volume": bool(later.get("low_volume", False)),
-                "tp_price": float(later["tp_price"])
-                if "tp_price" in later.index and later["tp_price"]
-                else 0.0,
-            }
-        )
-
-    if not matched:
-        return empty
-    return pd.DataFrame(matched)[SIGNAL_COLUMNS].reset_index(drop=True)
+    index = CofireIndex.build(ohlcv, {"a": signals_a, "b": signals_b})
+    return index.cofire_signals(("a", "b"), window=window, min_signals=min_signals)
 
 
 def run_combo_backtest(
@@ -112,17 +257,25 @@ def run_combo_backtest(
     fee_pct: float = 0.0,
     min_sl_pct: float = 0.0,
     min_signals: int = 3,
+    index: CofireIndex | None = None,
 ) -> ComboBacktestResult:
     """Run a co-firing confluence backtest for a pair of strategies.
 
     Detects co-firing pairs within ±window candles and simulates trades using
     the later signal's candle as entry. Dead strategies (< min_signals signals)
-    are auto-skipped — the result will have zero trades.
+    are auto-skipped — the result will have zero trades. Pass the (symbol, TF)
+    ``index`` when sweeping many pairs; its signals for strategy_a / strategy_b
+    are then used instead of signals_a / signals_b.
     """
     combo_label = f"{strategy_a}+{strategy_b}"
-    combo_signals = _find_cofire_signals(
-        signals_a, signals_b, ohlcv, window=window, min_signals=min_signals
-    )
+    if index is not None:
+        combo_signals = index.cofire_signals(
+            (strategy_a, strategy_b), window=window, min_signals=min_signals
+        )
+    else:
+        combo_signals = _find_cofire_signals(
+            signals_a, signals_b, ohlcv, window=window, min_signals=min_signals
+        )
     result = run_backtest(
         ohlcv,
         combo_signals,
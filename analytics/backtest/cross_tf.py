@@ -2,8 +2,10 @@
 
 from dataclasses import dataclass
 
+import numpy as np
 import pandas as pd
 
+from analytics.backtest.combo import _columns, _price, _value
 from analytics.backtest.engine import BacktestResult, run_backtest
 
 
@@ -32,8 +34,8 @@ def _find_cross_tf_signals(
     """Return filtered LTF signals that have an HTF signal within the lookback window.
 
     For each LTF signal, checks whether a same-direction HTF signal fired within
-    [ltf_time - window_hours, ltf_time]. The most recent qualifying HTF signal is
-    used (no exclusivity — one HTF signal can confirm multiple LTF signals).
+    [ltf_time - window_hours, ltf_time] (no exclusivity — one HTF signal can
+    confirm multiple LTF signals), by binary search over the sorted HTF times.
     Returns an empty DataFrame when either input has fewer than min_signals.
     """
     from analytics.strategies import SIGNAL_COLUMNS
@@ -46,47 +48,35 @@ def _find_cross_tf_signals(
 
     window_ms = int(window_hours * 3600 * 1000)
 
-    htf_times = signals_htf["open_time"].astype("int64").tolist()
-    htf_dirs = list(signals_htf["direction"])
+    htf_times = signals_htf["open_time"].to_numpy(dtype=np.int64)
+    htf_dirs = signals_htf["direction"].astype(str).to_numpy()
+    ltf_times = signals_ltf["open_time"].to_numpy(dtype=np.int64)
+    ltf_dirs = signals_ltf["direction"].astype(str).to_numpy()
 
-    matched: list[dict[str, object]] = []
-
-    for _, ltf_row in signals_ltf.iterrows():
-        ltf_time = int(ltf_row["open_time"])
-        ltf_dir = str(ltf_row["direction"])
-        window_start = ltf_time - window_ms
-
-        # Find the most recent HTF signal in the window with matching direction.
-        best_htf_time: int | None = None
-        for htf_t, htf_d in zip(htf_times, htf_dirs, strict=False):
-            if htf_d != ltf_dir:
-                continue
-            if window_start <= htf_t <= ltf_time and (
-                best_htf_time is None or htf_t > best_htf_time
-            ):
-                best_htf_time = htf_t
-
-        if best_htf_time is None:
+    # Per direction: latest HTF signal at or before each LTF signal, in the window.
+    keep = np.zeros(len(ltf_times), dtype=bool)
+    for direction in np.unique(ltf_dirs):
+        htf = np.sort(htf_times[htf_dirs == direction])
+        if htf.size == 0:
             continue
+        sel = np.flatnonzero(ltf_dirs == direction)
+        t = ltf_times[sel]
+        pos = np.searchsorted(htf, t, side="right") - 1
+        keep[sel] = (pos >= 0) & (htf[np.maximum(pos, 0)] >= t - window_ms)
 
-        matched.append(
-            {
-                "open_time": ltf_time,
-                "direction": ltf_dir,
-                "reason": str(ltf_row.get("reason", "")),
-                "sl_price": float(ltf_row["sl_price"])
-                if "sl_price" in ltf_row.index and ltf_row["sl_price"]
-                else 0.0,
-                "context": f"cross_tf|{ltf_row.get('context', '')}",
-                "low_volume": bool(ltf_row.get("low_volume", False)),
-                "tp_price": float(ltf_row["tp_price"])
-                if "tp_price" in ltf_row.index and ltf_row["tp_price"]
-                else 0.0,
-            }
-        )
-
-    if not matched:
+    rows = np.flatnonzero(keep).tolist()
+    if not rows:
         return empty
+    cols = _columns(signals_ltf)
+    matched = {
+        "open_time": [int(ltf_times[r]) for r in rows],
+        "direction": [str(ltf_dirs[r]) for r in rows],
+        "reason": [str(_value(cols, "reason", r, "")) for r in rows],
+        "sl_price": [_price(_value(cols, "sl_price", r, 0.0)) for r in rows],
+        "context": [f"cross_tf|{_value(cols, 'context', r, '')}" for r in rows],
+        "low_volume": [bool(_value(cols, "low_volume", r, False)) for r in rows],
+        "tp_price": [_price(_value(cols, "tp_price", r, 0.0)) for r in rows],
+    }
     return pd.DataFrame(matched)[SIGNAL_COLUMNS].reset_index(drop=True)
 
 
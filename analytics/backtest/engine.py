@@ -17,8 +17,9 @@ from typing import TYPE_CHECKING, Any
 import numpy as np
 import pandas as pd
 
-from analytics.backtest.gates import _is_low_volume, _is_volume_spike
+from analytics.backtest.funding import FundingIndex
 from analytics.backtest.live_parity_config import LiveParityConfig
+from analytics.features import FeatureFrame
 
 if TYPE_CHECKING:
     from analytics.signal.types import SignalEvent
@@ -922,22 +923,20 @@ def run_backtest(
     opens_np = ohlcv["open"].to_numpy(dtype=float)
     highs_np = ohlcv["high"].to_numpy(dtype=float)
     lows_np = ohlcv["low"].to_numpy(dtype=float)
-    closes_np = ohlcv["close"].to_numpy(dtype=float)
     time_to_idx: dict[int, int] = {int(t): i for i, t in enumerate(ohlcv_times_np)}
     n_candles = len(ohlcv_times_np)
+    # Volume means and ATR14 per bar, shared with every other run over this frame.
+    features = FeatureFrame.of(ohlcv)
 
-    # Pre-extract the funding series once for funding-cost computation at close.
+    # Cumulative funding of the symbol, shared by every run over this series.
     # Index is funding_time (ms), ascending (get_funding_rates ORDER BY funding_time).
-    if funding_series is not None and not funding_series.empty:
-        funding_times_np: np.ndarray[Any, np.dtype[np.int64]] | None = (
-            funding_series.index.to_numpy(dtype=np.int64)
-        )
-        funding_rates_np: np.ndarray[Any, np.dtype[np.float64]] | None = (
-            funding_series.to_numpy(dtype=float)
-        )
-    else:
-        funding_times_np = None
-        funding_rates_np = None
+    funding = (
+        FundingIndex.of(funding_series)
+        if funding_series is not None and not funding_series.empty
+        else None
+    )
+    # Closed trades with a nonzero risk, charged funding after the scan.
+    funded: list[tuple[Trade, float]] = []
 
     # Pre-extract signal arrays once — avoids creating a pandas Series per row.
     sig_times_np = signals["open_time"].to_numpy(dtype=np.int64)
@@ -958,8 +957,8 @@ def run_backtest(
 
         # Volume classification — computed once, used for both the suppress gate
         # and the Trade tag so they are always consistent.
-        is_spike = _is_volume_spike(ohlcv, sig_idx)
-        is_low_vol = _is_low_volume(ohlcv, sig_idx)
+        is_spike = features.volume_spike(sig_idx)
+        is_low_vol = features.low_volume(sig_idx)
 
         # Volume suppression: skip low-volume signal candles when enabled.
         # Directional params (volume_suppress_long / volume_suppress_short) take
@@ -1001,7 +1000,7 @@ def run_backtest(
             # still win. Opt-in via atr_sl_floor — default off preserves prior
             # behaviour (atr_sl_multiplier is otherwise dead in this branch).
             if atr_sl_floor and atr_sl_multiplier is not None:
-                atr = _compute_atr14(highs_np, lows_np, closes_np, sig_idx)
+                atr = features.atr14_at(sig_idx)
                 if atr is not None:
                     atr_dist = atr_sl_multiplier * atr
                     structural_dist = abs(entry_price - sl_price)
@@ -1015,7 +1014,7 @@ def run_backtest(
             else:
                 tp_price = entry_price - eff_tp_r * abs(entry_price - sl_price)
         elif atr_sl_multiplier is not None:
-            atr = _compute_atr14(highs_np, lows_np, closes_np, sig_idx)
+            atr = features.atr14_at(sig_idx)
             if atr is not None:
                 sl_dist = atr_sl_multiplier * atr
                 if min_sl_pct > 0.0:
@@ -1081,27 +1080,28 @@ def run_backtest(
             trade.outcome = "win"
         # else: neither hit → trade remains open
 
-        # Funding cost in R units (P0b PR-2). Sum funding stamps held in
-        # (entry_time, exit_time]; long pays (+), short receives (−). The
-        # subtraction happens in Trade.pnl_r. Graceful 0.0 with no series/data.
-        if (
-            funding_times_np is not None
-            and funding_rates_np is not None
-            and trade.exit_time is not None
-        ):
-            # Same 1R risk distance used for tp_price above; recomputed here
-            # because the loop doesn't keep it in a local.
+        # Funding cost in R units (P0b PR-2) needs the 1R risk distance used
+        # for tp_price above; recomputed here because the loop doesn't keep it.
+        if funding is not None and trade.exit_time is not None:
             risk = abs(entry_price - sl_price)
             if risk > 0.0:
-                lo_i = int(np.searchsorted(funding_times_np, entry_time, side="right"))
-                hi_i = int(
-                    np.searchsorted(funding_times_np, trade.exit_time, side="right")
-                )
-                if hi_i > lo_i:
-                    funding_sum = float(funding_rates_np[lo_i:hi_i].sum())
-                    side_sign = 1.0 if direction == "long" else -1.0
-                    trade.funding_r = side_sign * funding_sum * entry_price / risk
+                funded.append((trade, risk))
 
         result.trades.append(trade)
 
+    # Sum funding stamps held in (entry_time, exit_time] for every closed trade
+    # in one lookup; long pays (+), short receives (−). The subtraction happens
+    # in Trade.pnl_r. Graceful 0.0 with no series/data.
+    if funding is not None and funded:
+        held, sums = funding.window(
+            np.array([t.entry_time for t, _ in funded], dtype=np.int64),
+            np.array([t.exit_time for t, _ in funded], dtype=np.int64),
+        )
+        for (trade, risk), n_held, funding_sum in zip(
+            funded, held.tolist(), sums.tolist(), strict=True
+        ):
+            if n_held:
+                side_sign = 1.0 if trade.direction == "long" else -1.0
+                trade.funding_r = side_sign * funding_sum * trade.entry_price / risk
+
     return result
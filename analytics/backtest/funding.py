@@ -0,0 +1,69 @@
+"""Funding-cost index — O(1) funding sums over any holding window.
+
+A trade pays (long) or receives (short) every funding stamp held in
+(entry_time, exit_time]. ``FundingIndex`` keeps a symbol's stamp times next
+to the running sum of their rates, so the funding of a whole vector of trade
+windows is two ``searchsorted`` calls and one difference instead of a slice
+sum per trade.
+
+``FundingIndex.of(series)`` caches the index of a funding Series by identity
+(held weakly), so every ``run_backtest`` of a sweep handed the same
+per-symbol series shares one index.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from analytics._identity_cache import IdentityCache
+
+_INDEXES: IdentityCache[pd.Series, FundingIndex] = IdentityCache()
+
+
+@dataclass(frozen=True)
+class FundingIndex:
+    """Cumulative funding of one symbol.
+
+    - *times*: funding_time (ms) of each stamp, ascending.
+    - *cum*: ``cum[k]`` is the sum of the first k rates (len = stamps + 1).
+    - *nan_cum*: the number of NaN rates among the first k; a window holding
+      one sums to NaN, as a slice sum would.
+    """
+
+    times: npt.NDArray[np.int64]
+    cum: npt.NDArray[np.float64]
+    nan_cum: npt.NDArray[np.int64]
+
+    @classmethod
+    def from_series(cls, series: pd.Series) -> FundingIndex:
+        """Index a rate Series indexed by funding_time (ms, ascending)."""
+        rates = series.to_numpy(dtype=float)
+        missing = np.isnan(rates)
+        return cls(
+            times=series.index.to_numpy(dtype=np.int64),
+            cum=np.r_[0.0, np.cumsum(np.where(missing, 0.0, rates))],
+            nan_cum=np.r_[0, np.cumsum(missing)],
+        )
+
+    @classmethod
+    def of(cls, series: pd.Series) -> FundingIndex:
+        """The shared index of ``series`` (built on first request; not for series
+        modified in place afterwards)."""
+        return _INDEXES.get(series, cls.from_series)
+
+    def window(
+        self, start: Any, end: Any
+    ) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.float64]]:
+        """(stamps held, their rate sum) over (start, end] — element-wise for arrays."""
+        lo = np.searchsorted(self.times, start, side="right")
+        hi = np.searchsorted(self.times, end, side="right")
+        held = np.maximum(hi - lo, 0)
+        sums = np.where(
+            self.nan_cum[hi] > self.nan_cum[lo], np.nan, self.cum[hi] - self.cum[lo]
+        )
+        return held, np.where(held > 0, sums, 0.0)
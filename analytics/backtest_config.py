@@ -160,6 +160,12 @@ class BacktestSweepConfig:
     smt_trend_filter: int = 1
     # Persist aggregate results to backtest_runs table in DB
     save_results: bool = False
+    # Reuse / persist completed (symbol, tf, strategy, params, data) backtest cells
+    # in the sidecar sweep cell store so interrupted or widened sweeps resume.
+    resume: bool = True
+    # Processes for the sweep's signal-detection stage, one (symbol, tf) frame
+    # per task. None / 1 → detect in-process; the CLI fills in min(4, cpu_count - 1).
+    workers: int | None = None
     # When non-empty, run the full sweep once per value and print a TP ratio comparison
     # table showing avg R per strategy at each tp_r. e.g. [1.0, 1.5, 2.0, 2.5, 3.0]
     # Overrides the single tp_r value for the purpose of comparison only.
@@ -571,6 +577,7 @@ def load_backtest_config(path: str | Path) -> BacktestSweepConfig:
         day_filter=str(data.get("day_filter", "off")),
         smt_trend_filter=int(data.get("smt_trend_filter", 1)),
         save_results=bool(data.get("save_results", False)),
+        workers=int(data["workers"]) if data.get("workers") is not None else None,
         tp_r_values=[float(v) for v in data.get("tp_r_values", [])],
         strategy_params=strategy_params,
         atr_sl_multiplier_values=[
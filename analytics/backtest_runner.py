@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import contextlib
 import datetime
 import itertools
 import logging
@@ -10,7 +11,7 @@ import sys
 import uuid
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import duckdb
 import pandas as pd
@@ -23,6 +24,7 @@ if TYPE_CHECKING:
     from analytics.signal_config import StrategyOverride as LiveStrategyOverride
 from analytics.backtest_lib import (
     BacktestResult,
+    CofireIndex,
     ComboBacktestResult,
     CrossTfComboBacktestResult,
     filter_signals_by_day,
@@ -42,9 +44,20 @@ from analytics.backtest_lib import (
 )
 from analytics.data_store import (
     DEFAULT_DB_PATH,
-    get_funding_rates,
+    decode_signals,
+    encode_signals,
+    get_cached_signals,
+    get_funding_rates_for_symbols,
     get_ohlcv,
+    get_sweep_cells,
     init_schema,
+    open_sweep_cell_store,
+    prune_signal_cache,
+    prune_sweep_cells,
+    put_cached_signals,
+    put_sweep_cell,
+    signal_cache_key,
+    sweep_cell_key,
     upsert_backtest_run,
     upsert_backtest_trades,
     upsert_combo_run,
@@ -66,6 +79,9 @@ _SIMPLE_DETECTORS = DETECTOR_REGISTRY
 
 _SWEEP_STRATEGIES: list[str] = [s for s in KNOWN_STRATEGIES if s != "seasonality"]
 
+# One detection job of a (symbol, tf) frame: (strategy, secondary OHLCV, flags).
+_DetectJob = tuple[str, pd.DataFrame | None, dict[str, Any]]
+
 logger = logging.getLogger(__name__)
 
 
@@ -198,22 +214,23 @@ def _build_funding_series_by_symbol(
     start_ms: int,
     end_ms: int,
 ) -> dict[str, pd.Series]:
-    """Load the funding-rate series per symbol once per sweep.
+    """Load the funding-rate series per symbol once per sweep, in one query.
 
     Funding costs are always-on (no gate), so this is built unconditionally.
-    Returns ``{symbol: Series}`` indexed by funding_time (ms, ascending) so the
-    engine's at-close ``searchsorted`` window works. Symbols with no funding
+    Returns ``{symbol: Series}`` indexed by funding_time (ms, ascending); the
+    engine turns each into a cumulative ``FundingIndex`` on first use and
+    shares it across every run over that symbol. Symbols with no funding
     rows are omitted — the engine then sees ``funding_series=None`` and falls
     to ``funding_r = 0.0`` (graceful, matches a pre-backfill data gap).
     """
     out: dict[str, pd.Series] = {}
-    for sym in symbols:
-        df = get_funding_rates(conn, sym, start_ms, end_ms)
-        if df.empty:
-            continue
-        out[sym] = pd.Series(
-            df["funding_rate"].astype(float).to_numpy(),
-            index=df["funding_time"].astype("int64").to_numpy(),
+    if not symbols:
+        return out
+    df = get_funding_rates_for_symbols(conn, symbols, start_ms, end_ms)
+    for sym, rows in df.groupby("symbol", sort=False):
+        out[str(sym)] = pd.Series(
+            rows["funding_rate"].astype(float).to_numpy(),
+            index=rows["funding_time"].astype("int64").to_numpy(),
         )
     logger.debug("funding series: loaded %d/%d symbol(s)", len(out), len(symbols))
     return out
@@ -428,19 +445,43 @@ def detect_signals_for_strategy(
     smt_trend_filter: int = 1,
     liq_sweep_use_fib: bool = True,
     liq_sweep_fib_range_close: bool = False,
+    secondary_ohlcv: pd.DataFrame | None = None,
 ) -> pd.DataFrame | None:
     """Return signals DataFrame, or None when required data is absent.
 
     ohlcv must already be fetched and non-empty by the caller.
-    Returns None only when secondary OHLCV data is missing.
+    Returns None only when secondary OHLCV data is missing. Pass
+    ``secondary_ohlcv`` when the secondary frame is already loaded.
     """
-    if strategy == "smt_divergence":
+    if strategy == "smt_divergence" and secondary_ohlcv is None:
         if secondary_symbol is None:
             return None
-        ohlcv_sec = get_ohlcv(conn, secondary_symbol, timeframe, start_ms, end_ms)
-        if ohlcv_sec.empty:
+        secondary_ohlcv = get_ohlcv(conn, secondary_symbol, timeframe, start_ms, end_ms)
+    return _detect_signals(
+        ohlcv,
+        strategy,
+        secondary_ohlcv,
+        smt_trend_filter=smt_trend_filter,
+        liq_sweep_use_fib=liq_sweep_use_fib,
+        liq_sweep_fib_range_close=liq_sweep_fib_range_close,
+    )
+
+
+def _detect_signals(
+    ohlcv: pd.DataFrame,
+    strategy: str,
+    secondary_ohlcv: pd.DataFrame | None = None,
+    smt_trend_filter: int = 1,
+    liq_sweep_use_fib: bool = True,
+    liq_sweep_fib_range_close: bool = False,
+) -> pd.DataFrame | None:
+    """Pure detection over loaded frames (None when SMT lacks secondary data)."""
+    if strategy == "smt_divergence":
+        if secondary_ohlcv is None or secondary_ohlcv.empty:
             return None
-        return detect_smt_divergence(ohlcv, ohlcv_sec, trend_filter=smt_trend_filter)
+        return detect_smt_divergence(
+            ohlcv, secondary_ohlcv, trend_filter=smt_trend_filter
+        )
 
     if strategy == "liquidity_sweep":
         return detect_liquidity_sweep(
@@ -452,47 +493,92 @@ def detect_signals_for_strategy(
     return _SIMPLE_DETECTORS[strategy](ohlcv)
 
 
-def _collect_signals_map(
+def _detector_flags(cfg: BacktestSweepConfig, strategy: str) -> dict[str, Any]:
+    """The ``detect_signals_for_strategy`` flags that reach ``strategy``'s detector."""
+    if strategy == "smt_divergence":
+        return {"smt_trend_filter": cfg.smt_trend_filter}
+    if strategy == "liquidity_sweep":
+        return {
+            "liq_sweep_use_fib": cfg.liq_sweep_use_fib,
+            "liq_sweep_fib_range_close": cfg.liq_sweep_fib_range_close,
+        }
+    return {}
+
+
+def _detect_frame_worker(
+    ohlcv: pd.DataFrame,
+    jobs: list[_DetectJob],
+) -> dict[str, dict[str, Any] | pd.DataFrame | None]:
+    """Per-(symbol, TF) detection worker: every ``(strategy, secondary, flags)``
+    job over the one shared frame.
+
+    Signals come back in the compact ``encode_signals`` form (the frame itself
+    only when it cannot be encoded exactly); None marks missing secondary data.
+    Must be a top-level function so ProcessPoolExecutor can pickle it.
+    """
+    out: dict[str, dict[str, Any] | pd.DataFrame | None] = {}
+    for strategy, secondary_ohlcv, flags in jobs:
+        signals = _detect_signals(ohlcv, strategy, secondary_ohlcv, **flags)
+        if signals is None:
+            out[strategy] = None
+            continue
+        payload = encode_signals(signals)
+        out[strategy] = signals if payload is None else payload
+    return out
+
+
+def _detect_sweep_signals(
     conn: duckdb.DuckDBPyConnection,
     cfg: BacktestSweepConfig,
     symbols: list[str],
     strategies: list[str],
     start_ms: int,
     end_ms: int,
+    *,
+    signal_cache: duckdb.DuckDBPyConnection | None = None,
+    workers: int = 1,
 ) -> tuple[
     dict[tuple[str, str, str], tuple[pd.DataFrame, pd.DataFrame, str | None]], list[str]
 ]:
-    """Detect signals once for all symbol × TF × strategy combos.
-
-    Returns a map keyed by (symbol, timeframe, strategy) →
-    (ohlcv, filtered_signals, secondary_symbol) plus a skipped list.
-    Used by tp_r sweep mode to avoid re-running detection for each tp_r value.
+    """Detection stage of a sweep: raw signals for every symbol × TF × strategy.
+
+    Returns ``(symbol, timeframe, strategy) → (ohlcv, signals, secondary_symbol)``
+    and the skipped list, both in ``itertools.product`` order; signals are not
+    yet filtered. Frames are loaded here, once per (symbol, TF). With a
+    ``signal_cache`` (the sweep cell sidecar) a strategy whose frame, secondary
+    frame, flags and detector code are unchanged is read back instead of
+    detected, and every new result is stored. With ``workers > 1`` the
+    remaining detection fans out per (symbol, TF) over a process pool, all of
+    a frame's strategies in one worker; ``workers=1`` detects in-process.
     """
-    from analytics.signal_config import _day_filter_to_weekdays
-
-    allowed_days = _day_filter_to_weekdays(cfg.day_filter)
-    signals_map: dict[
-        tuple[str, str, str], tuple[pd.DataFrame, pd.DataFrame, str | None]
-    ] = {}
-    skipped: list[str] = []
     ohlcv_cache: dict[tuple[str, str], pd.DataFrame] = {}
+    secondary_cache: dict[tuple[str, str], pd.DataFrame] = {}
+    # (cell, skip message or None) in product order; runnable cells by frame.
+    plan: list[tuple[tuple[str, str, str], str | None]] = []
+    jobs: dict[tuple[str, str], list[_DetectJob]] = {}
 
     for symbol, timeframe, strategy in itertools.product(
         symbols, cfg.timeframes, strategies
     ):
         if strategy == "seasonality":
             continue
+        cell = (symbol, timeframe, strategy)
 
         secondary = cfg.smt_pairs.get(symbol) if strategy == "smt_divergence" else None
         if strategy == "smt_divergence" and secondary is None:
-            skipped.append(f"{symbol}/{timeframe}/{strategy} (no smt_pair configured)")
+            plan.append(
+                (cell, f"{symbol}/{timeframe}/{strategy} (no smt_pair configured)")
+            )
             continue
 
         # Bucket C — base strategy_timeframes allowlist (hard skip before detect).
         base_allowed = cfg.effective_strategy_timeframes(strategy)
         if base_allowed is not None and timeframe not in base_allowed:
-            skipped.append(
-                f"{symbol}/{timeframe}/{strategy} (strategy_timeframes excludes tf)"
+            plan.append(
+                (
+                    cell,
+                    f"{symbol}/{timeframe}/{strategy} (strategy_timeframes excludes tf)",
+                )
             )
             continue
 
@@ -501,30 +587,158 @@ def _collect_signals_map(
             ohlcv_cache[ohlcv_key] = get_ohlcv(
                 conn, symbol, timeframe, start_ms, end_ms
             )
-        ohlcv = ohlcv_cache[ohlcv_key]
-        if ohlcv.empty:
-            skipped.append(f"{symbol}/{timeframe}/{strategy} (no data)")
+        if ohlcv_cache[ohlcv_key].empty:
+            plan.append((cell, f"{symbol}/{timeframe}/{strategy} (no data)"))
             continue
 
-        signals = detect_signals_for_strategy(
-            conn,
-            ohlcv,
-            symbol,
-            timeframe,
-            strategy,
-            start_ms,
-            end_ms,
-            secondary,
-            smt_trend_filter=cfg.smt_trend_filter,
-            liq_sweep_use_fib=cfg.liq_sweep_use_fib,
-            liq_sweep_fib_range_close=cfg.liq_sweep_fib_range_close,
+        secondary_ohlcv = None
+        if secondary is not None:
+            if (secondary, timeframe) not in secondary_cache:
+                secondary_cache[(secondary, timeframe)] = get_ohlcv(
+                    conn, secondary, timeframe, start_ms, end_ms
+                )
+            secondary_ohlcv = secondary_cache[(secondary, timeframe)]
+        plan.append((cell, None))
+        jobs.setdefault(ohlcv_key, []).append(
+            (strategy, secondary_ohlcv, _detector_flags(cfg, strategy))
+        )
+
+    detected: dict[tuple[str, str, str], pd.DataFrame | None] = {}
+    cache_keys: dict[tuple[str, str, str], str] = {}
+    if signal_cache is not None:
+        for (symbol, timeframe), frame_jobs in jobs.items():
+            for strategy, secondary_ohlcv, flags in frame_jobs:
+                cache_keys[(symbol, timeframe, strategy)] = signal_cache_key(
+                    symbol,
+                    timeframe,
+                    strategy,
+                    ohlcv_cache[(symbol, timeframe)],
+                    secondary_ohlcv,
+                    flags,
+                )
+        hits = get_cached_signals(signal_cache, list(cache_keys.values()))
+        detected.update(
+            (cell, hits[key]) for cell, key in cache_keys.items() if key in hits
         )
+    todo = {
+        frame: [job for job in frame_jobs if (*frame, job[0]) not in detected]
+        for frame, frame_jobs in jobs.items()
+    }
+    todo = {frame: frame_jobs for frame, frame_jobs in todo.items() if frame_jobs}
+    cached = len(detected)
+
+    fresh: dict[tuple[str, str, str], pd.DataFrame | None] = {}
+    # Encoded payloads the workers already produced — stored as they are.
+    payloads: dict[tuple[str, str, str], dict[str, Any]] = {}
+    if workers > 1 and len(todo) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(_detect_frame_worker, ohlcv_cache[frame], frame_jobs): frame
+                for frame, frame_jobs in todo.items()
+            }
+            for fut in as_completed(futures):
+                symbol, timeframe = futures[fut]
+                for strategy, payload in fut.result().items():
+                    cell = (symbol, timeframe, strategy)
+                    if isinstance(payload, dict):
+                        payloads[cell] = payload
+                        fresh[cell] = decode_signals(payload)
+                    else:
+                        fresh[cell] = payload
+    else:
+        for (symbol, timeframe), frame_jobs in todo.items():
+            for strategy, secondary_ohlcv, flags in frame_jobs:
+                fresh[(symbol, timeframe, strategy)] = detect_signals_for_strategy(
+                    conn,
+                    ohlcv_cache[(symbol, timeframe)],
+                    symbol,
+                    timeframe,
+                    strategy,
+                    start_ms,
+                    end_ms,
+                    cfg.smt_pairs.get(symbol) if strategy == "smt_divergence" else None,
+                    secondary_ohlcv=secondary_ohlcv,
+                    **flags,
+                )
+    detected.update(fresh)
+    logger.debug("detection: %d cell(s) cached, %d detected", cached, len(fresh))
+
+    if signal_cache is not None:
+        stored = []
+        for (symbol, timeframe, strategy), signals in fresh.items():
+            payload = payloads.get((symbol, timeframe, strategy))
+            if payload is None and signals is not None:
+                payload = encode_signals(signals)
+            if payload is not None:
+                stored.append(
+                    (
+                        cache_keys[(symbol, timeframe, strategy)],
+                        strategy,
+                        symbol,
+                        timeframe,
+                        ohlcv_cache[(symbol, timeframe)],
+                        payload,
+                    )
+                )
+        put_cached_signals(signal_cache, stored)
+
+    out: dict[tuple[str, str, str], tuple[pd.DataFrame, pd.DataFrame, str | None]] = {}
+    skipped: list[str] = []
+    for (symbol, timeframe, strategy), message in plan:
+        if message is not None:
+            skipped.append(message)
+            continue
+        signals = detected[(symbol, timeframe, strategy)]
         if signals is None:
             skipped.append(
                 f"{symbol}/{timeframe}/{strategy} (missing funding/secondary data)"
             )
             continue
+        secondary = cfg.smt_pairs.get(symbol) if strategy == "smt_divergence" else None
+        out[(symbol, timeframe, strategy)] = (
+            ohlcv_cache[(symbol, timeframe)],
+            signals,
+            secondary,
+        )
+    return out, skipped
 
+
+def _collect_signals_map(
+    conn: duckdb.DuckDBPyConnection,
+    cfg: BacktestSweepConfig,
+    symbols: list[str],
+    strategies: list[str],
+    start_ms: int,
+    end_ms: int,
+    *,
+    signal_cache: duckdb.DuckDBPyConnection | None = None,
+    workers: int = 1,
+) -> tuple[
+    dict[tuple[str, str, str], tuple[pd.DataFrame, pd.DataFrame, str | None]], list[str]
+]:
+    """Detect signals once for all symbol × TF × strategy combos.
+
+    Returns a map keyed by (symbol, timeframe, strategy) →
+    (ohlcv, filtered_signals, secondary_symbol) plus a skipped list.
+    Used by tp_r sweep mode to avoid re-running detection for each tp_r value.
+    ``signal_cache`` / ``workers`` are passed to ``_detect_sweep_signals``.
+    """
+    from analytics.signal_config import _day_filter_to_weekdays
+
+    allowed_days = _day_filter_to_weekdays(cfg.day_filter)
+    signals_map, skipped = _detect_sweep_signals(
+        conn,
+        cfg,
+        symbols,
+        strategies,
+        start_ms,
+        end_ms,
+        signal_cache=signal_cache,
+        workers=workers,
+    )
+    for (symbol, timeframe, strategy), (ohlcv, signals, secondary) in list(
+        signals_map.items()
+    ):
         # Bucket C — directional strategy_timeframes_{long,short} mask.
         signals = _apply_strategy_timeframes_directional_filter(
             cfg, strategy, timeframe, signals
@@ -538,6 +752,31 @@ def _collect_signals_map(
     return signals_map, skipped
 
 
+def _run_backtest_cell(
+    cells: duckdb.DuckDBPyConnection | None,
+    ohlcv: pd.DataFrame,
+    signals: pd.DataFrame,
+    symbol: str,
+    timeframe: str,
+    strategy: str,
+    **kwargs: Any,
+) -> BacktestResult:
+    """``run_backtest`` through the sweep cell store when one is open.
+
+    A stored cell with the same inputs is returned as-is; a computed one is
+    persisted immediately so an interrupted sweep resumes from it.
+    """
+    if cells is None:
+        return run_backtest(ohlcv, signals, symbol, timeframe, strategy, **kwargs)
+    key = sweep_cell_key(symbol, timeframe, strategy, ohlcv, signals, kwargs)
+    hit = get_sweep_cells(cells, [key]).get(key)
+    if hit is not None:
+        return hit
+    bt = run_backtest(ohlcv, signals, symbol, timeframe, strategy, **kwargs)
+    put_sweep_cell(cells, key, bt, ohlcv, kwargs)
+    return bt
+
+
 def _collect_sweep_results(
     conn: duckdb.DuckDBPyConnection,
     cfg: BacktestSweepConfig,
@@ -552,14 +791,19 @@ def _collect_sweep_results(
     regime_series_by_symbol: dict[str, pd.Series] | None = None,
     htf_slope_by_symbol: dict[str, dict[tuple[str, int, int], pd.Series]] | None = None,
     funding_by_symbol: dict[str, pd.Series] | None = None,
+    cells: duckdb.DuckDBPyConnection | None = None,
+    signal_cache: duckdb.DuckDBPyConnection | None = None,
+    workers: int = 1,
 ) -> tuple[list[BacktestResult], list[str]]:
     """Run one full symbol × TF × strategy grid for a given tp_r value.
 
     PR-4b restructures this into three phases so the live-parity conflict
     resolver can pool signals across strategies per (symbol, tf):
 
-      1. Phase 1 — detect: walk (symbol, tf, strategy) once, populate
-         ``signals_map`` with detected + day-filtered + ADR-prefilter signals.
+      1. Phase 1 — detect: ``_detect_sweep_signals`` detects every
+         (symbol, tf, strategy) once (cache-aware, optionally over
+         ``workers`` processes), then ``signals_map`` gets the
+         day-filtered + ADR-prefiltered signals.
          When the ``adr_bias`` engine gate is on, the legacy ADR pre-filter
          is skipped (the engine applies it inside ``run_backtest`` with
          per-direction exemption from ``cfg.live_strategy_params``).
@@ -586,11 +830,6 @@ def _collect_sweep_results(
 
     allowed_days = _day_filter_to_weekdays(cfg.day_filter)
     results: list[BacktestResult] = []
-    skipped: list[str] = []
-    ohlcv_cache: dict[tuple[str, str], pd.DataFrame] = {}
-    signals_map: dict[
-        tuple[str, str, str], tuple[pd.DataFrame, pd.DataFrame, str | None]
-    ] = {}
 
     if regime_series_by_symbol is None:
         regime_series_by_symbol = _build_regime_series_by_symbol(
@@ -608,54 +847,19 @@ def _collect_sweep_results(
         ratings_map = _build_confidence_ratings_map(conn, cfg)
 
     # Phase 1: detect signals + apply day filter + legacy ADR pre-filter.
-    for symbol, timeframe, strategy in itertools.product(
-        symbols, cfg.timeframes, strategies
+    signals_map, skipped = _detect_sweep_signals(
+        conn,
+        cfg,
+        symbols,
+        strategies,
+        start_ms,
+        end_ms,
+        signal_cache=signal_cache,
+        workers=workers,
+    )
+    for (symbol, timeframe, strategy), (ohlcv, signals, secondary) in list(
+        signals_map.items()
     ):
-        if strategy == "seasonality":
-            continue
-
-        secondary = cfg.smt_pairs.get(symbol) if strategy == "smt_divergence" else None
-        if strategy == "smt_divergence" and secondary is None:
-            skipped.append(f"{symbol}/{timeframe}/{strategy} (no smt_pair configured)")
-            continue
-
-        # Bucket C — base strategy_timeframes allowlist (hard skip before detect).
-        base_allowed = cfg.effective_strategy_timeframes(strategy)
-        if base_allowed is not None and timeframe not in base_allowed:
-            skipped.append(
-                f"{symbol}/{timeframe}/{strategy} (strategy_timeframes excludes tf)"
-            )
-            continue
-
-        ohlcv_key = (symbol, timeframe)
-        if ohlcv_key not in ohlcv_cache:
-            ohlcv_cache[ohlcv_key] = get_ohlcv(
-                conn, symbol, timeframe, start_ms, end_ms
-            )
-        ohlcv = ohlcv_cache[ohlcv_key]
-        if ohlcv.empty:
-            skipped.append(f"{symbol}/{timeframe}/{strategy} (no data)")
-            continue
-
-        signals = detect_signals_for_strategy(
-            conn,
-            ohlcv,
-            symbol,
-            timeframe,
-            strategy,
-            start_ms,
-            end_ms,
-            secondary,
-            smt_trend_filter=cfg.smt_trend_filter,
-            liq_sweep_use_fib=cfg.liq_sweep_use_fib,
-            liq_sweep_fib_range_close=cfg.liq_sweep_fib_range_close,
-        )
-        if signals is None:
-            skipped.append(
-                f"{symbol}/{timeframe}/{strategy} (missing funding/secondary data)"
-            )
-            continue
-
         # Bucket C — directional strategy_timeframes_{long,short} mask.
         signals = _apply_strategy_timeframes_directional_filter(
             cfg, strategy, timeframe, signals
@@ -692,15 +896,16 @@ def _collect_sweep_results(
         eff_tp_r = cfg.effective_tp_r(strategy, symbol, timeframe)
         eff_sl_pct = cfg.effective_sl_pct(strategy, symbol, timeframe)
         eff_atr_sl = cfg.effective_atr_sl_multiplier(strategy, symbol, timeframe)
-        bt = run_backtest(
+        bt = _run_backtest_cell(
+            cells,
             ohlcv,
             signals,
             symbol,
             timeframe,
             strategy,
-            eff_sl_pct,
-            eff_tp_r,
-            cfg.fee_pct,
+            sl_pct=eff_sl_pct,
+            tp_r=eff_tp_r,
+            fee_pct=cfg.fee_pct,
             min_sl_pct=cfg.min_sl_pct,
             atr_sl_multiplier=eff_atr_sl,
             atr_sl_floor=cfg.atr_sl_floor,
@@ -808,7 +1013,15 @@ def run_backtest_sweep(
     if cfg.save_results and single_run_mode:
         init_schema(conn)
 
+    stack = contextlib.ExitStack()
     try:
+        # Completed cells persist in the sidecar store; reruns skip them.
+        cells = (
+            stack.enter_context(open_sweep_cell_store(db_path)) if cfg.resume else None
+        )
+        if cells is not None:
+            prune_sweep_cells(cells)
+            prune_signal_cache(cells)
         regime_series_by_symbol = _build_regime_series_by_symbol(
             conn, cfg, symbols, start_ms, end_ms
         )
@@ -819,10 +1032,20 @@ def run_backtest_sweep(
             conn, symbols, start_ms, end_ms
         )
         ratings_map = _build_confidence_ratings_map(conn, cfg)
+        # Detection fans out per (symbol, tf); the signal cache shares the
+        # sidecar store with the sweep cells.
+        workers = cfg.workers if cfg.workers is not None else 1
         if tp_sweep_mode:
             # Detect signals once — tp_r does not affect signal detection
             signals_map, skipped = _collect_signals_map(
-                conn, cfg, symbols, strategies, start_ms, end_ms
+                conn,
+                cfg,
+                symbols,
+                strategies,
+                start_ms,
+                end_ms,
+                signal_cache=cells,
+                workers=workers,
             )
             _resolve_conflicts_for_signals_map(signals_map, ratings_map)
             results_by_tp: dict[float, list[BacktestResult]] = {}
@@ -830,15 +1053,16 @@ def run_backtest_sweep(
                 tp_results: list[BacktestResult] = []
                 for (sym, tf, strat), (ohlcv, sigs, _sec) in signals_map.items():
                     # tp_r is swept globally; per-strategy sl_pct/atr_sl overrides still apply.
-                    bt = run_backtest(
+                    bt = _run_backtest_cell(
+                        cells,
                         ohlcv,
                         sigs,
                         sym,
                         tf,
                         strat,
-                        cfg.effective_sl_pct(strat, sym, tf),
-                        tp_r,
-                        cfg.fee_pct,
+                        sl_pct=cfg.effective_sl_pct(strat, sym, tf),
+                        tp_r=tp_r,
+                        fee_pct=cfg.fee_pct,
                         min_sl_pct=cfg.min_sl_pct,
                         atr_sl_multiplier=cfg.effective_atr_sl_multiplier(
                             strat, sym, tf
@@ -876,7 +1100,14 @@ def run_backtest_sweep(
         elif atr_sweep_mode:
             # Detect signals once — ATR multiplier affects only SL placement, not detection
             signals_map, skipped = _collect_signals_map(
-                conn, cfg, symbols, strategies, start_ms, end_ms
+                conn,
+                cfg,
+                symbols,
+                strategies,
+                start_ms,
+                end_ms,
+                signal_cache=cells,
+                workers=workers,
             )
             _resolve_conflicts_for_signals_map(signals_map, ratings_map)
             results_by_atr: dict[float, list[BacktestResult]] = {}
@@ -884,15 +1115,16 @@ def run_backtest_sweep(
                 atr_results: list[BacktestResult] = []
                 for (sym, tf, strat), (ohlcv, sigs, _sec) in signals_map.items():
                     # atr_sl_multiplier is swept globally; per-strategy tp_r overrides apply.
-                    bt = run_backtest(
+                    bt = _run_backtest_cell(
+                        cells,
                         ohlcv,
                         sigs,
                         sym,
                         tf,
                         strat,
-                        cfg.effective_sl_pct(strat, sym, tf),
-                        cfg.effective_tp_r(strat, sym, tf),
-                        cfg.fee_pct,
+                        sl_pct=cfg.effective_sl_pct(strat, sym, tf),
+                        tp_r=cfg.effective_tp_r(strat, sym, tf),
+                        fee_pct=cfg.fee_pct,
                         min_sl_pct=cfg.min_sl_pct,
                         atr_sl_multiplier=atr_mult,
                         atr_sl_floor=cfg.atr_sl_floor,
@@ -940,6 +1172,9 @@ def run_backtest_sweep(
                     regime_series_by_symbol=regime_series_by_symbol,
                     htf_slope_by_symbol=htf_slope_by_symbol,
                     funding_by_symbol=funding_by_symbol,
+                    cells=cells,
+                    signal_cache=cells,
+                    workers=workers,
                 )
             print(
                 format_sweep_table(
@@ -953,6 +1188,7 @@ def run_backtest_sweep(
                 print(f"\n  Results saved to DB (sweep_id={sweep_id})")
 
     finally:
+        stack.close()
         conn.close()
 
     if skipped:
@@ -1168,6 +1404,8 @@ def _combo_worker(
         if not signals_cache:
             return combo_results, skipped
 
+        # One co-fire index per (symbol, TF) serves every strategy pair below.
+        index = CofireIndex.build(ohlcv, signals_cache)
         strategies_with_signals = list(signals_cache.keys())
         for i, strat_a in enumerate(strategies_with_signals):
             for strat_b in strategies_with_signals[i + 1 :]:
@@ -1191,6 +1429,7 @@ def _combo_worker(
                     fee_pct=fee_pct,
                     min_sl_pct=min_sl_pct,
                     min_signals=min_signals,
+                    index=index,
                 )
                 combo_results.append(c)
     finally:
@@ -8,8 +8,11 @@ additive — no schema/golden change.
 
 from analytics.carry.book import (
     CarryBookResult,
+    carry_book,
+    carry_forecast_grid,
     carry_forecast_matrix,
     carry_leverage,
+    carry_leverage_grid,
     equity_curve,
     run_carry_backtest,
 )
@@ -27,9 +30,12 @@ __all__ = [
     "CarryConfig",
     "CarryReport",
     "annualized_funding",
+    "carry_book",
+    "carry_forecast_grid",
     "carry_forecast_matrix",
     "carry_gate_verdict",
     "carry_leverage",
+    "carry_leverage_grid",
     "combine_carry_forecasts",
     "equity_curve",
     "evaluate_carry",
@@ -15,15 +15,37 @@ import numpy as np
 import pandas as pd
 
 from analytics.carry.config import CarryConfig
-from analytics.carry.forecast import combine_carry_forecasts
-from analytics.forecast.vol import ew_return_vol
-
-
-def _union_index(closes: dict[str, pd.Series]) -> pd.DatetimeIndex:
-    union = pd.DatetimeIndex([])
-    for s in closes.values():
-        union = union.union(pd.DatetimeIndex(s.index))
-    return union.sort_values()
+from analytics.forecast.cache import (
+    apply_governor,
+    combine_legs,
+    ew_return_vol_frame,
+    row_mean,
+    union_lag,
+    vol_parity_leverage,
+)
+from analytics.forecast.panel import DailyPanel, Grid
+
+
+def carry_forecast_grid(panel: DailyPanel, cfg: CarryConfig) -> Grid:
+    """``carry_forecast_matrix`` as a ``(T, N)`` array over a ``DailyPanel``.
+
+    Whole-matrix form of ``combine_carry_forecasts``: the funding EWMAs and the
+    return vol run column-wise on the panel's compact own-index layout.
+    """
+    fund = panel.compact_frame(panel.funding)
+    vol_ann = ew_return_vol_frame(panel, cfg.vol_span).mul(
+        np.sqrt(cfg.annualization_days)
+    )
+    parts = np.empty((*fund.shape, len(cfg.carry_spans)))
+    for k, span in enumerate(cfg.carry_spans):
+        # annualized_funding, column-wise
+        ann_f = fund.ewm(span=span, adjust=False).mean() * cfg.annualization_days
+        carry_adj = ((-ann_f) / vol_ann).replace([np.inf, -np.inf], np.nan)
+        parts[:, :, k] = (carry_adj * cfg.carry_scalar).clip(
+            lower=-cfg.cap, upper=cfg.cap
+        )
+    combined = np.clip(combine_legs(parts) * cfg.fdm, -cfg.cap, cfg.cap)
+    return panel.expand(combined)
 
 
 def carry_forecast_matrix(
@@ -36,23 +58,27 @@ def carry_forecast_matrix(
     Columns = symbols, index = sorted union of all instrument dates. NaN where an
     instrument has not warmed up or where return-vol is undefined; the NaN warm-up
     bars are intentional (the cross-sectional demean skips NaN via ``mean(axis=1)``).
+    Funding is aligned to each instrument's close days (0.0 where missing).
     """
-    union = _union_index(closes)
-    cols: dict[str, pd.Series] = {}
-    for sym, close in closes.items():
-        fund = fundings.get(sym, pd.Series(0.0, index=close.index))
-        f = combine_carry_forecasts(
-            close,
-            fund,
-            cfg.carry_spans,
-            cfg.carry_scalar,
-            cfg.fdm,
-            cfg.vol_span,
-            cfg.cap,
-            cfg.annualization_days,
-        )
-        cols[sym] = f.reindex(union)
-    return pd.DataFrame(cols, index=union)
+    panel = DailyPanel.from_series(closes, fundings)
+    return pd.DataFrame(
+        carry_forecast_grid(panel, cfg),
+        index=panel.daily_index,
+        columns=list(panel.symbols),
+    )
+
+
+def carry_leverage_grid(panel: DailyPanel, cfg: CarryConfig) -> Grid:
+    """``carry_leverage`` as a ``(T, N)`` array over a ``DailyPanel``."""
+    f = carry_forecast_grid(panel, cfg)
+    if cfg.cross_sectional:
+        f = f - row_mean(f)[:, None]
+    vol_ann = panel.expand(
+        ew_return_vol_frame(panel, cfg.vol_span)
+        .mul(np.sqrt(cfg.annualization_days))
+        .to_numpy(dtype=np.float64)
+    )
+    return vol_parity_leverage(union_lag(f), vol_ann, cfg.vol_target_annual)
 
 
 def carry_leverage(
@@ -67,19 +93,12 @@ def carry_leverage(
     ``d`` uses info through ``d-1``) -> vol-target each leg:
     ``leverage = (f_shifted / 10) * (vol_target / vol_ann)``.
     """
-    f = carry_forecast_matrix(closes, fundings, cfg)
-    if cfg.cross_sectional:
-        f = f.sub(f.mean(axis=1), axis=0)
-    f_shifted = f.shift(1)
-    union = pd.DatetimeIndex(f.index)
-    ann = np.sqrt(cfg.annualization_days)
-
-    lev_cols: dict[str, pd.Series] = {}
-    for sym, close in closes.items():
-        vol_ann = ew_return_vol(close, cfg.vol_span).mul(ann).reindex(union)
-        lev = (f_shifted[sym] / 10.0) * (cfg.vol_target_annual / vol_ann)
-        lev_cols[sym] = lev.replace([np.inf, -np.inf], np.nan)
-    return pd.DataFrame(lev_cols, index=union)
+    panel = DailyPanel.from_series(closes, fundings)
+    return pd.DataFrame(
+        carry_leverage_grid(panel, cfg),
+        index=panel.daily_index,
+        columns=list(panel.symbols),
+    )
 
 
 @dataclass(frozen=True)
@@ -98,48 +117,42 @@ def run_carry_backtest(
     cfg: CarryConfig,
 ) -> CarryBookResult:
     """Causal carry book — absolute (equal-risk mean) or cross-sectional (sum)."""
-    leverage = carry_leverage(closes, fundings, cfg)
-    union = pd.DatetimeIndex(leverage.index)
-    cost = cfg.fee_pct + cfg.slippage_pct
-
-    per_net: dict[str, pd.Series] = {}
-    net_cols: list[pd.Series] = []
-    for sym, close in closes.items():
-        lev = leverage[sym]
-        r = close.pct_change().reindex(union)
-        gross = lev * r
-        turnover = (lev - lev.shift(1).fillna(0.0)).abs() * cost
-        fund = (
-            fundings.get(sym, pd.Series(0.0, index=close.index))
-            .reindex(union)
-            .fillna(0.0)
-        )
-        funding_cost = lev * fund  # shorts (lev<0) receive funding when fund>0
-        net = gross - turnover - funding_cost
-        per_net[sym] = net
-        net_cols.append(net)
+    return carry_book(DailyPanel.from_series(closes, fundings), cfg)
 
-    net_mat = pd.concat(net_cols, axis=1)
-    active = net_mat.notna().sum(axis=1)
-    # cross-sectional = long-short P&L (sum of legs; all-NaN warm-up -> 0.0);
-    # absolute = equal-risk mean across active instruments
-    pre = net_mat.sum(axis=1) if cfg.cross_sectional else net_mat.mean(axis=1)
-    pre = pre.fillna(0.0)
 
-    ann = np.sqrt(cfg.annualization_days)
-    trailing_vol = (
-        pre.rolling(cfg.gov_window, min_periods=cfg.gov_window).std().shift(1) * ann
+def carry_book(panel: DailyPanel, cfg: CarryConfig) -> CarryBookResult:
+    """``run_carry_backtest`` over a ``DailyPanel`` (whole-matrix)."""
+    lev = carry_leverage_grid(panel, cfg)
+    returns = panel.expand(
+        panel.compact_frame(panel.close).pct_change().to_numpy(dtype=np.float64)
     )
-    g = (cfg.vol_target_annual / trailing_vol).clip(cfg.g_min, cfg.g_max)
-    port = g.fillna(0.0) * pre
+    gross = lev * returns
+    turnover = np.abs(lev - np.nan_to_num(union_lag(lev), nan=0.0)) * (
+        cfg.fee_pct + cfg.slippage_pct
+    )
+    funding_cost = lev * panel.funding  # shorts (lev<0) receive funding when fund>0
+    net = gross - turnover - funding_cost
+
+    active = (~np.isnan(net)).sum(axis=1)
+    # cross-sectional = long-short P&L (sum of legs; all-NaN warm-up -> 0.0);
+    # absolute = equal-risk mean across active instruments
+    if cfg.cross_sectional:
+        pre = np.where(np.isnan(net), 0.0, net).sum(axis=1)
+    else:
+        pre = np.nan_to_num(row_mean(net), nan=0.0)
+    port, g = apply_governor(pre, cfg.sleeve_cfg)
 
+    union = panel.daily_index
     return CarryBookResult(
         daily_index=union,
-        portfolio_return=port.to_numpy(dtype=np.float64),
-        pre_governor_return=pre.to_numpy(dtype=np.float64),
-        governor=g.to_numpy(dtype=np.float64),
-        active_count=active.to_numpy(dtype=np.int64),
-        per_instrument_net=per_net,
+        portfolio_return=port,
+        pre_governor_return=pre,
+        governor=g,
+        active_count=active.astype(np.int64),
+        per_instrument_net={
+            sym: pd.Series(net[:, i], index=union)
+            for i, sym in enumerate(panel.symbols)
+        },
     )
 
 
@@ -1,6 +1,6 @@
 """Read-only DuckDB front door for the carry sleeve.
 
-Reuses the trend sleeve's ``load_daily_inputs`` (1d closes + summed daily funding)
+Reuses the trend sleeve's ``load_daily_panel`` (1d closes + summed daily funding)
 and runs the carry book. The only module in ``analytics/carry/`` that touches the DB;
 never writes.
 """
@@ -12,9 +12,9 @@ import dataclasses
 import duckdb
 import numpy as np
 
-from analytics.carry.book import CarryBookResult, run_carry_backtest
+from analytics.carry.book import CarryBookResult, carry_book
 from analytics.carry.config import CarryConfig
-from analytics.forecast.replay import load_daily_inputs
+from analytics.forecast.replay import load_daily_panel
 from analytics.universe import load_universe
 
 
@@ -25,8 +25,7 @@ def replay_carry(
 ) -> CarryBookResult:
     """Load the universe's 1d inputs and run the carry book (read-only)."""
     syms = symbols if symbols is not None else load_universe()
-    closes, fundings = load_daily_inputs(conn, syms)
-    return run_carry_backtest(closes, fundings, cfg)
+    return carry_book(load_daily_panel(conn, syms), cfg)
 
 
 def replay_carry_trials(
@@ -40,13 +39,11 @@ def replay_carry_trials(
     Keys: ``span{s}`` per span in ``cfg.carry_spans``, plus ``combined``.
     """
     syms = symbols if symbols is not None else load_universe()
-    closes, fundings = load_daily_inputs(conn, syms)
+    panel = load_daily_panel(conn, syms)
 
     trials: dict[str, np.ndarray] = {}
     for s in cfg.carry_spans:
         single = dataclasses.replace(cfg, carry_spans=(s,))
-        trials[f"span{s}"] = run_carry_backtest(
-            closes, fundings, single
-        ).portfolio_return
-    trials["combined"] = run_carry_backtest(closes, fundings, cfg).portfolio_return
+        trials[f"span{s}"] = carry_book(panel, single).portfolio_return
+    trials["combined"] = carry_book(panel, cfg).portfolio_return
     return trials
@@ -18,6 +18,7 @@ import pandas as pd
 from analytics.carry.book import CarryBookResult, equity_curve
 from analytics.carry.config import CarryConfig
 from analytics.research_guards import (
+    batch_sharpe,
     block_bootstrap_ci,
     cscv_pbo,
     deflated_sharpe_ratio,
@@ -35,10 +36,6 @@ def _per_period_sharpe(r: npt.NDArray[np.float64]) -> float:
     return float(np.mean(r) / sd)
 
 
-def _ann_sharpe(r: npt.NDArray[np.float64], ann: float) -> float:
-    return _per_period_sharpe(r) * ann
-
-
 def _aligned_corr(a: npt.NDArray[np.float64], b: npt.NDArray[np.float64]) -> float:
     """Pearson corr over the common tail, excluding joint dead warm-up (0, 0)."""
     n = min(len(a), len(b))
@@ -111,11 +108,7 @@ def evaluate_carry(
         pbo = float("nan")
 
     if sr_d != 0.0:
-
-        def _stat_fn(x: npt.NDArray[np.float64]) -> float:
-            return _ann_sharpe(x, ann)
-
-        boot = block_bootstrap_ci(r, stat_fn=_stat_fn, seed=7)
+        boot = block_bootstrap_ci(r, batch_stat=batch_sharpe(ann), seed=7)
         boot_lo, boot_hi = boot.lo, boot.hi
         dsr = deflated_sharpe_ratio(sr_d, len(r), trial_srs=trial_srs)
         min_trl = min_track_record_length(sr_d, target_sr=1.0 / ann, confidence=0.95)
@@ -123,13 +116,14 @@ def evaluate_carry(
         boot_lo = boot_hi = dsr = 0.0
         min_trl = float("inf")
 
+    cm = metrics.curve_metrics(curve)
     return CarryReport(
-        sharpe_annual=metrics.sharpe(curve),
-        sortino_annual=metrics.sortino(curve),
-        max_dd=metrics.max_drawdown(curve),
-        calmar=metrics.calmar(curve),
-        annual_return=metrics.annual_return(curve),
-        annual_vol=metrics.annual_vol(curve),
+        sharpe_annual=cm.sharpe,
+        sortino_annual=cm.sortino,
+        max_dd=cm.max_drawdown,
+        calmar=cm.calmar,
+        annual_return=cm.annual_return,
+        annual_vol=cm.annual_vol,
         n_obs=len(r),
         dsr=dsr,
         pbo=pbo,
@@ -2,9 +2,21 @@
 
 from __future__ import annotations
 
-from analytics.combine.book import CombinedBookResult, combine_books, equity_curve
+from analytics.combine.book import (
+    CombinedBookResult,
+    combine_book_grid,
+    combine_books,
+    equity_curve,
+)
 from analytics.combine.config import CombineConfig
-from analytics.combine.idm import causal_idm_series, idm_value, static_idm
+from analytics.combine.idm import (
+    causal_idm,
+    causal_idm_series,
+    idm_from_corr,
+    idm_value,
+    rolling_corr_matrix,
+    static_idm,
+)
 from analytics.combine.replay import (
     load_sleeves,
     replay_combined,
@@ -20,14 +32,18 @@ __all__ = [
     "CombineConfig",
     "CombineReport",
     "CombinedBookResult",
+    "causal_idm",
     "causal_idm_series",
+    "combine_book_grid",
     "combine_books",
     "combine_gate_verdict",
     "equity_curve",
     "evaluate_combined",
+    "idm_from_corr",
     "idm_value",
     "load_sleeves",
     "replay_combined",
     "replay_combined_trials",
+    "rolling_corr_matrix",
     "static_idm",
 ]
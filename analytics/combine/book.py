@@ -8,13 +8,15 @@ vol governor from trailing vol through `d-1`.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
 from analytics.combine.config import CombineConfig
-from analytics.combine.idm import causal_idm_series, static_idm
+from analytics.combine.idm import causal_idm, rolling_corr_matrix, static_idm
 from analytics.forecast.book import ForecastBookResult
 from analytics.xsmom.book import XSBookResult
 
@@ -36,31 +38,61 @@ def combine_books(
     cfg: CombineConfig,
 ) -> CombinedBookResult:
     """Weight → IDM → final causal governor over the two sleeve return streams."""
+    return combine_book_grid(xs_result, trend_result, [cfg])[0]
+
+
+def combine_book_grid(
+    xs_result: XSBookResult,
+    trend_result: ForecastBookResult,
+    cfgs: Sequence[CombineConfig],
+) -> list[CombinedBookResult]:
+    """`combine_books` for every config in `cfgs` over one pair of sleeve streams.
+
+    Causal-IDM configs sharing `(idm_window, idm_min_periods)` share one rolling
+    correlation pass; their IDMs come out of one batched quadratic form over all
+    of their `(w_xs, w_trend)` rows.
+    """
     s_xs = pd.Series(xs_result.portfolio_return, index=xs_result.daily_index)
     s_tr = pd.Series(trend_result.portfolio_return, index=trend_result.daily_index)
     union = pd.DatetimeIndex(s_xs.index.union(s_tr.index).sort_values())
     r_xs = s_xs.reindex(union).fillna(0.0)
     r_tr = s_tr.reindex(union).fillna(0.0)
-
+    returns = np.column_stack([r_xs.to_numpy(), r_tr.to_numpy()])
+
+    idms: dict[int, npt.NDArray[np.float64]] = {}
+    windows: dict[tuple[int, int], list[int]] = {}
+    for k, cfg in enumerate(cfgs):
+        if cfg.idm_mode == "static":
+            idms[k] = np.full(
+                len(union),
+                static_idm(
+                    returns[:, 0], returns[:, 1], cfg.w_xs, cfg.w_trend, cfg.idm_cap
+                ),
+            )
+        else:
+            windows.setdefault((cfg.idm_window, cfg.idm_min_periods), []).append(k)
+    for (window, min_periods), members in windows.items():
+        corr = rolling_corr_matrix(returns, window, min_periods)
+        for cap in {cfgs[k].idm_cap for k in members}:
+            group = [k for k in members if cfgs[k].idm_cap == cap]
+            weights = np.array([[cfgs[k].w_xs, cfgs[k].w_trend] for k in group])
+            for k, idm in zip(group, causal_idm(corr, weights, cap), strict=True):
+                idms[k] = idm
+
+    return [
+        _combined_result(union, r_xs, r_tr, pd.Series(idms[k], index=union), cfg)
+        for k, cfg in enumerate(cfgs)
+    ]
+
+
+def _combined_result(
+    union: pd.DatetimeIndex,
+    r_xs: pd.Series,
+    r_tr: pd.Series,
+    idm: pd.Series,
+    cfg: CombineConfig,
+) -> CombinedBookResult:
     pre = cfg.w_xs * r_xs + cfg.w_trend * r_tr
-
-    if cfg.idm_mode == "static":
-        idm_const = static_idm(
-            r_xs.to_numpy(), r_tr.to_numpy(), cfg.w_xs, cfg.w_trend, cfg.idm_cap
-        )
-        idm = pd.Series(idm_const, index=union)
-    else:
-        idm = causal_idm_series(
-            r_xs.to_numpy(),
-            r_tr.to_numpy(),
-            cfg.w_xs,
-            cfg.w_trend,
-            cfg.idm_window,
-            cfg.idm_min_periods,
-            cfg.idm_cap,
-            union,
-        )
-
     post_idm = idm * pre
 
     sc = cfg.sleeve_cfg
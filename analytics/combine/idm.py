@@ -1,10 +1,15 @@
-"""Carver Instrument Diversification Multiplier for the two-sleeve combine.
+"""Carver Instrument Diversification Multiplier for the sleeve combine.
 
 Pure math, no DB/IO. IDM = 1/√(wᵀ ρ w) scales a diversified combination back up to
 the vol target; capped (Carver uses 2.5). `static_idm` uses one full-sample
 correlation (a reported sensitivity — mild look-ahead); `causal_idm_series`
 estimates the correlation on a trailing window through `d-1` (the headline,
 no-look-ahead path).
+
+The causal path is array-native and generalises to N sleeves: one trailing
+correlation matrix per day (`rolling_corr_matrix`), then the quadratic form for a
+whole batch of weight vectors at once (`idm_from_corr` / `causal_idm`), so a
+weight grid costs one rolling-correlation pass per window.
 """
 
 from __future__ import annotations
@@ -28,6 +33,27 @@ def idm_value(w_xs: float, w_trend: float, corr: float, cap: float) -> float:
     return min(math.sqrt(1.0 / var), cap)
 
 
+def idm_from_corr(
+    weights: npt.NDArray[np.float64], corr: npt.NDArray[np.float64], cap: float
+) -> npt.NDArray[np.float64]:
+    """1/√(wᵀρw) for every weight row and every day, capped at `cap`.
+
+    `weights` is `(G, K)` (one row per weight setting), `corr` is `(T, K, K)`;
+    returns `(G, T)`. The quadratic form is `Σ wᵢ² + 2·Σ_{i<j} wᵢ·wⱼ·ρᵢⱼ` — for two
+    sleeves exactly `idm_value`'s arithmetic. Non-positive variance -> `cap`; a
+    day with any undefined pairwise correlation -> NaN.
+    """
+    w = np.asarray(weights, dtype=np.float64)
+    k = w.shape[1]
+    var = np.broadcast_to((w**2).sum(axis=1)[:, None], (w.shape[0], corr.shape[0]))
+    for i in range(k):
+        for j in range(i + 1, k):
+            var = var + (2.0 * w[:, i] * w[:, j])[:, None] * corr[None, :, i, j]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scaled = np.minimum(np.sqrt(1.0 / var), cap)
+    return np.where(var <= 0.0, cap, scaled)
+
+
 def _joint_live_corr(a: npt.NDArray[np.float64], b: npt.NDArray[np.float64]) -> float:
     """Pearson corr over the common tail, excluding joint dead warm-up (0, 0).
 
@@ -67,6 +93,41 @@ def static_idm(
     return idm_value(w_xs, w_trend, _joint_live_corr(a, b), cap)
 
 
+def rolling_corr_matrix(
+    returns: npt.NDArray[np.float64], window: int, min_periods: int
+) -> npt.NDArray[np.float64]:
+    """`(T, K, K)` trailing-window correlation of `K` sleeve return columns.
+
+    Rows where every sleeve is exactly 0.0 (joint warm-up) are masked out
+    before the window stats. Each pair uses pandas' rolling `corr`; NaN until
+    `min_periods` live rows or on zero variance. The diagonal is 1.0.
+    """
+    frame = pd.DataFrame(np.asarray(returns, dtype=np.float64))
+    live = ~(frame == 0.0).all(axis=1)
+    masked = frame.where(live, axis=0)
+    k = frame.shape[1]
+    out = np.ones((len(frame), k, k))
+    for i in range(k):
+        for j in range(i + 1, k):
+            roll = masked[i].rolling(window, min_periods=min_periods).corr(masked[j])
+            out[:, i, j] = out[:, j, i] = roll.to_numpy(dtype=np.float64)
+    return out
+
+
+def causal_idm(
+    corr: npt.NDArray[np.float64], weights: npt.NDArray[np.float64], cap: float
+) -> npt.NDArray[np.float64]:
+    """Causal per-day IDM for `G` weight rows over a `rolling_corr_matrix`: `(G, T)`.
+
+    The IDM from the trailing correlation through `d` is applied on `d+1`; days
+    without a defined correlation (warm-up) get the neutral 1.0.
+    """
+    idm = idm_from_corr(weights, corr, cap)
+    out = np.ones_like(idm)
+    out[:, 1:] = np.where(np.isnan(idm[:, :-1]), 1.0, idm[:, :-1])
+    return out
+
+
 def causal_idm_series(
     r_xs: npt.ArrayLike,
     r_trend: npt.ArrayLike,
@@ -85,17 +146,9 @@ def causal_idm_series(
     neutral 1.0 (the combined return there is ~0 anyway). Joint warm-up rows
     (both returns exactly 0.0) are masked out so they do not pollute the corr.
     """
-    idx = pd.DatetimeIndex(index)
-    s_xs = pd.Series(np.asarray(r_xs, dtype=np.float64), index=idx)
-    s_tr = pd.Series(np.asarray(r_trend, dtype=np.float64), index=idx)
-    live = ~((s_xs == 0.0) & (s_tr == 0.0))
-    xm = s_xs.where(live)
-    tm = s_tr.where(live)
-    roll = xm.rolling(window, min_periods=min_periods).corr(tm)
-
-    idm: pd.Series = pd.Series(1.0, index=idx)
-    valid = roll.notna()
-    idm.loc[valid] = roll.loc[valid].map(
-        lambda c: idm_value(w_xs, w_trend, float(c), cap)
+    returns = np.column_stack(
+        [np.asarray(r_xs, dtype=np.float64), np.asarray(r_trend, dtype=np.float64)]
     )
-    return idm.shift(1).fillna(1.0)
+    corr = rolling_corr_matrix(returns, window, min_periods)
+    idm = causal_idm(corr, np.array([[w_xs, w_trend]]), cap)
+    return pd.Series(idm[0], index=pd.DatetimeIndex(index))
@@ -13,10 +13,11 @@ import numpy as np
 
 from analytics.combine.book import CombinedBookResult, combine_books
 from analytics.combine.config import CombineConfig
-from analytics.forecast.book import ForecastBookResult, run_forecast_backtest
-from analytics.forecast.replay import load_daily_inputs
+from analytics.forecast.book import ForecastBookResult, forecast_book
+from analytics.forecast.cache import build_forecast_cache
+from analytics.forecast.replay import load_daily_panel
 from analytics.universe import load_universe
-from analytics.xsmom.book import XSBookResult, run_xs_backtest
+from analytics.xsmom.book import XSBookResult, xs_book
 
 
 def load_sleeves(
@@ -24,11 +25,15 @@ def load_sleeves(
     cfg: CombineConfig,
     symbols: list[str] | None = None,
 ) -> tuple[XSBookResult, ForecastBookResult]:
-    """Run both sleeves once over the shared 1d inputs (read-only)."""
+    """Run both sleeves once over the shared 1d inputs (read-only).
+
+    Both books share one forecast cache: the XS and trend sleeves use the same
+    per-instrument forecasts and vol, they only size and aggregate differently.
+    """
     syms = symbols if symbols is not None else load_universe()
-    closes, fundings = load_daily_inputs(conn, syms)
-    xs = run_xs_backtest(closes, fundings, cfg.sleeve_cfg)
-    trend = run_forecast_backtest(closes, fundings, cfg.sleeve_cfg)
+    cache = build_forecast_cache(load_daily_panel(conn, syms), cfg.sleeve_cfg)
+    xs = xs_book(cache, cfg.sleeve_cfg)
+    trend = forecast_book(cache, cfg.sleeve_cfg)
     return xs, trend
 
 
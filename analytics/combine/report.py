@@ -17,6 +17,7 @@ import pandas as pd
 from analytics.combine.book import CombinedBookResult, equity_curve
 from analytics.combine.config import CombineConfig
 from analytics.research_guards import (
+    batch_sharpe,
     block_bootstrap_ci,
     cscv_pbo,
     deflated_sharpe_ratio,
@@ -37,10 +38,6 @@ def _per_period_sharpe(r: npt.NDArray[np.float64]) -> float:
     return float(np.mean(r) / sd)
 
 
-def _ann_sharpe(r: npt.NDArray[np.float64], ann: float) -> float:
-    return _per_period_sharpe(r) * ann
-
-
 def _aligned_corr(a: npt.NDArray[np.float64], b: npt.NDArray[np.float64]) -> float:
     n = min(len(a), len(b))
     if n < 2:
@@ -120,11 +117,7 @@ def evaluate_combined(
         pbo = float("nan")
 
     if sr_d != 0.0:
-
-        def _stat_fn(x: npt.NDArray[np.float64]) -> float:
-            return _ann_sharpe(x, ann)
-
-        boot = block_bootstrap_ci(r, stat_fn=_stat_fn, seed=7)
+        boot = block_bootstrap_ci(r, batch_stat=batch_sharpe(ann), seed=7)
         boot_lo, boot_hi = boot.lo, boot.hi
         dsr = deflated_sharpe_ratio(sr_d, len(r), trial_srs=trial_srs)
         min_trl = min_track_record_length(sr_d, target_sr=1.0 / ann, confidence=0.95)
@@ -148,13 +141,14 @@ def evaluate_combined(
     xs_curve = (1.0 + pd.Series(xs_arr)).cumprod()
     tr_curve = (1.0 + pd.Series(tr_arr)).cumprod()
 
+    cm = metrics.curve_metrics(curve)
     return CombineReport(
-        sharpe_annual=metrics.sharpe(curve),
-        sortino_annual=metrics.sortino(curve),
-        max_dd=metrics.max_drawdown(curve),
-        calmar=metrics.calmar(curve),
-        annual_return=metrics.annual_return(curve),
-        annual_vol=metrics.annual_vol(curve),
+        sharpe_annual=cm.sharpe,
+        sortino_annual=cm.sortino,
+        max_dd=cm.max_drawdown,
+        calmar=cm.calmar,
+        annual_return=cm.annual_return,
+        annual_vol=cm.annual_vol,
         n_obs=len(r),
         dsr=dsr,
         pbo=pbo,
@@ -1,9 +1,18 @@
-"""Digest lib — aggregation queries over backtest_runs for the Analysis sub-tab.
+"""Digest lib — aggregation queries over backtest results for the Analysis sub-tab.
 
 Each function returns {"columns": [...], "rows": [[...], ...]} so the API and
 CLI can share the same data without a Pydantic layer.
 
 All queries respect a min_trades guard to exclude noise from sparse runs.
+
+``backtest_runs`` already holds one row per (strategy, tf, symbol, day_filter,
+fee_pct, config) — ``upsert_backtest_run`` replaces a config's row in place —
+so it is the summary most cards aggregate; the co-firing and cross-TF cards
+read ``backtest_combos`` / ``backtest_cross_tf_combos`` instead, and no query
+reads ``backtest_trades``. Rows are fetched straight off the DuckDB cursor,
+and ``run_digest`` results are memoised on the watermark of the tables each
+card reads, so Analysis tab re-renders and scope toggles do not re-run
+unchanged queries.
 """
 
 from __future__ import annotations
@@ -13,10 +22,13 @@ from dataclasses import dataclass, field
 from typing import Any
 
 import duckdb
-import pandas as pd
+
+from analytics.store.watermark import WatermarkMemo
 
 DigestResult = dict[str, Any]
 
+_memo = WatermarkMemo()
+
 
 @dataclass
 class DigestScope:
@@ -100,12 +112,18 @@ QUERY_NAMES = [
 ]
 
 
-def _df_to_result(df: pd.DataFrame) -> DigestResult:
-    """Convert a DataFrame to the generic {columns, rows} wire format."""
-    return {
-        "columns": list(df.columns),
-        "rows": [list(row) for row in df.itertuples(index=False)],
-    }
+def _fetch(
+    conn: duckdb.DuckDBPyConnection, sql: str, params: list[Any]
+) -> DigestResult:
+    """Run ``sql`` and return the generic {columns, rows} wire format.
+
+    Rows come straight off the DuckDB cursor as Python scalars (SQL NULL is
+    ``None``) instead of round-tripping through a DataFrame, which dominated
+    the cost of the row-per-pair A/B cards.
+    """
+    cur = conn.execute(sql, params)
+    columns = [d[0] for d in cur.description or []]
+    return {"columns": columns, "rows": [list(row) for row in cur.fetchall()]}
 
 
 # ---------------------------------------------------------------------------
@@ -121,7 +139,8 @@ def query_symbol(
     """Rank symbols by total_r.  Shows which market is generating the most edge."""
     mt_expr, mt_params = _min_trades_expr(scope, min_trades)
     sc_sql, sc_params = _scope_clauses(scope)
-    df = conn.execute(
+    return _fetch(
+        conn,
         f"""
         SELECT
             symbol,
@@ -140,8 +159,7 @@ def query_symbol(
         ORDER BY total_r DESC
         """,
         mt_params + sc_params,
-    ).df()
-    return _df_to_result(df)
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -157,7 +175,8 @@ def query_strategy(
     """Rank strategies by trade-weighted avg_r across all symbols × TFs."""
     mt_expr, mt_params = _min_trades_expr(scope, min_trades)
     sc_sql, sc_params = _scope_clauses(scope)
-    df = conn.execute(
+    return _fetch(
+        conn,
         f"""
         SELECT
             strategy,
@@ -175,8 +194,7 @@ def query_strategy(
         ORDER BY weighted_avg_r DESC
         """,
         mt_params + sc_params,
-    ).df()
-    return _df_to_result(df)
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -192,7 +210,8 @@ def query_tf(
     """Rank timeframes by trade-weighted avg_r."""
     mt_expr, mt_params = _min_trades_expr(scope, min_trades)
     sc_sql, sc_params = _scope_clauses(scope)
-    df = conn.execute(
+    return _fetch(
+        conn,
         f"""
         SELECT
             timeframe,
@@ -209,8 +228,7 @@ def query_tf(
         ORDER BY weighted_avg_r DESC
         """,
         mt_params + sc_params,
-    ).df()
-    return _df_to_result(df)
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -227,7 +245,8 @@ def query_combos(
     """Top symbol × strategy × TF combos by avg_r (min_trades filter applied)."""
     mt_expr, mt_params = _min_trades_expr(scope, min_trades)
     sc_sql, sc_params = _scope_clauses(scope)
-    df = conn.execute(
+    return _fetch(
+        conn,
         f"""
         SELECT
             symbol,
@@ -245,8 +264,7 @@ def query_combos(
         LIMIT {top_n}
         """,
         mt_params + sc_params,
-    ).df()
-    return _df_to_result(df)
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -284,7 +302,8 @@ def query_adr_ab(
     off_sc = sc_sql.replace("symbol", "off_r.symbol").replace(
         "fee_pct", "off_r.fee_pct"
     )
-    df = conn.execute(
+    return _fetch(
+        conn,
         f"""
         SELECT
             on_r.strategy,
@@ -311,8 +330,7 @@ def query_adr_ab(
         ORDER BY delta_avg_r DESC
         """,
         mt_params + sc_params + mt_params2 + sc_params,
-    ).df()
-    return _df_to_result(df)
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -351,7 +369,8 @@ def query_volume_ab(
         .replace("fee_pct", "off_r.fee_pct")
         .replace("day_filter", "off_r.day_filter")
     )
-    df = conn.execute(
+    return _fetch(
+        conn,
         f"""
         SELECT
             on_r.strategy,
@@ -378,8 +397,7 @@ def query_volume_ab(
         ORDER BY delta_avg_r DESC
         """,
         mt_params + sc_params + mt_params2 + sc_params,
-    ).df()
-    return _df_to_result(df)
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -421,7 +439,8 @@ def query_day_filter_ab(
     off_sc = sc_sql.replace("symbol", "off_r.symbol").replace(
         "fee_pct", "off_r.fee_pct"
     )
-    df = conn.execute(
+    return _fetch(
+        conn,
         f"""
         SELECT
             on_r.strategy,
@@ -448,8 +467,7 @@ def query_day_filter_ab(
         ORDER BY delta_avg_r DESC
         """,
         mt_params + sc_params + mt_params2 + sc_params,
-    ).df()
-    return _df_to_result(df)
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -468,7 +486,8 @@ def query_direction_bias(
         scope, min_trades, col="short_closed_trades"
     )
     sc_sql, sc_params = _scope_clauses(scope)
-    df = conn.execute(
+    return _fetch(
+        conn,
         f"""
         SELECT
             strategy,
@@ -486,8 +505,7 @@ def query_direction_bias(
         ORDER BY ABS(AVG(long_avg_r) - AVG(short_avg_r)) DESC
         """,
         mt_params + mt_params2 + sc_params,
-    ).df()
-    return _df_to_result(df)
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -503,7 +521,8 @@ def query_consistency(
     """For each strategy, how many symbol × TF combos show positive avg_r?"""
     mt_expr, mt_params = _min_trades_expr(scope, min_trades)
     sc_sql, sc_params = _scope_clauses(scope)
-    df = conn.execute(
+    return _fetch(
+        conn,
         f"""
         SELECT
             strategy,
@@ -522,8 +541,7 @@ def query_consistency(
         ORDER BY pct_profitable DESC, profitable_combos DESC
         """,
         mt_params + sc_params,
-    ).df()
-    return _df_to_result(df)
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -539,7 +557,8 @@ def query_recovery_factor(
     """Rank strategies by average recovery factor (total_r / max_drawdown_r)."""
     mt_expr, mt_params = _min_trades_expr(scope, min_trades)
     sc_sql, sc_params = _scope_clauses(scope)
-    df = conn.execute(
+    return _fetch(
+        conn,
         f"""
         SELECT
             strategy,
@@ -557,8 +576,7 @@ def query_recovery_factor(
         ORDER BY avg_rf DESC
         """,
         mt_params + sc_params,
-    ).df()
-    return _df_to_result(df)
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -575,7 +593,8 @@ def query_co_firing(
     """Rank strategy-pair combos by avg_r from backtest_combos table."""
     sc_sql, sc_params = _scope_clauses(scope)
 
-    df = conn.execute(
+    return _fetch(
+        conn,
         f"""
         -- One row per (symbol, tf, pair, window, day_filter) — latest run_at_ms wins.
         SELECT
@@ -599,8 +618,7 @@ def query_co_firing(
         LIMIT {top_n}
         """,
         [min_trades] + sc_params,
-    ).df()
-    return _df_to_result(df)
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -622,7 +640,8 @@ def query_cross_tf_combos(
     """
     sc_sql, sc_params = _scope_clauses(scope)
 
-    df = conn.execute(
+    return _fetch(
+        conn,
         f"""
         -- One row per (symbol, tf_htf, tf_ltf, strategy_htf, strategy_ltf,
         --              window_hours, day_filter) — latest run_at_ms wins.
@@ -648,8 +667,7 @@ def query_cross_tf_combos(
         LIMIT {top_n}
         """,
         [min_trades] + sc_params,
-    ).df()
-    return _df_to_result(df)
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -678,6 +696,30 @@ _QUERY_MIN_TRADES: dict[str, int] = {
 }
 _DEFAULT_MIN_TRADES = 5
 
+# Tables each card reads — its memo entry follows writes to exactly these.
+_QUERY_TABLES: dict[str, tuple[str, ...]] = {
+    "co_firing": ("backtest_combos",),
+    "cross_tf_combos": ("backtest_cross_tf_combos",),
+}
+_DEFAULT_TABLES = ("backtest_runs",)
+
+
+def clear_digest_cache() -> None:
+    """Drop every memoised digest result (tests, or after manual DB edits)."""
+    _memo.clear()
+
+
+def _scope_key(scope: DigestScope | None) -> tuple[Any, ...] | None:
+    if scope is None:
+        return None
+    return (
+        scope.day_filter,
+        scope.fee_pct,
+        tuple(scope.symbols),
+        scope.min_trades,
+        tuple(sorted(scope.min_trades_per_tf.items())),
+    )
+
 
 def run_digest(
     conn: duckdb.DuckDBPyConnection,
@@ -690,7 +732,9 @@ def run_digest(
 
     min_trades defaults to None, which lets each query use its own floor
     (_QUERY_MIN_TRADES for co_firing=3, _DEFAULT_MIN_TRADES=5 for everything else).
-    Pass an explicit value to override.
+    Pass an explicit value to override. Results are served from the memo while
+    the watermark of the tables the card reads (``_QUERY_TABLES``) is
+    unchanged; each call gets its own row lists.
     """
     fn = _QUERY_FN.get(query)
     if fn is None:
@@ -702,6 +746,13 @@ def run_digest(
         if min_trades is not None
         else _QUERY_MIN_TRADES.get(query, _DEFAULT_MIN_TRADES)
     )
+    kwargs: dict[str, Any] = {"min_trades": effective_min, "scope": scope}
     if query in ("combos", "co_firing", "cross_tf_combos"):
-        return fn(conn, min_trades=effective_min, top_n=top_n, scope=scope)
-    return fn(conn, min_trades=effective_min, scope=scope)
+        kwargs["top_n"] = top_n
+
+    return _memo.get(
+        conn,
+        _QUERY_TABLES.get(query, _DEFAULT_TABLES),
+        (query, effective_min, kwargs.get("top_n"), _scope_key(scope)),
+        lambda: fn(conn, **kwargs),
+    )
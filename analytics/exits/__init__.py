@@ -12,15 +12,26 @@ from analytics.exits.mfe_mae import (
     compute_excursions,
 )
 from analytics.exits.policies import ExitPolicyConfig, composite, fixed
-from analytics.exits.replay import ExitOutcome, replay_exits
+from analytics.exits.replay import (
+    ExitBatch,
+    ExitOutcome,
+    ExitPaths,
+    exit_paths,
+    replay_exits,
+    replay_exits_batch,
+)
 
 __all__ = [
     "EXCURSION_COLUMNS",
+    "ExitBatch",
     "ExitOutcome",
+    "ExitPaths",
     "ExitPolicyConfig",
     "aggregate_cohorts",
     "composite",
     "compute_excursions",
+    "exit_paths",
     "fixed",
     "replay_exits",
+    "replay_exits_batch",
 ]
@@ -1,9 +1,9 @@
 """Re-resolve the live ledger under exit policies and A/B via the P1 paper book.
 
-The exit-replay driver (exit spec §4–§5). For each resolved alert it walks the
-forward OHLCV window (entry → entry + `max_hold_bars`) under a policy via
-`replay_exits`, rebuilds a `LedgerTrade` carrying the re-resolved
-`(realized_r, exit_ts_ms, outcome)`, and feeds the list through the **same**
+The exit-replay driver (exit spec §4–§5). It loads each resolved alert's
+forward OHLCV window (entry → entry + `max_hold_bars`) once, re-resolves all of
+them under a policy in one `replay_exits_batch` call, rebuilds a `LedgerTrade`
+carrying the re-resolved `(realized_r, exit_ts_ms, outcome)`, and feeds the list through the **same**
 `portfolio.book_from_trades` machinery the P1 baseline used — so the headline
 metric is portfolio Sharpe / max-DD, not per-trade avg_r, and #0 vs the
 composite is apples-to-apples (identical entries + SL; only exit management
@@ -25,7 +25,7 @@ import pandas as pd
 
 from analytics.data_store import get_ohlcv
 from analytics.exits.policies import ExitPolicyConfig, composite, fixed
-from analytics.exits.replay import replay_exits
+from analytics.exits.replay import ExitPaths, exit_paths, replay_exits_batch
 from portfolio import metrics
 from portfolio.book import BookResult, LedgerTrade
 from portfolio.replay import book_from_trades
@@ -81,99 +81,164 @@ class PolicyResult:
     avg_r: float
 
 
-def resolve_ledger_under_policy(
-    conn: duckdb.DuckDBPyConnection,
-    kind: str,
-    *,
-    max_hold_by_tf: dict[str, int] | None = None,
-    time_stop_by_tf: dict[str, int] | None = None,
-) -> PolicyResult:
-    """Re-resolve every scoreable alert under `kind` ('fixed' | 'composite')."""
-    max_hold = max_hold_by_tf if max_hold_by_tf is not None else MAX_HOLD_BY_TF
-    time_stop = (
-        time_stop_by_tf if time_stop_by_tf is not None else TIME_STOP_FLOOR_BY_TF
-    )
+@dataclass(frozen=True)
+class LedgerWindows:
+    """Scoreable ledger alerts with their forward windows as R paths.
+
+    `rows` are the `_LEDGER_SQL` tuples kept (non-zero risk, ≥ 1 forward bar),
+    aligned with the rows of `paths` and `open_times` (`(A, H)` bar open times
+    of each window, -1 past its end). Loaded once, resolvable under any number
+    of policies.
+    """
+
+    rows: list[tuple]
+    paths: ExitPaths
+    open_times: np.ndarray
+
 
+def load_ledger_windows(
+    conn: duckdb.DuckDBPyConnection, max_hold_by_tf: dict[str, int]
+) -> LedgerWindows:
+    """Load the ledger and each alert's `max_hold_by_tf[tf]`-bar forward window."""
     rows = conn.execute(_LEDGER_SQL).fetchall()
     by_group: dict[tuple[str, str], list[tuple]] = {}
     for r in rows:
         by_group.setdefault((str(r[1]), str(r[2])), []).append(r)
+    width = max(
+        (max_hold_by_tf[tf] for _, tf in by_group if tf in max_hold_by_tf), default=1
+    )
+    steps = np.arange(width)
 
-    trades: list[LedgerTrade] = []
-    holds: list[int] = []
-    rs: list[float] = []
-    n_exp = 0
-    n_win = 0
-
+    kept: list[tuple] = []
+    parts: list[tuple[np.ndarray, ...]] = []
     for (sym, tf), grp in by_group.items():
-        mh = max_hold.get(tf)
+        mh = max_hold_by_tf.get(tf)
         if mh is None or tf not in _TF_MS:
             continue
-        start = min(int(g[5]) for g in grp)
-        end = max(int(g[5]) for g in grp) + (mh + 2) * _TF_MS[tf]
+        cts = np.array([int(g[5]) for g in grp], dtype=np.int64)
+        start = int(cts.min())
+        end = int(cts.max()) + (mh + 2) * _TF_MS[tf]
         bars = get_ohlcv(conn, sym, tf, start, end)
         if bars.empty:
             continue
         ot = bars["open_time"].to_numpy(dtype=np.int64)
-        hi = bars["high"].to_numpy(dtype=np.float64)
-        lo = bars["low"].to_numpy(dtype=np.float64)
-        cl = bars["close"].to_numpy(dtype=np.float64)
-
-        for sid, _s, _t, strat, direction, cts, entry, sl, rr in grp:
-            pol = _policy_for(
-                kind,
-                tf=tf,
-                rr=float(rr),
-                max_hold_by_tf=max_hold,
-                time_stop_by_tf=time_stop,
-            )
-            if pol is None:
-                continue
-            a = int(np.searchsorted(ot, int(cts), side="right"))
-            fwd_hi = hi[a : a + mh]
-            fwd_lo = lo[a : a + mh]
-            fwd_cl = cl[a : a + mh]
-            fwd_ot = ot[a : a + mh]
-            if len(fwd_hi) == 0 or abs(float(entry) - float(sl)) <= 0.0:
-                continue
-            eo = replay_exits(
-                fwd_hi,
-                fwd_lo,
-                fwd_cl,
-                direction=str(direction),
-                entry=float(entry),
-                sl_price=float(sl),
-                policy=pol,
-            )
-            trades.append(
-                LedgerTrade(
-                    signal_id=str(sid),
-                    symbol=sym,
-                    tf=tf,
-                    strategy=str(strat),
-                    direction=str(direction),
-                    entry_ts_ms=int(cts),
-                    exit_ts_ms=int(fwd_ot[eo.exit_bar]),
-                    entry_price=float(entry),
-                    sl_price=float(sl),
-                    outcome=eo.outcome,
-                    realized_r=eo.realized_r,
-                )
+        entry = np.array([float(g[6]) for g in grp])
+        sl = np.array([float(g[7]) for g in grp])
+        a = np.searchsorted(ot, cts, side="right")
+        n_bars = np.clip(len(ot) - a, 0, mh)
+        keep = (n_bars > 0) & (np.abs(entry - sl) > 0.0)
+        if not keep.any():
+            continue
+        a, n_bars = a[keep], n_bars[keep]
+        inside = steps < n_bars[:, None]
+        at = np.where(inside, a[:, None] + steps, 0)
+
+        highs, lows, closes = (
+            np.where(inside, bars[c].to_numpy(dtype=np.float64)[at], np.nan)
+            for c in ("high", "low", "close")
+        )
+
+        kept.extend(g for g, k in zip(grp, keep, strict=True) if k)
+        parts.append(
+            (
+                highs,
+                lows,
+                closes,
+                np.where(inside, ot[at], -1),
+                n_bars,
+                entry[keep],
+                sl[keep],
             )
-            holds.append(eo.exit_bar + 1)
-            rs.append(eo.realized_r)
-            n_exp += eo.outcome == "expired"
-            n_win += eo.outcome == "win"
+        )
+
+    if not parts:
+        empty = np.empty((0, width))
+        paths = ExitPaths(empty, empty, empty, np.empty(0, dtype=np.int64))
+        return LedgerWindows([], paths, np.empty((0, width), dtype=np.int64))
+    hi, lo, cl, open_times, n_bars, entry, sl = (
+        np.concatenate(c) for c in zip(*parts, strict=True)
+    )
+    paths = exit_paths(
+        hi,
+        lo,
+        cl,
+        n_bars=n_bars,
+        directions=[str(r[4]) for r in kept],
+        entries=entry,
+        sl_prices=sl,
+    )
+    return LedgerWindows(kept, paths, open_times)
+
+
+def resolve_windows_under_policy(
+    windows: LedgerWindows,
+    kind: str,
+    *,
+    max_hold_by_tf: dict[str, int],
+    time_stop_by_tf: dict[str, int],
+) -> PolicyResult:
+    """Re-resolve every loaded alert under `kind` in one `replay_exits_batch` call."""
+    policies: list[ExitPolicyConfig] = []
+    for r in windows.rows:
+        pol = _policy_for(
+            kind,
+            tf=str(r[2]),
+            rr=float(r[8]),
+            max_hold_by_tf=max_hold_by_tf,
+            time_stop_by_tf=time_stop_by_tf,
+        )
+        assert pol is not None  # rows were loaded for tfs in max_hold_by_tf
+        policies.append(pol)
+    batch = replay_exits_batch(windows.paths, policies)
+    exit_ts = windows.open_times[np.arange(len(batch)), batch.exit_bar]
 
+    trades = [
+        LedgerTrade(
+            signal_id=str(sid),
+            symbol=str(sym),
+            tf=str(tf),
+            strategy=str(strat),
+            direction=str(direction),
+            entry_ts_ms=int(cts),
+            exit_ts_ms=int(exit_ts[i]),
+            entry_price=float(entry),
+            sl_price=float(sl),
+            outcome=str(batch.outcome[i]),
+            realized_r=float(batch.realized_r[i]),
+        )
+        for i, (sid, sym, tf, strat, direction, cts, entry, sl, _rr) in enumerate(
+            windows.rows
+        )
+    ]
     n = len(trades)
     return PolicyResult(
         name=kind,
         trades=trades,
         n=n,
-        expiry_rate=n_exp / n if n else 0.0,
-        win_rate=n_win / n if n else 0.0,
-        avg_hold_bars=float(np.mean(holds)) if holds else 0.0,
-        avg_r=float(np.mean(rs)) if rs else 0.0,
+        expiry_rate=float((batch.outcome == "expired").sum()) / n if n else 0.0,
+        win_rate=float((batch.outcome == "win").sum()) / n if n else 0.0,
+        avg_hold_bars=float(np.mean(batch.exit_bar + 1)) if n else 0.0,
+        avg_r=float(np.mean(batch.realized_r)) if n else 0.0,
+    )
+
+
+def resolve_ledger_under_policy(
+    conn: duckdb.DuckDBPyConnection,
+    kind: str,
+    *,
+    max_hold_by_tf: dict[str, int] | None = None,
+    time_stop_by_tf: dict[str, int] | None = None,
+) -> PolicyResult:
+    """Re-resolve every scoreable alert under `kind` ('fixed' | 'composite')."""
+    max_hold = max_hold_by_tf if max_hold_by_tf is not None else MAX_HOLD_BY_TF
+    time_stop = (
+        time_stop_by_tf if time_stop_by_tf is not None else TIME_STOP_FLOOR_BY_TF
+    )
+    return resolve_windows_under_policy(
+        load_ledger_windows(conn, max_hold),
+        kind,
+        max_hold_by_tf=max_hold,
+        time_stop_by_tf=time_stop,
     )
 
 
@@ -210,25 +275,30 @@ def run_exit_ab(
     max_hold_by_tf: dict[str, int] | None = None,
     time_stop_by_tf: dict[str, int] | None = None,
 ) -> list[ExitAbRow]:
-    """A/B each policy through the P1 paper book; headline = fixed-basis Sharpe."""
+    """A/B each policy through the P1 paper book; headline = fixed-basis Sharpe.
+
+    The ledger windows are loaded once and re-resolved under every policy.
+    """
+    max_hold = max_hold_by_tf if max_hold_by_tf is not None else MAX_HOLD_BY_TF
+    time_stop = (
+        time_stop_by_tf if time_stop_by_tf is not None else TIME_STOP_FLOOR_BY_TF
+    )
+    windows = load_ledger_windows(conn, max_hold)
     out: list[ExitAbRow] = []
     for kind in kinds:
-        pr = resolve_ledger_under_policy(
-            conn,
-            kind,
-            max_hold_by_tf=max_hold_by_tf,
-            time_stop_by_tf=time_stop_by_tf,
+        pr = resolve_windows_under_policy(
+            windows, kind, max_hold_by_tf=max_hold, time_stop_by_tf=time_stop
         )
         book = book_from_trades(conn, cfg, pr.trades)
-        curve = _fixed_curve(book, cfg)
+        cm = metrics.curve_metrics(_fixed_curve(book, cfg))
         out.append(
             ExitAbRow(
                 name=kind,
                 n_sized=len(book.sized),
                 n_skipped=len(book.skipped),
-                sharpe=metrics.sharpe(curve),
-                sortino=metrics.sortino(curve),
-                max_dd=metrics.max_drawdown(curve),
+                sharpe=cm.sharpe,
+                sortino=cm.sortino,
+                max_dd=cm.max_drawdown,
                 expiry_rate=pr.expiry_rate,
                 win_rate=pr.win_rate,
                 avg_hold_bars=pr.avg_hold_bars,
@@ -14,7 +14,7 @@ Conservative intrabar conventions (anti-bias, exit spec §4):
 
   - loss exit bar: its favorable extreme does NOT count toward MFE — no way
     to know the favorable wick printed before the stop touch (adverse-first,
-    mirrors `_scan_forward`'s same-bar tie rule).
+    mirrors `backfill_outcomes`' same-bar tie rule).
   - win exit bar: MFE clamps to max(prior-bar MFE, rr_ratio) — post-TP
     overshoot is not credited; the exit bar's adverse extreme DOES count
     toward MAE (assume it printed before TP).
@@ -28,8 +28,10 @@ Pure functions over a DuckDB conn / DataFrames; no clock or network I/O.
 
 import duckdb
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
+from analytics._rmq import range_extreme, sparse_table
 from analytics.data_store import get_ohlcv
 
 EXCURSION_COLUMNS = [
@@ -47,53 +49,74 @@ EXCURSION_COLUMNS = [
 ]
 
 
-def _excursion_for_row(
-    window: pd.DataFrame,
-    *,
-    direction: str,
-    entry: float,
-    sl_price: float,
-    rr_ratio: float,
-    outcome: str,
-) -> tuple[float, float] | None:
-    """(mfe_r, mae_r) for one resolved alert over its held window.
-
-    `window` holds the bars strictly after the signal candle up to and
-    including the exit bar, in time order. Returns None when the window is
-    empty or risk is zero (excursions in R are undefined).
+def _group_excursions(
+    bars: pd.DataFrame, grp: list[tuple]
+) -> tuple[
+    npt.NDArray[np.bool_],
+    npt.NDArray[np.float64],
+    npt.NDArray[np.float64],
+    npt.NDArray[np.intp],
+]:
+    """(kept, mfe_r, mae_r, bars_held) for one (symbol, tf) group of ledger rows.
+
+    Each alert's held window is ``[lo, hi)`` — strictly after the signal
+    candle, up to and including the exit bar. The favorable / adverse R are
+    monotone in the bar high / low, so their maxima come straight from
+    sparse-table range max(high) / min(low) over the window and over the
+    window minus its exit bar (the prior-bar MFE). Rows with zero risk or an
+    empty window are not kept.
     """
-    if window.empty:
-        return None
-    risk = abs(entry - sl_price)
-    if risk <= 0.0:
-        return None
-    high = window["high"].to_numpy(dtype=np.float64)
-    low = window["low"].to_numpy(dtype=np.float64)
-    if direction == "long":
-        fav = (high - entry) / risk
-        adv = (entry - low) / risk
-    else:
-        fav = (entry - low) / risk
-        adv = (high - entry) / risk
-
-    prior_fav = float(fav[:-1].max()) if len(fav) > 1 else 0.0
-    if outcome == "loss":
-        mfe = prior_fav
-    elif outcome == "win":
-        mfe = max(prior_fav, float(rr_ratio))
-    else:  # expired — no intrabar exit event; every extreme was reachable
-        mfe = float(fav.max())
-    mae = float(adv.max())
-    return max(mfe, 0.0), max(mae, 0.0)
+    open_time = bars["open_time"].to_numpy(dtype=np.int64)
+    high = bars["high"].to_numpy(dtype=np.float64)
+    low = bars["low"].to_numpy(dtype=np.float64)
+    lo = np.searchsorted(open_time, np.array([int(r[5]) for r in grp]), side="right")
+    hi = np.searchsorted(open_time, np.array([int(r[11]) for r in grp]), side="right")
+    entry = np.array([float(r[6]) for r in grp])
+    risk = np.abs(entry - np.array([float(r[7]) for r in grp]))
+    rr = np.array([float(r[8]) for r in grp])
+    long = np.array([str(r[4]) == "long" for r in grp])
+    outcome = np.array([str(r[9]) for r in grp])
+
+    kept = (hi > lo) & (risk > 0.0)
+    lo, hi = lo[kept], hi[kept]
+    entry, risk, rr, long, outcome = (
+        entry[kept],
+        risk[kept],
+        rr[kept],
+        long[kept],
+        outcome[kept],
+    )
+    top, bottom = sparse_table(high, np.maximum), sparse_table(low, np.minimum)
+    top_all = range_extreme(top, np.maximum, lo, hi)
+    bottom_all = range_extreme(bottom, np.minimum, lo, hi)
+    prior = hi - lo > 1
+    prior_hi = np.where(prior, hi - 1, hi)  # placeholder span, masked out below
+    top_prior = range_extreme(top, np.maximum, lo, prior_hi)
+    bottom_prior = range_extreme(bottom, np.minimum, lo, prior_hi)
+
+    fav_all = np.where(long, (top_all - entry) / risk, (entry - bottom_all) / risk)
+    fav_prior = np.where(
+        prior,
+        np.where(long, (top_prior - entry) / risk, (entry - bottom_prior) / risk),
+        0.0,
+    )
+    mae = np.where(long, (entry - bottom_all) / risk, (top_all - entry) / risk)
+    mfe = np.select(
+        [outcome == "loss", outcome == "win"],
+        [fav_prior, np.maximum(fav_prior, rr)],
+        fav_all,  # expired — no intrabar exit event; every extreme was reachable
+    )
+    return kept, np.maximum(mfe, 0.0), np.maximum(mae, 0.0), hi - lo
 
 
 def compute_excursions(conn: duckdb.DuckDBPyConnection) -> pd.DataFrame:
     """Per-alert MFE/MAE rows for every resolved ledger row (EXCURSION_COLUMNS).
 
     Groups rows by (symbol, tf) so each group's OHLCV is fetched once — the
-    same batching shape as `backfill_outcomes`. Rows with zero risk, an empty
-    held window, or missing OHLCV are dropped; the caller can diff
-    len(result) against the resolved count for coverage.
+    same batching shape as `backfill_outcomes` — and resolves every alert of
+    the group in one vectorised pass (`_group_excursions`). Rows with zero
+    risk, an empty held window, or missing OHLCV are dropped; the caller can
+    diff len(result) against the resolved count for coverage.
     """
     rows = conn.execute(
         "SELECT signal_id, symbol, tf, strategy, direction, candle_ts_ms, "
@@ -114,59 +137,41 @@ def compute_excursions(conn: duckdb.DuckDBPyConnection) -> pd.DataFrame:
     for r in rows:
         by_group.setdefault((str(r[1]), str(r[2])), []).append(r)
 
-    out: list[dict[str, object]] = []
+    frames: list[pd.DataFrame] = []
     for (symbol, tf), grp in by_group.items():
         start = min(int(r[5]) for r in grp)
         end = max(int(r[11]) for r in grp)
         bars = get_ohlcv(conn, symbol, tf, start, end)
         if bars.empty:
             continue
-        open_time = bars["open_time"].to_numpy(dtype=np.int64)
-        for (
-            signal_id,
-            _sym,
-            _tf,
-            strategy,
-            direction,
-            candle_ts_ms,
-            entry_price,
-            sl_price,
-            rr_ratio,
-            outcome,
-            outcome_r,
-            filled_at_ms,
-        ) in grp:
-            lo_i = int(np.searchsorted(open_time, int(candle_ts_ms), side="right"))
-            hi_i = int(np.searchsorted(open_time, int(filled_at_ms), side="right"))
-            exc = _excursion_for_row(
-                bars.iloc[lo_i:hi_i],
-                direction=str(direction),
-                entry=float(entry_price),
-                sl_price=float(sl_price),
-                rr_ratio=float(rr_ratio),
-                outcome=str(outcome),
-            )
-            if exc is None:
-                continue
-            mfe_r, mae_r = exc
-            out.append(
+        kept, mfe_r, mae_r, bars_held = _group_excursions(bars, grp)
+        rows_kept = [r for r, k in zip(grp, kept, strict=True) if k]
+        if not rows_kept:
+            continue
+        frames.append(
+            pd.DataFrame(
                 {
-                    "signal_id": str(signal_id),
+                    "signal_id": [str(r[0]) for r in rows_kept],
                     "symbol": symbol,
                     "tf": tf,
-                    "strategy": str(strategy),
-                    "direction": str(direction),
-                    "outcome": str(outcome),
-                    "outcome_r": float(outcome_r)
-                    if outcome_r is not None
-                    else float("nan"),
-                    "rr_ratio": float(rr_ratio),
+                    "strategy": [str(r[3]) for r in rows_kept],
+                    "direction": [str(r[4]) for r in rows_kept],
+                    "outcome": [str(r[9]) for r in rows_kept],
+                    "outcome_r": [
+                        float(r[10]) if r[10] is not None else float("nan")
+                        for r in rows_kept
+                    ],
+                    "rr_ratio": [float(r[8]) for r in rows_kept],
                     "mfe_r": mfe_r,
                     "mae_r": mae_r,
-                    "bars_held": hi_i - lo_i,
-                }
+                    "bars_held": bars_held,
+                },
+                columns=EXCURSION_COLUMNS,
             )
-    return pd.DataFrame(out, columns=EXCURSION_COLUMNS)
+        )
+    if not frames:
+        return pd.DataFrame(columns=EXCURSION_COLUMNS)
+    return pd.concat(frames, ignore_index=True)
 
 
 def aggregate_cohorts(
@@ -181,30 +186,30 @@ def aggregate_cohorts(
     Columns map onto the spec's 4-pattern verdict grid: reach_05 / reach_10
     are the share of the cohort whose MFE hit ≥0.5R / ≥1.0R, and tp_r_p50 is
     the target those trades were asked to reach. Cells below min_n are
-    dropped (diagnostic n-floor).
+    dropped (diagnostic n-floor). Runs as one DuckDB aggregate over the frame.
     """
     if excursions.empty:
         return pd.DataFrame()
     keys = ["outcome", *by]
-    enriched = excursions.assign(
-        reach_05=(excursions["mfe_r"] >= 0.5).astype(float),
-        reach_10=(excursions["mfe_r"] >= 1.0).astype(float),
-    )
-    agg = (
-        enriched.groupby(keys)
-        .agg(
-            n=("mfe_r", "size"),
-            mfe_mean=("mfe_r", "mean"),
-            mfe_p50=("mfe_r", "median"),
-            mae_mean=("mae_r", "mean"),
-            mae_p50=("mae_r", "median"),
-            reach_05=("reach_05", "mean"),
-            reach_10=("reach_10", "mean"),
-            tp_r_p50=("rr_ratio", "median"),
-            bars_held_p50=("bars_held", "median"),
-            outcome_r_mean=("outcome_r", "mean"),
-        )
-        .reset_index()
-    )
-    agg = agg[agg["n"] >= min_n]
-    return agg.sort_values(keys).reset_index(drop=True)
+    unknown = [k for k in keys if k not in EXCURSION_COLUMNS]
+    if unknown:
+        raise ValueError(f"unknown cohort columns: {unknown}")
+    cols = ", ".join(keys)  # validated column names, safe to interpolate
+    # A NaN that reaches DuckDB as a value (Arrow-backed columns) poisons the
+    # means, and NaN sorts above every number so it would count as reached.
+    mfe_ok = "FILTER (WHERE NOT isnan(mfe_r))"
+    mae_ok = "FILTER (WHERE NOT isnan(mae_r))"
+    with duckdb.connect() as con:
+        con.register("excursions", excursions)
+        return con.execute(
+            f"SELECT {cols}, count(*) AS n, "
+            f"avg(mfe_r) {mfe_ok} AS mfe_mean, median(mfe_r) {mfe_ok} AS mfe_p50, "
+            f"avg(mae_r) {mae_ok} AS mae_mean, median(mae_r) {mae_ok} AS mae_p50, "
+            f"avg((mfe_r >= 0.5)::DOUBLE) {mfe_ok} AS reach_05, "
+            f"avg((mfe_r >= 1.0)::DOUBLE) {mfe_ok} AS reach_10, "
+            "median(rr_ratio) AS tp_r_p50, "
+            "median(bars_held)::DOUBLE AS bars_held_p50, "
+            "avg(outcome_r) FILTER (WHERE NOT isnan(outcome_r)) AS outcome_r_mean "
+            f"FROM excursions GROUP BY {cols} HAVING count(*) >= ? ORDER BY {cols}",
+            [min_n],
+        ).df()
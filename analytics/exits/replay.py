@@ -1,6 +1,6 @@
 """Pluggable exit-replay engine (exit spec §4).
 
-Generalizes the fixed SL/TP/time-expiry walk (`engine.py` / `_scan_forward`)
+Generalizes the fixed SL/TP/time-expiry walk (`engine.py` / `backfill_outcomes`)
 into a single evaluator parameterized by an `ExitPolicyConfig`. Given the OHLCV
 window strictly after entry and the alert's original entry + `sl_price`, it walks
 bars and returns the re-resolved `(outcome, realized_r, exit_bar)` under the
@@ -19,13 +19,21 @@ Conventions (anti-bias, exit spec §4):
 R is measured in units of the original risk |entry − sl|, so the SL sits at
 R = −1 and breakeven at R = 0 by construction. Excursions are gross of costs
 (price-path geometry); cost-netting is a downstream concern.
+
+`replay_exits_batch` resolves many (alert, policy) rows at once from an
+`ExitPaths` matrix. Each exit mechanism is the first bar its condition holds,
+so the walk reduces to row-wise first-index searches (the breakeven stop
+searched only past the arming bar), combined under the same precedence as the
+loop. It is exactly `replay_exits` row by row, down to the float arithmetic.
 """
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 import numpy as np
+import numpy.typing as npt
 
 from analytics.exits.policies import ExitPolicyConfig
 
@@ -127,3 +135,140 @@ def replay_exits(
     last = n - 1
     realized += remaining * close_r[last]
     return ExitOutcome("expired", realized, last, partial_taken)
+
+
+@dataclass(frozen=True)
+class ExitPaths:
+    """Forward R paths of many alerts on a common bar axis.
+
+    `fav` / `adv` / `close_r` are `(A, H)` favourable / adverse / close
+    excursions in R, NaN past each alert's `n_bars` (its window length, ≥ 1).
+    """
+
+    fav: npt.NDArray[np.float64]
+    adv: npt.NDArray[np.float64]
+    close_r: npt.NDArray[np.float64]
+    n_bars: npt.NDArray[np.int64]
+
+    def tile(self, reps: int) -> ExitPaths:
+        """`reps` stacked copies — pair with a policy list repeated per alert block."""
+        return ExitPaths(
+            np.tile(self.fav, (reps, 1)),
+            np.tile(self.adv, (reps, 1)),
+            np.tile(self.close_r, (reps, 1)),
+            np.tile(self.n_bars, reps),
+        )
+
+
+def exit_paths(
+    highs: npt.NDArray[np.float64],
+    lows: npt.NDArray[np.float64],
+    closes: npt.NDArray[np.float64],
+    *,
+    n_bars: npt.NDArray[np.int64],
+    directions: Sequence[str],
+    entries: npt.NDArray[np.float64],
+    sl_prices: npt.NDArray[np.float64],
+) -> ExitPaths:
+    """R paths from `(A, H)` forward price windows (NaN-padded past `n_bars`).
+
+    Same arithmetic as `replay_exits`; raises ValueError on a zero-risk row or
+    an empty window.
+    """
+    risk = np.abs(entries - sl_prices)
+    if (risk <= 0.0).any():
+        raise ValueError("risk (|entry - sl_price|) must be > 0")
+    if (n_bars <= 0).any():
+        raise ValueError("empty window")
+    e = entries[:, None]
+    r = risk[:, None]
+    long = (np.asarray(directions) == "long")[:, None]
+    return ExitPaths(
+        fav=np.where(long, (highs - e) / r, (e - lows) / r),
+        adv=np.where(long, (lows - e) / r, (e - highs) / r),
+        close_r=np.where(long, (closes - e) / r, (e - closes) / r),
+        n_bars=np.asarray(n_bars, dtype=np.int64),
+    )
+
+
+@dataclass(frozen=True)
+class ExitBatch:
+    """`ExitOutcome` fields for every row of a `replay_exits_batch` call."""
+
+    outcome: npt.NDArray[np.object_]
+    realized_r: npt.NDArray[np.float64]
+    exit_bar: npt.NDArray[np.int64]
+    partial_taken: npt.NDArray[np.bool_]
+
+    def __len__(self) -> int:
+        return len(self.realized_r)
+
+    def __getitem__(self, i: int) -> ExitOutcome:
+        return ExitOutcome(
+            str(self.outcome[i]),
+            float(self.realized_r[i]),
+            int(self.exit_bar[i]),
+            bool(self.partial_taken[i]),
+        )
+
+
+def _first(mask: npt.NDArray[np.bool_]) -> npt.NDArray[np.int64]:
+    """Row-wise index of the first True; the bar count when there is none."""
+    return np.where(mask.any(axis=1), mask.argmax(axis=1), mask.shape[1])
+
+
+def replay_exits_batch(
+    paths: ExitPaths, policies: Sequence[ExitPolicyConfig]
+) -> ExitBatch:
+    """Re-resolve every row of `paths` under its own policy (`policies[i]`).
+
+    Vectorised `replay_exits`: with SL / TP / partial / arming each found as
+    the first bar its level is touched, the exit is the earliest of the stop
+    (−1R, or 0R past the arming bar once breakeven is armed), the TP and the
+    time-stop bar `min(time_stop, n_bars) − 1`, ties resolved stop → TP →
+    time-stop. A policy grid over the same alerts is `paths.tile(P)` with each
+    policy repeated once per alert.
+    """
+    fav, adv = paths.fav, paths.adv
+    n_rows, width = fav.shape
+    if len(policies) != n_rows:
+        raise ValueError(f"{len(policies)} policies for {n_rows} paths")
+    tp_r = np.array([p.tp_r for p in policies], dtype=np.float64)
+    time_stop = np.array([p.effective_time_stop_bars for p in policies])
+    arm_r = np.array(
+        [np.nan if p.breakeven_arm_r is None else p.breakeven_arm_r for p in policies],
+        dtype=np.float64,
+    )
+    frac = np.array([p.partial_frac for p in policies], dtype=np.float64)
+    partial_r = np.array([p.partial_r for p in policies], dtype=np.float64)
+
+    end = np.minimum(time_stop, paths.n_bars) - 1
+    tp_bar = _first(fav >= (tp_r - _EPS)[:, None])
+    sl_bar = _first(adv <= -1.0 + _EPS)
+    arm_bar = _first(fav >= (arm_r - _EPS)[:, None])  # NaN level never arms
+    # Breakeven only arms on a bar the trade survives; it stops from the next.
+    armed = (arm_bar < sl_bar) & (arm_bar < tp_bar) & (arm_bar < end)
+    be_bar = _first((adv <= 0.0 + _EPS) & (np.arange(width) > arm_bar[:, None]))
+    stop_bar = np.where(armed, be_bar, sl_bar)
+    stop_r = np.where(armed, 0.0, -1.0)
+
+    exit_bar = np.minimum(np.minimum(stop_bar, tp_bar), end)
+    stopped = stop_bar == exit_bar
+    won = ~stopped & (tp_bar == exit_bar)
+    partial_bar = np.where(
+        frac > 0.0, _first(fav >= (partial_r - _EPS)[:, None]), width
+    )
+    # The partial leg fills before the TP / time-stop checks of its bar, not the stop.
+    partial = (partial_bar < exit_bar) | ((partial_bar == exit_bar) & ~stopped)
+
+    close_r = paths.close_r[np.arange(n_rows), exit_bar]
+    leg_r = np.where(stopped, stop_r, np.where(won, tp_r, close_r))
+    remaining = np.where(partial, 1.0 - frac, 1.0)
+    realized = np.where(partial, frac * partial_r, 0.0) + remaining * leg_r
+
+    outcome = np.where(
+        stopped,
+        np.where(stop_r <= -1.0 + 1e-9, "loss", "breakeven"),
+        np.where(won, "win", "expired"),
+    ).astype(object)
+    return ExitBatch(outcome, realized, exit_bar.astype(np.int64), partial)
@@ -0,0 +1,207 @@
+"""Per-bar feature frame shared by detectors, backtest gates and the scanner.
+
+Rolling features used to be recomputed at every call site: ATR14 per signal
+in the backtest loop, the prior-volume mean per signal in the volume gates and
+per candle in ``volume_confirm``, EMAs and cross counts per detector, the
+regime label per caller. ``FeatureFrame`` computes each of them once per OHLCV
+series, lazily on first read, and serves them by bar index.
+
+``FeatureFrame.of(df)`` returns the frame of ``df`` itself (by identity), so
+every consumer handed the same DataFrame in a cycle — the scanner's closed
+frame fanned out to every detector, one OHLCV frame replayed by every
+strategy of a sweep — shares a single computation. The frame is held weakly;
+its features assume the OHLCV columns are not modified in place afterwards.
+
+Every feature reproduces its per-call reference exactly (same arithmetic,
+same NaN handling): ``atr14`` ↔ ``analytics.backtest.engine._compute_atr14``,
+the volume flags ↔ ``analytics.backtest.gates`` / ``volume_confirm``,
+``ema`` ↔ ``compute_ema``, ``ema_crosses`` ↔ ``ema_cross_count`` and
+``regime`` ↔ ``analytics.regime.classify_series``.
+"""
+
+from __future__ import annotations
+
+import functools
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from analytics._identity_cache import IdentityCache
+
+_ATR_WINDOW = 14
+
+_FRAMES: IdentityCache[pd.DataFrame, FeatureFrame] = IdentityCache()
+
+
+def _prior_mean(values: npt.NDArray[np.float64], lookback: int) -> np.ndarray:
+    """``Series(values).iloc[max(0, i - lookback):i].mean()`` for every bar i.
+
+    NaN where the window is empty or all-NaN. Windows are summed row by row
+    over a contiguous copy so each sum is numpy's pairwise sum of exactly the
+    slice pandas would sum — the means are bit-identical.
+    """
+    n = len(values)
+    out = np.full(n, np.nan)
+    missing = np.isnan(values)
+    filled = np.where(missing, 0.0, values)
+    for i in range(1, min(lookback, n)):
+        count = int((~missing[:i]).sum())
+        if count:
+            out[i] = filled[:i].sum() / count
+    if lookback >= 1 and n > lookback:
+        rows = n - lookback
+        sums = np.ascontiguousarray(sliding_window_view(filled, lookback)[:rows])
+        counts = sliding_window_view(~missing, lookback)[:rows].sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out[lookback:] = np.where(counts > 0, sums.sum(axis=1) / counts, np.nan)
+    return out
+
+
+class FeatureFrame:
+    """Lazily materialised per-bar features of one OHLCV frame.
+
+    Columns are computed on first access and cached; Series-valued features
+    (``ema``, ``regime``) are shared, so callers must copy before mutating.
+    """
+
+    def __init__(self, ohlcv: pd.DataFrame) -> None:
+        self.n = len(ohlcv)
+        self.index = ohlcv.index
+        self.high = ohlcv["high"].to_numpy(dtype=float)
+        self.low = ohlcv["low"].to_numpy(dtype=float)
+        self.close = ohlcv["close"].astype(float)
+        self.volume: npt.NDArray[np.float64] | None = (
+            ohlcv["volume"].to_numpy(dtype=float) if "volume" in ohlcv.columns else None
+        )
+        self._volume_means: dict[int, np.ndarray] = {}
+        self._emas: dict[int, pd.Series] = {}
+        self._crosses: dict[tuple[int, int], np.ndarray] = {}
+        self._regimes: dict[tuple[str, float | None], pd.Series] = {}
+
+    @classmethod
+    def of(cls, ohlcv: pd.DataFrame) -> FeatureFrame:
+        """The shared FeatureFrame of ``ohlcv`` (built on first request)."""
+        return _FRAMES.get(ohlcv, cls)
+
+    # ------------------------------------------------------------------ ATR
+
+    @functools.cached_property
+    def atr14(self) -> npt.NDArray[np.float64]:
+        """``_compute_atr14`` at every bar: mean true range over up to 14 bars
+        ending at the bar (NaN where the engine returns None)."""
+        high, low, close = self.high.tolist(), self.low.tolist(), self.close.tolist()
+        tr = [0.0] * self.n
+        for i in range(1, self.n):
+            tr[i] = max(
+                high[i] - low[i],
+                abs(high[i] - close[i - 1]),
+                abs(low[i] - close[i - 1]),
+            )
+        out = np.full(self.n, np.nan)
+        for i in range(1, self.n):
+            start = max(1, i - (_ATR_WINDOW - 1))
+            atr = sum(tr[start : i + 1]) / (i + 1 - start)
+            if atr > 0.0:
+                out[i] = atr
+        return out
+
+    def atr14_at(self, idx: int) -> float | None:
+        """ATR14 at ``idx`` as ``_compute_atr14`` returns it (None when unavailable)."""
+        if idx < 1:
+            return None
+        atr = float(self.atr14[idx])
+        return None if np.isnan(atr) else atr
+
+    # --------------------------------------------------------------- volume
+
+    def volume_mean(self, lookback: int = 20) -> npt.NDArray[np.float64]:
+        """Mean volume of the ``lookback`` bars before each bar (no lookahead)."""
+        if lookback not in self._volume_means:
+            volume = np.full(self.n, np.nan) if self.volume is None else self.volume
+            self._volume_means[lookback] = _prior_mean(volume, lookback)
+        return self._volume_means[lookback]
+
+    def _volume_vs_mean(self, idx: int, lookback: int) -> tuple[float, float] | None:
+        """(volume, prior mean) at ``idx``; None where every gate falls back."""
+        if self.volume is None or idx < 1:
+            return None
+        avg = float(self.volume_mean(lookback)[idx])
+        return None if avg == 0.0 else (float(self.volume[idx]), avg)
+
+    def low_volume(self, idx: int, multiplier: float = 1.5, lookback: int = 20) -> bool:
+        """``analytics.backtest.gates._is_low_volume`` at ``idx``."""
+        pair = self._volume_vs_mean(idx, lookback)
+        return pair is not None and pair[0] < multiplier * pair[1]
+
+    def volume_spike(
+        self, idx: int, multiplier: float = 3.0, lookback: int = 20
+    ) -> bool:
+        """``analytics.backtest.gates._is_volume_spike`` at ``idx``."""
+        pair = self._volume_vs_mean(idx, lookback)
+        return pair is not None and pair[0] > multiplier * pair[1]
+
+    def volume_confirm(
+        self, idx: int, multiplier: float = 1.5, lookback: int = 20
+    ) -> bool:
+        """``analytics.strategies._shared.volume_confirm`` at ``idx``."""
+        pair = self._volume_vs_mean(idx, lookback)
+        return pair is None or pair[0] >= multiplier * pair[1]
+
+    # ------------------------------------------------------------------ EMA
+
+    def ema(self, span: int) -> pd.Series:
+        """``compute_ema(close, span)``, aligned with the frame's index."""
+        if span not in self._emas:
+            from analytics.strategies._shared import compute_ema
+
+            self._emas[span] = compute_ema(self.close, span)
+        return self._emas[span]
+
+    def ema_crosses(self, span: int, lookback: int) -> npt.NDArray[np.int64]:
+        """``ema_cross_count(close, ema(span), idx, lookback)`` for every bar.
+
+        A cross is a sign flip of ``close - ema`` from the previous non-zero
+        sample; one counts in a bar's window unless that previous sample lies
+        before the window. Prefix sums of the flips answer every window at once.
+        """
+        key = (span, lookback)
+        if key not in self._crosses:
+            diff = self.close.to_numpy(dtype=float) - self.ema(span).to_numpy(
+                dtype=float
+            )
+            sign = np.where(diff > 0, 1, np.where(diff < 0, -1, 0))
+            pos = np.arange(self.n)
+            nonzero = sign != 0
+            # Sign of the previous non-zero sample (0 when there is none).
+            last = np.maximum.accumulate(np.where(nonzero, pos, -1))
+            prev = np.r_[-1, last[:-1]]
+            prev_sign = np.where(prev >= 0, sign[np.maximum(prev, 0)], 0)
+            flip = nonzero & (prev_sign != 0) & (sign != prev_sign)
+            flips = np.r_[0, np.cumsum(flip)]
+            start = np.maximum(pos - lookback + 1, 0)
+            count = flips[pos + 1] - flips[start]
+            # The window's first non-zero sample flips against a sample outside it.
+            nxt = np.minimum.accumulate(np.where(nonzero, pos, self.n)[::-1])[::-1]
+            first = nxt[np.minimum(start, max(self.n - 1, 0))] if self.n else start
+            count -= (first <= pos) & flip[np.minimum(first, max(self.n - 1, 0))]
+            self._crosses[key] = np.where(start > pos, 0, count).astype(np.int64)
+        return self._crosses[key]
+
+    # --------------------------------------------------------------- regime
+
+    def regime(self, timeframe: str, slope_threshold: float | None = None) -> pd.Series:
+        """``classify_series`` labels of the frame (raises for unknown TFs)."""
+        key = (timeframe, slope_threshold)
+        if key not in self._regimes:
+            from analytics.regime import classify_series
+
+            bars = pd.DataFrame(
+                {"high": self.high, "low": self.low, "close": self.close.to_numpy()},
+                index=self.index,
+            )
+            self._regimes[key] = classify_series(
+                bars, timeframe, slope_threshold=slope_threshold
+            )
+        return self._regimes[key]
@@ -5,12 +5,16 @@ from __future__ import annotations
 from analytics.forecast.book import (
     ForecastBookResult,
     equity_curve,
+    forecast_book,
     instrument_returns,
     run_forecast_backtest,
 )
+from analytics.forecast.cache import ForecastCache, build_forecast_cache
 from analytics.forecast.config import ForecastConfig
+from analytics.forecast.panel import DailyPanel
 from analytics.forecast.replay import (
     load_daily_inputs,
+    load_daily_panel,
     replay_trials,
     replay_universe,
     replay_weight_schemes,
@@ -18,13 +22,18 @@ from analytics.forecast.replay import (
 from analytics.forecast.report import G2Report, evaluate
 
 __all__ = [
+    "DailyPanel",
     "ForecastBookResult",
+    "ForecastCache",
     "ForecastConfig",
     "G2Report",
+    "build_forecast_cache",
     "equity_curve",
     "evaluate",
+    "forecast_book",
     "instrument_returns",
     "load_daily_inputs",
+    "load_daily_panel",
     "replay_trials",
     "replay_universe",
     "replay_weight_schemes",
@@ -12,8 +12,16 @@ from dataclasses import dataclass
 import numpy as np
 import pandas as pd
 
+from analytics.forecast.cache import (
+    ForecastCache,
+    apply_governor,
+    build_forecast_cache,
+    row_mean,
+    vol_parity_leverage,
+)
 from analytics.forecast.config import ForecastConfig
 from analytics.forecast.ewmac import combine_forecasts
+from analytics.forecast.panel import DailyPanel
 from analytics.forecast.vol import ew_return_vol
 
 
@@ -75,39 +83,41 @@ def run_forecast_backtest(
     cfg: ForecastConfig,
 ) -> ForecastBookResult:
     """Aggregate per-instrument subsystem returns + causal vol governor."""
-    union = pd.DatetimeIndex([])
-    for s in closes.values():
-        union = union.union(pd.DatetimeIndex(s.index))
-    union = union.sort_values()
-
-    per_net: dict[str, pd.Series] = {}
-    net_cols: list[pd.Series] = []
-    for sym, close in closes.items():
-        fund = fundings.get(sym, pd.Series(0.0, index=close.index))
-        out = instrument_returns(close, fund, cfg)
-        net = out["net"].reindex(union)
-        per_net[sym] = net
-        net_cols.append(net)
-
-    net_mat = pd.concat(net_cols, axis=1)
-    active = net_mat.notna().sum(axis=1)
-    pre = net_mat.mean(axis=1)  # equal risk weight across active instruments
-    pre = pre.fillna(0.0)
-
-    ann = np.sqrt(cfg.annualization_days)
-    trailing_vol = (
-        pre.rolling(cfg.gov_window, min_periods=cfg.gov_window).std().shift(1) * ann
-    )
-    g = (cfg.vol_target_annual / trailing_vol).clip(cfg.g_min, cfg.g_max)
-    port = g.fillna(0.0) * pre
+    panel = DailyPanel.from_series(closes, fundings)
+    return forecast_book(build_forecast_cache(panel, cfg), cfg)
+
 
+def forecast_book(cache: ForecastCache, cfg: ForecastConfig) -> ForecastBookResult:
+    """``run_forecast_backtest`` over a prebuilt ``ForecastCache``.
+
+    Every instrument's ``instrument_returns`` at once on the ``(T, N)`` grid:
+    the combined forecast and the previous leverage are lagged on each
+    instrument's own index, exactly like the per-series ``.shift(1)``.
+    """
+    panel = cache.panel
+    forecast = panel.own_lag(cache.combined_forecast(cfg))
+    leverage = vol_parity_leverage(forecast, cache.vol_ann, cfg.vol_target_annual)
+    gross = leverage * cache.returns
+    lev_prev = np.nan_to_num(panel.own_lag(leverage), nan=0.0)
+    turnover_cost = np.abs(leverage - lev_prev) * (cfg.fee_pct + cfg.slippage_pct)
+    funding_cost = leverage * panel.funding
+    net = np.where(panel.active, gross - turnover_cost - funding_cost, np.nan)
+
+    active = (~np.isnan(net)).sum(axis=1)
+    pre = np.nan_to_num(row_mean(net), nan=0.0)  # equal risk weight across active
+    port, g = apply_governor(pre, cfg)
+
+    union = panel.daily_index
     return ForecastBookResult(
         daily_index=union,
-        portfolio_return=port.to_numpy(dtype=np.float64),
-        pre_governor_return=pre.to_numpy(dtype=np.float64),
-        governor=g.to_numpy(dtype=np.float64),
-        active_count=active.to_numpy(dtype=np.int64),
-        per_instrument_net=per_net,
+        portfolio_return=port,
+        pre_governor_return=pre,
+        governor=g,
+        active_count=active.astype(np.int64),
+        per_instrument_net={
+            sym: pd.Series(net[:, i], index=union)
+            for i, sym in enumerate(panel.symbols)
+        },
     )
 
 
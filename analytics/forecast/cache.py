@@ -0,0 +1,170 @@
+"""Per-instrument forecast cache shared by a family of sleeve replays.
+
+The expensive part of every trend/XS book run is the per-instrument EWMA work
+(fast/slow EMAs, EW return vol, price vol). It depends only on the closes and
+on ``(speeds, vol_span, cap, annualization_days)`` — not on forecast weights,
+FDM, costs, the governor or capital — so a trial family (single-speed sleeves,
+weight schemes, capital levels) can compute it once and reduce over it.
+
+``build_forecast_cache`` runs that work as whole-matrix window ops on a
+``DailyPanel``'s compact own-index layout and lays the per-speed scaled
+forecasts out as a ``(T, N, S)`` array on the union daily index, next to
+``(T, N)`` vol and return grids. The window ops are the same pandas kernels as
+``scaled_forecast`` / ``ew_return_vol`` applied column-wise, so the array books
+built on top are numerically the per-instrument pandas books. Pure: no DB, no IO.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from analytics.forecast.config import ForecastConfig
+from analytics.forecast.panel import DailyPanel, Grid
+
+
+@dataclass(frozen=True)
+class ForecastCache:
+    """Per-instrument forecast inputs for every speed in ``speeds``.
+
+    - *forecasts*: ``(T, N, S)`` capped single-speed forecasts (unshifted).
+    - *vol_ann*: causal annualised EW return vol (``ew_return_vol * sqrt(ann)``).
+    - *returns*: daily simple return on the instrument's own index.
+
+    All grids are NaN where the instrument is absent; close, funding and the
+    activity mask come from ``panel``.
+    """
+
+    panel: DailyPanel
+    speeds: tuple[tuple[int, int, float], ...]
+    vol_span: int
+    cap: float
+    annualization_days: float
+    forecasts: Grid
+    vol_ann: Grid
+    returns: Grid
+
+    def check(self, cfg: ForecastConfig) -> None:
+        """Raise ``ValueError`` if ``cfg`` needs inputs this cache was not built for."""
+        built = (self.vol_span, self.cap, self.annualization_days)
+        wanted = (cfg.vol_span, cfg.cap, cfg.annualization_days)
+        if built != wanted:
+            raise ValueError(f"cache built for {built}, config needs {wanted}")
+        missing = [s for s in cfg.speeds if s not in self.speeds]
+        if missing:
+            raise ValueError(f"speeds not in cache: {missing}")
+
+    def combined_forecast(self, cfg: ForecastConfig) -> Grid:
+        """``combine_forecasts`` for every instrument at once (unshifted, ``(T, N)``).
+
+        Selects ``cfg.speeds`` from the cached speed axis and applies
+        ``cfg.weights`` / ``cfg.fdm`` / ``cfg.cap`` with the same NaN-leg
+        re-normalisation as the per-series path.
+        """
+        self.check(cfg)
+        parts = self.forecasts[:, :, [self.speeds.index(s) for s in cfg.speeds]]
+        mean = combine_legs(parts, cfg.weights)
+        return np.asarray(np.clip(mean * cfg.fdm, -cfg.cap, cfg.cap), dtype=np.float64)
+
+
+def combine_legs(
+    parts: npt.NDArray[np.float64], weights: tuple[float, ...] | None = None
+) -> Grid:
+    """Mean over the last (leg) axis, re-normalised over the non-NaN legs.
+
+    ``weights=None`` is the equal-weight ``mean(axis=1)`` of the per-series
+    path; otherwise the weighted branch of ``combine_forecasts``. NaN where no
+    leg is defined.
+    """
+    present = ~np.isnan(parts)
+    if weights is None:
+        num = np.where(present, parts, 0.0).sum(axis=-1)
+        denom = present.sum(axis=-1).astype(np.float64)
+    else:
+        w = np.asarray(weights, dtype=float)
+        num = np.nansum(parts * w, axis=-1)
+        denom = (present * w).sum(axis=-1)
+    out = np.full_like(num, np.nan)
+    np.divide(num, denom, out=out, where=denom > 0.0)
+    return out
+
+
+def union_lag(grid: Grid) -> Grid:
+    """``shift(1)`` of every column on the union index."""
+    out = np.full_like(grid, np.nan)
+    out[1:] = grid[:-1]
+    return out
+
+
+def row_mean(grid: Grid) -> Grid:
+    """Per-row mean over non-NaN cells (pandas ``mean(axis=1)``; all-NaN -> NaN)."""
+    present = ~np.isnan(grid)
+    total = np.where(present, grid, 0.0).sum(axis=1)
+    count = present.sum(axis=1)
+    out = np.full_like(total, np.nan)
+    np.divide(total, count, out=out, where=count > 0)
+    return out
+
+
+def vol_parity_leverage(forecast: Grid, vol_ann: Grid, vol_target: float) -> Grid:
+    """``(forecast / 10) * (vol_target / vol_ann)`` with +/-inf mapped to NaN."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lev = (forecast / 10.0) * (vol_target / vol_ann)
+    return np.where(np.isinf(lev), np.nan, lev)
+
+
+def apply_governor(
+    pre: Grid, cfg: ForecastConfig
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Causal vol governor over the pre-governor return: ``(post, governor)``."""
+    pre_s = pd.Series(pre)
+    ann = np.sqrt(cfg.annualization_days)
+    trailing_vol = (
+        pre_s.rolling(cfg.gov_window, min_periods=cfg.gov_window).std().shift(1) * ann
+    )
+    g = (cfg.vol_target_annual / trailing_vol).clip(cfg.g_min, cfg.g_max)
+    port = g.fillna(0.0) * pre_s
+    return port.to_numpy(dtype=np.float64), g.to_numpy(dtype=np.float64)
+
+
+def ew_return_vol_frame(panel: DailyPanel, span: int) -> pd.DataFrame:
+    """``ew_return_vol`` of every instrument at once, in the compact layout."""
+    returns = panel.compact_frame(panel.close).pct_change()
+    return returns.ewm(span=span, min_periods=span).std().shift(1)
+
+
+def build_forecast_cache(panel: DailyPanel, cfg: ForecastConfig) -> ForecastCache:
+    """Compute every instrument's per-speed forecasts, vol and returns once.
+
+    Covers all of ``cfg.speeds``; any sub-family of those speeds (with any
+    weights / FDM / costs / governor settings) can then be replayed from the
+    cache. EMAs shared between speeds are computed once per span.
+    """
+    close = panel.compact_frame(panel.close)
+    ret_vol = ew_return_vol_frame(panel, cfg.vol_span)
+    pv = ret_vol * close
+
+    forecasts = np.full((*panel.close.shape, len(cfg.speeds)), np.nan)
+    emas: dict[int, pd.DataFrame] = {}
+    for k, (fast, slow, scalar) in enumerate(cfg.speeds):
+        for span in (fast, slow):
+            if span not in emas:
+                emas[span] = close.ewm(span=span, adjust=False).mean()
+        raw = emas[fast] - emas[slow]
+        scaled = ((raw / pv) * scalar).clip(lower=-cfg.cap, upper=cfg.cap)
+        forecasts[:, :, k] = panel.expand(scaled.to_numpy(dtype=np.float64))
+
+    ann = np.sqrt(cfg.annualization_days)
+    return ForecastCache(
+        panel=panel,
+        speeds=tuple(cfg.speeds),
+        vol_span=cfg.vol_span,
+        cap=cfg.cap,
+        annualization_days=cfg.annualization_days,
+        forecasts=forecasts,
+        vol_ann=panel.expand(ret_vol.mul(ann).to_numpy(dtype=np.float64)),
+        returns=panel.expand(close.pct_change().to_numpy(dtype=np.float64)),
+    )
@@ -0,0 +1,167 @@
+"""Dense daily panel shared by the sleeve books (forecast / xsmom / carry / combine).
+
+One aligned ``(T, N)`` float64 array per input — close, daily funding, dollar
+volume — on the sorted union daily index, plus an ``active`` mask (the day is in
+the instrument's own bar history). Built once by the loaders (or from the
+legacy ``dict[str, pd.Series]`` inputs) so the books run whole-matrix NumPy /
+pandas ops instead of per-symbol ``reindex`` loops.
+
+Per-instrument time-series ops (EWMA, ``pct_change``, own-index ``shift``) must
+skip the days an instrument has no bar, exactly like a Series on its own index.
+They run on the *compact* layout: column ``i`` holds instrument ``i``'s own-index
+values top-aligned (``(L, N)``, NaN-padded), which ``compact`` / ``expand`` map
+to and from the union grid. Pure: no DB, no IO.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+type Grid = npt.NDArray[np.float64]
+
+
+@dataclass(frozen=True)
+class DailyPanel:
+    """Aligned daily inputs for ``symbols`` on ``daily_index``.
+
+    - *close*: daily close, NaN where the instrument has no bar.
+    - *funding*: daily summed funding rate, 0.0 where missing or absent.
+    - *dollar_volume*: ``volume * close``, NaN where absent (or not loaded).
+    - *active*: the union day is one of the instrument's own bar days.
+    - *rows*: ``(L, N)`` union row of each own-index position, -1 padding.
+    """
+
+    daily_index: pd.DatetimeIndex
+    symbols: tuple[str, ...]
+    close: Grid
+    funding: Grid
+    dollar_volume: Grid
+    active: npt.NDArray[np.bool_]
+    rows: npt.NDArray[np.int64]
+
+    @classmethod
+    def from_arrays(
+        cls,
+        daily_index: pd.DatetimeIndex,
+        symbols: tuple[str, ...],
+        close: Grid,
+        funding: Grid,
+        dollar_volume: Grid,
+        active: npt.NDArray[np.bool_],
+    ) -> DailyPanel:
+        """Wrap aligned grids, deriving the compact row map from ``active``."""
+        lengths = active.sum(axis=0)
+        rows = np.full((int(lengths.max(initial=0)), len(symbols)), -1, dtype=np.int64)
+        col, union_row = np.nonzero(active.T)  # by column, then day
+        starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        rows[np.arange(len(col)) - starts[col], col] = union_row
+        return cls(
+            daily_index=daily_index,
+            symbols=symbols,
+            close=close,
+            funding=funding,
+            dollar_volume=dollar_volume,
+            active=active,
+            rows=rows,
+        )
+
+    @classmethod
+    def from_series(
+        cls,
+        closes: dict[str, pd.Series],
+        fundings: dict[str, pd.Series] | None = None,
+        dollar_volumes: dict[str, pd.Series] | None = None,
+    ) -> DailyPanel:
+        """Align the legacy per-symbol day-indexed Series into one panel.
+
+        Funding is aligned to each close's days (0.0 where missing), as
+        ``load_daily_inputs`` does; dollar volume likewise (NaN where missing).
+        """
+        fundings = fundings or {}
+        dollar_volumes = dollar_volumes or {}
+        symbols = tuple(closes)
+        indexes = [pd.DatetimeIndex(s.index) for s in closes.values()]
+        union = (
+            pd.DatetimeIndex(indexes[0].append(indexes[1:]).unique()).sort_values()
+            if indexes
+            else pd.DatetimeIndex([])
+        )
+
+        t, n = len(union), len(symbols)
+        close = np.full((t, n), np.nan)
+        funding = np.zeros((t, n))
+        dollar_volume = np.full((t, n), np.nan)
+        active = np.zeros((t, n), dtype=bool)
+        for i, (sym, series) in enumerate(closes.items()):
+            rows = union.get_indexer(series.index)
+            active[rows, i] = True
+            close[rows, i] = series.to_numpy(dtype=np.float64)
+            if sym in fundings:
+                fund = fundings[sym].reindex(series.index).fillna(0.0)
+                funding[rows, i] = fund.to_numpy(dtype=np.float64)
+            if sym in dollar_volumes:
+                dv = dollar_volumes[sym].reindex(series.index)
+                dollar_volume[rows, i] = dv.to_numpy(dtype=np.float64)
+        return cls.from_arrays(union, symbols, close, funding, dollar_volume, active)
+
+    def compact(self, grid: Grid) -> Grid:
+        """Union-grid ``(T, N)`` -> compact own-index layout ``(L, N)`` (NaN pad)."""
+        picked = np.take_along_axis(grid, np.maximum(self.rows, 0), axis=0)
+        return np.where(self.rows >= 0, picked, np.nan)
+
+    def expand(self, compact: Grid) -> Grid:
+        """Compact own-index layout ``(L, N)`` -> union grid ``(T, N)`` (NaN absent)."""
+        out = np.full(self.close.shape, np.nan)
+        pos, col = np.nonzero(self.rows >= 0)
+        out[self.rows[pos, col], col] = compact[pos, col]
+        return out
+
+    def compact_frame(self, grid: Grid) -> pd.DataFrame:
+        """``compact`` as a DataFrame for column-wise pandas window ops."""
+        return pd.DataFrame(self.compact(grid))
+
+    def own_lag(self, grid: Grid) -> Grid:
+        """``shift(1)`` of each column on its instrument's own index (NaN if none)."""
+        compact = self.compact(grid)
+        lagged = np.full_like(compact, np.nan)
+        lagged[1:] = compact[:-1]
+        return self.expand(lagged)
+
+    def through(self, cutoff: pd.Timestamp) -> DailyPanel:
+        """Keep days ``<= cutoff``; symbols left with no bars are dropped."""
+        keep_t = np.asarray(self.daily_index <= cutoff)
+        keep_n = self.active[keep_t].any(axis=0)
+        sub = np.ix_(keep_t, keep_n)
+        return DailyPanel.from_arrays(
+            pd.DatetimeIndex(self.daily_index[keep_t]),
+            tuple(s for s, k in zip(self.symbols, keep_n, strict=True) if k),
+            self.close[sub],
+            self.funding[sub],
+            self.dollar_volume[sub],
+            self.active[sub],
+        )
+
+    def _series(self, grid: Grid) -> dict[str, pd.Series]:
+        return {
+            sym: pd.Series(
+                grid[self.active[:, i], i],
+                index=self.daily_index[self.active[:, i]],
+            )
+            for i, sym in enumerate(self.symbols)
+        }
+
+    def closes(self) -> dict[str, pd.Series]:
+        """Per-symbol close Series on each instrument's own days."""
+        return self._series(self.close)
+
+    def fundings(self) -> dict[str, pd.Series]:
+        """Per-symbol daily funding Series on each instrument's own days."""
+        return self._series(self.funding)
+
+    def dollar_volumes(self) -> dict[str, pd.Series]:
+        """Per-symbol daily dollar-volume Series on each instrument's own days."""
+        return self._series(self.dollar_volume)
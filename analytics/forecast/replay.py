@@ -1,7 +1,8 @@
 """Read-only DuckDB front door for the EWMAC trend sleeve.
 
-Loads 1d OHLCV + funding for the universe and runs the forecast book. The only
-module in ``analytics/forecast/`` that touches the database; never writes.
+Loads 1d OHLCV + funding for the universe into a ``DailyPanel`` and runs the
+forecast book. The only module in ``analytics/forecast/`` that touches the
+database; never writes.
 """
 
 from __future__ import annotations
@@ -12,15 +13,77 @@ import duckdb
 import numpy as np
 import pandas as pd
 
-from analytics.forecast.book import ForecastBookResult, run_forecast_backtest
+from analytics.forecast.book import ForecastBookResult, forecast_book
+from analytics.forecast.cache import build_forecast_cache
 from analytics.forecast.config import ForecastConfig
+from analytics.forecast.panel import DailyPanel
 from analytics.forecast.weights import candidate_schemes
-from analytics.store.market_data import get_funding_rates, get_ohlcv
+from analytics.store.market_data import (
+    get_funding_rates_for_symbols,
+    get_ohlcv_for_symbols,
+)
 from analytics.universe import load_universe
 
 # Sentinels that cover any realistic data range (Unix ms).
 _FAR_PAST: int = 0
 _FAR_FUTURE: int = 9_999_999_999_999
+_DAY: int = 86_400_000
+
+
+def load_daily_panel(
+    conn: duckdb.DuckDBPyConnection,
+    symbols: list[str],
+    *,
+    start: int = _FAR_PAST,
+    end: int = _FAR_FUTURE,
+) -> DailyPanel:
+    """Load 1d close, dollar volume and daily funding for ``symbols`` as one panel.
+
+    One OHLCV query and one funding query for the whole universe. Bars are
+    keyed by UTC day (last bar wins on a duplicate day); funding is the day's
+    summed rate (3 × 8-h rows) on each symbol's bar days, 0.0 where missing.
+    Symbols with no OHLCV are silently skipped; the rest keep their order.
+    ``start`` / ``end`` bound the bar ``open_time`` (Unix ms, inclusive).
+    """
+    wanted = list(dict.fromkeys(symbols))
+    if not wanted:
+        return DailyPanel.from_series({})
+    bars = get_ohlcv_for_symbols(conn, wanted, "1d", start, end)
+    if bars.empty:
+        return DailyPanel.from_series({})
+    bars["day"] = pd.to_datetime(bars["open_time"], unit="ms", utc=True).dt.normalize()
+    bars = bars.drop_duplicates(subset=["symbol", "day"], keep="last")
+    loaded = set(bars["symbol"])
+    cols = pd.Index([s for s in wanted if s in loaded])
+    days = pd.DatetimeIndex(bars["day"].unique()).sort_values()
+
+    shape = (len(days), len(cols))
+    row = days.get_indexer(pd.Index(bars["day"]))
+    col = cols.get_indexer(pd.Index(bars["symbol"]))
+    close = np.full(shape, np.nan)
+    dollar_volume = np.full(shape, np.nan)
+    active = np.zeros(shape, dtype=bool)
+    close_v = bars["close"].to_numpy(dtype=float)
+    close[row, col] = close_v
+    dollar_volume[row, col] = bars["volume"].to_numpy(dtype=float) * close_v
+    active[row, col] = True
+
+    funding = np.zeros(shape)
+    fr = get_funding_rates_for_symbols(conn, list(cols), start, end + _DAY - 1)
+    if not fr.empty:
+        fr["day"] = pd.to_datetime(
+            fr["funding_time"], unit="ms", utc=True
+        ).dt.normalize()
+        daily = fr.groupby(["symbol", "day"], sort=False)["funding_rate"].sum()
+        f_row = days.get_indexer(daily.index.get_level_values("day"))
+        f_col = cols.get_indexer(daily.index.get_level_values("symbol"))
+        on_bar = f_row >= 0
+        on_bar[on_bar] = active[f_row[on_bar], f_col[on_bar]]
+        funding[f_row[on_bar], f_col[on_bar]] = daily.to_numpy(dtype=float)[on_bar]
+
+    return DailyPanel.from_arrays(
+        days, tuple(cols), close, funding, dollar_volume, active
+    )
 
 
 def load_daily_inputs(
@@ -33,30 +96,10 @@ def load_daily_inputs(
     - *fundings*: daily funding rate (3 × 8-h rows summed per day),
       reindexed to the close index; missing days filled with 0.0.
     Symbols with no OHLCV are silently skipped (no key in either dict).
+    Per-symbol view of ``load_daily_panel``.
     """
-    closes: dict[str, pd.Series] = {}
-    fundings: dict[str, pd.Series] = {}
-    for sym in symbols:
-        bars = get_ohlcv(conn, sym, "1d", _FAR_PAST, _FAR_FUTURE)
-        if bars.empty:
-            continue
-        idx = pd.to_datetime(bars["open_time"], unit="ms", utc=True).dt.normalize()
-        close = pd.Series(bars["close"].to_numpy(dtype=float), index=idx)
-        close = close[~close.index.duplicated(keep="last")].sort_index()
-        closes[sym] = close
-
-        fr = get_funding_rates(conn, sym, _FAR_PAST, _FAR_FUTURE)
-        if fr.empty:
-            fundings[sym] = pd.Series(0.0, index=close.index)
-            continue
-        fidx = pd.to_datetime(fr["funding_time"], unit="ms", utc=True).dt.normalize()
-        daily = (
-            pd.Series(fr["funding_rate"].to_numpy(dtype=float), index=fidx)
-            .groupby(level=0)
-            .sum()
-        )
-        fundings[sym] = daily.reindex(close.index).fillna(0.0)
-    return closes, fundings
+    panel = load_daily_panel(conn, symbols)
+    return panel.closes(), panel.fundings()
 
 
 def replay_universe(
@@ -66,8 +109,7 @@ def replay_universe(
 ) -> ForecastBookResult:
     """Load the universe's 1d inputs and run the forecast book (read-only)."""
     syms = symbols if symbols is not None else load_universe()
-    closes, fundings = load_daily_inputs(conn, syms)
-    return run_forecast_backtest(closes, fundings, cfg)
+    return forecast_book(build_forecast_cache(load_daily_panel(conn, syms), cfg), cfg)
 
 
 def replay_trials(
@@ -78,24 +120,25 @@ def replay_trials(
     """Daily portfolio returns for each single-speed sleeve + the combined book.
 
     The honest multiple-testing family for DSR/PBO and the H2 check
-    (s64_256 vs combined). Reuses ``replay_universe`` by swapping
-    ``cfg.speeds`` to a single pair per trial.
+    (s64_256 vs combined). Builds one ``ForecastCache`` over all of
+    ``cfg.speeds`` and replays each trial from it by swapping ``cfg.speeds``
+    to a single pair, so the per-instrument EWMA work runs once per family.
 
     Keys:
     - ``"s{fast}_{slow}"`` — one per speed in ``cfg.speeds``
     - ``"combined"`` — the full multi-speed book
     """
     syms = symbols if symbols is not None else load_universe()
-    closes, fundings = load_daily_inputs(conn, syms)
+    cache = build_forecast_cache(load_daily_panel(conn, syms), cfg)
 
     trials: dict[str, np.ndarray] = {}
     for fast, slow, scalar in cfg.speeds:
         single_cfg = dataclasses.replace(cfg, speeds=((fast, slow, scalar),))
-        result = run_forecast_backtest(closes, fundings, single_cfg)
+        result = forecast_book(cache, single_cfg)
         key = f"s{fast}_{slow}"
         trials[key] = result.portfolio_return
 
-    combined = run_forecast_backtest(closes, fundings, cfg)
+    combined = forecast_book(cache, cfg)
     trials["combined"] = combined.portfolio_return
     return trials
 
@@ -109,12 +152,13 @@ def replay_weight_schemes(
 
     Keys are scheme names from ``candidate_schemes``; values are the full
     ``ForecastBookResult`` under that scheme's weights. Loads the daily inputs
-    once and re-runs the book per scheme via ``dataclasses.replace``.
+    and builds the forecast cache once, then re-weights it per scheme via
+    ``dataclasses.replace``.
     """
     syms = symbols if symbols is not None else load_universe()
-    closes, fundings = load_daily_inputs(conn, syms)
+    cache = build_forecast_cache(load_daily_panel(conn, syms), cfg)
     out: dict[str, ForecastBookResult] = {}
     for name, scheme in candidate_schemes(cfg).items():
         scheme_cfg = dataclasses.replace(cfg, weights=scheme.weights)
-        out[name] = run_forecast_backtest(closes, fundings, scheme_cfg)
+        out[name] = forecast_book(cache, scheme_cfg)
     return out
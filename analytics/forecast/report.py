@@ -16,6 +16,7 @@ import numpy.typing as npt
 from analytics.forecast.book import ForecastBookResult, equity_curve
 from analytics.forecast.config import ForecastConfig
 from analytics.research_guards import (
+    batch_sharpe,
     block_bootstrap_ci,
     cscv_pbo,
     deflated_sharpe_ratio,
@@ -33,10 +34,6 @@ def _per_period_sharpe(r: npt.NDArray[np.float64]) -> float:
     return float(np.mean(r) / sd)
 
 
-def _ann_sharpe(r: npt.NDArray[np.float64], ann: float) -> float:
-    return _per_period_sharpe(r) * ann
-
-
 @dataclass(frozen=True)
 class G2Report:
     """Headline metrics + research-guard stamps for the G2 verdict."""
@@ -89,11 +86,7 @@ def evaluate(
         pbo = float("nan")
 
     if sr_d != 0.0:
-
-        def _stat_fn(x: npt.NDArray[np.float64]) -> float:
-            return _ann_sharpe(x, ann)
-
-        boot = block_bootstrap_ci(r, stat_fn=_stat_fn, seed=7)
+        boot = block_bootstrap_ci(r, batch_stat=batch_sharpe(ann), seed=7)
         boot_lo, boot_hi = boot.lo, boot.hi
         dsr = deflated_sharpe_ratio(sr_d, len(r), trial_srs=trial_srs)
         min_trl = min_track_record_length(sr_d, target_sr=1.0 / ann, confidence=0.95)
@@ -101,13 +94,14 @@ def evaluate(
         boot_lo = boot_hi = dsr = 0.0
         min_trl = float("inf")
 
+    cm = metrics.curve_metrics(curve)
     return G2Report(
-        sharpe_annual=metrics.sharpe(curve),
-        sortino_annual=metrics.sortino(curve),
-        max_dd=metrics.max_drawdown(curve),
-        calmar=metrics.calmar(curve),
-        annual_return=metrics.annual_return(curve),
-        annual_vol=metrics.annual_vol(curve),
+        sharpe_annual=cm.sharpe,
+        sortino_annual=cm.sortino,
+        max_dd=cm.max_drawdown,
+        calmar=cm.calmar,
+        annual_return=cm.annual_return,
+        annual_vol=cm.annual_vol,
         n_obs=len(r),
         dsr=dsr,
         pbo=pbo,
@@ -33,7 +33,13 @@ import pandas as pd
 
 from analytics.backtest_lib import BacktestResult, run_backtest
 from analytics.backtest_runner import detect_signals_for_strategy
-from analytics.data_store import DEFAULT_DB_PATH, get_ohlcv
+from analytics.data_store import (
+    DEFAULT_DB_PATH,
+    get_ohlcv,
+    get_sweep_cells,
+    put_sweep_cell,
+    sweep_cell_key,
+)
 from analytics.perf_timer import timed
 from analytics.strategies import KNOWN_STRATEGIES, STRATEGY_REGISTRY
 from analytics.sweep_guard import (
@@ -291,47 +297,29 @@ def _compute_sweep_gate(
 # ---------------------------------------------------------------------------
 
 
-def _sweep_grid_worker(
+def _grid_backtest_params(
     params: dict[str, Any],
-    ohlcv_is: pd.DataFrame,
-    signals_is: pd.DataFrame,
-    ohlcv_oos: pd.DataFrame,
-    signals_oos: pd.DataFrame,
-    symbol: str,
-    timeframe: str,
-    strategy: str,
     fee_pct: float,
+    atr_sl_multiplier: float | None,
+    atr_sl_floor: bool,
+) -> dict[str, Any]:
+    """``run_backtest`` keyword arguments for one grid combo (IS and OOS alike)."""
+    return {
+        "sl_pct": float(params.get("sl_pct", 0.02)),
+        "tp_r": float(params.get("tp_r", 2.0)),
+        "fee_pct": fee_pct,
+        "atr_sl_multiplier": atr_sl_multiplier,
+        "atr_sl_floor": atr_sl_floor,
+    }
+
+
+def _sweep_row(
+    params: dict[str, Any],
+    bt_is: BacktestResult,
+    bt_oos: BacktestResult,
     is_min: int,
-    atr_sl_multiplier: float | None = None,
-    atr_sl_floor: bool = False,
 ) -> SweepRow:
-    """Single grid-combo backtest worker — module-level so ProcessPoolExecutor can pickle it."""
-    tp_r = float(params.get("tp_r", 2.0))
-    sl_pct = float(params.get("sl_pct", 0.02))
-    bt_is = run_backtest(
-        ohlcv_is,
-        signals_is,
-        symbol,
-        timeframe,
-        strategy,
-        sl_pct=sl_pct,
-        tp_r=tp_r,
-        fee_pct=fee_pct,
-        atr_sl_multiplier=atr_sl_multiplier,
-        atr_sl_floor=atr_sl_floor,
-    )
-    bt_oos = run_backtest(
-        ohlcv_oos,
-        signals_oos,
-        symbol,
-        timeframe,
-        strategy,
-        sl_pct=sl_pct,
-        tp_r=tp_r,
-        fee_pct=fee_pct,
-        atr_sl_multiplier=atr_sl_multiplier,
-        atr_sl_floor=atr_sl_floor,
-    )
+    """Score one combo's IS/OOS backtests into a SweepRow."""
     is_s = _score(bt_is, is_min)
     oos_s = _score(bt_oos, 1)
     decay = (oos_s / is_s) if is_s > 0 else float("nan")
@@ -350,6 +338,27 @@ def _sweep_grid_worker(
     )
 
 
+def _sweep_grid_worker(
+    params: dict[str, Any],
+    ohlcv_is: pd.DataFrame,
+    signals_is: pd.DataFrame,
+    ohlcv_oos: pd.DataFrame,
+    signals_oos: pd.DataFrame,
+    symbol: str,
+    timeframe: str,
+    strategy: str,
+    fee_pct: float,
+    is_min: int,
+    atr_sl_multiplier: float | None = None,
+    atr_sl_floor: bool = False,
+) -> SweepRow:
+    """Single grid-combo backtest worker — module-level so ProcessPoolExecutor can pickle it."""
+    kw = _grid_backtest_params(params, fee_pct, atr_sl_multiplier, atr_sl_floor)
+    bt_is = run_backtest(ohlcv_is, signals_is, symbol, timeframe, strategy, **kw)
+    bt_oos = run_backtest(ohlcv_oos, signals_oos, symbol, timeframe, strategy, **kw)
+    return _sweep_row(params, bt_is, bt_oos, is_min)
+
+
 def run_param_sweep(
     conn: duckdb.DuckDBPyConnection,
     strategy: str,
@@ -366,9 +375,16 @@ def run_param_sweep(
     day_filter: str = "off",
     atr_sl_multiplier: float | None = None,
     atr_sl_floor: bool = False,
+    cells: duckdb.DuckDBPyConnection | None = None,
 ) -> ParamSweepReport:
     """Run WFO grid sweep. Returns rows sorted by IS score (descending), plus the
-    overfitting commit gate (P0a-2) computed over the full grid."""
+    overfitting commit gate (P0a-2) computed over the full grid.
+
+    With a sweep cell store (``cells``, see ``open_sweep_cell_store``) combos
+    whose IS and OOS backtests are already stored are not re-run, and each
+    computed combo is persisted as it completes — an interrupted or widened
+    sweep only runs the missing cells.
+    """
     end_ms = int(time.time() * 1000)
     start_ms = since_ms if since_ms is not None else end_ms - days * 24 * 3_600 * 1_000
 
@@ -440,23 +456,51 @@ def run_param_sweep(
     n = len(grid)
     is_min = max(1, min_trades // 2)  # relax min_trades for IS scoring (more history)
 
+    # Content-addressed resume: one cell per (combo, IS/OOS) backtest.
+    cell_keys: list[tuple[str, str]] = []
+    stored: dict[str, BacktestResult] = {}
+    if cells is not None:
+        for p in grid:
+            kw = _grid_backtest_params(p, fee_pct, atr_sl_multiplier, atr_sl_floor)
+            cell_keys.append(
+                (
+                    sweep_cell_key(
+                        symbol, timeframe, strategy, ohlcv_is, signals_is, kw
+                    ),
+                    sweep_cell_key(
+                        symbol, timeframe, strategy, ohlcv_oos, signals_oos, kw
+                    ),
+                )
+            )
+        stored = get_sweep_cells(cells, [k for pair in cell_keys for k in pair])
+
+    rows: list[SweepRow] = []
+    todo: list[int] = []
+    for i, p in enumerate(grid):
+        if cell_keys and all(k in stored for k in cell_keys[i]):
+            k_is, k_oos = cell_keys[i]
+            rows.append(_sweep_row(p, stored[k_is], stored[k_oos], is_min))
+        else:
+            todo.append(i)
+
     sl_note = (
         " (sl_pct dropped — strategy uses structural SLs)" if uses_structural_sl else ""
     )
-    workers = max(1, min((os.cpu_count() or 2) - 1, n))
+    workers = max(1, min((os.cpu_count() or 2) - 1, len(todo)))
     print(f"\n  Sweep: {strategy} / {symbol} / {timeframe}{sl_note}")
     print(
         f"  Grid size: {n} combos | IS candles: {len(ohlcv_is)} | OOS candles: {len(ohlcv_oos)}"
         f" | workers: {workers}"
     )
+    if rows:
+        print(f"  Resumed: {len(rows)} combos from the sweep cell store")
 
-    rows: list[SweepRow] = []
-    with timed(f"grid ({n} combos)"):
+    with timed(f"grid ({len(todo)} combos)"):
         with ProcessPoolExecutor(max_workers=workers) as pool:
             futures = {
                 pool.submit(
                     _sweep_grid_worker,
-                    p,
+                    grid[i],
                     ohlcv_is,
                     signals_is,
                     ohlcv_oos,
@@ -468,13 +512,21 @@ def run_param_sweep(
                     is_min,
                     atr_sl_multiplier,
                     atr_sl_floor,
-                ): p
-                for p in grid
+                ): i
+                for i in todo
             }
             print("  Running...", end="", flush=True)
             for done, fut in enumerate(as_completed(futures), start=1):
-                rows.append(fut.result())
-                if done % max(1, n // 20) == 0:
+                row = fut.result()
+                rows.append(row)
+                if cells is not None:
+                    kw = _grid_backtest_params(
+                        row.params, fee_pct, atr_sl_multiplier, atr_sl_floor
+                    )
+                    k_is, k_oos = cell_keys[futures[fut]]
+                    put_sweep_cell(cells, k_is, row.is_result, ohlcv_is, kw)
+                    put_sweep_cell(cells, k_oos, row.oos_result, ohlcv_oos, kw)
+                if done % max(1, len(todo) // 20) == 0:
                     print(".", end="", flush=True)
         print(" done")
 
@@ -669,7 +721,7 @@ class AuditRow:
     short_oos_n: int = 0
 
 
-def _audit_strategy_worker(
+def _audit_grid_worker(
     strat: str,
     signals_is: pd.DataFrame,
     signals_oos: pd.DataFrame,
@@ -678,16 +730,33 @@ def _audit_strategy_worker(
     symbol: str,
     timeframe: str,
     tp_values: list[float | int],
-    is_min: int,
     fee_pct: float,
     atr_sl_multiplier: float | None = None,
     atr_sl_floor: bool = False,
-) -> AuditRow:
-    """Per-strategy backtest grid worker — module-level so ProcessPoolExecutor can pickle it.
+) -> list[tuple[BacktestResult, BacktestResult]]:
+    """IS + OOS backtests for each of ``tp_values`` — module-level so ProcessPoolExecutor can pickle it.
 
-    Runs the 9-tp_r × IS+OOS grid for one strategy. All data passed explicitly
-    (no closures) since child processes get a fresh interpreter with no shared state.
+    All data passed explicitly (no closures) since child processes get a fresh
+    interpreter with no shared state.
     """
+    runs: list[tuple[BacktestResult, BacktestResult]] = []
+    for tp_r in tp_values:
+        kw = _grid_backtest_params(
+            {"tp_r": tp_r}, fee_pct, atr_sl_multiplier, atr_sl_floor
+        )
+        bt_is = run_backtest(ohlcv_is, signals_is, symbol, timeframe, strat, **kw)
+        bt_oos = run_backtest(ohlcv_oos, signals_oos, symbol, timeframe, strat, **kw)
+        runs.append((bt_is, bt_oos))
+    return runs
+
+
+def _audit_row(
+    strat: str,
+    tp_values: list[float | int],
+    runs: list[tuple[BacktestResult, BacktestResult]],
+    is_min: int,
+) -> AuditRow:
+    """Pick the best-IS tp_r from one strategy's grid and grade its OOS result."""
     best_is: float | None = None
     best_oos: float | None = None
     best_tp = float(tp_values[0])
@@ -698,32 +767,8 @@ def _audit_strategy_worker(
     best_long_oos_n = 0
     best_short_oos_n = 0
 
-    for tp_r in tp_values:
+    for tp_r, (bt_is, bt_oos) in zip(tp_values, runs, strict=True):
         tp = float(tp_r)
-        bt_is = run_backtest(
-            ohlcv_is,
-            signals_is,
-            symbol,
-            timeframe,
-            strat,
-            sl_pct=0.02,
-            tp_r=tp,
-            fee_pct=fee_pct,
-            atr_sl_multiplier=atr_sl_multiplier,
-            atr_sl_floor=atr_sl_floor,
-        )
-        bt_oos = run_backtest(
-            ohlcv_oos,
-            signals_oos,
-            symbol,
-            timeframe,
-            strat,
-            sl_pct=0.02,
-            tp_r=tp,
-            fee_pct=fee_pct,
-            atr_sl_multiplier=atr_sl_multiplier,
-            atr_sl_floor=atr_sl_floor,
-        )
         is_n = len(bt_is.closed_trades)
         is_r = bt_is.avg_r
         if is_n >= is_min and is_r is not None and (best_is is None or is_r > best_is):
@@ -765,6 +810,37 @@ def _audit_strategy_worker(
     )
 
 
+def _audit_strategy_worker(
+    strat: str,
+    signals_is: pd.DataFrame,
+    signals_oos: pd.DataFrame,
+    ohlcv_is: pd.DataFrame,
+    ohlcv_oos: pd.DataFrame,
+    symbol: str,
+    timeframe: str,
+    tp_values: list[float | int],
+    is_min: int,
+    fee_pct: float,
+    atr_sl_multiplier: float | None = None,
+    atr_sl_floor: bool = False,
+) -> AuditRow:
+    """Per-strategy backtest grid: the tp_r × IS+OOS runs graded into an AuditRow."""
+    runs = _audit_grid_worker(
+        strat,
+        signals_is,
+        signals_oos,
+        ohlcv_is,
+        ohlcv_oos,
+        symbol,
+        timeframe,
+        tp_values,
+        fee_pct,
+        atr_sl_multiplier,
+        atr_sl_floor,
+    )
+    return _audit_row(strat, tp_values, runs, is_min)
+
+
 def run_strategy_audit(
     conn: duckdb.DuckDBPyConnection,
     symbol: str,
@@ -779,8 +855,13 @@ def run_strategy_audit(
     day_filter: str = "off",
     atr_sl_multiplier: float | None = None,
     atr_sl_floor: bool = False,
+    cells: duckdb.DuckDBPyConnection | None = None,
 ) -> list[AuditRow]:
-    """Quick tp_r sweep across all strategies — produces one verdict row per strategy."""
+    """Quick tp_r sweep across all strategies — produces one verdict row per strategy.
+
+    ``cells`` is an optional sweep cell store: stored (strategy, tp_r, IS/OOS)
+    backtests are reused and new ones persisted as each strategy completes.
+    """
     end_ms = int(time.time() * 1000)
     start_ms = since_ms if since_ms is not None else end_ms - days * 24 * 3_600 * 1_000
 
@@ -863,11 +944,54 @@ def run_strategy_audit(
             sigs_oos = sigs[sigs["open_time"] >= split_ts].copy()
             to_submit.append((strat, sigs_is, sigs_oos))
 
-    tp_values_list = [float(v) for v in tp_values]
+    tp_values_list: list[float | int] = [float(v) for v in tp_values]
+
+    def _report(row: AuditRow) -> None:
+        rows.append(row)
+        verdict_label = (
+            row.verdict if row.verdict != "skipped" else f"skipped ({row.skip_reason})"
+        )
+        print(f"  {row.strategy}: {verdict_label}")
+
+    # Content-addressed resume: one cell per (strategy, tp_r, IS/OOS) backtest.
+    pending: dict[
+        str, tuple[dict[float | int, tuple[str, str]], list[float | int]]
+    ] = {}
+    stored: dict[str, BacktestResult] = {}
+    if cells is not None:
+        for strat, sigs_is, sigs_oos in to_submit:
+            keys: dict[float | int, tuple[str, str]] = {}
+            for tp in tp_values_list:
+                kw = _grid_backtest_params(
+                    {"tp_r": tp}, fee_pct, atr_sl_multiplier, atr_sl_floor
+                )
+                keys[tp] = (
+                    sweep_cell_key(symbol, timeframe, strat, ohlcv_is, sigs_is, kw),
+                    sweep_cell_key(symbol, timeframe, strat, ohlcv_oos, sigs_oos, kw),
+                )
+            pending[strat] = (keys, [])
+        stored = get_sweep_cells(
+            cells,
+            [k for keys, _ in pending.values() for pair in keys.values() for k in pair],
+        )
+        for keys, missing in pending.values():
+            missing.extend(
+                tp for tp, pair in keys.items() if not all(k in stored for k in pair)
+            )
+
+    def _runs(strat: str) -> list[tuple[BacktestResult, BacktestResult]]:
+        keys, _ = pending[strat]
+        return [(stored[keys[tp][0]], stored[keys[tp][1]]) for tp in tp_values_list]
+
     with timed("backtest grid"), ProcessPoolExecutor(max_workers=workers) as pool:
-        futures = {
-            pool.submit(
-                _audit_strategy_worker,
+        futures = {}
+        for strat, sigs_is, sigs_oos in to_submit:
+            todo = pending[strat][1] if cells is not None else tp_values_list
+            if not todo:
+                _report(_audit_row(strat, tp_values_list, _runs(strat), is_min))
+                continue
+            fut = pool.submit(
+                _audit_grid_worker,
                 strat,
                 sigs_is,
                 sigs_oos,
@@ -875,24 +999,27 @@ def run_strategy_audit(
                 ohlcv_oos,
                 symbol,
                 timeframe,
-                tp_values_list,
-                is_min,
+                todo,
                 fee_pct,
                 atr_sl_multiplier,
                 atr_sl_floor,
-            ): strat
-            for strat, sigs_is, sigs_oos in to_submit
-        }
-        for fut in as_completed(futures):
-            strat = futures[fut]
-            row = fut.result()
-            rows.append(row)
-            verdict_label = (
-                row.verdict
-                if row.verdict != "skipped"
-                else f"skipped ({row.skip_reason})"
             )
-            print(f"  {strat}: {verdict_label}")
+            futures[fut] = (strat, todo)
+        for fut in as_completed(futures):
+            strat, todo = futures[fut]
+            runs = fut.result()
+            if cells is None:
+                _report(_audit_row(strat, tp_values_list, runs, is_min))
+                continue
+            keys, _ = pending[strat]
+            for tp, (bt_is, bt_oos) in zip(todo, runs, strict=True):
+                kw = _grid_backtest_params(
+                    {"tp_r": tp}, fee_pct, atr_sl_multiplier, atr_sl_floor
+                )
+                put_sweep_cell(cells, keys[tp][0], bt_is, ohlcv_is, kw)
+                put_sweep_cell(cells, keys[tp][1], bt_oos, ohlcv_oos, kw)
+                stored[keys[tp][0]], stored[keys[tp][1]] = bt_is, bt_oos
+            _report(_audit_row(strat, tp_values_list, _runs(strat), is_min))
 
     # Sort: good → marginal → no_data → no_edge → skipped; within tier by OOS avg_r
     _order = {"good": 0, "marginal": 1, "no_data": 2, "no_edge": 3, "skipped": 4}
@@ -1,18 +1,26 @@
 """Pure recalibration logic — maps backtest_runs data to confidence star ratings.
 
 No module-level side effects. No DB writes. No network calls.
+
+The per-cell statistics are DuckDB aggregates: the latest run per
+(strategy, tf, symbol) is picked with ``arg_max`` and the rating / DSR inputs
+(trade counts, win counts, per-trade R moments) are grouped in SQL, so only
+one row per cell reaches Python. Results are memoised on the watermark of the
+tables each one reads (``analytics.store.watermark``) — a recalibration pass
+that reads the same scope several times, or a rerun with no new runs, reuses
+them.
 """
 
 import re
-import statistics
-from collections import defaultdict
 from collections.abc import Mapping
 from pathlib import Path
 
 import duckdb
+import numpy as np
 import pandas as pd
 
-from analytics.research_guards import deflated_sharpe_ratio
+from analytics.research_guards import deflated_sharpe_ratios
+from analytics.store.watermark import WatermarkMemo
 
 # A 5★ cell whose Deflated Sharpe falls below this is overfit-suspect (spec §3;
 # matches the sweep commit-gate threshold in analytics/sweep_guard.py).
@@ -25,6 +33,13 @@ DSR_SUSPECT_THRESHOLD = 0.95
 # every cell's DSR to ~0. Matches audit_guard.DEFAULT_MIN_N / sweep_guard's floor.
 MIN_DSR_TRADES = 30
 
+_memo = WatermarkMemo()
+
+
+def clear_recalibration_cache() -> None:
+    """Drop every memoised recalibration result (tests, or after manual DB edits)."""
+    _memo.clear()
+
 
 def _build_run_filter(
     day_filter: str | None,
@@ -55,6 +70,21 @@ def _build_run_filter(
     return sql, params
 
 
+def _latest_runs_cte(filter_sql: str) -> str:
+    """CTE ``latest(run_id)``: newest in-scope run per (strategy, timeframe, symbol).
+
+    ``arg_max`` is a plain aggregate — ROW_NUMBER() window functions segfault
+    in DuckDB 1.5.x on Python 3.11.
+    """
+    return (
+        "WITH latest AS ("
+        "  SELECT arg_max(run_id, run_at_ms) AS run_id FROM backtest_runs "
+        f"  WHERE closed_trades > 0{filter_sql} "
+        "  GROUP BY strategy, timeframe, symbol"
+        ") "
+    )
+
+
 def get_backtest_win_rates(
     conn: duckdb.DuckDBPyConnection,
     day_filter: str | None = None,
@@ -74,19 +104,31 @@ def get_backtest_win_rates(
     Returns a DataFrame with columns:
         strategy, timeframe, total_trades, win_rate, avg_r
     """
-    # Fetch raw rows and deduplicate in Python to avoid ROW_NUMBER() window
-    # functions, which segfault in DuckDB 1.5.x on Python 3.11.
     filter_sql, params = _build_run_filter(day_filter, adr_suppress_threshold)
-    cursor = conn.execute(
-        f"SELECT strategy, timeframe, symbol, run_at_ms, closed_trades, win_count, avg_r, "
-        f"long_closed_trades, long_win_count, long_avg_r, "
-        f"short_closed_trades, short_win_count, short_avg_r "
-        f"FROM backtest_runs "
-        f"WHERE closed_trades > 0{filter_sql}",
-        params,
+    return _memo.get(
+        conn,
+        ("backtest_runs",),
+        ("win_rates", filter_sql, *params),
+        lambda: _load_win_rates(conn, filter_sql, params),
     )
-    rows = cursor.fetchall()
-    if not rows:
+
+
+def _load_win_rates(
+    conn: duckdb.DuckDBPyConnection, filter_sql: str, params: list[str | float]
+) -> pd.DataFrame:
+    agg = conn.execute(
+        _latest_runs_cte(filter_sql) + "SELECT strategy, timeframe, "
+        "SUM(closed_trades) AS total_trades, SUM(win_count) AS win_count_sum, "
+        "AVG(avg_r) AS avg_r, "
+        "SUM(long_closed_trades) AS long_total_trades, "
+        "SUM(long_win_count) AS long_win_count_sum, AVG(long_avg_r) AS long_avg_r, "
+        "SUM(short_closed_trades) AS short_total_trades, "
+        "SUM(short_win_count) AS short_win_count_sum, AVG(short_avg_r) AS short_avg_r "
+        "FROM backtest_runs JOIN latest USING (run_id) "
+        "GROUP BY strategy, timeframe ORDER BY strategy, timeframe",
+        params,
+    ).df()
+    if agg.empty:
         return pd.DataFrame(
             columns=[
                 "strategy",
@@ -102,45 +144,14 @@ def get_backtest_win_rates(
                 "short_avg_r",
             ]
         )
-
-    raw = pd.DataFrame(
-        rows,
-        columns=[
-            "strategy",
-            "timeframe",
-            "symbol",
-            "run_at_ms",
-            "closed_trades",
-            "win_count",
-            "avg_r",
-            "long_closed_trades",
-            "long_win_count",
-            "long_avg_r",
-            "short_closed_trades",
-            "short_win_count",
-            "short_avg_r",
-        ],
-    )
-    # Keep only the latest run per (strategy, timeframe, symbol)
-    raw = raw.sort_values("run_at_ms", ascending=False).drop_duplicates(
-        subset=["strategy", "timeframe", "symbol"]
-    )
-    # Aggregate across symbols
-    agg = (
-        raw.groupby(["strategy", "timeframe"], sort=True)
-        .agg(
-            total_trades=("closed_trades", "sum"),
-            win_count_sum=("win_count", "sum"),
-            avg_r=("avg_r", "mean"),
-            long_total_trades=("long_closed_trades", "sum"),
-            long_win_count_sum=("long_win_count", "sum"),
-            long_avg_r=("long_avg_r", "mean"),
-            short_total_trades=("short_closed_trades", "sum"),
-            short_win_count_sum=("short_win_count", "sum"),
-            short_avg_r=("short_avg_r", "mean"),
-        )
-        .reset_index()
-    )
+    # Directional sums over all-NULL legacy rows come back NULL; pandas summed them to 0.
+    for col in (
+        "long_total_trades",
+        "long_win_count_sum",
+        "short_total_trades",
+        "short_win_count_sum",
+    ):
+        agg[col] = agg[col].astype(float).fillna(0.0)
     agg["win_rate"] = (agg["win_count_sum"] / agg["total_trades"]).round(4)
     agg["avg_r"] = agg["avg_r"].round(4)
     agg["total_trades"] = agg["total_trades"].astype(int)
@@ -272,42 +283,47 @@ def compute_directional_ratings(
     return result
 
 
-def _sharpe(returns: list[float]) -> float | None:
-    """Per-trade Sharpe ``mean / stdev(ddof=1)``. None when undefined (<2 trades
-    or zero dispersion) — such a cell cannot be deflated and is annotated NULL."""
-    if len(returns) < 2:
-        return None
-    sd = statistics.stdev(returns)
-    if sd == 0.0:
-        return None
-    return statistics.fmean(returns) / sd
+_CELL_MOMENTS_SQL = (
+    "SELECT t.strategy, t.timeframe, "
+    "CASE WHEN GROUPING(t.direction) = 1 THEN 'combined' ELSE t.direction END "
+    "AS scope, "
+    "COUNT(*) AS n, AVG(t.pnl_r) AS mean_r, STDDEV_SAMP(t.pnl_r) AS sd_r "
+    "FROM backtest_trades t JOIN latest USING (run_id) "
+    "WHERE t.outcome <> 'open' AND t.pnl_r IS NOT NULL "
+    "GROUP BY GROUPING SETS ("
+    "  (t.strategy, t.timeframe), (t.strategy, t.timeframe, t.direction)"
+    ") "
+    "ORDER BY t.strategy, t.timeframe"
+)
 
 
 def _scope_dsr(
-    pools: dict[tuple[str, str], list[float]],
-    min_trades: int,
+    cells: pd.DataFrame, min_trades: int
 ) -> dict[tuple[str, str], float | None]:
     """Deflated Sharpe per cell, deflated against the family of all cells' Sharpes.
 
-    The trial family (N + variance) is the per-recalibrate-pass cell set for one
-    direction scope — an **N-FLOOR** on the true search effort (spec §5): the real
-    N spans every sweep that ever produced these runs, so this DSR is *optimistic*.
-    Only cells with ``>= min_trades`` scoreable trades (and a defined Sharpe) join
-    the family and receive a DSR; smaller / degenerate cells are annotated None so
-    their noisy Sharpe cannot poison the deflation benchmark (see MIN_DSR_TRADES).
+    ``cells`` holds one row per (strategy, timeframe) with the SQL moments
+    ``n`` / ``mean_r`` / ``sd_r``; each cell's per-trade Sharpe is
+    ``mean / stdev(ddof=1)``. The trial family (N + variance) is the
+    per-recalibrate-pass cell set for one direction scope — an **N-FLOOR** on
+    the true search effort (spec §5): the real N spans every sweep that ever
+    produced these runs, so this DSR is *optimistic*. Only cells with
+    ``>= min_trades`` scoreable trades and a defined Sharpe (non-zero dispersion)
+    join the family and receive a DSR; smaller / degenerate cells are annotated
+    None so their noisy Sharpe cannot poison the deflation benchmark (see
+    MIN_DSR_TRADES).
     """
-    sharpes = {
-        key: (_sharpe(rets) if len(rets) >= min_trades else None)
-        for key, rets in pools.items()
-    }
-    family = [s for s in sharpes.values() if s is not None]
-    out: dict[tuple[str, str], float | None] = {}
-    for key, sr in sharpes.items():
-        out[key] = (
-            None
-            if sr is None
-            else deflated_sharpe_ratio(sr, len(pools[key]), trial_srs=family)
-        )
+    n = cells["n"].to_numpy(dtype=np.int64)
+    sd = cells["sd_r"].to_numpy(dtype=np.float64)
+    scored = (n >= max(min_trades, 2)) & (sd > 0.0)
+    keys = list(zip(cells["strategy"], cells["timeframe"], strict=True))
+    out: dict[tuple[str, str], float | None] = dict.fromkeys(keys)
+    if not scored.any():
+        return out
+    sharpe = cells["mean_r"].to_numpy(dtype=np.float64)[scored] / sd[scored]
+    dsr = deflated_sharpe_ratios(sharpe, n[scored], trial_srs=sharpe.tolist())
+    for i, value in zip(np.flatnonzero(scored), dsr, strict=True):
+        out[keys[i]] = float(value)
     return out
 
 
@@ -325,56 +341,39 @@ def compute_dsr_ratings(
     A high-star / low-DSR cell is overfit-suspect. Cells/directions with fewer than
     ``min_trades`` scoreable trades are annotated ``None`` (too noisy to deflate
     reliably, and excluded from the family); ``{}`` when there are no runs or trades.
+    The per-cell count / mean / stdev are one grouped DuckDB aggregate.
     """
     filter_sql, params = _build_run_filter(day_filter, adr_suppress_threshold)
-    run_rows = conn.execute(
-        f"SELECT run_id, strategy, timeframe, symbol, run_at_ms FROM backtest_runs "
-        f"WHERE closed_trades > 0{filter_sql}",
-        params,
-    ).fetchall()
-    if not run_rows:
-        return {}
+    return _memo.get(
+        conn,
+        ("backtest_runs", "backtest_trades"),
+        ("dsr", filter_sql, *params, min_trades),
+        lambda: _load_dsr_ratings(conn, filter_sql, params, min_trades),
+    )
 
-    # Keep only the latest run per (strategy, timeframe, symbol) — mirrors
-    # get_backtest_win_rates so DSR and the rated avg_r read the same trades.
-    latest: dict[tuple[str, str, str], tuple[int, str]] = {}
-    for run_id, strategy, tf, symbol, run_at_ms in run_rows:
-        key = (str(strategy), str(tf), str(symbol))
-        cur = latest.get(key)
-        if cur is None or int(run_at_ms) > cur[0]:
-            latest[key] = (int(run_at_ms), str(run_id))
-    run_ids = [v[1] for v in latest.values()]
-
-    placeholders = ",".join("?" * len(run_ids))
-    trade_rows = conn.execute(
-        f"SELECT strategy, timeframe, direction, pnl_r FROM backtest_trades "
-        f"WHERE run_id IN ({placeholders}) AND outcome <> 'open' AND pnl_r IS NOT NULL",
-        run_ids,
-    ).fetchall()
-    if not trade_rows:
-        return {}
 
-    combined: dict[tuple[str, str], list[float]] = defaultdict(list)
-    longs: dict[tuple[str, str], list[float]] = defaultdict(list)
-    shorts: dict[tuple[str, str], list[float]] = defaultdict(list)
-    for strategy, tf, direction, pnl_r in trade_rows:
-        cell = (str(strategy), str(tf))
-        combined[cell].append(float(pnl_r))
-        if direction == "long":
-            longs[cell].append(float(pnl_r))
-        elif direction == "short":
-            shorts[cell].append(float(pnl_r))
-
-    dsr_combined = _scope_dsr(combined, min_trades)
-    dsr_long = _scope_dsr(longs, min_trades)
-    dsr_short = _scope_dsr(shorts, min_trades)
+def _load_dsr_ratings(
+    conn: duckdb.DuckDBPyConnection,
+    filter_sql: str,
+    params: list[str | float],
+    min_trades: int,
+) -> dict[str, dict[str, dict[str, float | None]]]:
+    moments = conn.execute(
+        _latest_runs_cte(filter_sql) + _CELL_MOMENTS_SQL, params
+    ).df()
+    if moments.empty:
+        return {}
 
+    by_scope = {
+        scope: _scope_dsr(
+            moments[moments["scope"] == scope].reset_index(drop=True), min_trades
+        )
+        for scope in ("combined", "long", "short")
+    }
     result: dict[str, dict[str, dict[str, float | None]]] = {}
-    for strategy, tf in combined:
+    for strategy, tf in by_scope["combined"]:
         result.setdefault(strategy, {})[tf] = {
-            "combined": dsr_combined.get((strategy, tf)),
-            "long": dsr_long.get((strategy, tf)),
-            "short": dsr_short.get((strategy, tf)),
+            scope: dsr.get((strategy, tf)) for scope, dsr in by_scope.items()
         }
     return result
 
@@ -415,25 +414,15 @@ def format_recalibration_report(
     # Build lookup: (strategy, tf) → (total_trades, avg_r, win_rate)
     tf_stats: dict[tuple[str, str], tuple[int, float, float]] = {}
     if not win_rates.empty:
-        for _, row in win_rates.iterrows():
-            key = (str(row["strategy"]), str(row["timeframe"]))
-            tf_stats[key] = (
-                int(row["total_trades"]),
-                float(row["avg_r"]),
-                float(row["win_rate"]),
-            )
-
-    # Build directional lookup: (strategy, tf) → (long_avg_r, short_avg_r)
-    dir_stats: dict[tuple[str, str], tuple[float | None, float | None]] = {}
-    if not win_rates.empty and "long_avg_r" in win_rates.columns:
-        for _, row in win_rates.iterrows():
-            key = (str(row["strategy"]), str(row["timeframe"]))
-            lar = row.get("long_avg_r")
-            sar = row.get("short_avg_r")
-            dir_stats[key] = (
-                float(lar) if lar is not None and not pd.isna(lar) else None,
-                float(sar) if sar is not None and not pd.isna(sar) else None,
-            )
+        for strategy, tf, total, avg_r, wr in zip(
+            win_rates["strategy"].astype(str),
+            win_rates["timeframe"].astype(str),
+            win_rates["total_trades"].to_numpy(),
+            win_rates["avg_r"].to_numpy(dtype=float),
+            win_rates["win_rate"].to_numpy(dtype=float),
+            strict=True,
+        ):
+            tf_stats[(strategy, tf)] = (int(total), float(avg_r), float(wr))
 
     all_strategies = sorted(set(old_ratings) | set(new_ratings))
 
@@ -9,10 +9,17 @@ Eager re-exports so callers can do
 ``from analytics.research_guards import deflated_sharpe_ratio, cscv_pbo``.
 """
 
-from analytics.research_guards.bootstrap import BootstrapCI, block_bootstrap_ci
+from analytics.research_guards.bootstrap import (
+    BootstrapCI,
+    batch_mean,
+    batch_sharpe,
+    block_bootstrap_ci,
+    resample_mean_diffs,
+)
 from analytics.research_guards.dsr import (
     EULER_MASCHERONI,
     deflated_sharpe_ratio,
+    deflated_sharpe_ratios,
     expected_max_sharpe,
 )
 from analytics.research_guards.haircut import HaircutResult, haircut_sharpe
@@ -25,11 +32,15 @@ __all__ = [
     "BootstrapCI",
     "HaircutResult",
     "PBOResult",
+    "batch_mean",
+    "batch_sharpe",
     "block_bootstrap_ci",
     "cscv_pbo",
     "deflated_sharpe_ratio",
+    "deflated_sharpe_ratios",
     "expected_max_sharpe",
     "haircut_sharpe",
     "min_track_record_length",
     "probabilistic_sharpe_ratio",
+    "resample_mean_diffs",
 ]
@@ -3,6 +3,12 @@
 Resamples wrap-around blocks of a return series to build a percentile CI for an
 arbitrary statistic, preserving short-range autocorrelation that an iid
 bootstrap would destroy. Pure math (numpy only).
+
+Resamples are built as (chunk, n) index matrices: the random draws are taken
+per resample in the same order as a one-at-a-time loop (so a given ``seed``
+reproduces the same CI), while the block walk and — with a ``batch_stat`` —
+the statistic itself run vectorised over the whole chunk. Chunks bound memory
+to roughly ``_CHUNK_ELEMS`` index entries.
 """
 
 import math
@@ -13,6 +19,11 @@ from typing import Literal
 import numpy as np
 import numpy.typing as npt
 
+# Index-matrix entries per chunk (int64 -> ~16 MB, plus the gathered floats).
+_CHUNK_ELEMS = 2_000_000
+
+type BatchStat = Callable[[npt.NDArray[np.float64]], npt.NDArray[np.float64]]
+
 
 @dataclass(frozen=True)
 class BootstrapCI:
@@ -23,42 +34,77 @@ class BootstrapCI:
     n_valid: int
 
 
-def _stationary_indices(
-    n: int, block: int, rng: np.random.Generator
+def batch_mean(x: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """Row means of a (k, n) resample matrix."""
+    return np.asarray(np.mean(x, axis=1), dtype=np.float64)
+
+
+def batch_sharpe(scale: float = 1.0, min_sd: float = 1e-12) -> BatchStat:
+    """Row-wise ``mean / std(ddof=1) * scale``; 0.0 where std < ``min_sd``."""
+
+    def _stat(x: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        if x.shape[1] < 2:
+            return np.zeros(x.shape[0], dtype=np.float64)
+        sd = np.std(x, axis=1, ddof=1)
+        flat = sd < min_sd
+        out = np.mean(x, axis=1) / np.where(flat, 1.0, sd)
+        return np.where(flat, 0.0, out * scale)
+
+    return _stat
+
+
+def _chunk_rows(n: int) -> int:
+    return max(1, _CHUNK_ELEMS // max(n, 1))
+
+
+def _stationary_index_matrix(
+    k: int, n: int, block: int, rng: np.random.Generator
 ) -> npt.NDArray[np.int64]:
-    """Stationary bootstrap (geometric block length, mean ``block``)."""
+    """``k`` stationary-bootstrap index rows (geometric block length, mean ``block``).
+
+    Row ``b`` equals what the sequential walk would produce for the ``b``-th
+    resample: position ``t`` continues ``(idx[t-1] + 1) % n`` unless its
+    uniform draw restarts it at a fresh random start. With ``s`` the last
+    restart at or before ``t``, ``idx[t] = (start[s] + t - s) % n``.
+    """
     p = 1.0 / block
-    idx = np.empty(n, dtype=np.int64)
-    idx[0] = rng.integers(0, n)
-    draws = rng.random(n)
-    restarts = rng.integers(0, n, size=n)
-    for t in range(1, n):
-        if draws[t] < p:
-            idx[t] = restarts[t]
-        else:
-            idx[t] = (idx[t - 1] + 1) % n
-    return idx
+    draws = np.empty((k, n), dtype=np.float64)
+    starts = np.empty((k, n), dtype=np.int64)
+    for b in range(k):
+        first = rng.integers(0, n)
+        draws[b] = rng.random(n)
+        starts[b] = rng.integers(0, n, size=n)
+        starts[b, 0] = first
+    restart = draws < p
+    restart[:, 0] = True
+    pos = np.arange(n, dtype=np.int64)
+    last = np.maximum.accumulate(np.where(restart, pos, 0), axis=1)
+    picked = np.take_along_axis(starts, last, axis=1)
+    return np.asarray((picked + (pos - last)) % n, dtype=np.int64)
 
 
-def _circular_indices(
-    n: int, block: int, rng: np.random.Generator
+def _circular_index_matrix(
+    k: int, n: int, block: int, rng: np.random.Generator
 ) -> npt.NDArray[np.int64]:
-    """Circular block bootstrap (fixed block length, wrap-around)."""
+    """``k`` circular-block-bootstrap index rows (fixed block length, wrap-around)."""
     n_blocks = math.ceil(n / block)
-    starts = rng.integers(0, n, size=n_blocks)
+    starts = np.empty((k, n_blocks), dtype=np.int64)
+    for b in range(k):
+        starts[b] = rng.integers(0, n, size=n_blocks)
     offsets = np.arange(block)
-    idx = ((starts[:, None] + offsets[None, :]) % n).reshape(-1)
-    return idx[:n].astype(np.int64)
+    idx = ((starts[:, :, None] + offsets[None, None, :]) % n).reshape(k, -1)
+    return np.asarray(idx[:, :n], dtype=np.int64)
 
 
 def block_bootstrap_ci(
     returns: npt.NDArray[np.float64],
-    stat_fn: Callable[[npt.NDArray[np.float64]], float],
+    stat_fn: Callable[[npt.NDArray[np.float64]], float] | None = None,
     n_boot: int = 10_000,
     block: int | None = None,
     alpha: float = 0.05,
     method: Literal["stationary", "circular"] = "stationary",
     seed: int | None = None,
+    batch_stat: BatchStat | None = None,
 ) -> BootstrapCI:
     """Percentile bootstrap CI for ``stat_fn`` over a (possibly serially
     correlated) return series.
@@ -66,7 +112,13 @@ def block_bootstrap_ci(
     ``block`` defaults to ``round(len(returns) ** (1/3))`` and is clamped to
     ``[1, len-1]``. ``stat_fn`` results that are NaN are dropped (tracked via
     ``n_valid``). ``seed`` makes the resampling reproducible.
+
+    ``batch_stat`` is the vectorised form of the statistic — ``(k, n) -> (k,)``
+    over resample rows (``batch_mean``, ``batch_sharpe``) — and replaces the
+    per-resample ``stat_fn`` call when given. One of the two is required.
     """
+    if stat_fn is None and batch_stat is None:
+        raise ValueError("need stat_fn or batch_stat")
     arr = np.asarray(returns, dtype=np.float64)
     n = int(arr.shape[0])
     if n < 2:
@@ -75,20 +127,59 @@ def block_bootstrap_ci(
         block = max(1, round(n ** (1.0 / 3.0)))
     block = max(1, min(block, n - 1))
     rng = np.random.default_rng(seed)
-    point = float(stat_fn(arr))
-    samples: list[float] = []
-    for _ in range(n_boot):
-        if method == "stationary":
-            idx = _stationary_indices(n, block, rng)
+    if stat_fn is not None:
+        point = float(stat_fn(arr))
+    else:
+        assert batch_stat is not None
+        point = float(batch_stat(arr[None, :])[0])
+    index_matrix = (
+        _stationary_index_matrix if method == "stationary" else _circular_index_matrix
+    )
+
+    parts: list[npt.NDArray[np.float64]] = []
+    step = _chunk_rows(n)
+    for lo_b in range(0, n_boot, step):
+        k = min(step, n_boot - lo_b)
+        resampled = arr[index_matrix(k, n, block, rng)]
+        if batch_stat is not None:
+            parts.append(np.asarray(batch_stat(resampled), dtype=np.float64))
         else:
-            idx = _circular_indices(n, block, rng)
-        value = stat_fn(arr[idx])
-        if not math.isnan(value):
-            samples.append(value)
-    if samples:
+            assert stat_fn is not None
+            parts.append(
+                np.fromiter((stat_fn(row) for row in resampled), np.float64, k)
+            )
+    values = np.concatenate(parts) if parts else np.empty(0, dtype=np.float64)
+    samples = values[~np.isnan(values)]
+    if samples.size:
         lo = float(np.quantile(samples, alpha / 2.0))
         hi = float(np.quantile(samples, 1.0 - alpha / 2.0))
     else:
         lo = float("nan")
         hi = float("nan")
-    return BootstrapCI(point=point, lo=lo, hi=hi, alpha=alpha, n_valid=len(samples))
+    return BootstrapCI(
+        point=point, lo=lo, hi=hi, alpha=alpha, n_valid=int(samples.size)
+    )
+
+
+def resample_mean_diffs(
+    a: npt.NDArray[np.float64],
+    b: npt.NDArray[np.float64],
+    n_boot: int,
+    rng: np.random.Generator,
+) -> npt.NDArray[np.float64]:
+    """iid-bootstrap ``mean(a*) - mean(b*)`` for ``n_boot`` resamples.
+
+    Draws all of ``a``'s resample indices before ``b``'s, exactly like
+    ``rng.integers(0, len(a), (n_boot, len(a)))`` followed by the same for
+    ``b``, but in row chunks so memory stays bounded for long samples.
+    """
+    means: list[npt.NDArray[np.float64]] = []
+    for x in (a, b):
+        n = len(x)
+        step = _chunk_rows(n)
+        parts = [
+            x[rng.integers(0, n, (min(step, n_boot - lo_b), n))].mean(axis=1)
+            for lo_b in range(0, n_boot, step)
+        ]
+        means.append(np.concatenate(parts) if parts else np.empty(0))
+    return means[0] - means[1]
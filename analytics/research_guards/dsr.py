@@ -2,6 +2,7 @@
 
 Deflates an observed Sharpe by the expected-maximum Sharpe that ``N`` trials
 would produce by chance, then expresses the result as a PSR. Pure math.
+``deflated_sharpe_ratios`` scores a whole family against one shared benchmark.
 """
 
 import math
@@ -9,6 +10,9 @@ import statistics
 from collections.abc import Sequence
 from statistics import NormalDist
 
+import numpy as np
+import numpy.typing as npt
+
 from analytics.research_guards.psr import probabilistic_sharpe_ratio
 
 EULER_MASCHERONI = 0.5772156649015329
@@ -72,3 +76,36 @@ def deflated_sharpe_ratio(
             raise ValueError("path B requires both n_trials and sr_variance")
         sr0 = expected_max_sharpe(n_trials, sr_variance)
     return probabilistic_sharpe_ratio(sr, n_obs, skew, kurtosis, sr_benchmark=sr0)
+
+
+def deflated_sharpe_ratios(
+    srs: npt.ArrayLike,
+    n_obs: npt.ArrayLike,
+    *,
+    trial_srs: Sequence[float],
+    skew: npt.ArrayLike = 0.0,
+    kurtosis: npt.ArrayLike = 3.0,
+) -> npt.NDArray[np.float64]:
+    """:func:`deflated_sharpe_ratio` for many cells against one trial family.
+
+    The expected-maximum benchmark is derived once from ``trial_srs``; the PSR
+    z-scores are computed element-wise over ``srs`` / ``n_obs`` (and optional
+    per-cell ``skew`` / ``kurtosis``), matching the scalar function cell by cell.
+    """
+    srs_list = list(trial_srs)
+    sr0 = (
+        0.0
+        if len(srs_list) < 2
+        else expected_max_sharpe(len(srs_list), statistics.variance(srs_list))
+    )
+    sr = np.asarray(srs, dtype=np.float64)
+    n = np.asarray(n_obs, dtype=np.float64)
+    if np.any(n < 2):
+        raise ValueError("n_obs must be >= 2")
+    g3 = np.asarray(skew, dtype=np.float64)
+    g4 = np.asarray(kurtosis, dtype=np.float64)
+    variance = 1.0 - g3 * sr + ((g4 - 1.0) / 4.0) * sr * sr
+    if np.any(variance <= 0.0):
+        raise ValueError("degenerate higher moments: non-positive PSR variance term")
+    z = (sr - sr0) * np.sqrt(n - 1) / np.sqrt(variance)
+    return np.array([_NORM.cdf(float(v)) for v in z.ravel()]).reshape(z.shape)
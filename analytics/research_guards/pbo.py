@@ -4,9 +4,14 @@ Combinatorially Symmetric Cross-Validation: split the per-period performance
 matrix into ``n_splits`` blocks, and over every balanced train/test partition
 ask whether the in-sample-best trial stays good out-of-sample. PBO is the
 fraction of partitions where it lands in the bottom half OOS. Pure math.
+
+The default Sharpe metric is decomposable: every partition's per-trial
+mean/std follows from per-block sums, sums of squares and counts, so all
+``C(n_splits, n_splits/2)`` partitions are scored with two small matrix
+products instead of re-stacking blocks per partition. Other metrics go through
+a chunked path that gathers each partition's rows into a 3-D batch.
 """
 
-import math
 from collections.abc import Callable
 from dataclasses import dataclass
 from itertools import combinations
@@ -23,25 +28,6 @@ class PBOResult:
     n_combinations: int
 
 
-def _sharpe(col: npt.NDArray[np.float64]) -> float:
-    """Per-period Sharpe of one trial's returns (the default CSCV metric)."""
-    if col.shape[0] < 2:
-        return 0.0
-    sd = float(np.std(col, ddof=1))
-    if sd == 0.0:
-        return 0.0
-    return float(np.mean(col)) / sd
-
-
-def _relative_rank(values: npt.NDArray[np.float64], target: int, n: int) -> float:
-    """Average-rank relative position of ``target`` in ``values``, in (0, 1)."""
-    v = values[target]
-    less = int(np.sum(values < v))
-    equal = int(np.sum(values == v))  # includes the target itself
-    rank = less + (equal + 1) / 2.0  # 1-indexed average rank
-    return rank / (n + 1)
-
-
 def _ols_slope(x: list[float], y: list[float]) -> float:
     """OLS slope of ``y`` on ``x`` (0.0 when ``x`` has no variance)."""
     xa = np.asarray(x, dtype=np.float64)
@@ -54,17 +40,106 @@ def _ols_slope(x: list[float], y: list[float]) -> float:
     return float(np.sum((xa - xm) * (ya - ym)) / denom)
 
 
+# Partitions gathered per batch by the non-decomposable path; bounds its
+# (chunk, rows, N) stacked rows. Both paths still return full (C, N) scores.
+_CHUNK_PARTITIONS = 512
+
+# A partition std below this fraction of the RMS (after centring) is treated
+# as exactly zero (Sharpe 0.0, as ``np.std(col, ddof=1) == 0`` would give on a
+# constant column) despite sum-of-squares round-off.
+_ZERO_VAR_RTOL = 1e-12
+
+type BatchMetric = Callable[[npt.NDArray[np.float64]], npt.NDArray[np.float64]]
+
+
+def _partitions(n_splits: int) -> npt.NDArray[np.intp]:
+    """(C, n_splits/2) train-block ids, in itertools.combinations order."""
+    half = n_splits // 2
+    return np.array(list(combinations(range(n_splits), half)), dtype=np.intp)
+
+
+def _moment_sharpe(
+    blocks: npt.NDArray[np.float64], train_ids: npt.NDArray[np.intp]
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """(IS, OOS) per-trial Sharpe for every partition from per-block moments."""
+    n_splits, block_size, _ = blocks.shape
+    mu = blocks.mean(axis=(0, 1))
+    centred = blocks - mu
+    sums = centred.sum(axis=1)  # (n_splits, N)
+    sumsq = np.square(centred).sum(axis=1)
+    total_sum = sums.sum(axis=0)
+    total_sumsq = sumsq.sum(axis=0)
+
+    member = np.zeros((train_ids.shape[0], n_splits), dtype=np.float64)
+    np.put_along_axis(member, train_ids, 1.0, axis=1)
+    cnt = float(train_ids.shape[1] * block_size)  # train and test are equal-sized
+
+    def _sharpe_of(
+        s: npt.NDArray[np.float64], q: npt.NDArray[np.float64]
+    ) -> npt.NDArray[np.float64]:
+        mean_c = s / cnt
+        var = (q - s * mean_c) / (cnt - 1.0)
+        zero = var <= _ZERO_VAR_RTOL * (q / cnt)
+        sd = np.sqrt(np.where(zero, 1.0, var))
+        return np.where(zero, 0.0, (mean_c + mu) / sd)
+
+    is_sum = member @ sums
+    is_sq = member @ sumsq
+    return (
+        _sharpe_of(is_sum, is_sq),
+        _sharpe_of(total_sum - is_sum, total_sumsq - is_sq),
+    )
+
+
+def _column_batch(metric: Callable[[npt.NDArray[np.float64]], float]) -> BatchMetric:
+    """Lift a per-column metric to the (k, rows, N) -> (k, N) batch contract."""
+
+    def _batch(x: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        out = np.empty((x.shape[0], x.shape[2]), dtype=np.float64)
+        for k in range(x.shape[0]):
+            for c in range(x.shape[2]):
+                out[k, c] = metric(x[k, :, c])
+        return out
+
+    return _batch
+
+
+def _gathered_scores(
+    blocks: npt.NDArray[np.float64],
+    train_ids: npt.NDArray[np.intp],
+    batch_metric: BatchMetric,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """(IS, OOS) scores by gathering each partition's rows, chunk by chunk."""
+    n_splits, block_size, n_trials = blocks.shape
+    all_ids = np.arange(n_splits)
+    is_out: list[npt.NDArray[np.float64]] = []
+    oos_out: list[npt.NDArray[np.float64]] = []
+    for lo in range(0, train_ids.shape[0], _CHUNK_PARTITIONS):
+        tr = train_ids[lo : lo + _CHUNK_PARTITIONS]
+        mask = np.ones((tr.shape[0], n_splits), dtype=bool)
+        np.put_along_axis(mask, tr, False, axis=1)
+        te = np.broadcast_to(all_ids, mask.shape)[mask].reshape(tr.shape[0], -1)
+        rows = tr.shape[1] * block_size
+        is_out.append(batch_metric(blocks[tr].reshape(tr.shape[0], rows, n_trials)))
+        oos_out.append(batch_metric(blocks[te].reshape(te.shape[0], rows, n_trials)))
+    return np.vstack(is_out), np.vstack(oos_out)
+
+
 def cscv_pbo(
     perf_matrix: npt.NDArray[np.float64],
     n_splits: int = 14,
     metric: Callable[[npt.NDArray[np.float64]], float] | None = None,
+    batch_metric: BatchMetric | None = None,
 ) -> PBOResult:
     """Probability of Backtest Overfitting over a (T_periods, N_trials) matrix.
 
     Splits the ``T`` rows into ``n_splits`` equal blocks (remainder dropped) and
-    iterates every balanced train/test partition — ``C(n_splits, n_splits/2)``
+    scores every balanced train/test partition — ``C(n_splits, n_splits/2)``
     combinations (e.g. ``C(14, 7) = 3432`` at the default). ``metric`` defaults
-    to per-trial Sharpe.
+    to per-trial Sharpe, computed for all partitions at once from block
+    moments. A custom per-column ``metric`` or a vectorised ``batch_metric``
+    (``(k, rows, N) -> (k, N)``, reducing over axis 1) runs on chunks of
+    gathered partitions instead.
     """
     if n_splits < 4 or n_splits % 2 != 0:
         raise ValueError("n_splits must be even and >= 4")
@@ -77,31 +152,32 @@ def cscv_pbo(
     block_size = t_periods // n_splits
     if block_size < 2:
         raise ValueError("not enough periods for n_splits (need >= 2 rows per block)")
-    score = _sharpe if metric is None else metric
 
-    blocks = [m[i * block_size : (i + 1) * block_size] for i in range(n_splits)]
-    half = n_splits // 2
-    logits: list[float] = []
-    is_perf: list[float] = []
-    oos_perf: list[float] = []
-    for train_ids in combinations(range(n_splits), half):
-        train_set = set(train_ids)
-        test_ids = [i for i in range(n_splits) if i not in train_set]
-        train = np.vstack([blocks[i] for i in train_ids])
-        test = np.vstack([blocks[i] for i in test_ids])
-        is_metrics = np.array([score(train[:, c]) for c in range(n_trials)])
-        oos_metrics = np.array([score(test[:, c]) for c in range(n_trials)])
-        n_star = int(np.argmax(is_metrics))
-        omega = _relative_rank(oos_metrics, n_star, n_trials)
-        omega = min(max(omega, 1.0 / (n_trials + 1)), n_trials / (n_trials + 1))
-        logits.append(math.log(omega / (1.0 - omega)))
-        is_perf.append(float(is_metrics[n_star]))
-        oos_perf.append(float(oos_metrics[n_star]))
-
-    pbo = sum(1 for lam in logits if lam <= 0.0) / len(logits)
+    blocks = m[: n_splits * block_size].reshape(n_splits, block_size, n_trials)
+    train_ids = _partitions(n_splits)
+    if batch_metric is not None:
+        is_metrics, oos_metrics = _gathered_scores(blocks, train_ids, batch_metric)
+    elif metric is not None:
+        is_metrics, oos_metrics = _gathered_scores(
+            blocks, train_ids, _column_batch(metric)
+        )
+    else:
+        is_metrics, oos_metrics = _moment_sharpe(blocks, train_ids)
+
+    rows = np.arange(is_metrics.shape[0])
+    n_star = np.argmax(is_metrics, axis=1)
+    oos_star = oos_metrics[rows, n_star]
+    less = np.sum(oos_metrics < oos_star[:, None], axis=1)
+    equal = np.sum(oos_metrics == oos_star[:, None], axis=1)  # includes n_star
+    omega = (less + (equal + 1) / 2.0) / (n_trials + 1)
+    omega = np.clip(omega, 1.0 / (n_trials + 1), n_trials / (n_trials + 1))
+    logits = np.log(omega / (1.0 - omega))
+
     return PBOResult(
-        pbo=pbo,
-        logits=logits,
-        degradation_slope=_ols_slope(is_perf, oos_perf),
-        n_combinations=len(logits),
+        pbo=float(np.mean(logits <= 0.0)),
+        logits=logits.tolist(),
+        degradation_slope=_ols_slope(
+            is_metrics[rows, n_star].tolist(), oos_star.tolist()
+        ),
+        n_combinations=int(logits.shape[0]),
     )
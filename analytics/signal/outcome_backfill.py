@@ -29,12 +29,14 @@ Pure function over conn + now_ms + config dict; no clock or network I/O.
 """
 
 import logging
+from collections.abc import Mapping
 from typing import Any
 
 import duckdb
 import numpy as np
 import pandas as pd
 
+from analytics.backtest.funding import FundingIndex
 from analytics.data_store import get_funding_rates, get_ohlcv
 from analytics.signal._common import parse_timeframe_secs
 
@@ -57,115 +59,57 @@ def _net_outcome_r(
     direction: str,
     entry: float,
     sl_price: float,
-    entry_ts: int,
-    exit_ts: int,
     fee_pct: float,
     slippage_pct: float,
-    funding_times: "np.ndarray[Any, np.dtype[np.int64]] | None",
-    funding_rates: "np.ndarray[Any, np.dtype[np.float64]] | None",
+    funding_sum: float = 0.0,
 ) -> float:
     """net_R = raw_R − fee_R − slippage_R − funding_R, mirroring Trade.pnl_r.
 
     Fee/slippage: 2 legs × pct × entry / risk (engine.py::Trade.pnl_r).
-    Funding: stamps in (entry_ts, exit_ts] via searchsorted side="right" on
-    both ends; long pays positive rates (+side_sign), short receives (−)
-    — engine.py run_backtest's at-close funding block. Zero-risk rows return
-    raw_r untouched: costs in R are undefined when nothing is risked (the
-    engine returns pnl_r=None there; the ledger keeps the row scoreable).
+    Funding: ``funding_sum`` is the rate sum of the stamps in (entry, exit]
+    (``FundingIndex.window``); long pays positive rates (+side_sign), short
+    receives (−) — engine.py run_backtest's at-close funding block. Zero-risk
+    rows return raw_r untouched: costs in R are undefined when nothing is
+    risked (the engine returns pnl_r=None there; the ledger keeps the row
+    scoreable).
     """
     risk = abs(entry - sl_price)
     if risk <= 0.0:
         return raw_r
     drag_r = 2.0 * (fee_pct + slippage_pct) * entry / risk
     funding_r = 0.0
-    if funding_times is not None and funding_rates is not None:
-        lo_i = int(np.searchsorted(funding_times, entry_ts, side="right"))
-        hi_i = int(np.searchsorted(funding_times, exit_ts, side="right"))
-        if hi_i > lo_i:
-            funding_sum = float(funding_rates[lo_i:hi_i].sum())
-            side_sign = 1.0 if direction == "long" else -1.0
-            funding_r = side_sign * funding_sum * entry / risk
+    if funding_sum != 0.0:
+        side_sign = 1.0 if direction == "long" else -1.0
+        funding_r = side_sign * funding_sum * entry / risk
     return raw_r - drag_r - funding_r
 
 
-def _scan_forward(
-    bars: pd.DataFrame,
-    candle_ts_ms: int,
-    direction: str,
-    entry: float,
-    sl_price: float,
-    tp_price: float,
-    rr_ratio: float,
-    max_hold_bars: int,
-    *,
-    fee_pct: float = 0.0,
-    slippage_pct: float = 0.0,
-    funding_times: "np.ndarray[Any, np.dtype[np.int64]] | None" = None,
-    funding_rates: "np.ndarray[Any, np.dtype[np.float64]] | None" = None,
-) -> tuple[str | None, float | None, int | None]:
-    """Decide outcome for one signal given pre-fetched OHLCV bars for its TF.
-
-    Resolved outcome_r is net of costs (P0b PR-3): the same
-    net_R = raw_R − fee_R − slippage_R − funding_R the engine applies in
-    Trade.pnl_r. Defaults (zero costs, no funding) reproduce the historical
-    raw behaviour byte-for-byte.
-    """
-    post = bars[bars["open_time"] > candle_ts_ms].reset_index(drop=True)
-    if post.empty:
-        return None, None, None
-
-    window = post.iloc[:max_hold_bars]
-    h = window["high"].to_numpy()
-    lo = window["low"].to_numpy()
-    t = window["open_time"].to_numpy()
-
-    if direction == "long":
-        sl_idxs = np.nonzero(lo <= sl_price)[0]
-        tp_idxs = np.nonzero(h >= tp_price)[0]
-        sign = 1.0
-    else:
-        sl_idxs = np.nonzero(h >= sl_price)[0]
-        tp_idxs = np.nonzero(lo <= tp_price)[0]
-        sign = -1.0
-
-    sl_first = int(sl_idxs[0]) if len(sl_idxs) else len(t)
-    tp_first = int(tp_idxs[0]) if len(tp_idxs) else len(t)
-
-    # Entry fills at the open of the first post-signal bar — the same
-    # next-bar-open convention as the engine's Trade.entry_time. Anchors
-    # the funding window (entry_ts, exit_ts].
-    entry_ts = int(t[0])
-
-    def _net(raw_r: float, exit_ts: int) -> float:
-        return _net_outcome_r(
-            raw_r,
-            direction=direction,
-            entry=entry,
-            sl_price=sl_price,
-            entry_ts=entry_ts,
-            exit_ts=exit_ts,
-            fee_pct=fee_pct,
-            slippage_pct=slippage_pct,
-            funding_times=funding_times,
-            funding_rates=funding_rates,
-        )
+def _first_hit(hit: "np.ndarray[Any, np.dtype[np.bool_]]") -> "np.ndarray[Any, Any]":
+    """Per-row offset of the first True in ``hit`` (its width when none)."""
+    return np.where(hit.any(axis=1), hit.argmax(axis=1), hit.shape[1])
 
-    if sl_first <= tp_first and sl_first < len(t):
-        exit_ts = int(t[sl_first])
-        return "loss", _net(-1.0, exit_ts), exit_ts
-    if tp_first < len(t):
-        exit_ts = int(t[tp_first])
-        return "win", _net(float(rr_ratio), exit_ts), exit_ts
 
-    # Neither hit within the window so far.
-    if len(window) < max_hold_bars:
-        return None, None, None
+def _group_bars(
+    conn: duckdb.DuckDBPyConnection,
+    symbol: str,
+    tf: str,
+    start_ms: int,
+    now_ms: int,
+    ohlcv_cache: Mapping[tuple[str, str], pd.DataFrame] | None,
+) -> pd.DataFrame:
+    """Bars of (symbol, tf) with ``start_ms <= open_time <= now_ms``.
 
-    sl_dist = abs(entry - sl_price)
-    last_close = float(window["close"].iloc[-1])
-    mtm_r = (last_close - entry) / sl_dist * sign if sl_dist > 0 else 0.0
-    exit_ts_exp = int(t[-1])
-    return "expired", _net(float(mtm_r), exit_ts_exp), exit_ts_exp
+    Served from the daemon's candle cache when it reaches back to
+    ``start_ms``; a cold or too-short cache falls back to DuckDB.
+    """
+    cached = (ohlcv_cache or {}).get((symbol, tf))
+    if cached is not None and not cached.empty:
+        times = cached["open_time"]
+        if int(times.iloc[0]) <= start_ms:
+            return cached[(times >= start_ms) & (times <= now_ms)].reset_index(
+                drop=True
+            )
+    return get_ohlcv(conn, symbol, tf, start_ms, now_ms)
 
 
 def backfill_outcomes(
@@ -175,6 +119,7 @@ def backfill_outcomes(
     *,
     fee_pct: float = 0.0,
     slippage_pct: float = 0.0,
+    ohlcv_cache: Mapping[tuple[str, str], pd.DataFrame] | None = None,
 ) -> dict[str, int]:
     """Resolve unresolved signal_alert_outcomes rows by walking OHLCV forward.
 
@@ -189,86 +134,171 @@ def backfill_outcomes(
     Resolved `outcome_r` is net of costs — `fee_pct` / `slippage_pct` are
     per-leg fractions (same semantics as `BacktestFilterConfig`); defaults
     0.0 keep raw behaviour.
+
+    Incremental: an open row records how far it has been walked —
+    `scanned_through_ms` (last *closed* bar inspected), `scanned_bars` and
+    `entry_bar_ms` — and the next call resumes after that bar instead of
+    re-walking the hold window. A closed bar that hit neither level never
+    changes, so results match a walk from the signal bar; the still-forming
+    last bar is inspected every call but never passes the cursor. Pass the
+    daemon's `ohlcv_cache` to read the new bars from memory.
     """
     hold_map = {**DEFAULT_MAX_HOLD_BARS, **(max_hold_bars_by_tf or {})}
 
-    rows = conn.execute(
+    pending = conn.execute(
         "SELECT signal_id, symbol, tf, direction, candle_ts_ms, "
-        "entry_price, sl_price, tp_price, rr_ratio "
+        "entry_price, sl_price, tp_price, rr_ratio, "
+        "scanned_through_ms, scanned_bars, entry_bar_ms "
         "FROM signal_alert_outcomes "
         "WHERE outcome IS NULL "
         "AND tp_price IS NOT NULL "
         "AND sl_price IS NOT NULL "
         "AND entry_price IS NOT NULL "
         "AND rr_ratio IS NOT NULL"
-    ).fetchall()
+    ).df()
 
     counts = {"win": 0, "loss": 0, "expired": 0, "open": 0, "no_ohlcv": 0}
-    if not rows:
+    if pending.empty:
         return counts
 
     # Group by (symbol, tf) so each TF's OHLCV is fetched once.
-    by_tf: dict[tuple[str, str], list[tuple]] = {}
-    for r in rows:
-        by_tf.setdefault((r[1], r[2]), []).append(r)
-
-    for (symbol, tf), tf_rows in by_tf.items():
-        earliest_candle = min(r[4] for r in tf_rows)
-        tf_secs = parse_timeframe_secs(tf)
-        # Pull bars from one TF-bar after the earliest signal up to now.
-        bars = get_ohlcv(conn, symbol, tf, earliest_candle + tf_secs * 1000, now_ms)
+    for (symbol, tf), rows in pending.groupby(["symbol", "tf"], sort=False):
+        symbol, tf = str(symbol), str(tf)
+        tf_ms = parse_timeframe_secs(tf) * 1000
+        max_hold = hold_map.get(tf, max(hold_map.values()))
+
+        # A cursor at or past the hold window (max_hold lowered since) cannot
+        # be resumed — the expiry bar is behind it — so that row starts over.
+        scanned = rows["scanned_bars"].fillna(0).to_numpy(dtype=np.int64)
+        cursor = rows["scanned_through_ms"].notna().to_numpy() & (scanned < max_hold)
+        scanned = np.where(cursor, scanned, 0)
+        from_ms = np.where(
+            cursor,
+            rows["scanned_through_ms"].fillna(0).to_numpy(dtype=np.int64),
+            rows["candle_ts_ms"].to_numpy(dtype=np.int64),
+        )
+        entry_bar = np.where(
+            cursor, rows["entry_bar_ms"].fillna(0).to_numpy(dtype=np.int64), -1
+        )
+
+        # Pull bars from one TF-bar after the earliest resume point up to now.
+        bars = _group_bars(
+            conn, symbol, tf, int(from_ms.min()) + tf_ms, now_ms, ohlcv_cache
+        )
         if bars.empty:
-            counts["no_ohlcv"] += len(tf_rows)
+            # Rows already walked had bars; only never-walked ones lack them.
+            counts["open"] += int(cursor.sum())
+            counts["no_ohlcv"] += int((~cursor).sum())
             continue
 
-        # Funding stamps for the cost window (P0b PR-3). One fetch per group
-        # spanning earliest signal → now; per-row windows are narrowed in
-        # _net_outcome_r via searchsorted. Empty table (e.g. the OKX
-        # GH-Actions path never ingests funding) → None → funding_r = 0.0.
-        fdf = get_funding_rates(conn, symbol, int(earliest_candle), now_ms)
-        funding_times: np.ndarray[Any, np.dtype[np.int64]] | None
-        funding_rates: np.ndarray[Any, np.dtype[np.float64]] | None
-        if fdf.empty:
-            funding_times = None
-            funding_rates = None
-        else:
-            funding_times = fdf["funding_time"].to_numpy(dtype=np.int64)
-            funding_rates = fdf["funding_rate"].to_numpy(dtype=np.float64)
+        t = bars["open_time"].to_numpy(dtype=np.int64)
+        h = bars["high"].to_numpy(dtype=np.float64)
+        lo = bars["low"].to_numpy(dtype=np.float64)
+        c = bars["close"].to_numpy(dtype=np.float64)
+
+        # Each row's new bars are [start, end): after its cursor (or signal
+        # candle), capped at what is left of its hold window.
+        start = np.searchsorted(t, from_ms, side="right")
+        end = np.minimum(start + (max_hold - scanned), len(t))
+        span = np.arange(max(int((end - start).max()), 0))
+        at = start[:, None] + span
+        valid = at < end[:, None]
+        at = np.minimum(at, len(t) - 1)
+
+        ids = rows["signal_id"].astype(str).tolist()
+        directions = rows["direction"].astype(str).tolist()
+        entries = rows["entry_price"].to_numpy(dtype=np.float64)
+        sl_prices = rows["sl_price"].to_numpy(dtype=np.float64)
+        rr_ratios = rows["rr_ratio"].to_numpy(dtype=np.float64)
+        long = (rows["direction"] == "long").to_numpy()[:, None]
+        sl = sl_prices[:, None]
+        tp = rows["tp_price"].to_numpy(dtype=np.float64)[:, None]
+        sl_first = _first_hit(valid & np.where(long, lo[at] <= sl, h[at] >= sl))
+        tp_first = _first_hit(valid & np.where(long, h[at] >= tp, lo[at] <= tp))
+
+        width = len(span)
+        loss = (sl_first <= tp_first) & (sl_first < width)
+        win = ~loss & (tp_first < width)
+        expired = ~loss & ~win & (scanned + (end - start) >= max_hold)
+        # Entry fills at the open of the first post-signal bar — the same
+        # next-bar-open convention as the engine's Trade.entry_time. Anchors
+        # the funding window (entry, exit].
+        entry_bar = np.where(
+            entry_bar >= 0, entry_bar, t[np.minimum(start, len(t) - 1)]
+        )
 
-        max_hold = hold_map.get(tf, max(hold_map.values()))
-        updates: list[tuple[str, float, int, str]] = []
+        resolved = loss | win | expired
+        exit_at = np.where(
+            loss, start + sl_first, np.where(win, start + tp_first, end - 1)
+        )
+        funding_sums = np.zeros(len(ids))
+        if resolved.any():
+            # Funding stamps for the cost window (P0b PR-3). One fetch per
+            # group spanning the earliest resolving entry → now; every row's
+            # (entry, exit] sum comes from one FundingIndex lookup. Empty
+            # table (e.g. the OKX GH-Actions path never ingests funding) →
+            # funding_r = 0.0.
+            fdf = get_funding_rates(
+                conn, symbol, int(entry_bar[resolved].min()), now_ms
+            )
+            if not fdf.empty:
+                funding = FundingIndex.from_series(
+                    pd.Series(
+                        fdf["funding_rate"].to_numpy(dtype=np.float64),
+                        index=fdf["funding_time"].to_numpy(dtype=np.int64),
+                    )
+                )
+                done = np.flatnonzero(resolved)
+                funding_sums[done] = funding.window(entry_bar[done], t[exit_at[done]])[
+                    1
+                ]
+
+        # Open rows advance their cursor over the closed bars just walked.
+        n_closed = int(np.searchsorted(t, now_ms - tf_ms, side="right"))
+        walked = np.minimum(end, n_closed) - start
 
-        for (
-            signal_id,
-            _sym,
-            _tf,
-            direction,
-            candle_ts_ms,
-            entry_price,
-            sl_price,
-            tp_price,
-            rr_ratio,
-        ) in tf_rows:
-            outcome, outcome_r, filled_at = _scan_forward(
-                bars,
-                int(candle_ts_ms),
-                str(direction),
-                float(entry_price),
-                float(sl_price),
-                float(tp_price),
-                float(rr_ratio),
-                max_hold,
+        updates: list[tuple[str, float, int, str]] = []
+        cursors: list[tuple[int, int, int, str]] = []
+        for i, signal_id in enumerate(ids):
+            if not resolved[i]:
+                counts["open"] += 1
+                if walked[i] > 0:
+                    cursors.append(
+                        (
+                            int(t[start[i] + walked[i] - 1]),
+                            int(scanned[i] + walked[i]),
+                            int(entry_bar[i]),
+                            signal_id,
+                        )
+                    )
+                continue
+            entry = float(entries[i])
+            sl_price = float(sl_prices[i])
+            if loss[i]:
+                outcome, raw_r = "loss", -1.0
+            elif win[i]:
+                outcome, raw_r = "win", float(rr_ratios[i])
+            else:
+                sl_dist = abs(entry - sl_price)
+                sign = 1.0 if directions[i] == "long" else -1.0
+                mtm_r = (
+                    (float(c[exit_at[i]]) - entry) / sl_dist * sign
+                    if sl_dist > 0
+                    else 0.0
+                )
+                outcome, raw_r = "expired", float(mtm_r)
+            exit_ts = int(t[exit_at[i]])
+            outcome_r = _net_outcome_r(
+                raw_r,
+                direction=directions[i],
+                entry=entry,
+                sl_price=sl_price,
                 fee_pct=fee_pct,
                 slippage_pct=slippage_pct,
-                funding_times=funding_times,
-                funding_rates=funding_rates,
+                funding_sum=float(funding_sums[i]),
             )
-            if outcome is None:
-                counts["open"] += 1
-                continue
             counts[outcome] += 1
-            assert outcome_r is not None and filled_at is not None
-            updates.append((outcome, outcome_r, filled_at, str(signal_id)))
+            updates.append((outcome, outcome_r, exit_ts, signal_id))
 
         if updates:
             conn.executemany(
@@ -277,6 +307,13 @@ def backfill_outcomes(
                 "WHERE signal_id = ?",
                 updates,
             )
+        if cursors:
+            conn.executemany(
+                "UPDATE signal_alert_outcomes "
+                "SET scanned_through_ms = ?, scanned_bars = ?, entry_bar_ms = ? "
+                "WHERE signal_id = ?",
+                cursors,
+            )
 
     total_resolved = counts["win"] + counts["loss"] + counts["expired"]
     if total_resolved:
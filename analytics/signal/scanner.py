@@ -18,11 +18,7 @@ from typing import Any
 import duckdb
 import pandas as pd
 
-from analytics.backtest_lib import (
-    BacktestResult,
-    _is_low_volume,
-    _is_volume_spike,
-)
+from analytics.backtest_lib import BacktestResult
 from analytics.cme_gap_lib import cme_gap_alert_warning, get_recent_cme_gap
 from analytics.data_store import (
     BacktestSnapshot,
@@ -36,7 +32,8 @@ from analytics.data_store import (
     upsert_signal_outcome,
     upsert_signals,
 )
-from analytics.regime import Regime, classify_series
+from analytics.features import FeatureFrame
+from analytics.regime import Regime
 from analytics.signal._common import (
     _SCAN_WINDOW,
     _bt_mem_cache,
@@ -445,7 +442,7 @@ def run_scan_cycle(
             if _df is None or _df.empty or len(_df) < 2:
                 continue
             try:
-                _series = classify_series(_df, _r_tf)
+                _series = FeatureFrame.of(_df).regime(_r_tf)
             except ValueError:
                 # Unsupported timeframe — fall open.
                 continue
@@ -740,6 +737,7 @@ def run_scan_cycle(
         #   so alert_formatter can show ⚡ even when suppression is off.
         if backtest_cfg:
             vol_time_to_idx: dict[int, int] | None = None
+            vol_features = FeatureFrame.of(ohlcv_df)
             vol_filtered: list[SignalEvent] = []
             for _e in passing_events:
                 if vol_time_to_idx is None:
@@ -748,7 +746,7 @@ def run_scan_cycle(
                         for i, t in enumerate(ohlcv_df["open_time"].astype("int64"))
                     }
                 _idx = vol_time_to_idx.get(int(_e.open_time), 0)
-                if _is_volume_spike(ohlcv_df, _idx):
+                if vol_features.volume_spike(_idx):
                     _e.volume_spike = True
                 # Direction-aware suppress: directional fields take precedence over symmetric.
                 _dir = _e.direction
@@ -767,7 +765,7 @@ def run_scan_cycle(
                         strategy_params, _e.strategy, backtest_cfg.volume_suppress
                     )
                 )
-                if _suppress and _is_low_volume(ohlcv_df, _idx):
+                if _suppress and vol_features.low_volume(_idx):
                     logger.info(
                         "Volume filter suppressed %s %s — %s %s",
                         symbol,
@@ -378,12 +378,14 @@ def run_signal_watch(
                 )
 
                 # T2 P2: walk OHLCV forward to resolve outstanding outcome rows.
-                # Reuses the same write conn; cheap (single SELECT + per-TF
-                # OHLCV reads). Failure is logged but never blocks the cycle.
+                # Reuses the same write conn; cheap (single SELECT, new bars
+                # since each row's cursor read from the OHLCV cache). Failure
+                # is logged but never blocks the cycle.
                 try:
                     backfill_outcomes(
                         conn,
                         now_ms=now_ms,
+                        ohlcv_cache=ohlcv_cache,
                         fee_pct=backtest_cfg.fee_pct if backtest_cfg else 0.0,
                         slippage_pct=backtest_cfg.slippage_pct if backtest_cfg else 0.0,
                     )
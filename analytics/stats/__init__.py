@@ -9,6 +9,12 @@ from analytics.stats.hourly import (
     HourlyResult,
     compute_hourly_extremes,
 )
+from analytics.stats.live_fields import (
+    clear_live_reference_cache,
+    live_daily_distance,
+    live_weekly_current_state,
+    live_weekly_wick_percentile,
+)
 from analytics.stats.live_outcomes import (
     LiveOutcomeCell,
     LiveOutcomesResult,
@@ -59,6 +65,7 @@ __all__ = [
     "WeeklyP1P2Result",
     "WeeklyP2Timing",
     "WeeklyWickPercentile",
+    "clear_live_reference_cache",
     "compute_adr",
     "compute_all",
     "compute_daily_distance",
@@ -72,4 +79,7 @@ __all__ = [
     "compute_weekly_p1p2",
     "compute_weekly_p2_timing",
     "compute_weekly_wick_percentile",
+    "live_daily_distance",
+    "live_weekly_current_state",
+    "live_weekly_wick_percentile",
 ]
@@ -35,3 +35,12 @@ _ISODOW_TO_SHORT = ["", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
 def _start_ms(days: int) -> int:
     """Return Unix ms timestamp for `days` ago from now."""
     return int((datetime.now(tz=UTC) - timedelta(days=days)).timestamp() * 1000)
+
+
+def _current_week_start_ms() -> int:
+    """Return Unix ms of Monday 00:00 MYT for the current ISO week."""
+    now_myt = datetime.now(tz=UTC) + timedelta(hours=MYT_OFFSET_HOURS)
+    week_start_myt = (now_myt - timedelta(days=now_myt.weekday())).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    return int((week_start_myt - timedelta(hours=MYT_OFFSET_HOURS)).timestamp() * 1000)
@@ -1,5 +1,6 @@
 """Daily distance — empirical CDF for today's daily move size vs ADR14 distribution."""
 
+from bisect import bisect_right
 from dataclasses import dataclass
 
 import duckdb
@@ -12,7 +13,7 @@ class DailyDistanceResult:
     """Empirical CDF for today's daily move size vs ADR14 historical distribution.
 
     Given today's current move (as × ADR14), how extreme is it historically?
-    Not cached — computed fresh on every API request.
+    Not cached — the current-day position is computed fresh on every API request.
     """
 
     exceedance_pct: (
@@ -25,68 +26,103 @@ class DailyDistanceResult:
     sample_count: int
 
 
-def compute_daily_distance(
+_MS_PER_DAY = 86_400_000
+
+
+@dataclass(frozen=True)
+class DailyDistanceReference:
+    """Historical half of compute_daily_distance — stable for the whole UTC day.
+
+    ranges_pct holds each completed day's (high - low) / open before
+    day_start_ms, ascending. ADR normalisation happens per request.
+    """
+
+    day_start_ms: int
+    ranges_pct: tuple[float, ...]
+
+
+def latest_daily_range(
     conn: duckdb.DuckDBPyConnection,
     symbol: str,
-    adr_14: float,
-    days: int = 180,
-) -> "DailyDistanceResult | None":
-    """Compute exceedance probability for today's move vs historical daily moves.
-
-    Queries the last `days` days, normalises each completed day's range by adr_14,
-    then returns where today's partial move sits in that empirical CDF.
+    start_ms: int,
+) -> tuple[int, float, float, float] | None:
+    """Return (day_start_ms, high, low, open) for the newest UTC day in the window.
 
-    Returns None if adr_14 == 0 or insufficient data.
-    Not intended for caching — call fresh on every API request.
+    Only that day's candles are aggregated — this is the per-request part.
     """
-    if adr_14 <= 0:
+    latest = conn.execute(
+        """
+        SELECT MAX(open_time) FROM ohlcv
+        WHERE symbol = $symbol AND timeframe = '1h' AND open_time >= $start_ms
+        """,
+        {"symbol": symbol, "start_ms": start_ms},
+    ).fetchone()
+    if latest is None or latest[0] is None:
+        return None
+    day_start_ms = int(latest[0]) - int(latest[0]) % _MS_PER_DAY
+    row = conn.execute(
+        """
+        SELECT MAX(high), MIN(low), FIRST(open ORDER BY open_time)
+        FROM ohlcv
+        WHERE symbol = $symbol AND timeframe = '1h'
+          AND open_time >= $start_ms AND open_time >= $day_start
+        """,
+        {"symbol": symbol, "start_ms": start_ms, "day_start": day_start_ms},
+    ).fetchone()
+    if row is None or row[0] is None:
         return None
+    return day_start_ms, float(row[0]), float(row[1]), float(row[2])
 
-    start = _start_ms(days)
+
+def load_daily_distance_reference(
+    conn: duckdb.DuckDBPyConnection,
+    symbol: str,
+    start_ms: int,
+    day_start_ms: int,
+) -> DailyDistanceReference:
+    """Aggregate every completed day in [start_ms, day_start_ms) into range fractions."""
     rows = conn.execute(
         """
-        WITH daily AS (
-            SELECT
-                (epoch_ms(open_time)::TIMESTAMP)::DATE AS trade_date,
-                MAX(high) AS day_high, MIN(low) AS day_low,
-                FIRST(open ORDER BY open_time) AS day_open
-            FROM ohlcv
-            WHERE symbol = $symbol AND timeframe = '1h'
-              AND open_time >= $start_ms
-            GROUP BY trade_date
-            ORDER BY trade_date DESC
-        )
-        SELECT trade_date, day_high, day_low, day_open
-        FROM daily
+        SELECT
+            (epoch_ms(open_time)::TIMESTAMP)::DATE AS trade_date,
+            MAX(high) AS day_high, MIN(low) AS day_low,
+            FIRST(open ORDER BY open_time) AS day_open
+        FROM ohlcv
+        WHERE symbol = $symbol AND timeframe = '1h'
+          AND open_time >= $start_ms AND open_time < $day_start
+        GROUP BY trade_date
         """,
-        {"symbol": symbol, "start_ms": start},
+        {"symbol": symbol, "start_ms": start_ms, "day_start": day_start_ms},
     ).fetchall()
-
-    if len(rows) < 2:
-        return None
-
-    # rows[0] = today (newest, possibly partial); rows[1:] = completed historical days
-    historical: list[float] = []
-    for _date, day_high, day_low, day_open in rows[1:]:
+    ranges: list[float] = []
+    for _date, day_high, day_low, day_open in rows:
         open_f = float(day_open)
         if open_f <= 0:
             continue
-        range_pct = (float(day_high) - float(day_low)) / open_f
-        historical.append(range_pct / adr_14)
+        ranges.append((float(day_high) - float(day_low)) / open_f)
+    return DailyDistanceReference(
+        day_start_ms=day_start_ms, ranges_pct=tuple(sorted(ranges))
+    )
 
-    if not historical:
-        return None
 
-    today_open = float(rows[0][3])
+def daily_distance_from_reference(
+    ref: DailyDistanceReference,
+    today: tuple[int, float, float, float],
+    adr_14: float,
+) -> "DailyDistanceResult | None":
+    """Place today's partial range in the reference's empirical CDF."""
+    if adr_14 <= 0 or not ref.ranges_pct:
+        return None
+    _day_start, today_high, today_low, today_open = today
     if today_open <= 0:
         return None
-    today_range_pct = (float(rows[0][1]) - float(rows[0][2])) / today_open
-    current_of_adr = today_range_pct / adr_14
-
-    exceedance = sum(1 for h in historical if h > current_of_adr) / len(historical)
+    current_of_adr = (today_high - today_low) / today_open / adr_14
 
-    sorted_hist = sorted(historical)
+    # ranges_pct is ascending and dividing by adr_14 > 0 keeps it that way.
+    sorted_hist = [r / adr_14 for r in ref.ranges_pct]
     n = len(sorted_hist)
+    exceedance = (n - bisect_right(sorted_hist, current_of_adr)) / n
+
     idx = (n - 1) * 0.8
     lo, hi = int(idx), min(int(idx) + 1, n - 1)
     frac = idx - lo
@@ -98,5 +134,32 @@ def compute_daily_distance(
         exceedance_pct=exceedance,
         p80_of_adr=p80,
         gap_to_p80=gap_to_p80,
-        sample_count=len(historical),
+        sample_count=n,
     )
+
+
+def compute_daily_distance(
+    conn: duckdb.DuckDBPyConnection,
+    symbol: str,
+    adr_14: float,
+    days: int = 180,
+) -> "DailyDistanceResult | None":
+    """Compute exceedance probability for today's move vs historical daily moves.
+
+    Queries the last `days` days, normalises each completed day's range by adr_14,
+    then returns where today's (newest day's, possibly partial) move sits in that
+    empirical CDF.
+
+    Returns None if adr_14 == 0 or insufficient data.
+    Uncached: the web API splits this into a per-day cached
+    load_daily_distance_reference plus a per-request latest_daily_range.
+    """
+    if adr_14 <= 0:
+        return None
+
+    start = _start_ms(days)
+    today = latest_daily_range(conn, symbol, start)
+    if today is None:
+        return None
+    ref = load_daily_distance_reference(conn, symbol, start, today[0])
+    return daily_distance_from_reference(ref, today, adr_14)
@@ -0,0 +1,128 @@
+"""Live stats fields with per-day cached historical references.
+
+compute_weekly_current_state / compute_daily_distance / compute_weekly_wick_percentile
+each split into a historical reference (a full-window aggregation that only
+changes when a day rolls over) and a current position computed from the latest
+candles. The web Stats page calls these on every request, so the references are
+memoised in-process per (symbol, days, MYT date, ...) and only the small
+current-day/current-week queries hit DuckDB per request.
+
+Results are identical to the uncached compute_* functions except that the
+references are frozen at their first computation of the day.
+"""
+
+import threading
+from collections.abc import Callable
+from typing import Any
+
+import duckdb
+
+from analytics.stats._common import _current_week_start_ms, _start_ms
+from analytics.stats.daily_distance import (
+    DailyDistanceResult,
+    daily_distance_from_reference,
+    latest_daily_range,
+    load_daily_distance_reference,
+)
+from analytics.stats.weekly_state import (
+    WeeklyCurrentState,
+    fetch_current_week_open_close,
+    load_weekly_state_reference,
+    weekly_state_from_reference,
+)
+from analytics.stats.weekly_wick import (
+    WeeklyWickPercentile,
+    fetch_current_week_p1_candle,
+    load_weekly_wick_reference,
+    weekly_wick_from_reference,
+)
+
+_ref_cache: dict[tuple[Any, ...], Any] = {}
+_ref_cache_lock = threading.Lock()
+
+
+def clear_live_reference_cache() -> None:
+    """Drop every cached reference (tests, or after a bulk backfill)."""
+    with _ref_cache_lock:
+        _ref_cache.clear()
+
+
+def _cached_reference[T](key: tuple[Any, ...], loader: Callable[[], T]) -> T:
+    """Return the cached reference for key, loading it on miss.
+
+    key[0] is the MYT date string; a new date evicts every older entry.
+    """
+    with _ref_cache_lock:
+        if key in _ref_cache:
+            ref: T = _ref_cache[key]
+            return ref
+    ref = loader()
+    with _ref_cache_lock:
+        stale = [k for k in _ref_cache if k[0] != key[0]]
+        for k in stale:
+            del _ref_cache[k]
+        _ref_cache[key] = ref
+    return ref
+
+
+def live_weekly_current_state(
+    conn: duckdb.DuckDBPyConnection,
+    symbol: str,
+    adr_14: float,
+    days: int,
+    date_str: str,
+) -> WeeklyCurrentState | None:
+    """Cached-reference equivalent of compute_weekly_current_state."""
+    open_close = fetch_current_week_open_close(conn, symbol, _current_week_start_ms())
+    if open_close is None:
+        return None
+    ref = _cached_reference(
+        (date_str, "weekly_state", symbol, days, adr_14),
+        lambda: load_weekly_state_reference(conn, symbol, adr_14, _start_ms(days)),
+    )
+    return weekly_state_from_reference(ref, open_close)
+
+
+def live_daily_distance(
+    conn: duckdb.DuckDBPyConnection,
+    symbol: str,
+    adr_14: float,
+    days: int,
+    date_str: str,
+) -> DailyDistanceResult | None:
+    """Cached-reference equivalent of compute_daily_distance.
+
+    The reference is also keyed by the newest UTC day, which rolls at 08:00
+    MYT — mid-way through the MYT date.
+    """
+    if adr_14 <= 0:
+        return None
+    start = _start_ms(days)
+    today = latest_daily_range(conn, symbol, start)
+    if today is None:
+        return None
+    ref = _cached_reference(
+        (date_str, "daily_distance", symbol, days, today[0]),
+        lambda: load_daily_distance_reference(conn, symbol, start, today[0]),
+    )
+    return daily_distance_from_reference(ref, today, adr_14)
+
+
+def live_weekly_wick_percentile(
+    conn: duckdb.DuckDBPyConnection,
+    symbol: str,
+    adr_14: float,
+    days: int,
+    date_str: str,
+) -> WeeklyWickPercentile:
+    """Cached-reference equivalent of compute_weekly_wick_percentile."""
+    ref = _cached_reference(
+        (date_str, "weekly_wick", symbol, days),
+        lambda: load_weekly_wick_reference(conn, symbol, _start_ms(days)),
+    )
+    current = (
+        fetch_current_week_p1_candle(conn, symbol, _current_week_start_ms())
+        if adr_14 > 0 and ref.wicks_of_open
+        else None
+    )
+    return weekly_wick_from_reference(ref, current, adr_14)
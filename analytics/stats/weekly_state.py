@@ -5,14 +5,19 @@ from datetime import UTC, datetime, timedelta
 
 import duckdb
 
-from analytics.stats._common import _ISODOW_TO_SHORT, MYT_OFFSET_HOURS, _start_ms
+from analytics.stats._common import (
+    _ISODOW_TO_SHORT,
+    MYT_OFFSET_HOURS,
+    _current_week_start_ms,
+    _start_ms,
+)
 
 
 @dataclass
 class WeeklyCurrentState:
     """Live current-week position — distance-conditioned P2 probability.
 
-    Not cached — computed fresh on every API request.
+    Not cached — the current-week position is computed fresh on every API request.
     """
 
     current_isodow: int  # 1=Mon … 7=Sun
@@ -25,76 +30,56 @@ class WeeklyCurrentState:
     high_still_ahead_conditioned: float | None  # P(high still ahead | DOW, bucket)
 
 
-def compute_weekly_current_state(
-    conn: duckdb.DuckDBPyConnection,
-    symbol: str,
-    adr_14: float,
-    days: int = 180,
-) -> "WeeklyCurrentState | None":
-    """Compute live current-week state with distance-conditioned P2 probability.
+@dataclass(frozen=True)
+class WeeklyStateReference:
+    """Historical half of compute_weekly_current_state — stable for the day.
 
-    Returns None if the current week has no OHLCV data yet.
-    Not intended for caching — call fresh on every API request.
-
-    move_bucket thresholds (symbol-agnostic via ADR14 normalisation):
-        small  = |move_pct| < 1× adr_14
-        medium = |move_pct| < 2× adr_14
-        large  = |move_pct| >= 2× adr_14
+    lookup maps (isodow, move_bucket) → (P(low still ahead), P(high still ahead)),
+    with buckets cut at 1× / 2× the adr_14 the reference was built with.
     """
-    now_utc = datetime.now(tz=UTC)
-    now_myt = now_utc + timedelta(hours=MYT_OFFSET_HOURS)
 
-    # Current ISO day-of-week in MYT (1=Mon … 7=Sun)
-    current_isodow = now_myt.isoweekday()
-    current_dow = _ISODOW_TO_SHORT[current_isodow]
+    adr_14: float
+    lookup: dict[tuple[int, str], tuple[float, float]]
 
-    # Monday 00:00 MYT of current week → UTC ms for DB query
-    days_since_monday = now_myt.weekday()  # 0 = Monday
-    week_start_myt = (now_myt - timedelta(days=days_since_monday)).replace(
-        hour=0, minute=0, second=0, microsecond=0
-    )
-    week_start_ms = int(
-        (week_start_myt - timedelta(hours=MYT_OFFSET_HOURS)).timestamp() * 1000
-    )
 
-    # Weekly open = first 1h candle open on/after week start
-    open_row = conn.execute(
-        """
-        SELECT open FROM ohlcv
-        WHERE symbol = $symbol AND timeframe = '1h' AND open_time >= $week_start
-        ORDER BY open_time ASC LIMIT 1
-        """,
-        {"symbol": symbol, "week_start": week_start_ms},
-    ).fetchone()
-    if open_row is None:
-        return None
-    weekly_open = float(open_row[0])
+def _move_bucket(move_pct: float, adr_14: float) -> str:
+    abs_move = abs(move_pct)
+    if abs_move < adr_14:
+        return "small"
+    if abs_move < 2.0 * adr_14:
+        return "medium"
+    return "large"
 
-    # Current price = latest 1h close within the current week
-    price_row = conn.execute(
+
+def fetch_current_week_open_close(
+    conn: duckdb.DuckDBPyConnection,
+    symbol: str,
+    week_start_ms: int,
+) -> tuple[float, float] | None:
+    """Return (weekly_open, latest_close) from the current week's 1h candles."""
+    row = conn.execute(
         """
-        SELECT close FROM ohlcv
+        SELECT arg_min(open, open_time), arg_max(close, open_time)
+        FROM ohlcv
         WHERE symbol = $symbol AND timeframe = '1h' AND open_time >= $week_start
-        ORDER BY open_time DESC LIMIT 1
         """,
         {"symbol": symbol, "week_start": week_start_ms},
     ).fetchone()
-    if price_row is None:
+    if row is None or row[0] is None or row[1] is None:
         return None
-    current_price = float(price_row[0])
+    return float(row[0]), float(row[1])
 
-    move_pct = (current_price - weekly_open) / weekly_open
-    abs_move = abs(move_pct)
-    if abs_move < adr_14:
-        move_bucket = "small"
-    elif abs_move < 2.0 * adr_14:
-        move_bucket = "medium"
-    else:
-        move_bucket = "large"
-
-    # Historical conditioned probability lookup:
-    # P(low/high still ahead | today=DOW X AND weekly move so far = bucket Y)
-    start_ms = _start_ms(days)
+
+def load_weekly_state_reference(
+    conn: duckdb.DuckDBPyConnection,
+    symbol: str,
+    adr_14: float,
+    start_ms: int,
+) -> WeeklyStateReference:
+    """Historical conditioned probability lookup since start_ms.
+
+    P(low/high still ahead | today=DOW X AND weekly move so far = bucket Y)
+    """
     adr_medium = 2.0 * adr_14
 
     lookup_rows = conn.execute(
@@ -201,12 +186,25 @@ def compute_weekly_current_state(
             float(low_pct) if low_pct is not None else 0.0,
             float(high_pct) if high_pct is not None else 0.0,
         )
-
-    conditioned = lookup.get((current_isodow, move_bucket))
+    return WeeklyStateReference(adr_14=adr_14, lookup=lookup)
+
+
+def weekly_state_from_reference(
+    ref: WeeklyStateReference,
+    open_close: tuple[float, float],
+) -> WeeklyCurrentState:
+    """Bucket the current week's move and look up its conditioned probabilities."""
+    current_isodow = (
+        datetime.now(tz=UTC) + timedelta(hours=MYT_OFFSET_HOURS)
+    ).isoweekday()
+    weekly_open, current_price = open_close
+    move_pct = (current_price - weekly_open) / weekly_open
+    move_bucket = _move_bucket(move_pct, ref.adr_14)
+    conditioned = ref.lookup.get((current_isodow, move_bucket))
 
     return WeeklyCurrentState(
         current_isodow=current_isodow,
-        current_dow=current_dow,
+        current_dow=_ISODOW_TO_SHORT[current_isodow],
         weekly_open=weekly_open,
         current_price=current_price,
         move_pct=move_pct,
@@ -216,3 +214,27 @@ def compute_weekly_current_state(
         if conditioned is not None
         else None,
     )
+
+
+def compute_weekly_current_state(
+    conn: duckdb.DuckDBPyConnection,
+    symbol: str,
+    adr_14: float,
+    days: int = 180,
+) -> "WeeklyCurrentState | None":
+    """Compute live current-week state with distance-conditioned P2 probability.
+
+    Returns None if the current week has no OHLCV data yet.
+    Uncached: the web API caches load_weekly_state_reference per day and only
+    runs fetch_current_week_open_close per request.
+
+    move_bucket thresholds (symbol-agnostic via ADR14 normalisation):
+        small  = |move_pct| < 1× adr_14
+        medium = |move_pct| < 2× adr_14
+        large  = |move_pct| >= 2× adr_14
+    """
+    open_close = fetch_current_week_open_close(conn, symbol, _current_week_start_ms())
+    if open_close is None:
+        return None
+    ref = load_weekly_state_reference(conn, symbol, adr_14, _start_ms(days))
+    return weekly_state_from_reference(ref, open_close)
@@ -1,18 +1,18 @@
 """Weekly wick percentile — exceedance for current week's P1 wick vs historical."""
 
+from bisect import bisect_right
 from dataclasses import dataclass
-from datetime import UTC, datetime, timedelta
 
 import duckdb
 
-from analytics.stats._common import MYT_OFFSET_HOURS, _start_ms
+from analytics.stats._common import _current_week_start_ms, _start_ms
 
 
 @dataclass
 class WeeklyWickPercentile:
     """Live exceedance probability for current week's P1 wick vs historical P1 wicks.
 
-    Not cached — computed fresh on every API request.
+    Not cached — the current-week rank is computed fresh on every API request.
     """
 
     current_wick_of_adr: (
@@ -71,61 +71,50 @@ def _fetch_p1_candle_data(
     return raw
 
 
-def compute_weekly_wick_percentile(
-    conn: duckdb.DuckDBPyConnection,
-    symbol: str,
-    adr_14: float,
-    days: int = 180,
-) -> WeeklyWickPercentile:
-    """Compute exceedance probability for current week's P1 wick vs historical P1 wicks.
-
-    Historical: wick / open / adr_14 for each historical week where P1 is identified.
-    Current: same metric for the current (possibly incomplete) week.
+@dataclass(frozen=True)
+class WeeklyWickReference:
+    """Historical half of compute_weekly_wick_percentile — stable for the day.
 
-    Returns WeeklyWickPercentile with None fields if:
-    - adr_14 == 0
-    - no historical data
-    - current week's P1 has not been set yet (only one extreme formed so far)
-    Not intended for caching — call fresh on every API request.
+    wicks_of_open holds each identified week's P1 wick / open, ascending.
+    ADR normalisation happens per request.
     """
-    if adr_14 <= 0:
-        return WeeklyWickPercentile(
-            current_wick_of_adr=None,
-            exceedance_pct=None,
-            p1_direction=None,
-            sample_count=0,
-        )
 
-    start = _start_ms(days)
-    candle_rows = _fetch_p1_candle_data(conn, symbol, start)
-    if not candle_rows:
-        return WeeklyWickPercentile(
-            current_wick_of_adr=None,
-            exceedance_pct=None,
-            p1_direction=None,
-            sample_count=0,
-        )
+    wicks_of_open: tuple[float, ...]
+
+
+def _wick(p1_dir: str, high: float, low: float, open_: float, close: float) -> float:
+    return min(open_, close) - low if p1_dir == "low" else high - max(open_, close)
+
 
-    historical: list[float] = []
-    for p1_dir, high, low, open_, close in candle_rows:
-        high, low, open_, close = float(high), float(low), float(open_), float(close)
-        if open_ <= 0:
+def load_weekly_wick_reference(
+    conn: duckdb.DuckDBPyConnection,
+    symbol: str,
+    start_ms: int,
+) -> WeeklyWickReference:
+    """Collect every historical P1 wick (as a fraction of the candle open) since start_ms."""
+    wicks: list[float] = []
+    for p1_dir, high, low, open_, close in _fetch_p1_candle_data(
+        conn, symbol, start_ms
+    ):
+        open_f = float(open_)
+        if open_f <= 0:
             continue
-        wick = min(open_, close) - low if p1_dir == "low" else high - max(open_, close)
-        historical.append(wick / open_ / adr_14)
-
-    # Current week: MYT-based Monday 00:00 boundary (same as compute_weekly_current_state)
-    now_utc = datetime.now(tz=UTC)
-    now_myt = now_utc + timedelta(hours=MYT_OFFSET_HOURS)
-    days_since_monday = now_myt.weekday()  # 0 = Monday
-    week_start_myt = (now_myt - timedelta(days=days_since_monday)).replace(
-        hour=0, minute=0, second=0, microsecond=0
-    )
-    week_start_ms = int(
-        (week_start_myt - timedelta(hours=MYT_OFFSET_HOURS)).timestamp() * 1000
-    )
+        wicks.append(
+            _wick(p1_dir, float(high), float(low), open_f, float(close)) / open_f
+        )
+    return WeeklyWickReference(wicks_of_open=tuple(sorted(wicks)))
+
+
+def fetch_current_week_p1_candle(
+    conn: duckdb.DuckDBPyConnection,
+    symbol: str,
+    week_start_ms: int,
+) -> tuple[str, float, float, float, float] | None:
+    """Return (p1_dir, high, low, open, close) of the current week's P1 candle.
 
-    current_rows = conn.execute(
+    None until both weekly extremes have formed on different candles.
+    """
+    row = conn.execute(
         """
         WITH weekly AS (
             SELECT MAX(high) AS wk_high, MIN(low) AS wk_low
@@ -152,37 +141,72 @@ def compute_weekly_wick_percentile(
         WHERE h.symbol = $symbol AND h.timeframe = '1h'
         """,
         {"symbol": symbol, "week_start_ms": week_start_ms},
-    ).fetchall()
+    ).fetchone()
+    if row is None:
+        return None
+    p1_dir, high, low, open_, close = row
+    return str(p1_dir), float(high), float(low), float(open_), float(close)
 
-    if not current_rows or not historical:
+
+def weekly_wick_from_reference(
+    ref: WeeklyWickReference,
+    current: tuple[str, float, float, float, float] | None,
+    adr_14: float,
+) -> WeeklyWickPercentile:
+    """Rank the current week's P1 wick against the reference distribution."""
+    n = len(ref.wicks_of_open)
+    if adr_14 <= 0 or n == 0:
         return WeeklyWickPercentile(
             current_wick_of_adr=None,
             exceedance_pct=None,
             p1_direction=None,
-            sample_count=len(historical),
+            sample_count=0,
         )
-
-    p1_dir_curr, high, low, open_, close = current_rows[0]
-    high, low, open_, close = float(high), float(low), float(open_), float(close)
-    if open_ <= 0:
+    if current is None or current[3] <= 0:
         return WeeklyWickPercentile(
             current_wick_of_adr=None,
             exceedance_pct=None,
             p1_direction=None,
-            sample_count=len(historical),
+            sample_count=n,
         )
 
-    if p1_dir_curr == "low":
-        current_wick = min(open_, close) - low
-    else:
-        current_wick = high - max(open_, close)
-
-    current_of_adr = current_wick / open_ / adr_14
-    exceedance = sum(1 for h in historical if h > current_of_adr) / len(historical)
+    p1_dir_curr, high, low, open_, close = current
+    current_of_adr = _wick(p1_dir_curr, high, low, open_, close) / open_ / adr_14
+    # wicks_of_open is ascending and dividing by adr_14 > 0 keeps it that way.
+    historical = [w / adr_14 for w in ref.wicks_of_open]
+    exceedance = (n - bisect_right(historical, current_of_adr)) / n
 
     return WeeklyWickPercentile(
         current_wick_of_adr=current_of_adr,
         exceedance_pct=exceedance,
-        p1_direction=str(p1_dir_curr),
-        sample_count=len(historical),
+        p1_direction=p1_dir_curr,
+        sample_count=n,
     )
+
+
+def compute_weekly_wick_percentile(
+    conn: duckdb.DuckDBPyConnection,
+    symbol: str,
+    adr_14: float,
+    days: int = 180,
+) -> WeeklyWickPercentile:
+    """Compute exceedance probability for current week's P1 wick vs historical P1 wicks.
+
+    Historical: wick / open / adr_14 for each historical week where P1 is identified.
+    Current: same metric for the current (possibly incomplete) week, using the
+    MYT Monday 00:00 boundary (same as compute_weekly_current_state).
+
+    Returns WeeklyWickPercentile with None fields if:
+    - adr_14 == 0
+    - no historical data
+    - current week's P1 has not been set yet (only one extreme formed so far)
+    Uncached: the web API caches load_weekly_wick_reference per day and only
+    runs fetch_current_week_p1_candle per request.
+    """
+    if adr_14 <= 0:
+        return weekly_wick_from_reference(WeeklyWickReference(()), None, adr_14)
+    ref = load_weekly_wick_reference(conn, symbol, _start_ms(days))
+    if not ref.wicks_of_open:
+        return weekly_wick_from_reference(ref, None, adr_14)
+    current = fetch_current_week_p1_candle(conn, symbol, _current_week_start_ms())
+    return weekly_wick_from_reference(ref, current, adr_14)
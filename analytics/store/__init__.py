@@ -34,8 +34,10 @@ from analytics.store.confidence import (
 )
 from analytics.store.market_data import (
     get_funding_rates,
+    get_funding_rates_for_symbols,
     get_latest_open_time,
     get_ohlcv,
+    get_ohlcv_for_symbols,
     get_open_interest,
     get_symbol_lifecycle,
     upsert_funding_rates,
@@ -44,6 +46,14 @@ from analytics.store.market_data import (
     upsert_symbol_lifecycle,
 )
 from analytics.store.schema import init_schema
+from analytics.store.signal_cache import (
+    decode_signals,
+    encode_signals,
+    get_cached_signals,
+    prune_signal_cache,
+    put_cached_signals,
+    signal_cache_key,
+)
 from analytics.store.signals import (
     _OUTCOME_COLUMNS,
     get_signals_history,
@@ -54,6 +64,13 @@ from analytics.store.stats_cache import (
     get_stats_cache,
     upsert_stats_cache,
 )
+from analytics.store.sweep_cells import (
+    get_sweep_cells,
+    open_sweep_cell_store,
+    prune_sweep_cells,
+    put_sweep_cell,
+    sweep_cell_key,
+)
 
 __all__ = [
     "BacktestSnapshot",
@@ -62,25 +79,38 @@ __all__ = [
     "_backtest_run_id",
     "_make_bt_cache_key",
     "_upsert",
+    "decode_signals",
+    "encode_signals",
     "get_backtest_cache",
+    "get_cached_signals",
     "get_combo_lookup",
     "get_confidence_ratings",
     "get_cross_tf_combo_lookup",
     "get_directional_confidence_ratings",
     "get_funding_rates",
+    "get_funding_rates_for_symbols",
     "get_latest_open_time",
     "get_ohlcv",
+    "get_ohlcv_for_symbols",
     "get_open_interest",
     "get_signals_history",
     "get_stats_cache",
+    "get_sweep_cells",
     "get_symbol_lifecycle",
     "get_win_rate_by_strategy",
     "init_schema",
     "list_backtest_runs",
     "list_combo_runs",
     "list_cross_tf_combo_runs",
+    "open_sweep_cell_store",
     "prune_backtest_cache",
+    "prune_signal_cache",
+    "prune_sweep_cells",
     "put_backtest_cache",
+    "put_cached_signals",
+    "put_sweep_cell",
+    "signal_cache_key",
+    "sweep_cell_key",
     "upsert_backtest_run",
     "upsert_backtest_trades",
     "upsert_combo_run",
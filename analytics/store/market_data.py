@@ -72,6 +72,48 @@ def get_funding_rates(
     ).df()
 
 
+def get_ohlcv_for_symbols(
+    conn: duckdb.DuckDBPyConnection,
+    symbols: list[str],
+    timeframe: str,
+    start: int,
+    end: int,
+) -> pd.DataFrame:
+    """Return OHLCV rows for many symbols in one query, ordered by (symbol, open_time).
+
+    ``symbols`` must be non-empty.
+    """
+    placeholders = ", ".join("?" * len(symbols))
+    return conn.execute(
+        "SELECT symbol, timeframe, open_time, open, high, low, close, volume, taker_buy_volume "
+        "FROM ohlcv "
+        f"WHERE symbol IN ({placeholders}) AND timeframe = ? "
+        "AND open_time >= ? AND open_time <= ? "
+        "ORDER BY symbol, open_time",
+        [*symbols, timeframe, start, end],
+    ).df()
+
+
+def get_funding_rates_for_symbols(
+    conn: duckdb.DuckDBPyConnection,
+    symbols: list[str],
+    start: int,
+    end: int,
+) -> pd.DataFrame:
+    """Return funding rate rows for many symbols, ordered by (symbol, funding_time).
+
+    ``symbols`` must be non-empty.
+    """
+    placeholders = ", ".join("?" * len(symbols))
+    return conn.execute(
+        "SELECT symbol, funding_time, funding_rate "
+        "FROM funding_rates "
+        f"WHERE symbol IN ({placeholders}) AND funding_time >= ? AND funding_time <= ? "
+        "ORDER BY symbol, funding_time",
+        [*symbols, start, end],
+    ).df()
+
+
 def get_open_interest(
     conn: duckdb.DuckDBPyConnection,
     symbol: str,
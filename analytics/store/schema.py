@@ -93,9 +93,27 @@ def init_schema(conn: duckdb.DuckDBPyConnection) -> None:
             tags                   TEXT,
             outcome                TEXT,
             outcome_r              DOUBLE,
-            outcome_filled_at_ms   BIGINT
+            outcome_filled_at_ms   BIGINT,
+            scanned_through_ms     BIGINT,
+            scanned_bars           INTEGER,
+            entry_bar_ms           BIGINT
         )
     """)
+    # Migration: outcome backfill resume cursor on existing DBs.
+    existing_outcome_cols = {
+        row[0]
+        for row in conn.execute(
+            "SELECT column_name FROM information_schema.columns "
+            "WHERE table_name = 'signal_alert_outcomes'"
+        ).fetchall()
+    }
+    for col, dtype in [
+        ("scanned_through_ms", "BIGINT"),
+        ("scanned_bars", "INTEGER"),
+        ("entry_bar_ms", "BIGINT"),
+    ]:
+        if col not in existing_outcome_cols:
+            conn.execute(f"ALTER TABLE signal_alert_outcomes ADD COLUMN {col} {dtype}")
     conn.execute("""
         CREATE TABLE IF NOT EXISTS backtest_runs (
             run_id               TEXT    PRIMARY KEY,
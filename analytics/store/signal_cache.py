@@ -0,0 +1,167 @@
+"""Content-addressed signal cache — one row per detector run over one OHLCV frame.
+
+Signal detection is a pure function of the strategy, its OHLCV frame (plus the
+secondary frame for SMT), the detector flags and the detector source code.
+``signal_cache_key`` hashes all of them, so a sweep rerun over unchanged data
+reuses every stored signal frame and only detects what is new. Like the sweep
+cells, rows are never invalidated in place — any change yields a new key and
+stale rows age out through ``prune_signal_cache``.
+
+Signals travel (to / from detection workers) and persist in one compact,
+JSON-ready form: per-column value lists plus the dtypes and index needed to
+rebuild the frame exactly (``encode_signals`` / ``decode_signals``). The table
+lives in the sweep cell sidecar store (``open_sweep_cell_store``).
+"""
+
+import functools
+import hashlib
+import json
+import time
+from collections.abc import Mapping
+from typing import Any
+
+import duckdb
+import pandas as pd
+
+from analytics.store.sweep_cells import (
+    _canonical,
+    _window,
+    frame_fingerprint,
+    source_hash,
+)
+
+# Detector code: every strategy module plus the shared feature frame.
+_DETECTOR_SOURCES = ("strategies/*.py", "features.py")
+
+
+def init_signal_cache_schema(conn: duckdb.DuckDBPyConnection) -> None:
+    """Create the signal_cache table if it does not exist."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS signal_cache (
+            cache_key       TEXT    PRIMARY KEY,
+            strategy        TEXT    NOT NULL,
+            symbol          TEXT    NOT NULL,
+            timeframe       TEXT    NOT NULL,
+            data_start_ms   BIGINT,
+            data_end_ms     BIGINT,
+            signals_json    TEXT    NOT NULL,
+            computed_at_ms  BIGINT  NOT NULL
+        )
+    """)
+
+
+@functools.cache
+def detector_version() -> str:
+    """Hash of the detector sources — signals from other detector code never match."""
+    return source_hash(_DETECTOR_SOURCES)
+
+
+def signal_cache_key(
+    symbol: str,
+    timeframe: str,
+    strategy: str,
+    ohlcv: pd.DataFrame,
+    secondary: pd.DataFrame | None,
+    params: Mapping[str, Any],
+) -> str:
+    """32-char hex key of one detector run over ``ohlcv`` (and ``secondary``)."""
+    spec = json.dumps(
+        {
+            "detectors": detector_version(),
+            "strategy": strategy,
+            "symbol": symbol,
+            "timeframe": timeframe,
+            "ohlcv": frame_fingerprint(ohlcv),
+            "secondary": None if secondary is None else frame_fingerprint(secondary),
+            "params": _canonical(params),
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(spec.encode()).hexdigest()[:32]
+
+
+def encode_signals(signals: pd.DataFrame) -> dict[str, Any] | None:
+    """Compact JSON-ready form of a signals frame, or None when it cannot be
+    rebuilt exactly (unserialisable cells, lossy dtypes)."""
+    index = signals.index
+    payload: dict[str, Any] = {
+        "columns": [str(c) for c in signals.columns],
+        "dtypes": [str(d) for d in signals.dtypes],
+        "data": [signals[c].to_numpy().tolist() for c in signals.columns],
+        "index": (
+            {"range": [index.start, index.stop, index.step]}
+            if isinstance(index, pd.RangeIndex)
+            else {"dtype": str(index.dtype), "values": index.to_numpy().tolist()}
+        ),
+    }
+    try:
+        payload = json.loads(json.dumps(payload))
+        exact = frame_fingerprint(decode_signals(payload)) == frame_fingerprint(signals)
+    except (TypeError, ValueError):
+        return None
+    return payload if exact else None
+
+
+def decode_signals(payload: Mapping[str, Any]) -> pd.DataFrame:
+    """Rebuild the signals frame ``encode_signals`` produced ``payload`` from."""
+    spec = payload["index"]
+    index = (
+        pd.RangeIndex(*spec["range"])
+        if "range" in spec
+        else pd.Index(spec["values"], dtype=spec["dtype"])
+    )
+    return pd.DataFrame(
+        {
+            c: pd.Series(values, index=index, dtype=dtype)
+            for c, dtype, values in zip(
+                payload["columns"], payload["dtypes"], payload["data"], strict=True
+            )
+        },
+        index=index,
+        columns=payload["columns"],
+    )
+
+
+def get_cached_signals(
+    conn: duckdb.DuckDBPyConnection,
+    keys: list[str],
+) -> dict[str, pd.DataFrame]:
+    """Return ``{cache_key: signals}`` for every key already in the store."""
+    if not keys:
+        return {}
+    rows = conn.execute(
+        "SELECT cache_key, signals_json FROM signal_cache "
+        "WHERE cache_key IN (SELECT unnest(?))",
+        [list(dict.fromkeys(keys))],
+    ).fetchall()
+    return {str(key): decode_signals(json.loads(text)) for key, text in rows}
+
+
+def put_cached_signals(
+    conn: duckdb.DuckDBPyConnection,
+    rows: list[tuple[str, str, str, str, pd.DataFrame, dict[str, Any]]],
+) -> None:
+    """Persist ``(cache_key, strategy, symbol, timeframe, ohlcv, payload)`` rows.
+
+    ``payload`` is the ``encode_signals`` form. Keys already stored hold the
+    same signals by construction, so they are skipped.
+    """
+    if not rows:
+        return
+    now_ms = int(time.time() * 1000)
+    conn.executemany(
+        "INSERT INTO signal_cache VALUES (?,?,?,?,?,?,?,?) ON CONFLICT DO NOTHING",
+        [
+            [key, strategy, symbol, timeframe, *_window(ohlcv), json.dumps(p), now_ms]
+            for key, strategy, symbol, timeframe, ohlcv, p in rows
+        ],
+    )
+
+
+def prune_signal_cache(
+    conn: duckdb.DuckDBPyConnection,
+    keep_days: int = 30,
+) -> None:
+    """Delete signal_cache rows computed more than keep_days ago."""
+    cutoff_ms = int(time.time() * 1000) - keep_days * 24 * 3600 * 1000
+    conn.execute("DELETE FROM signal_cache WHERE computed_at_ms < ?", [cutoff_ms])
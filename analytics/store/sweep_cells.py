@@ -0,0 +1,280 @@
+"""Content-addressed sweep cell store — one row per completed ``run_backtest`` call.
+
+A sweep cell is fully determined by its inputs: (strategy, symbol, tf), the
+OHLCV window and signals it replays, the engine arguments (sl/tp, fees, gate
+configs, regime / funding series) and the backtest engine source itself.
+``sweep_cell_key`` hashes all of them, so a rerun after a crash, or a grid
+widened by one axis, finds every finished cell under the same key and only
+computes the missing ones. Any change to the data or the engine code yields a
+new key; stale rows are never read, only aged out by ``prune_sweep_cells``.
+
+The table lives in a sidecar DuckDB file next to the analytics DB (see
+``open_sweep_cell_store``) because the sweeps read the main DB read-only so
+they never hold its write lock while signal-watch is running.
+"""
+
+import contextlib
+import dataclasses
+import functools
+import hashlib
+import json
+import logging
+import time
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import duckdb
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from analytics.backtest_lib import BacktestResult
+
+logger = logging.getLogger(__name__)
+
+_ANALYTICS_DIR = Path(__file__).resolve().parent.parent
+# Code ``run_backtest`` executes, relative to analytics/: the engine package
+# plus the per-bar features, gates, regime classifier and helpers it calls into.
+_ENGINE_SOURCES = (
+    "backtest/*.py",
+    "features.py",
+    "regime.py",
+    "signal/_common.py",
+    "signal/gates.py",
+    "strategies/_shared.py",
+)
+
+
+def init_sweep_cell_schema(conn: duckdb.DuckDBPyConnection) -> None:
+    """Create the sweep_cells table if it does not exist."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS sweep_cells (
+            cell_key        TEXT     PRIMARY KEY,
+            strategy        TEXT     NOT NULL,
+            symbol          TEXT     NOT NULL,
+            timeframe       TEXT     NOT NULL,
+            data_start_ms   BIGINT,
+            data_end_ms     BIGINT,
+            params_json     TEXT     NOT NULL,
+            n_closed        INTEGER  NOT NULL,
+            win_rate        DOUBLE   NOT NULL,
+            avg_r           DOUBLE   NOT NULL,
+            total_r         DOUBLE   NOT NULL,
+            r_values        DOUBLE[] NOT NULL,
+            trades_json     TEXT     NOT NULL,
+            computed_at_ms  BIGINT   NOT NULL
+        )
+    """)
+
+
+def sweep_cell_store_path(db_path: Path) -> Path:
+    """Sidecar store path for ``db_path`` (``analytics.db`` → ``analytics.sweep_cells.db``)."""
+    return db_path.with_suffix(".sweep_cells" + (db_path.suffix or ".db"))
+
+
+@contextlib.contextmanager
+def open_sweep_cell_store(
+    db_path: Path,
+) -> Iterator[duckdb.DuckDBPyConnection | None]:
+    """Open (creating if needed) the sidecar store for ``db_path``.
+
+    The store holds the sweep cells and the detection signal cache
+    (``analytics.store.signal_cache``).
+
+    Yields None when the store is locked by another sweep — the caller then
+    runs without resume rather than failing.
+    """
+    path = sweep_cell_store_path(db_path)
+    try:
+        conn = duckdb.connect(str(path))
+    except duckdb.IOException as exc:
+        logger.warning("sweep cell store %s unavailable (%s); not resuming", path, exc)
+        yield None
+        return
+    try:
+        from analytics.store.signal_cache import init_signal_cache_schema
+
+        init_sweep_cell_schema(conn)
+        init_signal_cache_schema(conn)
+        yield conn
+    finally:
+        conn.close()
+
+
+def source_hash(patterns: tuple[str, ...]) -> str:
+    """16-char hash of the analytics/ sources matching ``patterns`` (paths + bytes)."""
+    h = hashlib.sha256()
+    for pattern in patterns:
+        for path in sorted(_ANALYTICS_DIR.glob(pattern)):
+            h.update(path.relative_to(_ANALYTICS_DIR).as_posix().encode())
+            h.update(path.read_bytes())
+    return h.hexdigest()[:16]
+
+
+@functools.cache
+def engine_version() -> str:
+    """Hash of the engine sources (``_ENGINE_SOURCES``) — cells from other engine
+    code never match."""
+    return source_hash(_ENGINE_SOURCES)
+
+
+def frame_fingerprint(obj: pd.DataFrame | pd.Series) -> str:
+    """Content hash of a DataFrame / Series: shape, labels, dtypes, index and values."""
+    h = hashlib.sha256()
+    labels = list(obj.columns) if isinstance(obj, pd.DataFrame) else [obj.name]
+    dtypes = obj.dtypes.tolist() if isinstance(obj, pd.DataFrame) else [obj.dtype]
+    h.update(
+        repr((obj.shape, [str(c) for c in labels], [str(d) for d in dtypes])).encode()
+    )
+    try:
+        h.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+    except TypeError:  # unhashable cells (lists / dicts) — fall back to the JSON form
+        h.update(obj.to_json(orient="split", default_handler=str).encode())
+    return h.hexdigest()[:24]
+
+
+def _canonical(value: Any) -> Any:
+    """JSON-ready, order-independent form of a ``run_backtest`` argument."""
+    if isinstance(value, pd.DataFrame | pd.Series):
+        return {"frame": frame_fingerprint(value)}
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            "type": type(value).__qualname__,
+            "fields": {
+                f.name: _canonical(getattr(value, f.name))
+                for f in dataclasses.fields(value)
+            },
+        }
+    if isinstance(value, Mapping):
+        return sorted([repr(k), _canonical(v)] for k, v in value.items())
+    if isinstance(value, list | tuple | set | frozenset):
+        items = [_canonical(v) for v in value]
+        return sorted(items, key=repr) if isinstance(value, set | frozenset) else items
+    if value is None or isinstance(value, bool | int | str):
+        return value
+    return repr(value)  # floats by repr so 0.1 and 0.1000000001 never collide
+
+
+def _window(ohlcv: pd.DataFrame) -> tuple[int | None, int | None]:
+    if ohlcv.empty or "open_time" not in ohlcv.columns:
+        return None, None
+    return int(ohlcv["open_time"].iloc[0]), int(ohlcv["open_time"].iloc[-1])
+
+
+def sweep_cell_key(
+    symbol: str,
+    timeframe: str,
+    strategy: str,
+    ohlcv: pd.DataFrame,
+    signals: pd.DataFrame,
+    params: Mapping[str, Any],
+) -> str:
+    """32-char hex key of ``run_backtest(ohlcv, signals, symbol, timeframe, strategy, **params)``."""
+    spec = json.dumps(
+        {
+            "engine": engine_version(),
+            "strategy": strategy,
+            "symbol": symbol,
+            "timeframe": timeframe,
+            "window": _window(ohlcv),
+            "ohlcv": frame_fingerprint(ohlcv),
+            "signals": frame_fingerprint(signals),
+            "params": _canonical(params),
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(spec.encode()).hexdigest()[:32]
+
+
+def _engine_scalar(value: Any) -> Any:
+    """Prices come out of the engine as ``np.float64``; restore them as such.
+
+    ``sum()`` over exact Python floats is compensated, over numpy scalars it is
+    not — keeping the engine's type keeps ``avg_r`` / ``total_r`` bit-identical
+    to a fresh run.
+    """
+    return np.float64(value) if isinstance(value, float) else value
+
+
+def get_sweep_cells(
+    conn: duckdb.DuckDBPyConnection,
+    keys: list[str],
+) -> dict[str, "BacktestResult"]:
+    """Return ``{cell_key: BacktestResult}`` for every key already in the store."""
+    from analytics.backtest_lib import BacktestResult, Trade
+
+    if not keys:
+        return {}
+    rows = conn.execute(
+        "SELECT cell_key, symbol, timeframe, strategy, params_json, trades_json "
+        "FROM sweep_cells WHERE cell_key IN (SELECT unnest(?))",
+        [list(dict.fromkeys(keys))],
+    ).fetchall()
+    names = [f.name for f in dataclasses.fields(Trade)]
+    out: dict[str, BacktestResult] = {}
+    for key, symbol, timeframe, strategy, params_json, trades_json in rows:
+        fee_pct = json.loads(params_json).get("fee_pct", 0.0)
+        out[str(key)] = BacktestResult(
+            symbol=str(symbol),
+            timeframe=str(timeframe),
+            strategy=str(strategy),
+            fee_pct=float(fee_pct),
+            trades=[
+                Trade(**dict(zip(names, map(_engine_scalar, t), strict=True)))
+                for t in json.loads(trades_json)
+            ],
+        )
+    return out
+
+
+def put_sweep_cell(
+    conn: duckdb.DuckDBPyConnection,
+    cell_key: str,
+    result: "BacktestResult",
+    ohlcv: pd.DataFrame,
+    params: Mapping[str, Any],
+) -> None:
+    """Persist one completed cell: summary stats, closed-trade R vector and all trades.
+
+    ``params`` are the scalar engine arguments recorded for inspection (the key
+    already covers everything). A key that is already stored holds the same
+    result by construction, so the duplicate is dropped — a plain INSERT is several times cheaper than
+    ``INSERT OR REPLACE`` on the primary key.
+    """
+    start, end = _window(ohlcv)
+    scalars = {
+        k: v
+        for k, v in params.items()
+        if v is None or isinstance(v, bool | int | float | str)
+    }
+    scalars["fee_pct"] = result.fee_pct
+    row = [
+        cell_key,
+        result.strategy,
+        result.symbol,
+        result.timeframe,
+        start,
+        end,
+        json.dumps(scalars, sort_keys=True),
+        len(result.closed_trades),
+        result.win_rate,
+        result.avg_r,
+        result.total_r,
+        [t.pnl_r for t in result.closed_trades if t.pnl_r is not None],
+        json.dumps([dataclasses.astuple(t) for t in result.trades]),
+        int(time.time() * 1000),
+    ]
+    with contextlib.suppress(duckdb.ConstraintException):
+        conn.execute(
+            "INSERT INTO sweep_cells VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?)", row
+        )
+
+
+def prune_sweep_cells(
+    conn: duckdb.DuckDBPyConnection,
+    keep_days: int = 30,
+) -> None:
+    """Delete sweep_cells rows computed more than keep_days ago."""
+    cutoff_ms = int(time.time() * 1000) - keep_days * 24 * 3600 * 1000
+    conn.execute("DELETE FROM sweep_cells WHERE computed_at_ms < ?", [cutoff_ms])
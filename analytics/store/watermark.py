@@ -0,0 +1,89 @@
+"""Watermark memo — derived results cached until a table they read is written.
+
+A digest card or recalibration aggregate is a pure function of the tables it
+reads. ``table_watermark`` summarises each named table as its row count and,
+where the table has one, its newest ``run_at_ms`` (every writer either adds
+rows or stamps ``run_at_ms``). ``WatermarkMemo`` keys each result on the
+database file plus the watermark of exactly the tables the caller lists, so a
+write to any of them — and only to them — recomputes it.
+
+In-memory databases have no stable identity across connections, so they are
+never memoised.
+"""
+
+import copy
+import threading
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import duckdb
+
+# (db file, watched tables) → per-table (row count, newest run_at_ms).
+type Watermark = tuple[tuple[str, tuple[str, ...]], tuple[tuple[int, int], ...]]
+
+
+def table_watermark(
+    conn: duckdb.DuckDBPyConnection, tables: Sequence[str]
+) -> Watermark | None:
+    """Watermark of ``tables`` in ``conn``'s database, or None if uncacheable."""
+    row = conn.execute(
+        "SELECT file FROM pragma_database_list WHERE name = current_database()"
+    ).fetchone()
+    if row is None or not row[0]:
+        return None
+    stamped = {
+        str(name)
+        for (name,) in conn.execute(
+            "SELECT table_name FROM duckdb_columns() "
+            "WHERE column_name = 'run_at_ms' AND database_name = current_database()"
+        ).fetchall()
+    }
+    marks: list[tuple[int, int]] = []
+    for table in tables:
+        newest = "COALESCE(MAX(run_at_ms), 0)" if table in stamped else "0"
+        counts = conn.execute(f"SELECT COUNT(*), {newest} FROM {table}").fetchone()
+        assert counts is not None
+        marks.append((int(counts[0]), int(counts[1])))
+    return (str(row[0]), tuple(tables)), tuple(marks)
+
+
+class WatermarkMemo:
+    """Thread-safe memo of loader results per database, table watermark and key.
+
+    Stored values and hits are deep copies, so callers may mutate what they
+    get. A new watermark of the same tables evicts their older entries.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[Any, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        """Drop every memoised result."""
+        with self._lock:
+            self._entries.clear()
+
+    def get[T](
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        tables: Sequence[str],
+        key: tuple[Any, ...],
+        loader: Callable[[], T],
+    ) -> T:
+        """Return a copy of ``loader()`` memoised for ``key`` while ``tables`` are unchanged."""
+        mark = table_watermark(conn, tables)
+        if mark is None:
+            return loader()
+        scope, marks = mark
+        full_key = (scope, marks, *key)
+        with self._lock:
+            if full_key in self._entries:
+                hit: T = copy.deepcopy(self._entries[full_key])
+                return hit
+        value = loader()
+        with self._lock:
+            stale = [k for k in self._entries if k[0] == scope and k[1] != marks]
+            for k in stale:
+                del self._entries[k]
+            self._entries[full_key] = copy.deepcopy(value)
+        return value
@@ -9,6 +9,7 @@ from datetime import datetime, timedelta, timezone
 
 import pandas as pd
 
+from analytics.features import FeatureFrame as FeatureFrame
 from analytics.strategies._base import SIGNAL_COLUMNS
 
 _MYT = timezone(timedelta(hours=8))
@@ -113,6 +114,7 @@ def is_trending(
     regime_lookback: int = 20,
     max_crosses: int = 2,
     min_slope_pct: float = 0.003,
+    crosses: int | None = None,
 ) -> bool:
     """Binary regime gate: trending vs range/chop.
 
@@ -121,6 +123,9 @@ def is_trending(
       (range markets cross the EMA repeatedly),
     - slow-EMA |slope| over `slope_lookback` bars >= `min_slope_pct`
       (a flat EMA = no directional conviction).
+
+    `crosses` is the precomputed cross count at idx
+    (`FeatureFrame.ema_crosses`); None counts it here.
     """
     if idx < max(slope_lookback, regime_lookback - 1):
         return False
@@ -131,7 +136,8 @@ def is_trending(
     slope_pct = abs((slow_now - slow_then) / slow_then)
     if slope_pct < min_slope_pct:
         return False
-    crosses = ema_cross_count(close, ema_fast, idx, regime_lookback)
+    if crosses is None:
+        crosses = ema_cross_count(close, ema_fast, idx, regime_lookback)
     return crosses <= max_crosses
 
 
@@ -1,6 +1,7 @@
 """Detector: CVD Divergence — extracted from `analytics/indicators_lib.py` in strat-2.
 
-No behaviour change. Function body byte-identical to pre-split source.
+Signals are unchanged from the pre-split source; the per-candle window rescan
+was replaced by running swing arrays (see ``detect_cvd_divergence``).
 """
 
 import numpy as np
@@ -29,10 +30,13 @@ def detect_cvd_divergence(
     from index `cvd_lookback - 1` onward is evaluated. Each divergence pair fires
     exactly once (deduplicated by the 2nd swing peak's timestamp).
 
-    Performance: global CVD and swing arrays are precomputed once (O(n)); the
-    main loop uses numpy searchsorted (O(log n)) avoiding per-window DataFrame
-    creation. CVD comparisons use global offsets — window-relative and global
-    CVD orderings are identical (ch2 < ch1 ↔ CVD_global[i2] < CVD_global[i1]).
+    Performance: global CVD and swing arrays are precomputed once (O(n)). The
+    last two deduplicated swings of every rolling window come from running
+    "last swing so far" / "run start so far" arrays instead of a rescan of the
+    window (`_last_two_runs`), and the divergence test only runs at the candles
+    where that pair changes — a signal can only fire there. CVD comparisons use
+    global offsets — window-relative and global CVD orderings are identical
+    (ch2 < ch1 ↔ CVD_global[i2] < CVD_global[i1]).
     """
     if "taker_buy_volume" not in df.columns or df["taker_buy_volume"].isna().all():
         return _empty_signals()
@@ -53,90 +57,101 @@ def detect_cvd_divergence(
 
     # Precompute confirmed swing highs/lows using rolling max/min.
     # A swing at absolute index k is confirmed iff it has `lookback` candles on
-    # each side — the searchsorted step below restricts to [ws+lookback, end_i-lookback+1).
+    # each side — the window below is restricted to [ws+lookback, end_i-lookback+1).
     win = 2 * lookback + 1
     roll_max = (
         pd.Series(highs).rolling(win, center=True, min_periods=1).max().to_numpy()
     )
     roll_min = pd.Series(lows).rolling(win, center=True, min_periods=1).min().to_numpy()
-    sh_idx: np.ndarray = np.where(highs >= roll_max)[0]
-    sl_idx: np.ndarray = np.where(lows <= roll_min)[0]
 
-    signals: list[dict[str, object]] = []
-    seen_pairs: set[tuple[int, str]] = set()
+    # Every candle from cvd_lookback - 1 on closes a window starting at
+    # ws = end_i - cvd_lookback + 1; its confirmed swing region is
+    # [ws+lookback, end_i-lookback+1) (range(lookback, wn-lookback) in window
+    # coordinates).
+    end = np.arange(cvd_lookback - 1, n)
+    c_start = np.maximum(end - cvd_lookback + 1, 0) + lookback
+    c_end = end - lookback + 1
+
+    # (candle, side, i1, i2) per divergence; short before long on one candle.
+    fired: list[tuple[int, int, int, int]] = []
+    for side, is_swing in enumerate((highs >= roll_max, lows <= roll_min)):
+        first, second = _last_two_runs(is_swing, c_start, c_end)
+        valid = first >= 0
+        changed = valid & (
+            (first != np.r_[-1, first[:-1]]) | (second != np.r_[-1, second[:-1]])
+        )
+        seen: set[int] = set()
+        for k in np.flatnonzero(changed).tolist():
+            i1, i2 = int(first[k]), int(second[k])
+            peak2_time = int(open_times[i2])
+            if peak2_time in seen:
+                continue
+            if side == 0:
+                diverges = highs[i2] > highs[i1] and cvd_global[i2] < cvd_global[i1]
+            else:
+                diverges = lows[i2] < lows[i1] and cvd_global[i2] > cvd_global[i1]
+            if diverges:
+                seen.add(peak2_time)
+                fired.append((int(end[k]), side, i1, i2))
 
-    for end_i in range(cvd_lookback - 1, n):
-        ws = max(0, end_i - cvd_lookback + 1)
+    signals: list[dict[str, object]] = []
+    for end_i, side, i1, i2 in sorted(fired):
         sig_time = int(open_times[end_i])
-
-        # Confirmed swing region: [ws+lookback, end_i-lookback+1)
-        # This matches range(lookback, wn-lookback) in window coordinates.
-        c_start = ws + lookback
-        c_end = end_i - lookback + 1
-
-        lo = int(np.searchsorted(sh_idx, c_start))
-        hi = int(np.searchsorted(sh_idx, c_end))
-        wsh = sh_idx[lo:hi]
-
-        lo = int(np.searchsorted(sl_idx, c_start))
-        hi = int(np.searchsorted(sl_idx, c_end))
-        wsl = sl_idx[lo:hi]
-
-        # Dedup consecutive plateaus (keep first of each run)
-        def _dedup(arr: np.ndarray) -> list[int]:
-            out: list[int] = []
-            prev = -2
-            for idx in arr:
-                if idx > prev + 1:
-                    out.append(int(idx))
-                prev = idx
-            return out
-
-        sh_peaks = _dedup(wsh)
-        sl_peaks = _dedup(wsl)
-
-        if len(sh_peaks) >= 2:
-            i1, i2 = sh_peaks[-2], sh_peaks[-1]
-            peak2_time = int(open_times[i2])
-            pair_key: tuple[int, str] = (peak2_time, "short")
-            if pair_key not in seen_pairs:
-                ph1, ph2 = highs[i1], highs[i2]
-                ch1, ch2 = cvd_global[i1], cvd_global[i2]
-                if ph2 > ph1 and ch2 < ch1:
-                    seen_pairs.add(pair_key)
-                    signals.append(
-                        {
-                            "open_time": sig_time,
-                            "direction": "short",
-                            "reason": f"cvd_div_bear@{ph2:.2f}",
-                            "sl_price": ph2,
-                            "context": (
-                                f"CVD div: price H {ph1:.2f}→{ph2:.2f}, "
-                                f"CVD {ch1:.0f}→{ch2:.0f} at {_fmt_time(sig_time)}"
-                            ),
-                        }
-                    )
-
-        if len(sl_peaks) >= 2:
-            i1, i2 = sl_peaks[-2], sl_peaks[-1]
-            peak2_time = int(open_times[i2])
-            pair_key = (peak2_time, "long")
-            if pair_key not in seen_pairs:
-                pl1, pl2 = lows[i1], lows[i2]
-                cl1, cl2 = cvd_global[i1], cvd_global[i2]
-                if pl2 < pl1 and cl2 > cl1:
-                    seen_pairs.add(pair_key)
-                    signals.append(
-                        {
-                            "open_time": sig_time,
-                            "direction": "long",
-                            "reason": f"cvd_div_bull@{pl2:.2f}",
-                            "sl_price": pl2,
-                            "context": (
-                                f"CVD div: price L {pl1:.2f}→{pl2:.2f}, "
-                                f"CVD {cl1:.0f}→{cl2:.0f} at {_fmt_time(sig_time)}"
-                            ),
-                        }
-                    )
+        if side == 0:
+            ph1, ph2 = highs[i1], highs[i2]
+            ch1, ch2 = cvd_global[i1], cvd_global[i2]
+            signals.append(
+                {
+                    "open_time": sig_time,
+                    "direction": "short",
+                    "reason": f"cvd_div_bear@{ph2:.2f}",
+                    "sl_price": ph2,
+                    "context": (
+                        f"CVD div: price H {ph1:.2f}→{ph2:.2f}, "
+                        f"CVD {ch1:.0f}→{ch2:.0f} at {_fmt_time(sig_time)}"
+                    ),
+                }
+            )
+        else:
+            pl1, pl2 = lows[i1], lows[i2]
+            cl1, cl2 = cvd_global[i1], cvd_global[i2]
+            signals.append(
+                {
+                    "open_time": sig_time,
+                    "direction": "long",
+                    "reason": f"cvd_div_bull@{pl2:.2f}",
+                    "sl_price": pl2,
+                    "context": (
+                        f"CVD div: price L {pl1:.2f}→{pl2:.2f}, "
+                        f"CVD {cl1:.0f}→{cl2:.0f} at {_fmt_time(sig_time)}"
+                    ),
+                }
+            )
 
     return _signals_to_df(signals)
+
+
+def _last_two_runs(
+    is_swing: np.ndarray, c_start: np.ndarray, c_end: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Last two deduplicated swings (i1, i2) of every window [c_start, c_end).
+
+    Consecutive swing candles collapse to the first of their run, a run cut by
+    the window start counting from c_start. i1 is -1 when the window holds
+    fewer than two runs, i2 when it holds none.
+    """
+    n = len(is_swing)
+    pos = np.arange(n)
+    last_swing = np.maximum.accumulate(np.where(is_swing, pos, -1))
+    starts = is_swing & ~np.r_[False, is_swing[:-1]]
+    run_start = np.maximum.accumulate(np.where(starts, pos, -1))
+
+    hi = np.clip(c_end - 1, 0, n - 1)
+    p = np.where(c_end > c_start, last_swing[hi], -1)
+    has_one = p >= c_start
+    rs = run_start[np.maximum(p, 0)]
+    second = np.where(has_one, np.maximum(rs, c_start), -1)
+    q = last_swing[np.clip(rs - 1, 0, n - 1)]
+    has_two = has_one & (rs > c_start) & (q >= c_start)
+    first = np.where(has_two, np.maximum(run_start[np.maximum(q, 0)], c_start), -1)
+    return first, second
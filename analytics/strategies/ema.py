@@ -7,11 +7,10 @@ design — the rules below mirror §3 of the spec verbatim.
 import pandas as pd
 
 from analytics.strategies._shared import (
+    FeatureFrame,
     _empty_signals,
     _signals_to_df,
-    compute_ema,
     is_trending,
-    volume_confirm,
 )
 
 
@@ -49,9 +48,11 @@ def detect_ema(
     if n < min_bars:
         return _empty_signals()
 
-    closes = df["close"].astype(float)
-    ema_fast = compute_ema(closes, fast_period)
-    ema_slow = compute_ema(closes, slow_period)
+    features = FeatureFrame.of(df)
+    closes = features.close
+    ema_fast = features.ema(fast_period)
+    ema_slow = features.ema(slow_period)
+    crosses = features.ema_crosses(fast_period, regime_lookback)
 
     opens_arr = df["open"].to_numpy(dtype=float)
     highs = df["high"].to_numpy(dtype=float)
@@ -87,6 +88,7 @@ def detect_ema(
             regime_lookback=regime_lookback,
             max_crosses=max_crosses,
             min_slope_pct=min_slope_pct,
+            crosses=int(crosses[i]),
         ):
             continue
 
@@ -142,7 +144,7 @@ def detect_ema(
             direction = "short"
             reason = f"ema_pullback_short@{entry:.2f}"
 
-        vol_ok = volume_confirm(df, i)
+        vol_ok = features.volume_confirm(i)
         signals.append(
             {
                 "open_time": int(open_times[i]),
@@ -5,7 +5,11 @@ No behaviour change. Function body byte-identical to pre-split source.
 
 import pandas as pd
 
-from analytics.strategies._shared import _empty_signals, _signals_to_df, volume_confirm
+from analytics.strategies._shared import (
+    FeatureFrame,
+    _empty_signals,
+    _signals_to_df,
+)
 
 
 def detect_engulfing(
@@ -30,6 +34,7 @@ def detect_engulfing(
         return _empty_signals()
 
     signals: list[dict[str, object]] = []
+    features = FeatureFrame.of(df)
 
     opens = df["open"].to_numpy(dtype=float)
     closes = df["close"].to_numpy(dtype=float)
@@ -56,7 +61,7 @@ def detect_engulfing(
             sl = entry * (1 - sl_pct)
             sl_dist = entry - sl
             tp = entry + sl_dist * tp_r
-            vol_ok = volume_confirm(df, i)
+            vol_ok = features.volume_confirm(i)
             ctx = f"TP={tp:.2f}"
             signals.append(
                 {
@@ -80,7 +85,7 @@ def detect_engulfing(
             sl = entry * (1 + sl_pct)
             sl_dist = sl - entry
             tp = entry - sl_dist * tp_r
-            vol_ok = volume_confirm(df, i)
+            vol_ok = features.volume_confirm(i)
             ctx = f"TP={tp:.2f}"
             signals.append(
                 {
@@ -5,7 +5,11 @@ No behaviour change. Function body byte-identical to pre-split source.
 
 import pandas as pd
 
-from analytics.strategies._shared import _empty_signals, _signals_to_df, volume_confirm
+from analytics.strategies._shared import (
+    FeatureFrame,
+    _empty_signals,
+    _signals_to_df,
+)
 
 
 def detect_hammer_hanging_man(
@@ -29,6 +33,7 @@ def detect_hammer_hanging_man(
         return _empty_signals()
 
     signals: list[dict[str, object]] = []
+    features = FeatureFrame.of(df)
 
     for i in range(context_lookback, n):
         row = df.iloc[i]
@@ -50,7 +55,7 @@ def detect_hammer_hanging_man(
 
         open_time = int(row["open_time"])
         prior_close = float(df.iloc[i - context_lookback]["close"])
-        vol_ok = volume_confirm(df, i)
+        vol_ok = features.volume_confirm(i)
 
         if c < prior_close:
             # Downtrend context → Hammer (bullish)
@@ -1,8 +1,11 @@
 """Detector: SMT Divergence — extracted from `analytics/indicators_lib.py` in strat-2.
 
-No behaviour change. Function body byte-identical to pre-split source.
+Signals are unchanged from the pre-split source; the per-candle window rescan
+was replaced by one pass over the swing sequence (see ``_new_extremes``).
 """
 
+from collections import deque
+
 import numpy as np
 import pandas as pd
 
@@ -88,96 +91,84 @@ def detect_smt_divergence(
     if trend_filter:
         ema50 = merged["close_p"].ewm(span=50, adjust=False).mean().to_numpy()
 
-    signals: list[dict[str, object]] = []
+    # A signal candle i sits exactly swing_n candles after a primary swing k
+    # (the latest confirmed one, so k = i - swing_n) whose window
+    # [i - lookback, k] holds an earlier swing. Only those candles are
+    # visited; each side's swings stream through `_new_extremes` once.
+    fired: list[tuple[int, int]] = []  # (candle, 0 = short / 1 = long)
+    if lookback >= swing_n:
+        sides = (
+            (sh_p_idx, sh_s_idx, highs_p, highs_s),
+            (sl_p_idx, sl_s_idx, -lows_p, -lows_s),
+        )
+        for side, (piv_p, piv_s, vals_p, vals_s) in enumerate(sides):
+            pivots = piv_p[
+                (piv_p + swing_n >= lookback) & (piv_p + swing_n < n)
+            ].tolist()
+            win_start = [k + swing_n - lookback for k in pivots]
+            new_p = _new_extremes(piv_p.tolist(), vals_p, win_start, pivots)
+            new_s = _new_extremes(piv_s.tolist(), vals_s, win_start, pivots)
+            for k, primary_new, secondary_new in zip(pivots, new_p, new_s, strict=True):
+                if primary_new and not secondary_new:
+                    fired.append((k + swing_n, side))
 
-    for i in range(lookback, n):
+    signals: list[dict[str, object]] = []
+    for i, side in sorted(fired):
         close_p = float(closes_p[i])
         ema_val = float(ema50[i]) if ema50 is not None else 0.0
-
-        # Window start (inclusive) for confirmed pivots: confirmed means pivot_k + swing_n <= i
-        # i.e. pivot_k <= i - swing_n.  Window also bounded by lookback from signal candle.
-        win_start = i - lookback
-        win_end_confirmed = i - swing_n  # pivot must be <= this to be confirmed
-
-        if win_end_confirmed < win_start:
-            continue
-
-        # ---- Bearish SMT ------------------------------------------------
-        # Find confirmed swing highs on primary within [win_start, win_end_confirmed].
-        lo_p = int(np.searchsorted(sh_p_idx, win_start))
-        hi_p = int(np.searchsorted(sh_p_idx, win_end_confirmed + 1))
-        sh_p_window = sh_p_idx[lo_p:hi_p]
-
-        if len(sh_p_window) >= 2:
-            # Most recent swing high on primary
-            latest_p_sh_idx = int(sh_p_window[-1])
-            latest_p_sh_val = float(highs_p[latest_p_sh_idx])
-            # Prior swing high on primary (any earlier one)
-            prior_p_sh_val = float(highs_p[sh_p_window[:-1]].max())
-
-            if latest_p_sh_val > prior_p_sh_val:
-                # Primary made a new structural swing high.
-                # Check secondary: find confirmed swing highs on secondary in same window.
-                lo_s = int(np.searchsorted(sh_s_idx, win_start))
-                hi_s = int(np.searchsorted(sh_s_idx, win_end_confirmed + 1))
-                sh_s_window = sh_s_idx[lo_s:hi_s]
-
-                secondary_also_new_high = False
-                if len(sh_s_window) >= 2:
-                    latest_s_sh_val = float(highs_s[sh_s_window[-1]])
-                    prior_s_sh_val = float(highs_s[sh_s_window[:-1]].max())
-                    secondary_also_new_high = latest_s_sh_val > prior_s_sh_val
-
-                if (
-                    i == latest_p_sh_idx + swing_n
-                    and not secondary_also_new_high
-                    and (not trend_filter or close_p < ema_val)
-                ):
-                    signals.append(
-                        {
-                            "open_time": int(open_times[i]),
-                            "direction": "short",
-                            "reason": f"smt_bearish@{latest_p_sh_val:.2f}",
-                            "sl_price": latest_p_sh_val,
-                            "context": "",
-                        }
-                    )
-
-        # ---- Bullish SMT ------------------------------------------------
-        lo_p2 = int(np.searchsorted(sl_p_idx, win_start))
-        hi_p2 = int(np.searchsorted(sl_p_idx, win_end_confirmed + 1))
-        sl_p_window = sl_p_idx[lo_p2:hi_p2]
-
-        if len(sl_p_window) >= 2:
-            latest_p_sl_idx = int(sl_p_window[-1])
-            latest_p_sl_val = float(lows_p[latest_p_sl_idx])
-            prior_p_sl_val = float(lows_p[sl_p_window[:-1]].min())
-
-            if latest_p_sl_val < prior_p_sl_val:
-                # Primary made a new structural swing low.
-                lo_s2 = int(np.searchsorted(sl_s_idx, win_start))
-                hi_s2 = int(np.searchsorted(sl_s_idx, win_end_confirmed + 1))
-                sl_s_window = sl_s_idx[lo_s2:hi_s2]
-
-                secondary_also_new_low = False
-                if len(sl_s_window) >= 2:
-                    latest_s_sl_val = float(lows_s[sl_s_window[-1]])
-                    prior_s_sl_val = float(lows_s[sl_s_window[:-1]].min())
-                    secondary_also_new_low = latest_s_sl_val < prior_s_sl_val
-
-                if (
-                    i == latest_p_sl_idx + swing_n
-                    and not secondary_also_new_low
-                    and (not trend_filter or close_p > ema_val)
-                ):
-                    signals.append(
-                        {
-                            "open_time": int(open_times[i]),
-                            "direction": "long",
-                            "reason": f"smt_bullish@{latest_p_sl_val:.2f}",
-                            "sl_price": latest_p_sl_val,
-                            "context": "",
-                        }
-                    )
+        if side == 0 and (not trend_filter or close_p < ema_val):
+            latest_p_sh_val = float(highs_p[i - swing_n])
+            signals.append(
+                {
+                    "open_time": int(open_times[i]),
+                    "direction": "short",
+                    "reason": f"smt_bearish@{latest_p_sh_val:.2f}",
+                    "sl_price": latest_p_sh_val,
+                    "context": "",
+                }
+            )
+        elif side == 1 and (not trend_filter or close_p > ema_val):
+            latest_p_sl_val = float(lows_p[i - swing_n])
+            signals.append(
+                {
+                    "open_time": int(open_times[i]),
+                    "direction": "long",
+                    "reason": f"smt_bullish@{latest_p_sl_val:.2f}",
+                    "sl_price": latest_p_sl_val,
+                    "context": "",
+                }
+            )
 
     return _signals_to_df(signals)
+
+
+def _new_extremes(
+    swings: list[int],
+    values: np.ndarray,
+    win_start: list[int],
+    win_end: list[int],
+) -> list[bool]:
+    """Per window [win_start, win_end] (both non-decreasing across windows),
+    whether it holds ≥2 of ``swings`` and the latest one's value is strictly
+    above every earlier one's.
+
+    One pass over ``swings`` with a monotonic deque of the window's candidate
+    maxima: a swing evicts the earlier ones it strictly exceeds, so the latest
+    swing is a strict new extreme exactly when it is alone in the deque.
+    """
+    out: list[bool] = []
+    window: deque[int] = deque()  # positions in swings, values non-increasing
+    first = nxt = 0  # window = swings[first:nxt]
+    for lo, hi in zip(win_start, win_end, strict=True):
+        while nxt < len(swings) and swings[nxt] <= hi:
+            v = values[swings[nxt]]
+            while window and values[swings[window[-1]]] < v:
+                window.pop()
+            window.append(nxt)
+            nxt += 1
+        while first < nxt and swings[first] < lo:
+            first += 1
+        while window and window[0] < first:
+            window.popleft()
+        out.append(nxt - first >= 2 and len(window) == 1)
+    return out
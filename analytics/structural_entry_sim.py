@@ -11,13 +11,17 @@ and a pre-committed de-biased BUILD / NO-EDGE gate.
 Design (pure, read-only, additive — no schema / golden change):
 
 * Touch geometry is reused verbatim from :mod:`analytics.structural_touch`
-  (``extract_zones`` / ``index_touches`` / ``Zone`` / ``Touch``).
-* Realized-R resolution is delegated to the **production backtest engine**
+  (``extract_zones`` / ``index_zone_touches`` / ``Zone`` / ``Touch``).
+* Realized R follows the **production backtest engine**
   (:func:`analytics.backtest.engine.run_backtest`) so the cost model
   (``net_R = raw − fee − slippage − funding``), the next-bar-open entry, and
   the SL/TP candle scan match live exactly — zero drift. Each indexed touch
   becomes one synthetic signal row (``open_time`` = touch bar, structural
   ``sl_price`` from the sl-model, ``direction`` = the zone's reaction bias).
+  ``resolve_touch_trades`` hands those rows to the engine itself; the grid
+  path (``simulate_grid``) replays the engine's arithmetic for every
+  tp_r × sl_model cell in one batched pass, with sparse-table first-hit
+  searches in place of the per-trade candle scan.
 * The stop model is computed **here** (not inside the engine) so the engine
   never widens ``sl_price`` — keeping ``Trade.sl_price`` identical to the input
   and the touch↔trade merge on ``(open_time, direction, sl_price)`` exact.
@@ -33,10 +37,13 @@ from dataclasses import dataclass
 from typing import Any
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
 from analytics import audit_guard
+from analytics._rmq import sparse_table
 from analytics.backtest.engine import Trade, run_backtest
+from analytics.backtest.funding import FundingIndex
 from analytics.research_guards import (
     cscv_pbo,
     deflated_sharpe_ratio,
@@ -47,9 +54,10 @@ from analytics.structural_touch import (
     Zone,
     _atr14,
     _holm,
+    _next_hit,
     _two_sample_lift_ci,
     extract_zones,
-    index_touches,
+    index_zone_touches,
 )
 
 _SIGNAL_COLUMNS = ["open_time", "direction", "sl_price", "touch_index", "zone_id"]
@@ -170,6 +178,14 @@ def build_touch_signals(
     return pd.DataFrame(rows, columns=_SIGNAL_COLUMNS)
 
 
+def _dedup_signals(signals: pd.DataFrame) -> pd.DataFrame:
+    """Unique ``(open_time, direction, sl_price)`` signal keys in open_time order."""
+    cols = ["open_time", "direction", "sl_price"]
+    return (
+        signals[cols].drop_duplicates().sort_values("open_time").reset_index(drop=True)
+    )
+
+
 def resolve_touch_trades(
     bars: pd.DataFrame,
     signals: pd.DataFrame,
@@ -190,14 +206,11 @@ def resolve_touch_trades(
     is disabled (``min_sl_pct=0``, ``atr_sl_floor=False``) so ``Trade.sl_price``
     equals the input and the touch↔trade merge stays exact.
     """
-    cols = ["open_time", "direction", "sl_price"]
     out_cols = ["open_time", "direction", "sl_price", "pnl_r", "pnl_r_gross"]
     if signals.empty:
         return pd.DataFrame({c: [] for c in out_cols})
 
-    dedup = (
-        signals[cols].drop_duplicates().sort_values("open_time").reset_index(drop=True)
-    )
+    dedup = _dedup_signals(signals)
     result = run_backtest(
         bars,
         dedup,
@@ -268,22 +281,186 @@ def extract_zone_touches(
     zones = extract_zones(
         bars, zone_type, band_atr_frac=band_atr_frac, step=step, symbol=symbol, tf=tf
     )
-    out: list[tuple[Zone, list[Touch]]] = []
-    for zone in zones:
-        touches = index_touches(zone, bars, min_gap_bars=min_gap_bars)
-        if touches:
-            out.append((zone, touches))
+    per_zone = index_zone_touches(zones, bars, min_gap_bars=min_gap_bars)
+    return [(z, ts) for z, ts in zip(zones, per_zone, strict=True) if ts]
+
+
+def _touch_signal_grid(
+    zone_touches: Sequence[tuple[Zone, list[Touch]]],
+    bars: pd.DataFrame,
+    *,
+    sl_models: Sequence[str],
+    atr_floor_frac: float = 0.5,
+    atr_mult: float = 1.0,
+) -> dict[str, pd.DataFrame]:
+    """`build_touch_signals` for every zone under every sl-model, keyed by model.
+
+    Each frame equals the concatenation of the per-zone frames; the ATR is
+    computed once per ``bars`` instead of once per zone and the stops follow
+    `touch_sl_price` elementwise (NaN inputs included).
+    """
+    closes = bars["close"].to_numpy(dtype=float)
+    open_time = bars["open_time"].to_numpy(dtype="int64")
+    atr = _atr14(bars).to_numpy(dtype=float)
+    med_atr = float(pd.Series(atr).median())
+
+    counts = [len(touches) for _, touches in zone_touches]
+    idx = np.array(
+        [t.bar_idx for _, touches in zone_touches for t in touches], dtype=np.intp
+    )
+    is_long = np.repeat([z.bias == "long" for z, _ in zone_touches], counts)
+    far_edge = np.repeat(
+        [z.zone_low if z.bias == "long" else z.zone_high for z, _ in zone_touches],
+        counts,
+    ).astype(float)
+    in_range = (idx >= 0) & (idx < len(atr))
+    a_at = atr[np.clip(idx, 0, len(atr) - 1)]
+    a = np.where(in_range & (a_at > 0.0), a_at, med_atr)
+    entry_ref = closes[idx]
+
+    base = {
+        "open_time": open_time[idx],
+        "direction": [z.bias for z, ts in zone_touches for _ in ts],
+        "touch_index": [int(t.touch_index) for _, ts in zone_touches for t in ts],
+        "zone_id": [_zone_id(z) for z, ts in zone_touches for _ in ts],
+    }
+    out: dict[str, pd.DataFrame] = {}
+    for sl_model in sl_models:
+        if sl_model == "structural":
+            sl = far_edge
+        elif sl_model == "fixed_atr":
+            dist = atr_mult * a
+            sl = np.where(is_long, entry_ref - dist, entry_ref + dist)
+        elif sl_model == "atr_floor":
+            floor = atr_floor_frac * a
+            below, above = entry_ref - floor, entry_ref + floor
+            # where() rather than minimum()/maximum(): the builtin min/max of
+            # touch_sl_price keep the structural edge when the floor is NaN.
+            sl = np.where(
+                is_long,
+                np.where(below < far_edge, below, far_edge),
+                np.where(above > far_edge, above, far_edge),
+            )
+        else:
+            raise ValueError(f"unknown sl_model: {sl_model!r}")
+        out[sl_model] = pd.DataFrame({**base, "sl_price": sl})[_SIGNAL_COLUMNS]
     return out
 
 
-def simulate_cell(
+def _first_at_or_below(
+    table: npt.NDArray[np.float64],
+    start: npt.NDArray[np.intp],
+    level: npt.NDArray[np.float64],
+) -> npt.NDArray[np.intp]:
+    """Per query, the first bar ``>= start`` of a min sparse table ``<= level``."""
+    return _next_hit(table, start, lambda m: m <= level)
+
+
+def _resolve_exits(
+    bars: pd.DataFrame,
+    signals: pd.DataFrame,
+    tp_r_grid: Sequence[float],
+    *,
+    fee_pct: float = 0.0,
+    slippage_pct: float = 0.0,
+    funding_series: pd.Series | None = None,
+) -> tuple[npt.NDArray[np.bool_], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Engine exits of every signal row under every ``tp_r`` in one pass.
+
+    Returns ``(closed, pnl_r, pnl_r_gross)``, each shaped ``(len(tp_r_grid),
+    len(signals))``; ``closed`` marks the rows `resolve_touch_trades` would
+    return a trade for. Entry, stop / target geometry, the SL-first tie rule
+    and the fee / slippage / funding arithmetic are those of ``run_backtest``
+    (with ``min_sl_pct=0`` and no ATR floor) operation for operation, so the
+    R values are bit-identical. Only the bar scan differs: instead of testing
+    every later bar per trade, the first stop / target bar comes from
+    sparse-table minima of the lows and of the negated highs
+    (`analytics.structural_touch._next_hit`), shared by all trades and
+    ``tp_r`` values — a NaN bar never hits, as in the engine.
+    """
+    n_tp, n_sig = len(tp_r_grid), len(signals)
+    closed = np.zeros((n_tp, n_sig), dtype=bool)
+    net = np.full((n_tp, n_sig), np.nan)
+    gross = np.full((n_tp, n_sig), np.nan)
+    n = len(bars)
+    if n == 0 or n_sig == 0 or n_tp == 0:
+        return closed, net, gross
+
+    times = bars["open_time"].to_numpy(dtype=np.int64)
+    opens = bars["open"].to_numpy(dtype=float)
+    highs = bars["high"].to_numpy(dtype=float)
+    lows = bars["low"].to_numpy(dtype=float)
+
+    # Signal candle → bar index; a repeated bar time maps to its last row.
+    index = pd.Index(times)
+    last = ~index.duplicated(keep="last")
+    pos = index[last].get_indexer(signals["open_time"].to_numpy(dtype=np.int64))
+    entry_idx = np.where(pos >= 0, np.flatnonzero(last)[np.maximum(pos, 0)] + 1, n)
+    rows = np.flatnonzero(entry_idx < n)
+    if not len(rows):
+        return closed, net, gross
+
+    start = entry_idx[rows]
+    entry = opens[start]
+    sl = signals["sl_price"].to_numpy(dtype=float)[rows]
+    is_long = signals["direction"].to_numpy(dtype=object)[rows] == "long"
+    tp_r = np.asarray(tp_r_grid, dtype=float)[:, None]
+    risk = np.abs(entry - sl)
+    tp = np.where(is_long, entry + tp_r * risk, entry - tp_r * risk)
+
+    # Long: stop on low <= sl, target on high >= tp ⇔ -high <= -tp. Short:
+    # the mirror image. Both are "first bar at or below a level" searches.
+    down = sparse_table(np.where(np.isnan(lows), np.inf, lows), np.minimum)
+    up = sparse_table(np.where(np.isnan(highs), np.inf, -highs), np.minimum)
+    sl_hit = np.empty(len(rows), dtype=np.intp)
+    tp_hit = np.empty((n_tp, len(rows)), dtype=np.intp)
+    for side_long, sign in ((True, 1.0), (False, -1.0)):
+        q = np.flatnonzero(is_long == side_long)
+        if not len(q):
+            continue
+        sl_table, tp_table = (down, up) if side_long else (up, down)
+        sl_hit[q] = _first_at_or_below(sl_table, start[q], sign * sl[q])
+        tp_hit[:, q] = _first_at_or_below(
+            tp_table, np.tile(start[q], n_tp), (-sign * tp[:, q]).ravel()
+        ).reshape(n_tp, len(q))
+
+    loss = (sl_hit <= tp_hit) & (sl_hit < n)
+    hit = loss | (tp_hit < n)
+    exit_idx = np.where(loss, sl_hit, tp_hit)
+    exit_price = np.where(loss, sl, tp)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        raw = np.where(
+            is_long, (exit_price - entry) / risk, (entry - exit_price) / risk
+        )
+        fee_drag = 2.0 * fee_pct * entry / risk
+        slippage_drag = 2.0 * slippage_pct * entry / risk
+    ok = hit & (risk != 0.0)
+
+    funding_r = np.zeros((n_tp, len(rows)))
+    if funding_series is not None and not funding_series.empty:
+        j_idx, q_idx = np.nonzero(ok & (risk > 0.0))
+        held, funding_sum = FundingIndex.of(funding_series).window(
+            times[start[q_idx]], times[exit_idx[j_idx, q_idx]]
+        )
+        side_sign = np.where(is_long[q_idx], 1.0, -1.0)
+        funding_r[j_idx, q_idx] = np.where(
+            held > 0, side_sign * funding_sum * entry[q_idx] / risk[q_idx], 0.0
+        )
+
+    closed[:, rows] = ok
+    net[:, rows] = raw - fee_drag - slippage_drag - funding_r
+    gross[:, rows] = raw
+    return closed, net, gross
+
+
+def simulate_grid(
     bars: pd.DataFrame,
     zone_type: str,
     *,
     symbol: str,
     tf: str,
-    tp_r: float,
-    sl_model: str,
+    tp_r_grid: Sequence[float],
+    sl_models: Sequence[str],
     fee_pct: float = 0.0,
     slippage_pct: float = 0.0,
     funding_series: pd.Series | None = None,
@@ -294,10 +471,14 @@ def simulate_cell(
     atr_mult: float = 1.0,
     zone_touches: Sequence[tuple[Zone, list[Touch]]] | None = None,
 ) -> pd.DataFrame:
-    """Per-touch realized-R rows for one (symbol, tf, zone_type, tp_r, sl_model).
-
-    ``zone_touches`` (zone, touches) pairs may be supplied to skip re-extraction
-    across a tp_r × sl_model grid; when ``None`` they are extracted from ``bars``.
+    """Per-touch realized-R rows for one (symbol, tf, zone_type) over a
+    tp_r × sl_model grid.
+
+    Touches are extracted once (or taken from ``zone_touches``), stops once per
+    sl-model, and every (signal, tp_r) exit is resolved in a single batched
+    `_resolve_exits` pass. Rows come cell by cell — tp_r outer, sl_model
+    inner, empty cells skipped — each cell exactly as `build_touch_signals` →
+    `resolve_touch_trades` → `_merge_touches_to_trades` would give it.
     """
     empty = pd.DataFrame({c: [] for c in REALIZED_TABLE_COLUMNS})
     if zone_touches is None:
@@ -310,44 +491,90 @@ def simulate_cell(
             min_gap_bars=min_gap_bars,
             fib_step=fib_step,
         )
-    if not zone_touches:
+    if not zone_touches or not sl_models:
         return empty
 
-    sig_frames = [
-        build_touch_signals(
-            zone,
-            touches,
-            bars,
-            sl_model=sl_model,
-            atr_floor_frac=atr_floor_frac,
-            atr_mult=atr_mult,
-        )
-        for zone, touches in zone_touches
-    ]
-    touch_signals = pd.concat(sig_frames, ignore_index=True)
-    if touch_signals.empty:
+    touch_signals = _touch_signal_grid(
+        zone_touches,
+        bars,
+        sl_models=sl_models,
+        atr_floor_frac=atr_floor_frac,
+        atr_mult=atr_mult,
+    )
+    dedups = [_dedup_signals(touch_signals[m]) for m in sl_models]
+    bounds = np.cumsum([0] + [len(d) for d in dedups]).tolist()
+    closed, net, gross = _resolve_exits(
+        bars,
+        pd.concat(dedups, ignore_index=True),
+        tp_r_grid,
+        fee_pct=fee_pct,
+        slippage_pct=slippage_pct,
+        funding_series=funding_series,
+    )
+
+    frames: list[pd.DataFrame] = []
+    for j, tp_r in enumerate(tp_r_grid):
+        for m, (sl_model, dedup) in enumerate(zip(sl_models, dedups, strict=True)):
+            cell = slice(bounds[m], bounds[m + 1])
+            keep = closed[j, cell]
+            trades = dedup[keep].assign(
+                pnl_r=net[j, cell][keep], pnl_r_gross=gross[j, cell][keep]
+            )
+            merged = _merge_touches_to_trades(touch_signals[sl_model], trades)
+            if merged.empty:
+                continue
+            merged["symbol"] = symbol
+            merged["tf"] = tf
+            merged["zone_type"] = zone_type
+            merged["tp_r"] = float(tp_r)
+            merged["sl_model"] = sl_model
+            frames.append(merged[REALIZED_TABLE_COLUMNS].reset_index(drop=True))
+    if not frames:
         return empty
+    return pd.concat(frames, ignore_index=True)
 
-    trades = resolve_touch_trades(
+
+def simulate_cell(
+    bars: pd.DataFrame,
+    zone_type: str,
+    *,
+    symbol: str,
+    tf: str,
+    tp_r: float,
+    sl_model: str,
+    fee_pct: float = 0.0,
+    slippage_pct: float = 0.0,
+    funding_series: pd.Series | None = None,
+    band_atr_frac: float = 0.25,
+    min_gap_bars: int = 1,
+    fib_step: int = 5,
+    atr_floor_frac: float = 0.5,
+    atr_mult: float = 1.0,
+    zone_touches: Sequence[tuple[Zone, list[Touch]]] | None = None,
+) -> pd.DataFrame:
+    """Per-touch realized-R rows for one (symbol, tf, zone_type, tp_r, sl_model).
+
+    ``zone_touches`` (zone, touches) pairs may be supplied to skip
+    re-extraction; when ``None`` they are extracted from ``bars``. Single-cell
+    form of `simulate_grid`.
+    """
+    return simulate_grid(
         bars,
-        touch_signals,
+        zone_type,
         symbol=symbol,
         tf=tf,
-        tp_r=tp_r,
+        tp_r_grid=[tp_r],
+        sl_models=[sl_model],
         fee_pct=fee_pct,
         slippage_pct=slippage_pct,
         funding_series=funding_series,
+        band_atr_frac=band_atr_frac,
+        min_gap_bars=min_gap_bars,
+        fib_step=fib_step,
+        atr_floor_frac=atr_floor_frac,
+        atr_mult=atr_mult,
+        zone_touches=zone_touches,
     )
-    merged = _merge_touches_to_trades(touch_signals, trades)
-    if merged.empty:
-        return empty
-
-    merged["symbol"] = symbol
-    merged["tf"] = tf
-    merged["zone_type"] = zone_type
-    merged["tp_r"] = float(tp_r)
-    merged["sl_model"] = sl_model
-    return merged[REALIZED_TABLE_COLUMNS].reset_index(drop=True)
 
 
 def build_realized_table(
@@ -367,8 +594,8 @@ def build_realized_table(
 ) -> pd.DataFrame:
     """Concatenated per-touch realized-R rows over the full symbol × tf × cell grid.
 
-    Zones are extracted once per (symbol, tf, zone_type) and reused across the
-    tp_r × sl_model grid (the slow extractor runs once, not per param).
+    Zones are extracted once per (symbol, tf, zone_type) and the whole
+    tp_r × sl_model grid is resolved from them in one `simulate_grid` call.
     """
     frames: list[pd.DataFrame] = []
     for (symbol, tf), bars in bars_by_symbol_tf.items():
@@ -385,24 +612,22 @@ def build_realized_table(
             )
             if not zt:
                 continue
-            for tp_r in tp_r_grid:
-                for sl_model in sl_models:
-                    df = simulate_cell(
-                        bars,
-                        zone_type,
-                        symbol=symbol,
-                        tf=tf,
-                        tp_r=tp_r,
-                        sl_model=sl_model,
-                        fee_pct=fee_pct,
-                        slippage_pct=slippage_pct,
-                        funding_series=funding,
-                        atr_floor_frac=atr_floor_frac,
-                        atr_mult=atr_mult,
-                        zone_touches=zt,
-                    )
-                    if not df.empty:
-                        frames.append(df)
+            df = simulate_grid(
+                bars,
+                zone_type,
+                symbol=symbol,
+                tf=tf,
+                tp_r_grid=tp_r_grid,
+                sl_models=sl_models,
+                fee_pct=fee_pct,
+                slippage_pct=slippage_pct,
+                funding_series=funding,
+                atr_floor_frac=atr_floor_frac,
+                atr_mult=atr_mult,
+                zone_touches=zt,
+            )
+            if not df.empty:
+                frames.append(df)
     if not frames:
         return pd.DataFrame({c: [] for c in REALIZED_TABLE_COLUMNS})
     return pd.concat(frames, ignore_index=True)
@@ -491,6 +716,15 @@ def evaluate_build(
             float
         )
 
+    # The tp_r × sl_model trial family of every cell at the headline tf, built
+    # in one grouping pass (groupby order = the (tp_r, sl_model) sort order).
+    family = table[(table["tf"] == headline_tf) & (table["touch_index"] == 1)]
+    trials_by_cell: dict[tuple[str, str], list[np.ndarray]] = {}
+    for key, grp in family.groupby(["zone_type", "direction", "tp_r", "sl_model"]):
+        arr = grp["pnl_r"].to_numpy(float)
+        if arr.shape[0] >= 2:
+            trials_by_cell.setdefault((str(key[0]), str(key[1])), []).append(arr)
+
     audit_cells = [
         audit_guard.AuditCell(label=f"{zt}/{d}", supp_r=first_by_cell[(zt, d)].tolist())
         for zt, d in cells
@@ -567,13 +801,7 @@ def evaluate_build(
         )
         mintrl_pass = mintrl is not None and np.isfinite(mintrl) and nf >= mintrl
         dsr, pbo = _family_dsr_pbo(
-            table,
-            zt,
-            d,
-            headline_tf=headline_tf,
-            sr_headline=sr,
-            n_headline=nf,
-            seed=seed,
+            trials_by_cell.get((zt, d), []), sr_headline=sr, n_headline=nf
         )
         dsr_pass = dsr is None or dsr >= 0.95
         pbo_pass = pbo is None or pbo <= 0.5
@@ -626,36 +854,21 @@ def _decay_split_ok(sub: pd.DataFrame, *, split_min: int) -> bool:
 
 
 def _family_dsr_pbo(
-    table: pd.DataFrame,
-    zone_type: str,
-    direction: str,
+    trial_arrays: Sequence[np.ndarray],
     *,
-    headline_tf: str,
     sr_headline: float,
     n_headline: int,
-    seed: int | None,
 ) -> tuple[float | None, float | None]:
-    """DSR / PBO over the tp_r × sl_model trial family for one cell (headline tf).
+    """DSR / PBO over one cell's tp_r × sl_model trial family (headline tf).
 
+    ``trial_arrays`` holds the first-touch R of every trial with ≥2 trades.
     DSR deflates the headline first-touch Sharpe against the family's
     expected-max; PBO is CSCV over the per-trial first-touch R matrix (forecast
     convention: truncate trials to the shortest, column-stack). Both are
     ``None`` when uncomputable (no positive headline Sharpe / <2 trials / <28
     aligned observations).
     """
-    cell = table[
-        (table["zone_type"] == zone_type)
-        & (table["direction"] == direction)
-        & (table["tf"] == headline_tf)
-        & (table["touch_index"] == 1)
-    ]
-    trial_arrays: list[np.ndarray] = []
-    trial_srs: list[float] = []
-    for _key, grp in cell.groupby(["tp_r", "sl_model"]):
-        arr = grp["pnl_r"].to_numpy(float)
-        if arr.shape[0] >= 2:
-            trial_arrays.append(arr)
-            trial_srs.append(_per_trade_sharpe(arr))
+    trial_srs = [_per_trade_sharpe(a) for a in trial_arrays]
 
     dsr: float | None = None
     if sr_headline > 0.0 and trial_srs:
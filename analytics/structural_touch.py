@@ -14,14 +14,17 @@ Pure functions over DataFrames; no DB / clock / network I/O.
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from typing import Any
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
 from analytics import zones_lib
+from analytics._rmq import range_extreme, sparse_table
+from analytics.research_guards import resample_mean_diffs
 
 # zones_lib `direction` ("bull"/"bear") → expected reaction on a touch.
 _BIAS = {"bull": "long", "bear": "short"}
@@ -77,26 +80,160 @@ def index_touches(
     outside the band (the very first eligible inside bar always counts).
     Contiguous inside bars are the same touch. Only bars with
     ``open_time > zone.start_ms`` are eligible (a level is touched after it
-    forms — causal).
+    forms — causal). One-zone form of `index_zone_touches`.
     """
+    return index_zone_touches([zone], bars, min_gap_bars=min_gap_bars)[0]
+
+
+def _next_hit(
+    table: npt.NDArray[np.float64],
+    start: npt.NDArray[np.intp],
+    hit: Callable[[npt.NDArray[np.float64]], npt.NDArray[np.bool_]],
+) -> npt.NDArray[np.intp]:
+    """Per query, the first bar ``>= start`` whose value satisfies ``hit``.
+
+    ``table`` is a sparse table (see `sparse_table`) whose op makes ``hit``
+    monotone — a block holds a hit iff its extreme does — so descending the
+    powers of two skips every hit-free block. ``hit`` receives one extreme per
+    query. Returns the number of bars when there is no such bar.
+    """
+    n = table.shape[1]
+    cur = start.copy()
+    for k in range(len(table) - 1, -1, -1):
+        width = 1 << k
+        fits = cur + width <= n
+        skip = fits & ~hit(table[k, np.minimum(cur, n - 1)])
+        cur = np.where(skip, cur + width, cur)
+    return np.minimum(cur, n)
+
+
+def index_zone_touches(
+    zones: Sequence[Zone],
+    bars: pd.DataFrame,
+    *,
+    min_gap_bars: int = 1,
+) -> list[list[Touch]]:
+    """`index_touches` for every zone at once, aligned with ``zones``.
+
+    Instead of testing every bar against every zone, each zone jumps from one
+    band entry to the next: sparse-table range extremes of low / high find the
+    next bar inside the band (``low <= zone_high`` and ``high >= zone_low``)
+    and the next bar outside it, so the work per zone is proportional to its
+    number of band crossings (times ``log(len(bars))``), not to the history
+    length. ``bars`` must be in ``open_time`` order.
+    """
+    out: list[list[Touch]] = [[] for _ in zones]
+    n = len(bars)
+    if not zones or n == 0:
+        return out
+
     open_time = bars["open_time"].to_numpy(dtype="int64")
-    high = bars["high"].to_numpy(dtype=float)
+    # A NaN bar is never inside a band: as low it sorts above it, as high below.
     low = bars["low"].to_numpy(dtype=float)
+    high = bars["high"].to_numpy(dtype=float)
+    low = np.where(np.isnan(low), np.inf, low)
+    high = np.where(np.isnan(high), -np.inf, high)
+    low_min = sparse_table(low, np.minimum)
+    low_max = sparse_table(low, np.maximum)
+    high_min = sparse_table(high, np.minimum)
+    high_max = sparse_table(high, np.maximum)
+
+    z_lo = np.array([z.zone_low for z in zones], dtype=float)
+    z_hi = np.array([z.zone_high for z in zones], dtype=float)
+    starts = np.array([z.start_ms for z in zones], dtype="int64")
+
+    def next_inside(
+        pos: npt.NDArray[np.intp], ids: npt.NDArray[np.intp]
+    ) -> npt.NDArray[np.intp]:
+        # The next bar reaching down to the band and the next reaching up to
+        # it; the later one is inside unless the band was gapped over, in which
+        # case search again from there (a bar inside stays put).
+        lo, hi = z_lo[ids], z_hi[ids]
+        while True:
+            a = _next_hit(low_min, pos, lambda v: v <= hi)
+            b = _next_hit(high_max, pos, lambda v: v >= lo)
+            pos = np.maximum(a, b)
+            at = np.minimum(pos, n - 1)
+            if not ((pos < n) & ~((low[at] <= hi) & (high[at] >= lo))).any():
+                return pos
+
+    def next_outside(
+        pos: npt.NDArray[np.intp], ids: npt.NDArray[np.intp]
+    ) -> npt.NDArray[np.intp]:
+        lo, hi = z_lo[ids], z_hi[ids]
+        above = _next_hit(low_max, pos, lambda v: v > hi)
+        below = _next_hit(high_min, pos, lambda v: v < lo)
+        return np.minimum(above, below)
+
+    # Only bars after formation are eligible; the first band entry always counts.
+    ids = np.arange(len(zones))
+    pos = next_inside(np.searchsorted(open_time, starts, side="right"), ids)
+    hits_zone, hits_bar = [ids[pos < n]], [pos[pos < n]]
+    ids, pos = ids[pos < n], pos[pos < n]
+    while len(ids):
+        left = next_outside(pos, ids)
+        ids, left = ids[left < n], left[left < n]
+        pos = next_inside(left, ids)
+        ids, left, pos = ids[pos < n], left[pos < n], pos[pos < n]
+        touch = pos - left >= min_gap_bars
+        hits_zone.append(ids[touch])
+        hits_bar.append(pos[touch])
+
+    zone_of = np.concatenate(hits_zone)
+    bar_of = np.concatenate(hits_bar)
+    for z, i in zip(zone_of.tolist(), bar_of.tolist(), strict=True):
+        touches = out[z]
+        touches.append(
+            Touch(touch_index=len(touches) + 1, bar_idx=i, ts_ms=int(open_time[i]))
+        )
+    return out
 
-    touches: list[Touch] = []
-    prev_inside = False
-    outside_run = min_gap_bars  # so the first eligible inside bar qualifies
-    for i in range(len(bars)):
-        if open_time[i] <= zone.start_ms:
-            continue
-        inside = low[i] <= zone.zone_high and high[i] >= zone.zone_low
-        if inside and not prev_inside and outside_run >= min_gap_bars:
-            touches.append(
-                Touch(touch_index=len(touches) + 1, bar_idx=i, ts_ms=int(open_time[i]))
-            )
-        outside_run = 0 if inside else outside_run + 1
-        prev_inside = inside
-    return touches
+
+def _touch_outcomes(
+    bars: pd.DataFrame,
+    bar_idx: npt.NDArray[np.intp],
+    long: npt.NDArray[np.bool_],
+    atr: npt.NDArray[np.float64],
+    *,
+    window: int,
+    hold_thr: float,
+    adv_thr: float,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.bool_]]:
+    """`touch_excursion` + `touch_held` for many touches at once (ATR > 0 each).
+
+    Returns (mfe_atr, mae_atr, held) per touch. The forward window's extremes
+    come from sparse-table range queries, and the first favorable / adverse
+    threshold bar from `_next_hit` — both excursions are monotone in the bar
+    high / low, so a block reaches a threshold iff its extreme does.
+    """
+    n = len(bars)
+    high = bars["high"].to_numpy(dtype=float)
+    low = bars["low"].to_numpy(dtype=float)
+    entry = bars["close"].to_numpy(dtype=float)[bar_idx]
+    lo = bar_idx + 1
+    hi = np.minimum(lo + window, n)
+    empty = hi <= lo
+
+    q_lo, q_hi = np.where(empty, 0, lo), np.where(empty, 1, hi)
+    h_max = range_extreme(sparse_table(high, np.maximum), np.maximum, q_lo, q_hi)
+    l_min = range_extreme(sparse_table(low, np.minimum), np.minimum, q_lo, q_hi)
+    fav = np.where(long, h_max - entry, entry - l_min)
+    adv = np.where(long, entry - l_min, h_max - entry)
+    mfe = np.where(empty, 0.0, np.maximum(fav, 0.0) / atr)
+    mae = np.where(empty, 0.0, np.maximum(adv, 0.0) / atr)
+
+    # Threshold walks: a NaN bar reaches no threshold (as in `touch_held`).
+    high_max = sparse_table(np.where(np.isnan(high), -np.inf, high), np.maximum)
+    low_min = sparse_table(np.where(np.isnan(low), np.inf, low), np.minimum)
+    start = np.minimum(lo, n)
+    up = _next_hit(high_max, start, lambda v: v - entry >= hold_thr * atr)
+    down = _next_hit(low_min, start, lambda v: entry - v >= adv_thr * atr)
+    up_adv = _next_hit(high_max, start, lambda v: v - entry >= adv_thr * atr)
+    down_fav = _next_hit(low_min, start, lambda v: entry - v >= hold_thr * atr)
+    first_fav = np.where(long, up, down_fav)
+    first_adv = np.where(long, down, up_adv)
+    held = ~empty & (first_fav < hi) & (first_fav < first_adv)
+    return mfe, mae, held
 
 
 def _atr14(df: pd.DataFrame, period: int = 14) -> pd.Series:
@@ -144,21 +281,19 @@ def _zone_from_dict(
 def _fib_walk_forward(df: pd.DataFrame, step: int) -> list[dict[str, Any]]:
     """Collect historical fib golden zones causally via expanding windows.
 
-    `extract_fib_golden_zones` returns only the single current zone, so we slide
-    an expanding window (each sees only `df[:end]` — no look-ahead) and dedup by
+    `extract_fib_golden_zones` returns only the single current zone; its
+    walk-forward history (each zone sees only `df[:end]` — no look-ahead) comes
+    from `extract_fib_golden_zone_history` in one linear pass, deduped by
     (start_ms, bounds). Returned in chronological start_ms order.
     """
-    n = len(df)
-    min_bars = 20 + 5 + 2  # swing_lookback + bos_lookback + 2 (extractor floor)
     seen: dict[tuple[int, float, float], dict[str, Any]] = {}
-    for end in range(min_bars, n + 1, max(1, step)):
-        for z in zones_lib.extract_fib_golden_zones(df.iloc[:end]):
-            key = (
-                int(z["start_ms"]),
-                round(float(z["zone_low"]), 8),
-                round(float(z["zone_high"]), 8),
-            )
-            seen.setdefault(key, z)
+    for z in zones_lib.extract_fib_golden_zone_history(df, step=step):
+        key = (
+            int(z["start_ms"]),
+            round(float(z["zone_low"]), 8),
+            round(float(z["zone_high"]), 8),
+        )
+        seen.setdefault(key, z)
     return [seen[k] for k in sorted(seen)]
 
 
@@ -251,7 +386,7 @@ def touch_held(
     """Did the level hold? True if favorable reaches ``hold_thr`` ATR before
     adverse reaches ``adv_thr`` ATR, walking bars after the touch in order.
 
-    Adverse-first same-bar tie (conservative, mirrors `_scan_forward`). A touch
+    Adverse-first same-bar tie (conservative, mirrors `backfill_outcomes`). A touch
     that reaches neither threshold inside `window` counts as NOT held.
     """
     if atr <= 0.0 or bar_idx < 0:
@@ -308,13 +443,13 @@ def build_touch_table(
     flag. The excursion ATR is taken at the touch bar (median fallback). Causal:
     excursions read only bars strictly after each touch.
     """
-    rows: list[dict[str, object]] = []
+    frames: list[pd.DataFrame] = []
     for (symbol, tf), raw in bars_by_symbol_tf.items():
         bars = raw.sort_values("open_time").reset_index(drop=True)
         if len(bars) < 3:
             continue
-        atr = _atr14(bars)
-        med = float(np.nanmedian(atr.to_numpy(dtype=float))) if len(atr) else 0.0
+        atr = _atr14(bars).to_numpy(dtype=float)
+        med = float(np.nanmedian(atr)) if len(atr) else 0.0
         for zt in zone_types:
             zones = extract_zones(
                 bars,
@@ -324,41 +459,53 @@ def build_touch_table(
                 symbol=symbol,
                 tf=tf,
             )
-            for z in zones:
-                zid = f"{symbol}:{tf}:{zt}:{z.start_ms}:{round(z.zone_low, 8)}"
-                for t in index_touches(z, bars, min_gap_bars=min_gap_bars):
-                    a = float(atr.iloc[t.bar_idx]) if t.bar_idx < len(atr) else med
-                    if not np.isfinite(a) or a <= 0.0:
-                        a = med
-                    if a <= 0.0:
-                        continue
-                    mfe, mae = touch_excursion(
-                        bars, t.bar_idx, bias=z.bias, atr=a, window=window
-                    )
-                    held = touch_held(
-                        bars,
-                        t.bar_idx,
-                        bias=z.bias,
-                        atr=a,
-                        window=window,
-                        hold_thr=hold_thr,
-                        adv_thr=adv_thr,
-                    )
-                    rows.append(
-                        {
-                            "symbol": symbol,
-                            "tf": tf,
-                            "zone_type": zt,
-                            "direction": z.bias,
-                            "zone_id": zid,
-                            "touch_index": t.touch_index,
-                            "mfe_atr": mfe,
-                            "mae_atr": mae,
-                            "held": held,
-                            "ts_ms": t.ts_ms,
-                        }
-                    )
-    return pd.DataFrame(rows, columns=TOUCH_TABLE_COLUMNS)
+            per_zone = index_zone_touches(zones, bars, min_gap_bars=min_gap_bars)
+            touched = [
+                (z, t) for z, ts in zip(zones, per_zone, strict=True) for t in ts
+            ]
+            if not touched:
+                continue
+            bar_idx = np.array([t.bar_idx for _, t in touched], dtype=np.intp)
+            a = atr[bar_idx]
+            a = np.where(np.isfinite(a) & (a > 0.0), a, med)
+            keep = ~(a <= 0.0)  # a NaN median is kept (as the scalar path does)
+            touched = [p for p, k in zip(touched, keep.tolist(), strict=True) if k]
+            if not touched:
+                continue
+            bar_idx, a = bar_idx[keep], a[keep]
+            long = np.array([z.bias == "long" for z, _ in touched])
+            mfe, mae, held = _touch_outcomes(
+                bars,
+                bar_idx,
+                long,
+                a,
+                window=window,
+                hold_thr=hold_thr,
+                adv_thr=adv_thr,
+            )
+            frames.append(
+                pd.DataFrame(
+                    {
+                        "symbol": symbol,
+                        "tf": tf,
+                        "zone_type": zt,
+                        "direction": [z.bias for z, _ in touched],
+                        "zone_id": [
+                            f"{symbol}:{tf}:{zt}:{z.start_ms}:{round(z.zone_low, 8)}"
+                            for z, _ in touched
+                        ],
+                        "touch_index": [t.touch_index for _, t in touched],
+                        "mfe_atr": mfe,
+                        "mae_atr": mae,
+                        "held": held,
+                        "ts_ms": [t.ts_ms for _, t in touched],
+                    },
+                    columns=TOUCH_TABLE_COLUMNS,
+                )
+            )
+    if not frames:
+        return pd.DataFrame([], columns=TOUCH_TABLE_COLUMNS)
+    return pd.concat(frames, ignore_index=True)
 
 
 @dataclass(frozen=True)
@@ -390,9 +537,7 @@ def _two_sample_lift_ci(
     """Bootstrap (lift, ci_lo, ci_hi, two_sided_p) for mean(a) − mean(b)."""
     rng = np.random.default_rng(seed)
     lift = float(a.mean() - b.mean())
-    ia = rng.integers(0, len(a), (n_boot, len(a)))
-    ib = rng.integers(0, len(b), (n_boot, len(b)))
-    diffs = a[ia].mean(axis=1) - b[ib].mean(axis=1)
+    diffs = resample_mean_diffs(a, b, n_boot, rng)
     lo, hi = np.percentile(diffs, [100 * alpha / 2, 100 * (1 - alpha / 2)])
     p = 2.0 * min(float(np.mean(diffs <= 0.0)), float(np.mean(diffs >= 0.0)))
     return lift, float(lo), float(hi), min(p, 1.0)
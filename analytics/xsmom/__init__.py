@@ -6,9 +6,11 @@ from analytics.xsmom.book import (
     XSBookResult,
     equity_curve,
     run_xs_backtest,
+    xs_book,
     xs_demeaned_forecasts,
     xs_forecasts,
     xs_leverage,
+    xs_leverage_grid,
 )
 from analytics.xsmom.diagnostics import (
     BetaAttribution,
@@ -20,9 +22,13 @@ from analytics.xsmom.diagnostics import (
 from analytics.xsmom.execution import (
     CapacityRun,
     ExecutionCostConfig,
+    adv_grid,
+    cost_rate_grid,
     dollar_adv,
+    dollar_adv_grid,
     run_xs_with_costs,
     turnover_cost_rate,
+    xs_book_with_costs,
 )
 from analytics.xsmom.live import (
     TargetBook,
@@ -37,12 +43,22 @@ from analytics.xsmom.live import (
 )
 from analytics.xsmom.replay import (
     load_daily_dollar_volumes,
+    replay_target_stream,
     replay_targets,
     replay_xs,
     replay_xs_capacity,
     replay_xs_trials,
 )
 from analytics.xsmom.report import XSReport, evaluate_xs, evaluate_xs_capacity
+from analytics.xsmom.stream import (
+    XSStreamState,
+    advance,
+    advance_panel,
+    stream_state_from_dict,
+    stream_state_to_dict,
+    stream_target_book,
+    target_book_drift,
+)
 
 __all__ = [
     "BetaAttribution",
@@ -53,9 +69,15 @@ __all__ = [
     "TargetPosition",
     "XSBookResult",
     "XSReport",
+    "XSStreamState",
+    "adv_grid",
+    "advance",
+    "advance_panel",
     "beta_attribution",
     "build_target_book",
+    "cost_rate_grid",
     "dollar_adv",
+    "dollar_adv_grid",
     "equal_weight_market_return",
     "equity_curve",
     "evaluate_xs",
@@ -65,17 +87,25 @@ __all__ = [
     "next_period_leverage",
     "position_deltas",
     "reconcile",
+    "replay_target_stream",
     "replay_targets",
     "replay_xs",
     "replay_xs_capacity",
     "replay_xs_trials",
     "run_xs_backtest",
     "run_xs_with_costs",
+    "stream_state_from_dict",
+    "stream_state_to_dict",
+    "stream_target_book",
     "subperiod_sharpe",
+    "target_book_drift",
     "target_book_from_dict",
     "target_book_to_dict",
     "turnover_cost_rate",
+    "xs_book",
+    "xs_book_with_costs",
     "xs_demeaned_forecasts",
     "xs_forecasts",
     "xs_leverage",
+    "xs_leverage_grid",
 ]
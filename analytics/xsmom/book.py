@@ -12,16 +12,17 @@ from dataclasses import dataclass
 import numpy as np
 import pandas as pd
 
+from analytics.forecast.cache import (
+    ForecastCache,
+    Grid,
+    apply_governor,
+    build_forecast_cache,
+    row_mean,
+    union_lag,
+    vol_parity_leverage,
+)
 from analytics.forecast.config import ForecastConfig
-from analytics.forecast.ewmac import combine_forecasts
-from analytics.forecast.vol import ew_return_vol
-
-
-def _union_index(closes: dict[str, pd.Series]) -> pd.DatetimeIndex:
-    union = pd.DatetimeIndex([])
-    for s in closes.values():
-        union = union.union(pd.DatetimeIndex(s.index))
-    return union.sort_values()
+from analytics.forecast.panel import DailyPanel
 
 
 def xs_forecasts(closes: dict[str, pd.Series], cfg: ForecastConfig) -> pd.DataFrame:
@@ -34,14 +35,12 @@ def xs_forecasts(closes: dict[str, pd.Series], cfg: ForecastConfig) -> pd.DataFr
     Causal: each column is `combine_forecasts(...)`, which uses only closes through
     each day.
     """
-    union = _union_index(closes)
-    cols: dict[str, pd.Series] = {}
-    for sym, close in closes.items():
-        f = combine_forecasts(
-            close, cfg.speeds, cfg.fdm, cfg.vol_span, cfg.cap, weights=cfg.weights
-        )
-        cols[sym] = f.reindex(union)
-    return pd.DataFrame(cols, index=union)
+    panel = DailyPanel.from_series(closes)
+    return pd.DataFrame(
+        build_forecast_cache(panel, cfg).combined_forecast(cfg),
+        index=panel.daily_index,
+        columns=list(panel.symbols),
+    )
 
 
 def xs_demeaned_forecasts(
@@ -68,24 +67,28 @@ def xs_leverage(closes: dict[str, pd.Series], cfg: ForecastConfig) -> pd.DataFra
     ``cfg.xs_dollar_neutral`` is set, the matrix is re-centered so each day's
     active leverage sums to zero (dollar-neutral).
     """
-    demeaned = xs_demeaned_forecasts(closes, cfg)
-    demeaned_shifted = demeaned.shift(1)
-    union = pd.DatetimeIndex(demeaned.index)
-    ann = np.sqrt(cfg.annualization_days)
-
-    lev_cols: dict[str, pd.Series] = {}
-    for sym, close in closes.items():
-        vol_ann = ew_return_vol(close, cfg.vol_span).mul(ann).reindex(union)
-        lev = (demeaned_shifted[sym] / 10.0) * (cfg.vol_target_annual / vol_ann)
-        lev_cols[sym] = lev.replace([np.inf, -np.inf], np.nan)
-    lev_df = pd.DataFrame(lev_cols, index=union)
+    panel = DailyPanel.from_series(closes)
+    return pd.DataFrame(
+        xs_leverage_grid(build_forecast_cache(panel, cfg), cfg),
+        index=panel.daily_index,
+        columns=list(panel.symbols),
+    )
+
+
+def xs_leverage_grid(cache: ForecastCache, cfg: ForecastConfig) -> Grid:
+    """``xs_leverage`` as a ``(T, N)`` array over a prebuilt ``ForecastCache``."""
+    forecast = cache.combined_forecast(cfg)
+    demeaned = forecast - row_mean(forecast)[:, None]
+    leverage = vol_parity_leverage(
+        union_lag(demeaned), cache.vol_ann, cfg.vol_target_annual
+    )
     if cfg.xs_dollar_neutral:
         # Subtract the per-day active-set mean leverage so each day's positions
         # net to zero (dollar-neutral). Same skipna idiom as the forecast demean:
         # NaN cells stay NaN; a same-day op on already-shifted leverage adds no
         # look-ahead.
-        lev_df = lev_df.sub(lev_df.mean(axis=1), axis=0)
-    return lev_df
+        leverage = leverage - row_mean(leverage)[:, None]
+    return leverage
 
 
 @dataclass(frozen=True)
@@ -116,54 +119,52 @@ def run_xs_backtest(
     legs (long-short portfolio P&L; the level is set by the causal 20%-vol
     governor, so sum-vs-mean is only a scale it absorbs).
     """
-    leverage = xs_leverage(closes, cfg)
-    union = pd.DatetimeIndex(leverage.index)
-    cost = cfg.fee_pct + cfg.slippage_pct
-    rate_df = (
-        turnover_cost_rate.reindex(index=union)
-        if turnover_cost_rate is not None
-        else None
-    )
+    panel = DailyPanel.from_series(closes, fundings)
+    rate: Grid | None = None
+    if turnover_cost_rate is not None:
+        # legs without a supplied rate column fall back to the flat rate
+        rate = turnover_cost_rate.reindex(
+            index=panel.daily_index, columns=list(panel.symbols)
+        ).to_numpy(dtype=np.float64, copy=True)
+        missing = ~np.isin(panel.symbols, turnover_cost_rate.columns)
+        rate[:, missing] = cfg.fee_pct + cfg.slippage_pct
+    return xs_book(build_forecast_cache(panel, cfg), cfg, cost_rate=rate)
+
+
+def xs_book(
+    cache: ForecastCache,
+    cfg: ForecastConfig,
+    *,
+    leverage: Grid | None = None,
+    cost_rate: Grid | None = None,
+) -> XSBookResult:
+    """``run_xs_backtest`` over a prebuilt ``ForecastCache``.
 
-    per_net: dict[str, pd.Series] = {}
-    net_cols: list[pd.Series] = []
-    for sym, close in closes.items():
-        lev = leverage[sym]
-        r = close.pct_change().reindex(union)
-        gross = lev * r
-        dlev = (lev - lev.shift(1).fillna(0.0)).abs()
-        if rate_df is not None and sym in rate_df.columns:
-            turnover = dlev * rate_df[sym]
-        else:
-            turnover = dlev * cost
-        fund = (
-            fundings.get(sym, pd.Series(0.0, index=close.index))
-            .reindex(union)
-            .fillna(0.0)
-        )
-        funding_cost = lev * fund
-        net = gross - turnover - funding_cost
-        per_net[sym] = net
-        net_cols.append(net)
-
-    net_mat = pd.concat(net_cols, axis=1)
-    active = net_mat.notna().sum(axis=1)
-    pre = net_mat.sum(axis=1)  # all-NaN warm-up rows -> 0.0 (skipna)
-
-    ann = np.sqrt(cfg.annualization_days)
-    trailing_vol = (
-        pre.rolling(cfg.gov_window, min_periods=cfg.gov_window).std().shift(1) * ann
-    )
-    g = (cfg.vol_target_annual / trailing_vol).clip(cfg.g_min, cfg.g_max)
-    port = g.fillna(0.0) * pre
+    ``leverage`` (from ``xs_leverage_grid``) may be passed in when the caller
+    reuses one trial's positions across several cost models; ``cost_rate`` is
+    the ``(T, N)`` per-leg turnover rate (default: flat ``fee + slippage``).
+    """
+    lev = leverage if leverage is not None else xs_leverage_grid(cache, cfg)
+    rate = cost_rate if cost_rate is not None else cfg.fee_pct + cfg.slippage_pct
+    gross = lev * cache.returns
+    dlev = np.abs(lev - np.nan_to_num(union_lag(lev), nan=0.0))
+    net = gross - dlev * rate - lev * cache.panel.funding
+
+    active = (~np.isnan(net)).sum(axis=1)
+    pre = np.where(np.isnan(net), 0.0, net).sum(axis=1)  # all-NaN warm-up rows -> 0.0
+    port, g = apply_governor(pre, cfg)
 
+    union = cache.panel.daily_index
     return XSBookResult(
         daily_index=union,
-        portfolio_return=port.to_numpy(dtype=np.float64),
-        pre_governor_return=pre.to_numpy(dtype=np.float64),
-        governor=g.to_numpy(dtype=np.float64),
-        active_count=active.to_numpy(dtype=np.int64),
-        per_instrument_net=per_net,
+        portfolio_return=port,
+        pre_governor_return=pre,
+        governor=g,
+        active_count=active.astype(np.int64),
+        per_instrument_net={
+            sym: pd.Series(net[:, i], index=union)
+            for i, sym in enumerate(cache.panel.symbols)
+        },
     )
 
 
@@ -17,8 +17,14 @@ from typing import TypedDict
 import numpy as np
 import pandas as pd
 
+from analytics.forecast.cache import (
+    ForecastCache,
+    build_forecast_cache,
+    union_lag,
+)
 from analytics.forecast.config import ForecastConfig
-from analytics.xsmom.book import XSBookResult, run_xs_backtest, xs_leverage
+from analytics.forecast.panel import DailyPanel, Grid
+from analytics.xsmom.book import XSBookResult, xs_book, xs_leverage_grid
 
 
 class CapacityRun(TypedDict):
@@ -80,27 +86,53 @@ def turnover_cost_rate(
         },
         index=idx,
     )
+    rate = cost_rate_grid(
+        leverage.to_numpy(dtype=np.float64), adv_df.to_numpy(dtype=np.float64), cfg
+    )
+    return pd.DataFrame(rate, index=idx, columns=leverage.columns)
+
+
+def adv_grid(adv: dict[str, pd.Series], panel: DailyPanel) -> Grid:
+    """``adv`` laid out on the panel's ``(T, N)`` grid (NaN where missing)."""
+    return np.asarray(
+        pd.DataFrame(adv)
+        .reindex(index=panel.daily_index, columns=list(panel.symbols))
+        .to_numpy(dtype=np.float64),
+        dtype=np.float64,
+    )
 
+
+def dollar_adv_grid(panel: DailyPanel, window: int) -> Grid:
+    """``dollar_adv`` of the panel's dollar volume, on its ``(T, N)`` grid."""
+    dv = panel.compact_frame(panel.dollar_volume)
+    return panel.expand(dv.rolling(window).median().shift(1).to_numpy(np.float64))
+
+
+def cost_rate_grid(leverage: Grid, adv: Grid, cfg: ExecutionCostConfig) -> Grid:
+    """``turnover_cost_rate`` on aligned ``(T, N)`` leverage / ADV arrays."""
     # A-priori half-spread tiers (bps -> fraction). NaN ADV falls to the alt
     # default but the impact term below makes the whole rate NaN there anyway.
-    conds = [adv_df >= cfg.major_cutoff, adv_df >= cfg.mid_cutoff]
-    choices = [cfg.major_bps, cfg.mid_bps]
-    half_spread = pd.DataFrame(
-        np.select(conds, choices, default=cfg.alt_bps) / 1e4,
-        index=idx,
-        columns=leverage.columns,
+    half_spread = (
+        np.select(
+            [adv >= cfg.major_cutoff, adv >= cfg.mid_cutoff],
+            [cfg.major_bps, cfg.mid_bps],
+            default=cfg.alt_bps,
+        )
+        / 1e4
     )
 
-    dlev = (leverage - leverage.shift(1).fillna(0.0)).abs()
-    participation = (dlev * cfg.capital / adv_df).replace([np.inf, -np.inf], np.nan)
+    dlev = np.abs(leverage - np.nan_to_num(union_lag(leverage), nan=0.0))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        participation = dlev * cfg.capital / adv
+    participation = np.where(np.isinf(participation), np.nan, participation)
     if cfg.impact == "sqrt":
-        impact = cfg.k * participation.pow(0.5)
+        impact = cfg.k * np.power(participation, 0.5)
     elif cfg.impact == "linear":
         impact = cfg.k * participation
     else:
         raise ValueError(f"unknown impact form: {cfg.impact!r}")
 
-    return cfg.fee_pct + half_spread + impact
+    return np.asarray(cfg.fee_pct + half_spread + impact, dtype=np.float64)
 
 
 def run_xs_with_costs(
@@ -113,9 +145,28 @@ def run_xs_with_costs(
     """Run the XS book under the size-aware cost model.
 
     Builds the leverage matrix once to derive `|Δlev|`, computes the per-day
-    cost-rate, and feeds it to `run_xs_backtest`. `adv` is precomputed (it does
-    not depend on `cfg.speeds`) so the caller can reuse it across trials.
+    cost-rate, and prices the book with it (see `xs_book_with_costs`). `adv` is
+    precomputed (it does not depend on `cfg.speeds`) so the caller can reuse it
+    across trials.
+    """
+    panel = DailyPanel.from_series(closes, fundings)
+    cache = build_forecast_cache(panel, cfg)
+    return xs_book_with_costs(cache, cfg, exec_cfg, adv_grid(adv, panel))
+
+
+def xs_book_with_costs(
+    cache: ForecastCache,
+    cfg: ForecastConfig,
+    exec_cfg: ExecutionCostConfig,
+    adv: Grid,
+    leverage: Grid | None = None,
+) -> XSBookResult:
+    """``run_xs_with_costs`` over a prebuilt cache and ``adv_grid``.
+
+    Positions do not depend on ``exec_cfg``, so a capacity sweep passes the
+    trial's ``xs_leverage_grid`` once as ``leverage`` and only re-prices costs
+    per capital level.
     """
-    leverage = xs_leverage(closes, cfg)
-    rate = turnover_cost_rate(leverage, adv, exec_cfg)
-    return run_xs_backtest(closes, fundings, cfg, turnover_cost_rate=rate)
+    lev = leverage if leverage is not None else xs_leverage_grid(cache, cfg)
+    rate = cost_rate_grid(lev, adv, exec_cfg)
+    return xs_book(cache, cfg, leverage=lev, cost_rate=rate)
@@ -1,8 +1,8 @@
 """Read-only DuckDB front door for the cross-sectional momentum sleeve.
 
-Reuses the trend sleeve's `load_daily_inputs` (1d closes + summed daily funding)
-and runs the XS book. The only module in `analytics/xsmom/` that touches the DB;
-never writes.
+Reuses the trend sleeve's `load_daily_panel` (1d closes, dollar volume + summed
+daily funding) and runs the XS book. The only module in `analytics/xsmom/` that
+touches the DB; never writes.
 """
 
 from __future__ import annotations
@@ -14,21 +14,25 @@ import duckdb
 import numpy as np
 import pandas as pd
 
+from analytics.forecast.cache import build_forecast_cache
 from analytics.forecast.config import ForecastConfig
-from analytics.forecast.replay import load_daily_inputs
-from analytics.store.market_data import get_ohlcv
+from analytics.forecast.replay import load_daily_inputs, load_daily_panel
 from analytics.universe import load_universe
-from analytics.xsmom.book import XSBookResult, run_xs_backtest
+from analytics.xsmom.book import XSBookResult, xs_book, xs_leverage_grid
 from analytics.xsmom.execution import (
     CapacityRun,
     ExecutionCostConfig,
-    dollar_adv,
-    run_xs_with_costs,
+    dollar_adv_grid,
+    xs_book_with_costs,
 )
 from analytics.xsmom.live import TargetBook, build_target_book
+from analytics.xsmom.stream import XSStreamState, advance_panel, stream_target_book
 
-_FAR_PAST = 0
-_FAR_FUTURE = 9_999_999_999_999
+_DAY_MS: int = 86_400_000
+
+# Trailing days of closed bars the live stream re-reads on every run, so bars
+# that reach the DB late (partial / late syncs) still land in the target book.
+STREAM_RESTREAM_DAYS: int = 7
 
 
 def replay_xs(
@@ -38,8 +42,7 @@ def replay_xs(
 ) -> XSBookResult:
     """Load the universe's 1d inputs and run the XS book (read-only)."""
     syms = symbols if symbols is not None else load_universe()
-    closes, fundings = load_daily_inputs(conn, syms)
-    return run_xs_backtest(closes, fundings, cfg)
+    return xs_book(build_forecast_cache(load_daily_panel(conn, syms), cfg), cfg)
 
 
 def replay_xs_trials(
@@ -50,18 +53,19 @@ def replay_xs_trials(
     """Daily XS portfolio returns per single-speed sleeve + the combined book.
 
     The honest multiple-testing family for DSR/PBO. Keys:
-    `s{fast}_{slow}` per speed in `cfg.speeds`, plus `combined`.
+    `s{fast}_{slow}` per speed in `cfg.speeds`, plus `combined`. Every trial is
+    replayed from one shared `ForecastCache`.
     """
     syms = symbols if symbols is not None else load_universe()
-    closes, fundings = load_daily_inputs(conn, syms)
+    cache = build_forecast_cache(load_daily_panel(conn, syms), cfg)
 
     trials: dict[str, np.ndarray] = {}
     for fast, slow, scalar in cfg.speeds:
         single_cfg = dataclasses.replace(cfg, speeds=((fast, slow, scalar),))
-        result = run_xs_backtest(closes, fundings, single_cfg)
+        result = xs_book(cache, single_cfg)
         trials[f"s{fast}_{slow}"] = result.portfolio_return
 
-    combined = run_xs_backtest(closes, fundings, cfg)
+    combined = xs_book(cache, cfg)
     trials["combined"] = combined.portfolio_return
     return trials
 
@@ -73,20 +77,10 @@ def load_daily_dollar_volumes(
     """Per-symbol daily dollar volume (`volume * close`), day-indexed.
 
     Read-only sibling of `load_daily_inputs`; the impact term's ADV source.
-    Symbols with no OHLCV are silently skipped.
+    Symbols with no OHLCV are silently skipped. Per-symbol view of
+    `load_daily_panel`, which already carries dollar volume.
     """
-    out: dict[str, pd.Series] = {}
-    for sym in symbols:
-        bars = get_ohlcv(conn, sym, "1d", _FAR_PAST, _FAR_FUTURE)
-        if bars.empty:
-            continue
-        idx = pd.to_datetime(bars["open_time"], unit="ms", utc=True).dt.normalize()
-        dv = pd.Series(
-            bars["volume"].to_numpy(dtype=float) * bars["close"].to_numpy(dtype=float),
-            index=idx,
-        )
-        out[sym] = dv[~dv.index.duplicated(keep="last")].sort_index()
-    return out
+    return load_daily_panel(conn, symbols).dollar_volumes()
 
 
 def replay_xs_capacity(
@@ -101,23 +95,31 @@ def replay_xs_capacity(
     For each target capital `C`: rebuild each trial's own cost-rate (cost depends
     on that trial's `|Δlev|`), run the headline combined book and every
     single-speed sleeve. Returns `{C: {"result": XSBookResult, "trials": {...}}}`.
-    The dollar-ADV is independent of `C`, so it is computed once.
+    The dollar-ADV, the forecast cache and each trial's leverage are independent
+    of `C`, so they are computed once; only the cost rate is re-priced per `C`.
     """
     syms = symbols if symbols is not None else load_universe()
-    closes, fundings = load_daily_inputs(conn, syms)
-    dvol = load_daily_dollar_volumes(conn, syms)
-    adv = dollar_adv(dvol, exec_cfg.adv_window)
+    panel = load_daily_panel(conn, syms)
+    cache = build_forecast_cache(panel, cfg)
+    adv = dollar_adv_grid(panel, exec_cfg.adv_window)
+
+    singles = {
+        f"s{fast}_{slow}": dataclasses.replace(cfg, speeds=((fast, slow, scalar),))
+        for fast, slow, scalar in cfg.speeds
+    }
+    leverage = {key: xs_leverage_grid(cache, c) for key, c in singles.items()}
+    combined_lev = xs_leverage_grid(cache, cfg)
 
     out: dict[float, CapacityRun] = {}
     for capital in capitals:
         ec = dataclasses.replace(exec_cfg, capital=capital)
-        result = run_xs_with_costs(closes, fundings, cfg, ec, adv)
-        trials: dict[str, np.ndarray] = {}
-        for fast, slow, scalar in cfg.speeds:
-            single = dataclasses.replace(cfg, speeds=((fast, slow, scalar),))
-            trials[f"s{fast}_{slow}"] = run_xs_with_costs(
-                closes, fundings, single, ec, adv
+        result = xs_book_with_costs(cache, cfg, ec, adv, combined_lev)
+        trials: dict[str, np.ndarray] = {
+            key: xs_book_with_costs(
+                cache, single, ec, adv, leverage[key]
             ).portfolio_return
+            for key, single in singles.items()
+        }
         trials["combined"] = result.portfolio_return
         out[capital] = {"result": result, "trials": trials}
     return out
@@ -165,3 +167,45 @@ def replay_targets(
     fundings = _drop_unclosed_daily(fundings, now)
     fundings = {s: fundings[s] for s in closes if s in fundings}
     return build_target_book(closes, fundings, cfg, capital)
+
+
+def replay_target_stream(
+    conn: duckdb.DuckDBPyConnection,
+    cfg: ForecastConfig,
+    capital: float,
+    state: XSStreamState | None,
+    symbols: list[str] | None = None,
+    *,
+    now: pd.Timestamp | None = None,
+    restream_days: int = STREAM_RESTREAM_DAYS,
+) -> tuple[TargetBook, XSStreamState]:
+    """``replay_targets`` from a persisted stream checkpoint (read-only).
+
+    The checkpoint trails the last completed daily close by ``restream_days``:
+    each run advances it over the bars that have left that trailing window,
+    then streams the window itself — re-read from the DB every run — on top of
+    it for the book. A bar that lands late, or is rewritten by a later sync,
+    inside the window still reaches the book; only one older than the window
+    needs a reconcile against ``replay_targets``. With no checkpoint, or one
+    built for another universe or config, it is re-seeded from the full
+    history. Returns ``(book, checkpoint)``; persist the checkpoint.
+    """
+    now = now if now is not None else pd.Timestamp(datetime.now(UTC))
+    syms = symbols if symbols is not None else load_universe()
+    # A 1d bar opened at d closes at d + 1 day; keep only closed bars.
+    end = int(now.timestamp() * 1000) - _DAY_MS
+    cut = end - restream_days * _DAY_MS
+    if state is None or not state.matches(syms, cfg):
+        state = XSStreamState.empty(syms, cfg)
+    start = 0
+    if state.as_of is not None:
+        start = int((state.as_of + pd.Timedelta(days=1)).timestamp() * 1000)
+    if start <= cut:
+        panel = load_daily_panel(conn, syms, start=start, end=cut)
+        state = advance_panel(state, panel, cfg)
+    live = state
+    window_start = max(start, cut + 1)
+    if window_start <= end:
+        panel = load_daily_panel(conn, syms, start=window_start, end=end)
+        live = advance_panel(state, panel, cfg)
+    return stream_target_book(live, cfg, capital), state
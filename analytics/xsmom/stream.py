@@ -0,0 +1,372 @@
+"""Streaming (one-bar) form of the live XS target book.
+
+``build_target_book`` recomputes every forecast, vol and the governor from the
+full daily history and keeps only the last row. ``XSStreamState`` carries just
+the per-instrument recursions that row depends on — the fast/slow EMAs of every
+speed, the EW return-vol moments, the last close and the leverage held on the
+last day — plus the governor's trailing window of pre-governor returns, so
+``advance`` rolls the book forward one union day in O(N).
+
+The EMA / EW-vol updates are pandas' own ``ewm`` recursions (``adjust=False``
+mean; ``adjust=True`` bias-corrected std), stepped only on an instrument's own
+bar days, so a state seeded by folding ``advance`` over the history matches the
+vectorised book to float rounding. ``target_book_drift`` measures a streamed
+book against a full replay. Pure: no DB, no IO.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from analytics.forecast.cache import combine_legs, row_mean, vol_parity_leverage
+from analytics.forecast.config import ForecastConfig
+from analytics.forecast.panel import DailyPanel, Grid
+from analytics.xsmom.live import TargetBook, TargetPosition
+
+
+def config_key(cfg: ForecastConfig) -> str:
+    """Stable fingerprint of ``cfg``; a stream is only valid for the config it saw."""
+    return json.dumps(dataclasses.asdict(cfg), sort_keys=True)
+
+
+def _alpha(span: int) -> float:
+    # pandas ``get_center_of_mass`` then ``1 / (1 + com)``.
+    return 1.0 / (1.0 + (span - 1) / 2.0)
+
+
+@dataclass(frozen=True)
+class XSStreamState:
+    """Everything the next target book depends on, as of the ``as_of`` close.
+
+    Per instrument (columns = ``symbols``; NaN until first seen):
+
+    - *last_close*: close on the instrument's latest own bar.
+    - *ema* / *ema_wt*: ``(N, E)`` ``ewm(adjust=False).mean()`` value and
+      pending old-weight for every distinct EMA span in ``spans``.
+    - *vol_mean* / *vol_cov* / *vol_sum_wt* / *vol_sum_wt2* / *vol_old_wt* /
+      *vol_nobs*: the ``ewm(vol_span, adjust=True)`` variance moments of the
+      daily return; *vol_std* is its latest output (unshifted).
+    - *next_leverage*: raw vol-parity leverage for the next bar (before the
+      dollar-neutral re-center and the governor).
+    - *held_leverage*: the book's leverage held during ``as_of`` (turnover base).
+    - *forecast*: latest demeaned forecast, for context.
+
+    *pre_window* holds the trailing ``gov_window`` pre-governor returns.
+    """
+
+    config: str
+    symbols: tuple[str, ...]
+    spans: tuple[int, ...]
+    as_of: pd.Timestamp | None
+    last_close: Grid
+    ema: Grid
+    ema_wt: Grid
+    vol_mean: Grid
+    vol_cov: Grid
+    vol_sum_wt: Grid
+    vol_sum_wt2: Grid
+    vol_old_wt: Grid
+    vol_nobs: npt.NDArray[np.int64]
+    vol_std: Grid
+    next_leverage: Grid
+    held_leverage: Grid
+    forecast: Grid
+    pre_window: Grid
+
+    @classmethod
+    def empty(cls, symbols: list[str], cfg: ForecastConfig) -> XSStreamState:
+        """A state that has seen no bars for ``symbols``."""
+        syms = tuple(dict.fromkeys(symbols))
+        spans = tuple(sorted({s for fast, slow, _ in cfg.speeds for s in (fast, slow)}))
+        n = len(syms)
+        nan = np.full(n, np.nan)
+        one = np.ones(n)
+        return cls(
+            config=config_key(cfg),
+            symbols=syms,
+            spans=spans,
+            as_of=None,
+            last_close=nan,
+            ema=np.full((n, len(spans)), np.nan),
+            ema_wt=np.ones((n, len(spans))),
+            vol_mean=nan,
+            vol_cov=np.zeros(n),
+            vol_sum_wt=one,
+            vol_sum_wt2=one,
+            vol_old_wt=one,
+            vol_nobs=np.zeros(n, dtype=np.int64),
+            vol_std=nan,
+            next_leverage=nan,
+            held_leverage=nan,
+            forecast=nan,
+            pre_window=np.empty(0),
+        )
+
+    def matches(self, symbols: list[str], cfg: ForecastConfig) -> bool:
+        """True when this state was built for ``symbols`` under ``cfg``."""
+        wanted = tuple(dict.fromkeys(symbols))
+        return self.symbols == wanted and self.config == config_key(cfg)
+
+
+def _ewm_mean_step(
+    value: Grid, wt: Grid, x: Grid, bar: npt.NDArray[np.bool_], alpha: Grid
+) -> tuple[Grid, Grid]:
+    """One ``ewm(adjust=False, ignore_na=False).mean()`` step on ``bar`` columns."""
+    obs = bar & ~np.isnan(x)
+    seen = ~np.isnan(value)
+    step = bar & seen
+    wt = np.where(step, wt * (1.0 - alpha), wt)
+    move = step & obs & (value != x)
+    with np.errstate(invalid="ignore"):
+        blended = (wt * value + alpha * x) / (wt + alpha)
+    value = np.where(move, blended, value)
+    value = np.where(bar & ~seen & obs, x, value)
+    wt = np.where(step & obs, 1.0, wt)
+    return value, wt
+
+
+def _advance_vol(
+    state: XSStreamState, r: Grid, bar: npt.NDArray[np.bool_], cfg: ForecastConfig
+) -> dict[str, Any]:
+    """One ``ewm(vol_span, min_periods=vol_span).std()`` step on ``bar`` columns."""
+    f = 1.0 - _alpha(cfg.vol_span)
+    obs = bar & ~np.isnan(r)
+    nobs = state.vol_nobs + obs
+    mean = state.vol_mean
+    seen = ~np.isnan(mean)
+    step = bar & seen
+    sum_wt = np.where(step, state.vol_sum_wt * f, state.vol_sum_wt)
+    sum_wt2 = np.where(step, state.vol_sum_wt2 * (f * f), state.vol_sum_wt2)
+    old_wt = np.where(step, state.vol_old_wt * f, state.vol_old_wt)
+
+    upd = step & obs
+    with np.errstate(invalid="ignore"):
+        new_mean = np.where(
+            mean != r, ((old_wt * mean) + (1.0 * r)) / (old_wt + 1.0), mean
+        )
+        d_old = mean - new_mean
+        d_new = r - new_mean
+        cov = (
+            (old_wt * (state.vol_cov + (d_old * d_old))) + (1.0 * (d_new * d_new))
+        ) / (old_wt + 1.0)
+    cov = np.where(upd, cov, state.vol_cov)
+    mean = np.where(upd, new_mean, mean)
+    sum_wt = np.where(upd, sum_wt + 1.0, sum_wt)
+    sum_wt2 = np.where(upd, sum_wt2 + 1.0, sum_wt2)
+    old_wt = np.where(upd, old_wt + 1.0, old_wt)
+    mean = np.where(bar & ~seen & obs, r, mean)
+
+    numerator = sum_wt * sum_wt
+    denominator = numerator - sum_wt2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        var = np.where(denominator > 0.0, (numerator / denominator) * cov, np.nan)
+        std = np.where(var < 0.0, 0.0, np.sqrt(var))
+    std = np.where(nobs >= cfg.vol_span, std, np.nan)
+    return {
+        "vol_mean": mean,
+        "vol_cov": cov,
+        "vol_sum_wt": sum_wt,
+        "vol_sum_wt2": sum_wt2,
+        "vol_old_wt": old_wt,
+        "vol_nobs": nobs,
+        "vol_std": np.where(bar, std, state.vol_std),
+    }
+
+
+def advance(
+    state: XSStreamState,
+    day: pd.Timestamp,
+    close: Grid,
+    funding: Grid,
+    bar: npt.NDArray[np.bool_],
+    cfg: ForecastConfig,
+) -> XSStreamState:
+    """Roll ``state`` forward by one union day.
+
+    ``close`` / ``funding`` / ``bar`` are the day's ``(N,)`` row over
+    ``state.symbols`` (``bar`` = the instrument printed a 1d bar that day).
+    Books the day's pre-governor return from the leverage decided at the
+    previous close, then updates the recursions and decides the next leverage.
+    """
+    if state.as_of is not None and day <= state.as_of:
+        raise ValueError(
+            f"stream is at {state.as_of.date()}, cannot apply {day.date()}"
+        )
+
+    # The day's P&L on the leverage decided at the previous union close.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r = np.where(bar, close / state.last_close - 1.0, np.nan)
+    lev = np.where(bar, state.next_leverage, np.nan)
+    if cfg.xs_dollar_neutral:
+        lev = lev - row_mean(lev[None, :])[0]
+    rate = cfg.fee_pct + cfg.slippage_pct
+    dlev = np.abs(lev - np.nan_to_num(state.held_leverage, nan=0.0))
+    net = lev * r - dlev * rate - lev * funding
+    pre = np.where(np.isnan(net), 0.0, net).sum()
+    pre_window = np.append(state.pre_window, pre)[-cfg.gov_window :]
+
+    # Forecasts at this close use the return vol as of the previous own bar.
+    alpha = np.array([_alpha(s) for s in state.spans])
+    ema, ema_wt = _ewm_mean_step(
+        state.ema, state.ema_wt, close[:, None], bar[:, None], alpha[None, :]
+    )
+    pv = state.vol_std * close
+    parts = np.full((len(state.symbols), len(cfg.speeds)), np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for k, (fast, slow, scalar) in enumerate(cfg.speeds):
+            raw = ema[:, state.spans.index(fast)] - ema[:, state.spans.index(slow)]
+            parts[:, k] = np.clip((raw / pv) * scalar, -cfg.cap, cfg.cap)
+    combined = np.clip(combine_legs(parts, cfg.weights) * cfg.fdm, -cfg.cap, cfg.cap)
+    combined = np.where(bar, combined, np.nan)
+    demeaned = combined - row_mean(combined[None, :])[0]
+
+    vol = _advance_vol(state, r, bar, cfg)
+    ann = np.sqrt(cfg.annualization_days)
+    next_leverage = vol_parity_leverage(
+        demeaned, vol["vol_std"] * ann, cfg.vol_target_annual
+    )
+    return dataclasses.replace(
+        state,
+        as_of=day,
+        last_close=np.where(bar, close, state.last_close),
+        ema=ema,
+        ema_wt=ema_wt,
+        next_leverage=np.where(bar, next_leverage, np.nan),
+        held_leverage=lev,
+        forecast=demeaned,
+        pre_window=pre_window,
+        **vol,
+    )
+
+
+def advance_panel(
+    state: XSStreamState, panel: DailyPanel, cfg: ForecastConfig
+) -> XSStreamState:
+    """Fold ``advance`` over every day of ``panel`` (its symbols ⊆ the state's)."""
+    col = [state.symbols.index(s) for s in panel.symbols]
+    n = len(state.symbols)
+    for t, day in enumerate(panel.daily_index):
+        close = np.full(n, np.nan)
+        funding = np.zeros(n)
+        bar = np.zeros(n, dtype=bool)
+        close[col] = panel.close[t]
+        funding[col] = panel.funding[t]
+        bar[col] = panel.active[t]
+        state = advance(state, pd.Timestamp(day), close, funding, bar, cfg)
+    return state
+
+
+def next_governor(state: XSStreamState, cfg: ForecastConfig) -> float:
+    """``next_period_governor`` over the streamed trailing pre-governor window."""
+    if len(state.pre_window) < cfg.gov_window:
+        return 1.0
+    trailing_std = float(np.std(state.pre_window, ddof=1))
+    if not np.isfinite(trailing_std) or trailing_std <= 0.0:
+        return 1.0
+    g = cfg.vol_target_annual / (trailing_std * np.sqrt(cfg.annualization_days))
+    return float(np.clip(g, cfg.g_min, cfg.g_max))
+
+
+def stream_target_book(
+    state: XSStreamState, cfg: ForecastConfig, capital: float
+) -> TargetBook:
+    """``build_target_book`` from a streamed state (no history needed)."""
+    if state.as_of is None:
+        raise ValueError("stream has not seen a completed daily bar")
+    lev = state.next_leverage
+    if cfg.xs_dollar_neutral:
+        lev = lev - row_mean(lev[None, :])[0]
+    g_next = next_governor(state, cfg)
+
+    positions: list[TargetPosition] = []
+    for i in sorted(range(len(state.symbols)), key=lambda j: state.symbols[j]):
+        if not np.isfinite(lev[i]):
+            continue
+        scaled = g_next * float(lev[i])
+        side = "long" if scaled > 0 else "short" if scaled < 0 else "flat"
+        positions.append(
+            TargetPosition(
+                symbol=state.symbols[i],
+                side=side,
+                leverage=scaled,
+                notional_usd=scaled * capital,
+                forecast=float(state.forecast[i]),
+            )
+        )
+
+    return TargetBook(
+        as_of_date=state.as_of.date().isoformat(),
+        next_period_date=(state.as_of + pd.Timedelta(days=1)).date().isoformat(),
+        capital=capital,
+        governor=g_next,
+        active_count=len(positions),
+        gross_leverage=sum(abs(p.leverage) for p in positions),
+        net_leverage=sum(p.leverage for p in positions),
+        positions=positions,
+    )
+
+
+def target_book_drift(streamed: TargetBook, full: TargetBook) -> float:
+    """Max abs leverage / governor gap between a streamed and a full-replay book.
+
+    ``inf`` when the two disagree on the as-of date or the active set.
+    """
+    a = {p.symbol: p.leverage for p in streamed.positions}
+    b = {p.symbol: p.leverage for p in full.positions}
+    if streamed.as_of_date != full.as_of_date or a.keys() != b.keys():
+        return float("inf")
+    gaps = [abs(a[s] - b[s]) for s in a]
+    return max([abs(streamed.governor - full.governor), *gaps])
+
+
+_ARRAYS = (
+    "last_close",
+    "ema",
+    "ema_wt",
+    "vol_mean",
+    "vol_cov",
+    "vol_sum_wt",
+    "vol_sum_wt2",
+    "vol_old_wt",
+    "vol_std",
+    "next_leverage",
+    "held_leverage",
+    "forecast",
+    "pre_window",
+)
+
+
+def stream_state_to_dict(state: XSStreamState) -> dict[str, Any]:
+    """Plain JSON-serializable dict (NaN kept as JSON ``NaN``)."""
+    out: dict[str, Any] = {
+        "config": state.config,
+        "symbols": list(state.symbols),
+        "spans": list(state.spans),
+        "as_of": state.as_of.isoformat() if state.as_of is not None else None,
+        "vol_nobs": state.vol_nobs.tolist(),
+    }
+    out.update({name: getattr(state, name).tolist() for name in _ARRAYS})
+    return out
+
+
+def stream_state_from_dict(d: dict[str, Any]) -> XSStreamState:
+    """Inverse of ``stream_state_to_dict``."""
+    arrays = {name: np.asarray(d[name], dtype=np.float64) for name in _ARRAYS}
+    shape = (len(d["symbols"]), len(d["spans"]))
+    arrays["ema"] = arrays["ema"].reshape(shape)
+    arrays["ema_wt"] = arrays["ema_wt"].reshape(shape)
+    return XSStreamState(
+        config=d["config"],
+        symbols=tuple(d["symbols"]),
+        spans=tuple(d["spans"]),
+        as_of=pd.Timestamp(d["as_of"]) if d["as_of"] is not None else None,
+        vol_nobs=np.asarray(d["vol_nobs"], dtype=np.int64),
+        **arrays,
+    )
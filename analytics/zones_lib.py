@@ -10,6 +10,7 @@ from typing import Any
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 
 
 def extract_fvg_zones(
@@ -454,6 +455,96 @@ def extract_fib_golden_zones(
     ]
 
 
+def extract_fib_golden_zone_history(
+    df: pd.DataFrame,
+    swing_lookback: int = 20,
+    bos_lookback: int = 5,
+    step: int = 1,
+) -> list[dict[str, Any]]:
+    """Every Fib Golden Zone ``extract_fib_golden_zones`` reports walking forward.
+
+    Equivalent to calling ``extract_fib_golden_zones(df.iloc[:end])`` for every
+    ``end`` in ``range(swing_lookback + bos_lookback + 2, len(df) + 1, step)``
+    and keeping each distinct (start_ms, zone_low, zone_high) zone once, in the
+    order it is first confirmed — but in one vectorised pass over fixed-width
+    windows (the BOS swing only ever reads the last
+    ``swing_lookback + bos_lookback + 1`` bars of a prefix), so the cost is
+    linear in ``len(df)`` instead of quadratic. Causal: a zone is emitted at
+    the first prefix whose BOS confirms it.
+    """
+    n = len(df)
+    first_end = swing_lookback + bos_lookback + 2
+    if n < first_end or swing_lookback < 2 or bos_lookback < 1:
+        return []
+
+    open_times = df["open_time"].to_numpy(dtype=int)
+    highs = df["high"].to_numpy(dtype=float)
+    lows = df["low"].to_numpy(dtype=float)
+    closes = df["close"].to_numpy(dtype=float)
+
+    ends = np.arange(first_end, n + 1, max(1, step))
+    bos_start = ends - bos_lookback - 1
+    struct_start = bos_start - swing_lookback
+    h_w = sliding_window_view(highs, swing_lookback)[struct_start]
+    l_w = sliding_window_view(lows, swing_lookback)[struct_start]
+    bos_h = sliding_window_view(highs, bos_lookback)[bos_start]
+    bos_l = sliding_window_view(lows, bos_lookback)[bos_start]
+    bos_c = sliding_window_view(closes, bos_lookback)[bos_start]
+    rows = np.arange(len(ends))
+    pos = np.arange(swing_lookback)
+
+    # Bullish BOS: lowest low, then the highest high at/after it, broken above.
+    sl_loc = l_w.argmin(axis=1)
+    sl_price = l_w[rows, sl_loc]
+    sh_loc = np.where(pos >= sl_loc[:, None], h_w, -np.inf).argmax(axis=1)
+    sh_price = h_w[rows, sh_loc]
+    bull = (
+        (sl_loc + 1 < swing_lookback)
+        & (sh_price > sl_price)
+        & (sh_loc > sl_loc)
+        & ((bos_c > sh_price[:, None]) | (bos_h > sh_price[:, None])).any(axis=1)
+    )
+
+    # Bearish BOS (checked only when bullish fails): mirror image.
+    sh_loc2 = h_w.argmax(axis=1)
+    sh_price2 = h_w[rows, sh_loc2]
+    sl_loc2 = np.where(pos >= sh_loc2[:, None], l_w, np.inf).argmin(axis=1)
+    sl_price2 = l_w[rows, sl_loc2]
+    bear = (
+        ~bull
+        & (sh_loc2 + 1 < swing_lookback)
+        & (sh_price2 > sl_price2)
+        & (sl_loc2 > sh_loc2)
+        & ((bos_c < sl_price2[:, None]) | (bos_l < sl_price2[:, None])).any(axis=1)
+    )
+
+    swing_low = np.where(bull, sl_price, sl_price2)
+    swing_high = np.where(bull, sh_price, sh_price2)
+    swing_range = swing_high - swing_low
+    zone_low = np.where(
+        bull, swing_high - 0.618 * swing_range, swing_low + 0.5 * swing_range
+    )
+    zone_high = np.where(
+        bull, swing_high - 0.5 * swing_range, swing_low + 0.618 * swing_range
+    )
+    # The pivot that dates the zone: the swing high (bull) / swing low (bear).
+    start_ms = open_times[struct_start + np.where(bull, sh_loc, sl_loc2)]
+
+    zones: dict[tuple[int, float, float], dict[str, Any]] = {}
+    for i in np.flatnonzero((bull | bear) & (swing_range > 0.0)).tolist():
+        key = (int(start_ms[i]), float(zone_low[i]), float(zone_high[i]))
+        if key not in zones:
+            zones[key] = {
+                "zone_type": "fib_zone",
+                "direction": "bull" if bull[i] else "bear",
+                "zone_low": key[1],
+                "zone_high": key[2],
+                "start_ms": key[0],
+                "active": True,
+            }
+    return list(zones.values())
+
+
 def extract_ote_zones(
     df: pd.DataFrame,
     swing_lookback: int = 20,
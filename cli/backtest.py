@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import os
 from dataclasses import replace
 from typing import Any
 
@@ -134,6 +135,12 @@ def run_backtest(args: argparse.Namespace) -> None:
             cfg.atr_sl_multiplier_values = args.atr_sl_multiplier_values
         if getattr(args, "atr_sl_floor", False):
             cfg.atr_sl_floor = True
+        if not getattr(args, "resume", True):
+            cfg.resume = False
+        if getattr(args, "workers", None) is not None:
+            cfg.workers = args.workers
+        elif cfg.workers is None:
+            cfg.workers = min(4, max(1, (os.cpu_count() or 1) - 1))
         cfg.live_parity = _resolve_live_parity(args, cfg.live_parity)
         backtest_runner.run_backtest_sweep(cfg)
         return
@@ -291,6 +298,12 @@ def add_backtest_subparser(
             "that emit a structural sl_price."
         ),
     )
+    backtest_parser.add_argument(
+        "--no-resume",
+        action="store_false",
+        dest="resume",
+        help="Sweep mode: ignore and do not update the sweep cell store",
+    )
     backtest_parser.add_argument(
         "--min-trades",
         type=int,
@@ -317,8 +330,8 @@ def add_backtest_subparser(
         default=None,
         dest="workers",
         help=(
-            "Parallel workers for combo backtest (default: min(4, cpu_count-1)). "
-            "Pass 1 to run serially."
+            "Parallel workers for combo backtest and sweep signal detection "
+            "(default: min(4, cpu_count-1)). Pass 1 to run serially."
         ),
     )
     backtest_parser.add_argument(
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
+from pathlib import Path
 
 from analytics.strategies import KNOWN_STRATEGIES
 from cli._common import parse_since_to_ms
@@ -11,7 +13,11 @@ from cli._common import parse_since_to_ms
 def run_param_sweep(args: argparse.Namespace) -> None:
     import duckdb
 
-    from analytics.data_store import DEFAULT_DB_PATH
+    from analytics.data_store import (
+        DEFAULT_DB_PATH,
+        open_sweep_cell_store,
+        prune_sweep_cells,
+    )
     from analytics.param_sweep import (
         ParamRange,
         _parse_param_spec,
@@ -55,8 +61,15 @@ def run_param_sweep(args: argparse.Namespace) -> None:
 
     db_path = args.db or DEFAULT_DB_PATH
     conn: duckdb.DuckDBPyConnection = duckdb.connect(str(db_path), read_only=True)
+    cell_store = (
+        open_sweep_cell_store(Path(db_path))
+        if args.resume
+        else contextlib.nullcontext(None)
+    )
     try:
-        with timed("param-sweep total"):
+        with timed("param-sweep total"), cell_store as cells:
+            if cells is not None:
+                prune_sweep_cells(cells)
             report = _run(
                 conn=conn,
                 strategy=args.strategy,
@@ -73,6 +86,7 @@ def run_param_sweep(args: argparse.Namespace) -> None:
                 day_filter=args.day_filter,
                 atr_sl_multiplier=args.atr_sl_multiplier,
                 atr_sl_floor=args.atr_sl_floor,
+                cells=cells,
             )
     finally:
         conn.close()
@@ -91,7 +105,11 @@ def run_param_sweep(args: argparse.Namespace) -> None:
 def run_param_audit(args: argparse.Namespace) -> None:
     import duckdb
 
-    from analytics.data_store import DEFAULT_DB_PATH
+    from analytics.data_store import (
+        DEFAULT_DB_PATH,
+        open_sweep_cell_store,
+        prune_sweep_cells,
+    )
     from analytics.param_sweep import (
         format_audit_results,
         run_strategy_audit,
@@ -115,8 +133,15 @@ def run_param_audit(args: argparse.Namespace) -> None:
 
     db_path = args.db or DEFAULT_DB_PATH
     conn: duckdb.DuckDBPyConnection = duckdb.connect(str(db_path), read_only=True)
+    cell_store = (
+        open_sweep_cell_store(Path(db_path))
+        if args.resume
+        else contextlib.nullcontext(None)
+    )
     try:
-        with timed("param-audit total"):
+        with timed("param-audit total"), cell_store as cells:
+            if cells is not None:
+                prune_sweep_cells(cells)
             rows = run_strategy_audit(
                 conn=conn,
                 symbol=args.symbol,
@@ -131,6 +156,7 @@ def run_param_audit(args: argparse.Namespace) -> None:
                 day_filter=args.day_filter,
                 atr_sl_multiplier=args.atr_sl_multiplier,
                 atr_sl_floor=args.atr_sl_floor,
+                cells=cells,
             )
     finally:
         conn.close()
@@ -250,6 +276,12 @@ def add_param_sweep_subparser(
         default=None,
         help="Path to DuckDB database (default: analytics.db)",
     )
+    param_sweep_parser.add_argument(
+        "--no-resume",
+        action="store_false",
+        dest="resume",
+        help="Ignore and do not update the sweep cell store (recompute every cell)",
+    )
     param_sweep_parser.set_defaults(func=run_param_sweep)
 
 
@@ -338,4 +370,10 @@ def add_param_audit_subparser(
     param_audit_parser.add_argument(
         "--db", type=str, default=None, help="DuckDB path (default: analytics.db)"
     )
+    param_audit_parser.add_argument(
+        "--no-resume",
+        action="store_false",
+        dest="resume",
+        help="Ignore and do not update the sweep cell store (recompute every cell)",
+    )
     param_audit_parser.set_defaults(func=run_param_audit)
@@ -1,4 +1,4 @@
-"""Live position monitor: polling + Rich terminal."""
+"""Live position monitor: user-data stream (REST polling fallback) + Rich terminal."""
 
 import time
 from typing import Any
@@ -6,10 +6,12 @@ from typing import Any
 from rich.panel import Panel
 from rich.text import Text
 
-from monitor.position_lib import display_table
+from monitor.position_lib import display_table, format_position_display
+from monitor.position_state import PositionFeed, create_position_feed
 from utils.live_loop import run_live_loop
 
-REFRESH_INTERVAL = 5  # seconds
+REFRESH_INTERVAL = 5  # seconds, REST polling fallback
+STREAM_REFRESH_INTERVAL = 5.0  # seconds, heartbeat repaint while stream-driven
 
 
 def _render(
@@ -22,21 +24,34 @@ def _render(
     descending: bool,
     hide_empty: bool,
     compact: bool,
+    feed: PositionFeed | None = None,
 ) -> Panel:
-    """Fetch and format positions, wrapping in a Rich Panel."""
+    """Format positions (from the stream state when live, else REST) in a Rich Panel."""
     try:
-        output = display_table(
-            client,
-            coins_config,
-            coin_order,
-            wallet_target,
-            wallet_target_invalid,
-            sort_by=sort_by,
-            descending=descending,
-            telegram=False,
-            hide_empty=hide_empty,
-            compact=compact,
-        )
+        if feed is not None and feed.live:
+            output = format_position_display(
+                feed.snapshot(
+                    coins_config, coin_order, sort_by, descending, hide_empty
+                ),
+                wallet_target,
+                wallet_target_invalid,
+                sort_by=sort_by,
+                descending=descending,
+                compact=compact,
+            )
+        else:
+            output = display_table(
+                client,
+                coins_config,
+                coin_order,
+                wallet_target,
+                wallet_target_invalid,
+                sort_by=sort_by,
+                descending=descending,
+                telegram=False,
+                hide_empty=hide_empty,
+                compact=compact,
+            )
     except Exception as e:
         output = f"\nError fetching positions: {e}"
     ts = time.strftime("%H:%M:%S")
@@ -59,18 +74,29 @@ def run(
     compact: bool = False,
     interval: int = REFRESH_INTERVAL,
 ) -> None:
-    """Run live position monitor, polling every `interval` seconds until Ctrl-C."""
-    run_live_loop(
-        lambda: _render(
-            client,
-            coins_config,
-            coin_order,
-            wallet_target,
-            wallet_target_invalid,
-            sort_by,
-            descending,
-            hide_empty,
-            compact,
-        ),
-        interval=float(interval),
-    )
+    """Run live position monitor until Ctrl-C.
+
+    Positions come from the futures user-data stream; if it cannot start, fall
+    back to polling REST every `interval` seconds.
+    """
+    feed = create_position_feed(client)
+    try:
+        run_live_loop(
+            lambda: _render(
+                client,
+                coins_config,
+                coin_order,
+                wallet_target,
+                wallet_target_invalid,
+                sort_by,
+                descending,
+                hide_empty,
+                compact,
+                feed,
+            ),
+            interval=STREAM_REFRESH_INTERVAL if feed is not None else float(interval),
+            version=(lambda: feed.version) if feed is not None else None,
+        )
+    finally:
+        if feed is not None:
+            feed.stop()
@@ -7,6 +7,7 @@ import time
 from typing import Any
 
 from binance import ThreadedWebsocketManager
+from rich.console import RenderableType
 from rich.table import Table
 from rich.text import Text
 
@@ -15,15 +16,23 @@ from monitor.price_lib import (
     batch_get_asia_open,
     batch_get_klines,
     format_pct_rich,
-    sort_table_raw,
 )
 from utils.live_loop import run_live_loop
-from utils.live_store import KlineData, LiveDataStore, TickerData
+from utils.live_store import (
+    KlineData,
+    LiveDataStore,
+    SnapshotResult,
+    StoreSnapshot,
+    TickerData,
+)
 
 HEADERS = PRICE_HEADERS
 KLINE_REFRESH_INTERVAL = 60
 # Abort the process after this many seconds with no successful WS message.
 WS_SILENCE_TIMEOUT = 120
+# Repaint on store changes at most this often, and at least every heartbeat.
+RENDER_MAX_FPS = 4.0
+RENDER_HEARTBEAT_INTERVAL = 5.0
 
 _KLINE_INTERVALS: list[tuple[str, int]] = [("15m", 15), ("1h", 60), ("4h", 240)]
 _SORT_COL_MAP: dict[str, int] = {
@@ -72,14 +81,127 @@ def _pct_change(last: float, base: float | None) -> float | None:
     return ((last - base) / base * 100) if base else None
 
 
+# Raw row layout mirrors HEADERS: [symbol, last_price, 15m, 1h, 4h, asia, 24h].
+type RawRow = tuple[float | None, ...]
+
+_PENDING_CELLS: tuple[RenderableType, ...] = ("...", "", "", "", "", "")
+
+
+def _raw_row(snap: StoreSnapshot) -> RawRow | None:
+    """Numeric cells (everything after the symbol) for one symbol, or None before the first tick."""
+    ticker: TickerData | None = snap.ticker
+    if ticker is None:
+        return None
+    klines: KlineData | None = snap.klines
+    last = ticker.last_price
+    return (
+        last,
+        _pct_change(last, klines.open_15m if klines else None),
+        _pct_change(last, klines.open_1h if klines else None),
+        _pct_change(last, klines.open_4h if klines else None),
+        _pct_change(last, klines.asia_open if klines else None),
+        ticker.change_24h,
+    )
+
+
+def _format_cell(col: int, val: float | None) -> RenderableType:
+    if col == 0:
+        return str(round(val, 4)) if val is not None else "..."
+    return format_pct_rich(val) if val is not None else Text("N/A")
+
+
+class PriceTableModel:
+    """Render model for the live price table.
+
+    Keeps the raw numeric row and the formatted cells per symbol; a cell is
+    re-formatted only when its value changed since the previous frame. The row
+    order is kept between frames and re-sorted only when a sort-column value
+    moved — timsort on the previous (nearly sorted) order is close to linear.
+    Output is identical to formatting and sorting every row from scratch.
+    """
+
+    def __init__(
+        self, symbols: list[str], sort_col: str = "", sort_order: bool = True
+    ) -> None:
+        self.symbols = list(symbols)
+        self._index = {sym: i for i, sym in enumerate(self.symbols)}
+        # HEADERS index -> raw-row index (raw rows drop the symbol column).
+        sort_idx = _SORT_COL_MAP.get(sort_col)
+        self._sort_idx = sort_idx - 1 if sort_idx is not None else None
+        self._sort_order = sort_order
+        self._order = list(self.symbols)
+        self._raw: dict[str, RawRow | None] = dict.fromkeys(self.symbols)
+        self._cells: dict[str, tuple[RenderableType, ...]] = dict.fromkeys(
+            self.symbols, _PENDING_CELLS
+        )
+        self.cells_formatted = 0
+
+    def update(self, result: SnapshotResult) -> None:
+        """Apply a store snapshot: re-format changed cells, re-sort if needed."""
+        resort = False
+        for sym in self.symbols:
+            new = _raw_row(result.data[sym])
+            old = self._raw[sym]
+            if new == old:
+                continue
+            self._raw[sym] = new
+            if new is None:
+                self._cells[sym] = _PENDING_CELLS
+            elif old is None:
+                self._cells[sym] = tuple(_format_cell(i, v) for i, v in enumerate(new))
+                self.cells_formatted += len(new)
+            else:
+                cells = list(self._cells[sym])
+                for i, (a, b) in enumerate(zip(old, new, strict=True)):
+                    if a != b:
+                        cells[i] = _format_cell(i, b)
+                        self.cells_formatted += 1
+                self._cells[sym] = tuple(cells)
+            if self._sort_idx is not None and (
+                old is None or new is None or old[self._sort_idx] != new[self._sort_idx]
+            ):
+                resort = True
+        if resort:
+            self._resort()
+
+    def _sort_key(self, sym: str) -> tuple[float, int]:
+        # Same ordering as sort_table_raw: None last, ties in symbol order.
+        raw = self._raw[sym]
+        val = (
+            raw[self._sort_idx]
+            if raw is not None and self._sort_idx is not None
+            else None
+        )
+        if val is None:
+            val = float("-inf") if self._sort_order else float("inf")
+        idx = self._index[sym]
+        return val, -idx if self._sort_order else idx
+
+    def _resort(self) -> None:
+        self._order.sort(key=self._sort_key, reverse=self._sort_order)
+
+    def rows(self) -> list[tuple[RenderableType, ...]]:
+        """Display rows (symbol + formatted cells) in the current sort order."""
+        return [(sym, *self._cells[sym]) for sym in self._order]
+
+
 def _build_table(
     symbols: list[str],
     store: LiveDataStore,
     sort_col: str = "",
     sort_order: bool = True,
+    model: PriceTableModel | None = None,
 ) -> Table:
-    """Build a Rich Table from the current store snapshot."""
-    result = store.snapshot(symbols)
+    """Build a Rich Table from the current store snapshot.
+
+    Pass a long-lived `model` to reuse formatted cells and the sort order
+    across frames; without one every cell is formatted from scratch.
+    """
+    if model is None:
+        model = PriceTableModel(symbols, sort_col, sort_order)
+    result = store.snapshot(model.symbols)
+    model.update(result)
+
     ts = result.last_update.strftime("%H:%M:%S") if result.last_update else "--:--:--"
     if result.ws_connected:
         title = (
@@ -92,55 +214,8 @@ def _build_table(
     table = Table(title=title, expand=True)
     for header in HEADERS:
         table.add_column(header, justify="right")
-
-    # Raw rows for sorting: [symbol, price_str_or_none, pct_15m, pct_1h, pct_4h, pct_asia, pct_24h]
-    raw_rows: list[list[Any]] = []
-    for sym in symbols:
-        snap = result.data[sym]
-        ticker: TickerData | None = snap.ticker
-        if ticker is None:
-            raw_rows.append([sym, None, None, None, None, None, None])
-            continue
-
-        klines: KlineData | None = snap.klines
-        last = ticker.last_price
-        open_15m = klines.open_15m if klines else None
-        open_1h = klines.open_1h if klines else None
-        open_4h = klines.open_4h if klines else None
-        asia_open = klines.asia_open if klines else None
-
-        raw_rows.append(
-            [
-                sym,
-                str(round(last, 4)),
-                _pct_change(last, open_15m),
-                _pct_change(last, open_1h),
-                _pct_change(last, open_4h),
-                _pct_change(last, asia_open),
-                ticker.change_24h,
-            ]
-        )
-
-    if sort_col in _SORT_COL_MAP:
-        raw_rows = sort_table_raw(raw_rows, _SORT_COL_MAP[sort_col], sort_order)
-
-    def _fmt(val: float | None) -> Text:
-        return format_pct_rich(val) if val is not None else Text("N/A")
-
-    for row in raw_rows:
-        if row[1] is None:
-            table.add_row(row[0], "...", "", "", "", "", "")
-        else:
-            table.add_row(
-                row[0],
-                row[1],
-                _fmt(row[2]),
-                _fmt(row[3]),
-                _fmt(row[4]),
-                _fmt(row[5]),
-                _fmt(row[6]),
-            )
-
+    for row in model.rows():
+        table.add_row(*row)
     return table
 
 
@@ -222,9 +297,12 @@ def run(
         _start_daemon(_kline_refresh_loop, (client, coins, store))
         _start_daemon(_ws_watchdog, (store,))
 
+        model = PriceTableModel(coins, sort_col, sort_order)
         run_live_loop(
-            lambda: _build_table(coins, store, sort_col, sort_order),
-            interval=1.0,
+            lambda: _build_table(coins, store, model=model),
+            interval=RENDER_HEARTBEAT_INTERVAL,
+            version=lambda: store.version,
+            max_fps=RENDER_MAX_FPS,
         )
     finally:
         twm.stop()
@@ -22,6 +22,9 @@ _RESET = "\033[0m"
 _SL_ORDER_TYPES = ("STOP_MARKET", "STOP")
 _TP_ORDER_TYPES = ("TAKE_PROFIT_MARKET", "TAKE_PROFIT")
 
+# (rows, total_risk_usd, wallet_balance, unrealized_pnl, available_balance)
+type PositionSnapshot = tuple[list[Any], float, float, float, float]
+
 
 def colorize(value: Any, threshold: float = 0) -> Any:
     """Colorize a percentage value based on threshold."""
@@ -181,7 +184,13 @@ def _fetch_all_tpsl_prices(
     except Exception as e:
         logging.warning("Failed to fetch all open orders: %s", e)
         return {}
+    return tpsl_prices_from_orders(all_orders)
+
 
+def tpsl_prices_from_orders(
+    all_orders: list[dict[str, Any]],
+) -> dict[tuple[str, str], dict[str, float | None]]:
+    """Group open orders into {(symbol, positionSide): {"sl": price, "tp": price}}."""
     orders_by_key: dict[tuple[str, str], list[dict[str, Any]]] = {}
     for o in all_orders:
         key = (o.get("symbol", ""), o.get("positionSide", "BOTH"))
@@ -294,44 +303,48 @@ def _placeholder_row(symbol: str, leverage: int) -> list[Any]:
     ]
 
 
-def fetch_open_positions(
+def resolve_missing_sl(
     client: Client,
+    open_positions: list[dict[str, Any]],
+    tpsl_prices: dict[tuple[str, str], dict[str, float | None]],
+) -> None:
+    """Fill in SL prices the bulk order fetch missed with per-symbol lookups (in place).
+
+    Falls back to per-symbol if the bulk call returns nothing (e.g. API error
+    swallowed silently, or exchange quirk) so SL/TP is never silently dropped.
+    """
+    for pos in open_positions:
+        sym = pos["symbol"]
+        pos_side = pos.get("positionSide", "BOTH")
+        if (sym, pos_side) in tpsl_prices or (sym, "BOTH") in tpsl_prices:
+            continue
+        sl = get_stop_loss_for_symbol(client, sym, pos_side)
+        if sl is not None:
+            tpsl_prices[(sym, pos_side)] = {"sl": sl, "tp": None}
+
+
+def build_position_table(
+    positions: list[dict[str, Any]],
+    tpsl_prices: dict[tuple[str, str], dict[str, float | None]],
+    wallet_balance: float,
+    available_balance: float,
     coins_config: dict[str, Any],
     coin_order: list[str],
     sort_by: str = "default",
     descending: bool = True,
     hide_empty: bool = False,
-) -> tuple[list[Any], float, float, float, float]:
-    """Fetch and format open futures positions."""
-    try:
-        positions = client.futures_position_information()
-    except Exception as e:
-        logging.error("Failed to fetch position information: %s", e)
-        raise RuntimeError(f"Failed to fetch position information: {e}") from e
-
-    wallet_balance, _cross_unrealized_pnl, available_balance = get_wallet_balance(
-        client
-    )
+) -> PositionSnapshot:
+    """Format position dicts (futures_position_information shape) into table rows.
 
+    Shared by the REST path (fetch_open_positions) and the user-data-stream
+    state engine (monitor.position_state), so both produce identical rows.
+    """
     open_positions: list[dict[str, Any]] = [
         pos
         for pos in positions
         if pos["symbol"] in coins_config and float(pos["positionAmt"]) != 0
     ]
 
-    # One bulk fetch instead of one REST call per open position.
-    # Fall back to per-symbol if the bulk call returns nothing (e.g. API error
-    # swallowed silently, or exchange quirk) so SL/TP is never silently dropped.
-    tpsl_prices = _fetch_all_tpsl_prices(client) if open_positions else {}
-    for pos in open_positions:
-        sym = pos["symbol"]
-        pos_side = pos.get("positionSide", "BOTH")
-        if (sym, pos_side) in tpsl_prices or (sym, "BOTH") in tpsl_prices:
-            continue
-        sl = get_stop_loss_for_symbol(client, sym, pos_side)
-        if sl is not None:
-            tpsl_prices[(sym, pos_side)] = {"sl": sl, "tp": None}
-
     # Sum unrealized PnL from positions — crossUnPnl is 0 for isolated margin.
     unrealized_pnl = sum(float(p.get("unRealizedProfit", 0)) for p in open_positions)
 
@@ -365,6 +378,48 @@ def fetch_open_positions(
     return filtered, total_risk_usd, wallet_balance, unrealized_pnl, available_balance
 
 
+def fetch_open_positions(
+    client: Client,
+    coins_config: dict[str, Any],
+    coin_order: list[str],
+    sort_by: str = "default",
+    descending: bool = True,
+    hide_empty: bool = False,
+) -> PositionSnapshot:
+    """Fetch and format open futures positions."""
+    try:
+        positions = client.futures_position_information()
+    except Exception as e:
+        logging.error("Failed to fetch position information: %s", e)
+        raise RuntimeError(f"Failed to fetch position information: {e}") from e
+
+    wallet_balance, _cross_unrealized_pnl, available_balance = get_wallet_balance(
+        client
+    )
+
+    open_positions: list[dict[str, Any]] = [
+        pos
+        for pos in positions
+        if pos["symbol"] in coins_config and float(pos["positionAmt"]) != 0
+    ]
+
+    # One bulk fetch instead of one REST call per open position.
+    tpsl_prices = _fetch_all_tpsl_prices(client) if open_positions else {}
+    resolve_missing_sl(client, open_positions, tpsl_prices)
+
+    return build_position_table(
+        open_positions,
+        tpsl_prices,
+        wallet_balance,
+        available_balance,
+        coins_config,
+        coin_order,
+        sort_by,
+        descending,
+        hide_empty,
+    )
+
+
 _DISPLAY_HEADERS = [
     "Symbol",
     "Side",
@@ -396,9 +451,32 @@ def display_table(
     send_fn: Callable[[str], None] = send_telegram_message,
 ) -> str:
     """Build the full position display output."""
-    table, total_risk_usd, wallet, unrealized, available_balance = fetch_open_positions(
-        client, coins_config, coin_order, sort_by, descending, hide_empty
+    return format_position_display(
+        fetch_open_positions(
+            client, coins_config, coin_order, sort_by, descending, hide_empty
+        ),
+        wallet_target,
+        wallet_target_invalid,
+        sort_by=sort_by,
+        descending=descending,
+        telegram=telegram,
+        compact=compact,
+        send_fn=send_fn,
     )
+
+
+def format_position_display(
+    snapshot: PositionSnapshot,
+    wallet_target: list[float],
+    wallet_target_invalid: list[str] | None = None,
+    sort_by: str = "default",
+    descending: bool = True,
+    telegram: bool = False,
+    compact: bool = False,
+    send_fn: Callable[[str], None] = send_telegram_message,
+) -> str:
+    """Render a fetch_open_positions-shaped snapshot as the display output."""
+    table, total_risk_usd, wallet, unrealized, available_balance = snapshot
     total = wallet + unrealized
     unrealized_pct = (unrealized / wallet * 100) if wallet else 0
 
@@ -0,0 +1,417 @@
+"""Event-driven position state: futures user-data stream + mark-price ticks.
+
+PositionStateEngine holds positions, open SL/TP orders and the USDT balance in
+memory. It is seeded from a REST snapshot (reconcile) and then kept current by
+user-data stream events:
+
+  ACCOUNT_UPDATE        -> wallet balance, position amount/entry/isolated wallet
+  ORDER_TRADE_UPDATE    -> open SL/TP orders (added on NEW, removed when terminal)
+  ACCOUNT_CONFIG_UPDATE -> leverage
+  markPriceUpdate       -> mark price, notional, margin and unrealized PnL
+
+Fields the stream does not carry (liquidation price, availableBalance, leverage
+of a brand-new position) come from REST: PositionFeed re-reconciles after every
+position change, after a stream error/reconnect, and on a slow safety timer.
+
+Consumers (live_position, the web positions endpoint and SSE stream) call
+PositionFeed.snapshot(), which returns the same tuple as
+position_lib.fetch_open_positions without touching the REST API.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, Protocol
+
+from binance import ThreadedWebsocketManager
+from binance.client import Client
+
+from monitor.position_lib import (
+    PositionSnapshot,
+    build_position_table,
+    get_wallet_balance,
+    tpsl_prices_from_orders,
+)
+
+# Safety-net REST reconcile even when the stream looks healthy.
+RECONCILE_INTERVAL_S = 300.0
+# Coalesce bursts of ACCOUNT_UPDATEs (partial fills) into one REST reconcile.
+RECONCILE_DEBOUNCE_S = 2.0
+
+_OPEN_ORDER_STATUSES = frozenset({"NEW", "PARTIALLY_FILLED"})
+
+type EventCallback = Callable[[Any], None]
+
+
+class EventSource(Protocol):
+    """Anything that pushes raw user-data / mark-price messages to a callback."""
+
+    def start(self, callback: EventCallback) -> None: ...
+
+    def stop(self) -> None: ...
+
+
+def _position_key(pos: dict[str, Any]) -> tuple[str, str]:
+    return pos["symbol"], pos.get("positionSide", "BOTH")
+
+
+def _leverage_of(pos: dict[str, Any]) -> float:
+    """Leverage from a REST position row (v2 has it directly, v3 via margin)."""
+    lev = float(pos.get("leverage") or 0)
+    if lev > 0:
+        return lev
+    margin = float(pos.get("positionInitialMargin") or 0)
+    notional = abs(float(pos.get("notional") or 0))
+    return notional / margin if margin > 0 else 0.0
+
+
+class PositionStateEngine:
+    """Thread-safe in-memory account state driven by user-data events."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._positions: dict[tuple[str, str], dict[str, Any]] = {}
+        self._orders: dict[int, dict[str, Any]] = {}
+        self._leverage: dict[str, float] = {}
+        self._marks: dict[str, float] = {}
+        self._wallet_balance = 0.0
+        self._available_balance = 0.0
+        self._synced = False
+        self._stale = False
+        self._reconciling = False
+        self._pending: list[Any] = []
+        self.version = 0
+        self.last_update: float | None = None
+
+    # --- state flags ---
+
+    @property
+    def synced(self) -> bool:
+        """True once a REST snapshot has been installed."""
+        return self._synced
+
+    @property
+    def stale(self) -> bool:
+        """True after a stream error until the next reconcile."""
+        return self._stale
+
+    def mark_stale(self) -> None:
+        with self._lock:
+            self._stale = True
+
+    # --- REST reconcile ---
+
+    def reconcile(self, client: Client) -> None:
+        """Replace state with a REST snapshot, then replay events that raced it.
+
+        Events arriving while the REST calls are in flight are applied live and
+        also buffered; they are re-applied on top of the snapshot so a fill that
+        lands mid-reconcile is never rolled back to the older REST view.
+        """
+        with self._lock:
+            self._reconciling = True
+            self._pending = []
+        try:
+            positions: list[dict[str, Any]] = client.futures_position_information()
+            wallet, _cross_unpnl, available = get_wallet_balance(client)
+            orders: list[dict[str, Any]] = client.futures_get_open_orders()
+        except Exception:
+            with self._lock:
+                self._reconciling = False
+                self._pending = []
+            raise
+
+        with self._lock:
+            self._positions = {
+                _position_key(p): dict(p)
+                for p in positions
+                if float(p.get("positionAmt") or 0) != 0
+            }
+            for pos in self._positions.values():
+                lev = _leverage_of(pos)
+                if lev > 0:
+                    self._leverage[pos["symbol"]] = lev
+            self._orders = {int(o["orderId"]): dict(o) for o in orders}
+            self._wallet_balance = wallet
+            self._available_balance = available
+            pending, self._pending = self._pending, []
+            self._reconciling = False
+            for msg in pending:
+                self._apply_locked(msg)
+            self._synced = True
+            self._stale = False
+            self._touch()
+
+    # --- stream events ---
+
+    def apply_event(self, msg: Any) -> bool:
+        """Apply one raw stream message. Returns True if it changed a position.
+
+        Position changes are the cue for a REST reconcile (liquidation price and
+        availableBalance are not in the stream). Mark-price arrays, combined-stream
+        envelopes and error frames are all accepted.
+        """
+        with self._lock:
+            if self._reconciling:
+                self._pending.append(msg)
+            changed = self._apply_locked(msg)
+            self._touch()
+            return changed
+
+    def _touch(self) -> None:
+        self.version += 1
+        self.last_update = time.time()
+
+    def _apply_locked(self, msg: Any) -> bool:
+        if isinstance(msg, list):
+            for item in msg:
+                self._apply_locked(item)
+            return False
+        if not isinstance(msg, dict):
+            return False
+        if "data" in msg and "e" not in msg:
+            return self._apply_locked(msg["data"])
+        event = msg.get("e")
+        if event in ("error", "listenKeyExpired"):
+            self._stale = True
+            return False
+        if event == "markPriceUpdate":
+            self._apply_mark(msg["s"], float(msg["p"]))
+            return False
+        if event == "ACCOUNT_UPDATE":
+            return self._apply_account(msg.get("a", {}))
+        if event == "ORDER_TRADE_UPDATE":
+            self._apply_order(msg.get("o", {}))
+            return False
+        if event == "ACCOUNT_CONFIG_UPDATE":
+            ac = msg.get("ac")
+            if ac and "l" in ac:
+                self._leverage[ac["s"]] = float(ac["l"])
+                self._reprice(ac["s"])
+            return False
+        return False
+
+    def _apply_account(self, data: dict[str, Any]) -> bool:
+        for bal in data.get("B", []):
+            if bal.get("a") == "USDT":
+                self._wallet_balance = float(bal["wb"])
+        changed = False
+        for p in data.get("P", []):
+            key = (p["s"], p.get("ps", "BOTH"))
+            amt = float(p["pa"])
+            if amt == 0:
+                changed |= self._positions.pop(key, None) is not None
+                continue
+            pos = self._positions.setdefault(
+                key, {"symbol": p["s"], "positionSide": key[1]}
+            )
+            if pos.get("positionAmt") is not None and (
+                float(pos["positionAmt"]) != amt
+                or float(pos["entryPrice"]) != float(p["ep"])
+            ):
+                # Size or entry moved: the cached liquidation price is wrong
+                # until the follow-up REST reconcile.
+                pos["liquidationPrice"] = "0"
+            pos["positionAmt"] = p["pa"]
+            pos["entryPrice"] = p["ep"]
+            pos["unRealizedProfit"] = p.get("up", "0")
+            pos["isolatedWallet"] = (
+                p.get("iw", "0") if p.get("mt") == "isolated" else "0"
+            )
+            pos.setdefault("markPrice", self._marks.get(p["s"], float(p["ep"])))
+            self._reprice(p["s"])
+            changed = True
+        return changed
+
+    def _apply_order(self, o: dict[str, Any]) -> None:
+        order_id = int(o["i"])
+        if o.get("X") not in _OPEN_ORDER_STATUSES:
+            self._orders.pop(order_id, None)
+            return
+        self._orders[order_id] = {
+            "orderId": order_id,
+            "symbol": o["s"],
+            "type": o.get("ot") or o.get("o"),
+            "positionSide": o.get("ps", "BOTH"),
+            "stopPrice": o.get("sp", "0"),
+        }
+
+    def _apply_mark(self, symbol: str, mark: float) -> None:
+        self._marks[symbol] = mark
+        self._reprice(symbol)
+
+    def _reprice(self, symbol: str) -> None:
+        """Recompute mark-derived fields for every side of symbol."""
+        mark = self._marks.get(symbol)
+        lev = self._leverage.get(symbol, 0.0)
+        for (sym, _side), pos in self._positions.items():
+            if sym != symbol:
+                continue
+            if mark is not None:
+                pos["markPrice"] = mark
+            amt = float(pos["positionAmt"])
+            px = float(pos["markPrice"])
+            notional = amt * px
+            pos["notional"] = notional
+            pos["unRealizedProfit"] = amt * (px - float(pos["entryPrice"]))
+            if lev > 0:
+                pos["positionInitialMargin"] = abs(notional) / lev
+
+    # --- read side ---
+
+    def snapshot(
+        self,
+        coins_config: dict[str, Any],
+        coin_order: list[str],
+        sort_by: str = "default",
+        descending: bool = True,
+        hide_empty: bool = False,
+    ) -> PositionSnapshot:
+        """Same tuple as fetch_open_positions, built from in-memory state."""
+        with self._lock:
+            positions = [dict(p) for p in self._positions.values()]
+            orders = list(self._orders.values())
+            wallet = self._wallet_balance
+            available = self._available_balance
+        return build_position_table(
+            positions,
+            tpsl_prices_from_orders(orders),
+            wallet,
+            available,
+            coins_config,
+            coin_order,
+            sort_by,
+            descending,
+            hide_empty,
+        )
+
+
+class BinanceUserDataSource:
+    """Futures user-data stream plus the all-symbol 1s mark-price stream."""
+
+    def __init__(self, api_key: str, api_secret: str) -> None:
+        self._twm = ThreadedWebsocketManager(api_key=api_key, api_secret=api_secret)
+
+    def start(self, callback: EventCallback) -> None:
+        self._twm.start()
+        self._twm.start_futures_user_socket(callback=callback)
+        self._twm.start_all_mark_price_socket(callback=callback, fast=True)
+
+    def stop(self) -> None:
+        self._twm.stop()
+
+
+class PositionFeed:
+    """Owns a PositionStateEngine, its event source and the reconcile worker."""
+
+    def __init__(
+        self,
+        client: Client,
+        source: EventSource,
+        reconcile_interval_s: float = RECONCILE_INTERVAL_S,
+        debounce_s: float = RECONCILE_DEBOUNCE_S,
+    ) -> None:
+        self.client = client
+        self.engine = PositionStateEngine()
+        self._source = source
+        self._reconcile_interval_s = reconcile_interval_s
+        self._debounce_s = debounce_s
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._worker: threading.Thread | None = None
+        self._awaiting_reconnect = False
+
+    @property
+    def live(self) -> bool:
+        """True while the in-memory state can be served instead of REST."""
+        return self.engine.synced and not self.engine.stale
+
+    @property
+    def version(self) -> int:
+        return self.engine.version
+
+    def start(self) -> None:
+        """Subscribe to the stream, take the initial REST snapshot, start the worker.
+
+        Subscribing first means events that land during the initial REST
+        snapshot are buffered and replayed rather than lost. Raises (after
+        stopping the source) if the initial snapshot fails.
+        """
+        self._source.start(self._on_event)
+        try:
+            self.engine.reconcile(self.client)
+        except Exception:
+            self._source.stop()
+            raise
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._wake.set()
+        self._source.stop()
+
+    def request_reconcile(self) -> None:
+        self._wake.set()
+
+    def _on_event(self, msg: Any) -> None:
+        try:
+            changed = self.engine.apply_event(msg)
+        except (KeyError, ValueError, TypeError):
+            logging.warning("Malformed user-data message: %s", msg)
+            return
+        if isinstance(msg, dict) and msg.get("e") in ("error", "listenKeyExpired"):
+            self._awaiting_reconnect = True
+            changed = True
+        elif self._awaiting_reconnect:
+            # First good message after an error: the socket reconnected, and
+            # anything that happened while it was down is only visible via REST.
+            self._awaiting_reconnect = False
+            changed = True
+        if changed:
+            self._wake.set()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._wake.wait(timeout=self._reconcile_interval_s)
+            if self._stopped.is_set():
+                return
+            # Let a burst of fills settle into one reconcile.
+            if self._stopped.wait(self._debounce_s):
+                return
+            self._wake.clear()
+            try:
+                self.engine.reconcile(self.client)
+            except Exception:
+                logging.warning("Position reconcile failed; serving REST fallback")
+                self.engine.mark_stale()
+
+    def snapshot(
+        self,
+        coins_config: dict[str, Any],
+        coin_order: list[str],
+        sort_by: str = "default",
+        descending: bool = True,
+        hide_empty: bool = False,
+    ) -> PositionSnapshot:
+        return self.engine.snapshot(
+            coins_config, coin_order, sort_by, descending, hide_empty
+        )
+
+
+def create_position_feed(client: Client) -> PositionFeed | None:
+    """Start a PositionFeed on the Binance user-data stream, or None on failure.
+
+    Callers fall back to REST polling (fetch_open_positions) when this
+    returns None or while feed.live is False.
+    """
+    try:
+        feed = PositionFeed(
+            client, BinanceUserDataSource(client.API_KEY, client.API_SECRET)
+        )
+        feed.start()
+    except Exception:
+        logging.warning("User-data stream unavailable; positions fall back to REST")
+        return None
+    return feed
@@ -78,6 +78,10 @@ def _parse_sort_value(val: Any, reverse: bool) -> float:
     None/unparseable values always sort last:
     -inf when reverse=True (desc), +inf when reverse=False (asc).
     """
+    if isinstance(val, float | int):
+        return float(val)
+    if val is None:
+        return float("-inf") if reverse else float("inf")
     if isinstance(val, str):
         val = _ANSI_RE.sub("", val).replace("%", "").strip()
     try:
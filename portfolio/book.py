@@ -8,6 +8,13 @@ equity curve on TWO bases in parallel:
   - compounding (risk-% of current equity) — what the vol-governor reads.
 
 Same-day-resolving trades bank realized R on their exit day (no prior mark).
+
+The forward pass is event-driven: each admitted trade scatters its signed
+units and entry cost into (days × symbols) position deltas plus a realized-P&L
+step on its exit day, and the curves are the cumulated position matrix marked
+against the close matrix. Only the compounding curve is materialised during
+the pass (lazily, up to the day the governor reads); the fixed-notional curve
+and the gross open-risk exposure are built in one vectorised pass at the end.
 Pure: no DB / network / clock. Marking uses caller-supplied 1d close series
 aligned to `daily_index`. The vol governor + regime modulator are wired in by
 `PaperBook._g_vol` / `regime_by_signal`; this file's defaults are neutral so
@@ -75,6 +82,90 @@ class BookResult:
     pnl_comp: np.ndarray
     sized: list[SizedTrade]
     skipped: list[tuple[str, str]]
+    open_risk: np.ndarray  # daily gross open-risk fraction (Σ r_eff held)
+
+
+def _mark(units: np.ndarray, cost: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """Per-day unrealized P&L of a position matrix; a NaN close marks at 0."""
+    with np.errstate(invalid="ignore"):
+        value = units * close - cost
+    return np.asarray(np.where(np.isnan(close), 0.0, value).sum(axis=1))
+
+
+class _Ledger:
+    """Position / cost / realized deltas on the daily grid for one sizing basis.
+
+    ``units[d, j]`` and ``cost[d, j]`` hold the change in signed units and in
+    units × entry price of symbol ``j`` on day ``d``; ``realized[d]`` the R
+    banked on day ``d``. ``curve`` materialises the MTM P&L incrementally:
+    days before ``cursor`` are final (every trade that can touch them has been
+    scattered), so a forward pass only re-marks from the cursor on.
+    ``_units0`` / ``_cost0`` / ``_realized0`` are the cumulated deltas of the
+    days before the cursor.
+    """
+
+    def __init__(self, close: np.ndarray) -> None:
+        n, m = close.shape
+        self.close = close
+        self.units = np.zeros((n + 1, m))
+        self.cost = np.zeros((n + 1, m))
+        self.realized = np.zeros(n + 1)
+        self.pnl = np.zeros(n)
+        self.cursor = 0
+        self._units0 = np.zeros(m)
+        self._cost0 = np.zeros(m)
+        self._realized0 = 0.0
+
+    def add(
+        self,
+        col: int,
+        entry_idx: int,
+        exit_idx: int,
+        units: float,
+        entry_price: float,
+        banked: float,
+    ) -> None:
+        marked = exit_idx > entry_idx and col >= 0
+        if marked:
+            self.units[entry_idx, col] += units
+            self.units[exit_idx, col] -= units
+            self.cost[entry_idx, col] += units * entry_price
+            self.cost[exit_idx, col] -= units * entry_price
+        self.realized[exit_idx] += banked
+        if entry_idx == self.cursor:
+            # Keep the cursor day current without re-marking the whole row.
+            if marked:
+                px = self.close[entry_idx, col]
+                if not np.isnan(px):
+                    self.pnl[entry_idx] += units * px - units * entry_price
+            elif exit_idx == entry_idx:
+                self.pnl[entry_idx] += banked
+
+    def curve(self, through: int) -> np.ndarray:
+        """Mark days ``(cursor, through]``; day ``through`` becomes the cursor.
+
+        The cursor day is kept current by ``add``, so a same-day trade never
+        re-marks; moving forward re-marks from the old cursor (whose deltas
+        are now final) through the new one.
+        """
+        lo, hi = self.cursor, through + 1
+        if through > lo:
+            units = self._units0 + np.cumsum(self.units[lo:hi], axis=0)
+            cost = self._cost0 + np.cumsum(self.cost[lo:hi], axis=0)
+            realized = self._realized0 + np.cumsum(self.realized[lo:hi])
+            self.pnl[lo:hi] = _mark(units, cost, self.close[lo:hi]) + realized
+            self._units0, self._cost0 = units[-2], cost[-2]
+            self._realized0 = float(realized[-2])
+            self.cursor = through
+        return self.pnl
+
+    def full_curve(self) -> np.ndarray:
+        """The whole curve in one pass (for a ledger never read mid-run)."""
+        n = len(self.pnl)
+        units = np.cumsum(self.units[:n], axis=0)
+        cost = np.cumsum(self.cost[:n], axis=0)
+        realized = np.cumsum(self.realized[:n])
+        return np.asarray(_mark(units, cost, self.close) + realized)
 
 
 class PaperBook:
@@ -109,25 +200,34 @@ class PaperBook:
 
     def run(self, trades: list[LedgerTrade]) -> BookResult:
         n = len(self.daily_index)
-        pnl_fixed = np.zeros(n)
-        pnl_comp = np.zeros(n)
+        symbols = list(self.close_by_symbol)
+        col_of = {s: j for j, s in enumerate(symbols)}
+        close = np.empty((n, len(symbols)))
+        for j, s in enumerate(symbols):
+            close[:, j] = self.close_by_symbol[s]
+        fixed = _Ledger(close)
+        comp = _Ledger(close)
+        open_risk = np.zeros(n + 1)
         open_positions: list[
             tuple[int, float, str]
         ] = []  # (exit_ts_ms, r_eff, cluster)
         sized: list[SizedTrade] = []
         skipped: list[tuple[str, str]] = []
 
-        for t in sorted(trades, key=lambda x: x.entry_ts_ms):
-            entry_idx = (
-                int(np.searchsorted(self.daily_index, t.entry_ts_ms, side="right")) - 1
-            )
+        g_vol, g_vol_day = 1.0, -1
+        ordered = sorted(trades, key=lambda x: x.entry_ts_ms)
+        entry_ts = np.array([t.entry_ts_ms for t in ordered], dtype=np.int64)
+        exit_ts = np.array([t.exit_ts_ms for t in ordered], dtype=np.int64)
+        entry_idxs = np.searchsorted(self.daily_index, entry_ts, side="right") - 1
+        exit_idxs = np.maximum(
+            np.searchsorted(self.daily_index, exit_ts, side="right") - 1, entry_idxs
+        )
+
+        for t, entry_i, exit_i in zip(ordered, entry_idxs, exit_idxs, strict=True):
+            entry_idx, exit_idx = int(entry_i), int(exit_i)
             if entry_idx < 0:
                 skipped.append((t.signal_id, "before_grid"))
                 continue
-            exit_idx = (
-                int(np.searchsorted(self.daily_index, t.exit_ts_ms, side="right")) - 1
-            )
-            exit_idx = max(exit_idx, entry_idx)
 
             rpu = risk_per_unit(t.entry_price, t.sl_price)
             if rpu <= 0.0:
@@ -136,7 +236,9 @@ class PaperBook:
 
             open_positions = [p for p in open_positions if p[0] > t.entry_ts_ms]
 
-            g_vol = self._g_vol(pnl_comp, entry_idx)
+            pnl_comp = comp.curve(entry_idx)
+            if entry_idx != g_vol_day:  # days < entry_idx are final: one read per day
+                g_vol, g_vol_day = self._g_vol(pnl_comp, entry_idx), entry_idx
             regime = (
                 None
                 if self.regime_by_signal is None
@@ -165,14 +267,18 @@ class PaperBook:
             rc_fixed = r_eff * self.cfg.capital
             rc_comp = r_eff * comp_equity_at_entry
             side = 1.0 if t.direction == "long" else -1.0
-            closes = self.close_by_symbol.get(t.symbol)
-
-            for arr, rc in ((pnl_fixed, rc_fixed), (pnl_comp, rc_comp)):
-                if exit_idx > entry_idx and closes is not None:
-                    seg = closes[entry_idx:exit_idx]
-                    unreal = rc * side * (seg - t.entry_price) / rpu
-                    arr[entry_idx:exit_idx] += np.nan_to_num(unreal)
-                arr[exit_idx:] += rc * t.realized_r
+            col = col_of.get(t.symbol, -1)
+            for ledger, rc in ((fixed, rc_fixed), (comp, rc_comp)):
+                ledger.add(
+                    col,
+                    entry_idx,
+                    exit_idx,
+                    rc * side / rpu,
+                    t.entry_price,
+                    rc * t.realized_r,
+                )
+            open_risk[entry_idx] += r_eff
+            open_risk[max(exit_idx, entry_idx + 1)] -= r_eff
 
             open_positions.append((t.exit_ts_ms, r_eff, cluster))
             sized.append(
@@ -199,8 +305,9 @@ class PaperBook:
         return BookResult(
             daily_index=self.daily_index,
             capital=self.cfg.capital,
-            pnl_fixed=pnl_fixed,
-            pnl_comp=pnl_comp,
+            pnl_fixed=fixed.full_curve(),
+            pnl_comp=comp.curve(n - 1).copy() if n else np.zeros(0),
             sized=sized,
             skipped=skipped,
+            open_risk=np.cumsum(open_risk[:n]),
         )
@@ -3,14 +3,15 @@
 Pure functions over a pandas daily curve (Series indexed by UTC day) and the
 `SizedTrade` list from `portfolio.book`. Annualization defaults to 365 days
 (crypto trades every day). Degenerate inputs (flat / single-point curves)
-return 0.0 rather than NaN.
+return 0.0 rather than NaN. `curve_metrics` computes the whole headline set
+from one daily-returns pass; the single-metric functions are its pieces.
 """
 
 from __future__ import annotations
 
 import math
+from dataclasses import dataclass
 
-import numpy as np
 import pandas as pd
 
 from portfolio.book import BookResult, SizedTrade
@@ -22,8 +23,7 @@ def daily_returns(curve: pd.Series) -> pd.Series:
     return curve.pct_change().dropna()
 
 
-def sharpe(curve: pd.Series, periods_per_year: float = _PPY) -> float:
-    r = daily_returns(curve)
+def _sharpe(r: pd.Series, periods_per_year: float) -> float:
     sd = float(r.std(ddof=1)) if len(r) > 1 else 0.0
     # Guard: treat machine-epsilon variance (pure drift, no noise) as degenerate.
     if sd < 1e-10:
@@ -31,8 +31,7 @@ def sharpe(curve: pd.Series, periods_per_year: float = _PPY) -> float:
     return float(r.mean() / sd * math.sqrt(periods_per_year))
 
 
-def sortino(curve: pd.Series, periods_per_year: float = _PPY) -> float:
-    r = daily_returns(curve)
+def _sortino(r: pd.Series, periods_per_year: float) -> float:
     if len(r) < 2:
         return 0.0
     downside = r[r < 0.0]
@@ -42,6 +41,19 @@ def sortino(curve: pd.Series, periods_per_year: float = _PPY) -> float:
     return float(r.mean() / dd * math.sqrt(periods_per_year))
 
 
+def _annual_vol(r: pd.Series, periods_per_year: float) -> float:
+    sd = float(r.std(ddof=1)) if len(r) > 1 else 0.0
+    return sd * math.sqrt(periods_per_year)
+
+
+def sharpe(curve: pd.Series, periods_per_year: float = _PPY) -> float:
+    return _sharpe(daily_returns(curve), periods_per_year)
+
+
+def sortino(curve: pd.Series, periods_per_year: float = _PPY) -> float:
+    return _sortino(daily_returns(curve), periods_per_year)
+
+
 def max_drawdown(curve: pd.Series) -> float:
     """Worst peak-to-trough return (≤ 0.0)."""
     if len(curve) < 2:
@@ -61,27 +73,53 @@ def annual_return(curve: pd.Series, periods_per_year: float = _PPY) -> float:
 
 
 def annual_vol(curve: pd.Series, periods_per_year: float = _PPY) -> float:
-    r = daily_returns(curve)
-    sd = float(r.std(ddof=1)) if len(r) > 1 else 0.0
-    return sd * math.sqrt(periods_per_year)
+    return _annual_vol(daily_returns(curve), periods_per_year)
 
 
-def calmar(curve: pd.Series, periods_per_year: float = _PPY) -> float:
-    mdd = abs(max_drawdown(curve))
-    if mdd <= 0.0:
+def _calmar(ann_return: float, mdd: float) -> float:
+    depth = abs(mdd)
+    if depth <= 0.0:
         return 0.0
-    return annual_return(curve, periods_per_year) / mdd
+    return ann_return / depth
+
+
+def calmar(curve: pd.Series, periods_per_year: float = _PPY) -> float:
+    return _calmar(annual_return(curve, periods_per_year), max_drawdown(curve))
+
+
+@dataclass(frozen=True)
+class CurveMetrics:
+    sharpe: float
+    sortino: float
+    max_drawdown: float
+    calmar: float
+    annual_return: float
+    annual_vol: float
+
+
+def curve_metrics(curve: pd.Series, periods_per_year: float = _PPY) -> CurveMetrics:
+    """Every headline metric of a curve from one daily-returns / drawdown pass.
+
+    Field-for-field equal to calling the single-metric functions.
+    """
+    r = daily_returns(curve)
+    mdd = max_drawdown(curve)
+    ann_return = annual_return(curve, periods_per_year)
+    return CurveMetrics(
+        sharpe=_sharpe(r, periods_per_year),
+        sortino=_sortino(r, periods_per_year),
+        max_drawdown=mdd,
+        calmar=_calmar(ann_return, mdd),
+        annual_return=ann_return,
+        annual_vol=_annual_vol(r, periods_per_year),
+    )
 
 
 def avg_exposure(result: BookResult) -> float:
     """Mean daily gross open-risk fraction across the curve."""
-    n = len(result.daily_index)
-    if n == 0:
+    if len(result.open_risk) == 0:
         return 0.0
-    open_risk = np.zeros(n)
-    for t in result.sized:
-        open_risk[t.entry_idx : max(t.exit_idx, t.entry_idx + 1)] += t.r_eff
-    return float(open_risk.mean())
+    return float(result.open_risk.mean())
 
 
 def risk_turnover(result: BookResult) -> float:
@@ -1,9 +1,10 @@
 """Glue the DuckDB outcome ledger + 1d OHLCV + regime into the paper book.
 
 The only module in `portfolio/` that touches the database. Reads resolved
-`signal_alert_outcomes` rows, builds a daily grid spanning the ledger, aligns
-each symbol's 1d close to that grid (forward-filled), optionally labels each
-entry's 1d regime via `analytics.regime.classify_series`, and runs `PaperBook`.
+`signal_alert_outcomes` rows, builds a daily grid spanning the ledger, loads
+every traded symbol's 1d bars in one query, aligns each close to that grid
+(forward-filled), optionally labels each entry's 1d regime via
+`analytics.regime.classify_series`, and runs `PaperBook`.
 
 `book_from_trades` is the reusable seam: it takes an already-built
 `list[LedgerTrade]` (e.g. re-resolved under an exit policy) and runs the same
@@ -16,8 +17,8 @@ from __future__ import annotations
 import duckdb
 import numpy as np
 
-from analytics.data_store import get_ohlcv
 from analytics.regime import classify_series
+from analytics.store.market_data import get_ohlcv_for_symbols
 from portfolio.book import BookResult, LedgerTrade, PaperBook
 from portfolio.sizing import SizingConfig
 
@@ -41,6 +42,7 @@ def _empty_result(cfg: SizingConfig) -> BookResult:
         pnl_comp=np.array([]),
         sized=[],
         skipped=[],
+        open_risk=np.array([]),
     )
 
 
@@ -51,8 +53,8 @@ def book_from_trades(
 ) -> BookResult:
     """Run a prebuilt ledger-trade list through the paper book.
 
-    Builds the daily grid spanning the trades, aligns each symbol's 1d close
-    (forward-filled) and — when `cfg.apply_high_vol_halving` — its 1d regime,
+    Builds the daily grid spanning the trades, loads all traded symbols' 1d
+    bars in one query, aligns each symbol's close (forward-filled) and — when `cfg.apply_high_vol_halving` — its 1d regime,
     then replays via `PaperBook`. The reusable seam shared by `replay_ledger`
     and the exit-policy A/B (which feeds re-resolved `(realized_r, exit_ts)`).
     """
@@ -66,22 +68,19 @@ def book_from_trades(
     daily_index = np.arange(start_day, end_day + _DAY, _DAY, dtype=np.int64)
 
     symbols = sorted({t.symbol for t in trades})
-    close_by_symbol: dict[str, np.ndarray] = {}
-    regime_by_signal: dict[str, str] = {}
+    close_by_symbol = {sym: np.full(len(daily_index), np.nan) for sym in symbols}
     regime_by_symbol_grid: dict[str, np.ndarray] = {}
 
-    for sym in symbols:
-        bars = get_ohlcv(conn, sym, "1d", int(start_day), int(end_day + _DAY))
-        if bars.empty:
-            close_by_symbol[sym] = np.full(len(daily_index), np.nan)
-            continue
+    bars_all = get_ohlcv_for_symbols(
+        conn, symbols, "1d", int(start_day), int(end_day + _DAY)
+    )
+    for sym, bars in bars_all.groupby("symbol", sort=False):
+        bars = bars.reset_index(drop=True)
         ot = bars["open_time"].to_numpy(dtype=np.int64)
         cl = bars["close"].to_numpy(dtype=np.float64)
         idx = np.searchsorted(ot, daily_index, side="right") - 1
         valid = idx >= 0
-        aligned = np.full(len(daily_index), np.nan)
-        aligned[valid] = cl[idx[valid]]
-        close_by_symbol[sym] = aligned
+        close_by_symbol[str(sym)][valid] = cl[idx[valid]]
 
         if cfg.apply_high_vol_halving:
             # classify_series requires the timeframe as the second argument;
@@ -91,18 +90,22 @@ def book_from_trades(
             )
             grid_labels: np.ndarray = np.full(len(daily_index), "unknown", dtype=object)
             grid_labels[valid] = raw_labels[idx[valid]]
-            regime_by_symbol_grid[sym] = grid_labels
+            regime_by_symbol_grid[str(sym)] = grid_labels
 
-    if cfg.apply_high_vol_halving:
-        for t in trades:
-            grid = regime_by_symbol_grid.get(t.symbol)
-            if grid is None:
-                continue
-            entry_idx = (
-                int(np.searchsorted(daily_index, t.entry_ts_ms, side="right")) - 1
+    regime_by_signal: dict[str, str] = {}
+    if cfg.apply_high_vol_halving and regime_by_symbol_grid:
+        entry_idx = (
+            np.searchsorted(
+                daily_index,
+                np.array([t.entry_ts_ms for t in trades], dtype=np.int64),
+                side="right",
             )
-            if 0 <= entry_idx < len(grid):
-                regime_by_signal[t.signal_id] = str(grid[entry_idx])
+            - 1
+        )
+        for t, i in zip(trades, entry_idx, strict=True):
+            grid = regime_by_symbol_grid.get(t.symbol)
+            if grid is not None and 0 <= i < len(grid):
+                regime_by_signal[t.signal_id] = str(grid[i])
 
     book = PaperBook(
         cfg,
@@ -34,23 +34,24 @@ def format_report(res: BookResult, cfg: SizingConfig) -> str:
         f"days={len(res.daily_index)}  capital={cfg.capital:,.0f}"
     )
     lines.append("")
+    head = metrics.curve_metrics(fixed_curve, ppy)
     lines.append("-- HEADLINE: fixed-notional / constant-R --")
-    lines.append(f"  Sharpe        {metrics.sharpe(fixed_curve, ppy):+.2f}")
-    lines.append(f"  Sortino       {metrics.sortino(fixed_curve, ppy):+.2f}")
-    lines.append(f"  Calmar        {metrics.calmar(fixed_curve, ppy):+.2f}")
-    lines.append(f"  Max drawdown  {metrics.max_drawdown(fixed_curve):+.1%}")
-    lines.append(f"  Ann. return   {metrics.annual_return(fixed_curve, ppy):+.1%}")
+    lines.append(f"  Sharpe        {head.sharpe:+.2f}")
+    lines.append(f"  Sortino       {head.sortino:+.2f}")
+    lines.append(f"  Calmar        {head.calmar:+.2f}")
+    lines.append(f"  Max drawdown  {head.max_drawdown:+.1%}")
+    lines.append(f"  Ann. return   {head.annual_return:+.1%}")
     lines.append(
-        f"  Ann. vol      {metrics.annual_vol(fixed_curve, ppy):.1%} "
-        f"(target {cfg.vol_target_annual:.0%})"
+        f"  Ann. vol      {head.annual_vol:.1%} (target {cfg.vol_target_annual:.0%})"
     )
     lines.append(f"  Avg exposure  {metrics.avg_exposure(res):.2%} gross open risk")
     lines.append(f"  Risk turnover {metrics.risk_turnover(res):.1f}x")
     lines.append(f"  Final equity  {fixed[-1]:,.0f}")
     lines.append("")
+    comp_metrics = metrics.curve_metrics(comp_curve, ppy)
     lines.append("-- compounding curve (governor basis) --")
-    lines.append(f"  Sharpe        {metrics.sharpe(comp_curve, ppy):+.2f}")
-    lines.append(f"  Max drawdown  {metrics.max_drawdown(comp_curve):+.1%}")
+    lines.append(f"  Sharpe        {comp_metrics.sharpe:+.2f}")
+    lines.append(f"  Max drawdown  {comp_metrics.max_drawdown:+.1%}")
     lines.append(f"  Final equity  {comp[-1]:,.0f}")
     lines.append("")
     lines.append("-- Attribution (fixed basis, by strategy×tf×direction) --")
@@ -5,7 +5,7 @@ import pandas as pd
 
 from analytics.store import init_schema
 from analytics.store.market_data import upsert_ohlcv
-from tools.combine_audit import build_combine_report_row
+from tools.combine_audit import build_combine_report_row, build_combine_report_rows
 
 _DAY = 86_400_000
 
@@ -48,3 +48,20 @@ def test_build_combine_report_row_returns_dict() -> None:
         "gate",
     ):
         assert col in row
+
+
+def test_build_combine_report_rows_batches_settings() -> None:
+    conn = duckdb.connect(":memory:")
+    init_schema(conn)
+    _seed(conn, "AAAUSDT", 1.0)
+    _seed(conn, "BBBUSDT", -0.5)
+    syms = ["AAAUSDT", "BBBUSDT"]
+    settings = [
+        ("equal", 0.5, 0.5, "causal", 365),
+        ("xs 180d", 0.7, 0.3, "causal", 180),
+        ("static", 0.5, 0.5, "static", 365),
+    ]
+    rows = build_combine_report_rows(conn, syms, 2.0, settings)
+    assert [r["label"] for r in rows] == ["equal", "xs 180d", "static"]
+    single = build_combine_report_row(conn, "equal", symbols=syms, slippage_bps=2.0)
+    pd.testing.assert_series_equal(pd.Series(rows[0]), pd.Series(single))
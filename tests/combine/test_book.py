@@ -3,7 +3,12 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 
-from analytics.combine.book import CombinedBookResult, combine_books, equity_curve
+from analytics.combine.book import (
+    CombinedBookResult,
+    combine_book_grid,
+    combine_books,
+    equity_curve,
+)
 from analytics.combine.config import CombineConfig
 from analytics.forecast.book import ForecastBookResult
 from analytics.xsmom.book import XSBookResult
@@ -133,3 +138,17 @@ def test_degenerate_flat_sleeves() -> None:
     res = combine_books(xs, tr, CombineConfig())
     assert np.all(res.portfolio_return == 0.0)
     assert np.all(res.idm == 1.0)  # no live data -> neutral IDM throughout
+
+
+def test_combine_book_grid_matches_one_combine_per_config() -> None:
+    xs, tr = _pair()
+    cfgs = [
+        CombineConfig(w_xs=w, w_trend=1.0 - w, idm_window=win, idm_mode=mode)
+        for w in (0.5, 0.7)
+        for win in (120, 365)
+        for mode in ("causal", "static")
+    ]
+    for cfg, got in zip(cfgs, combine_book_grid(xs, tr, cfgs), strict=True):
+        want = combine_books(xs, tr, cfg)
+        np.testing.assert_array_equal(got.idm, want.idm)
+        np.testing.assert_array_equal(got.portfolio_return, want.portfolio_return)
@@ -4,8 +4,16 @@ import math
 
 import numpy as np
 import pandas as pd
+import pytest
 
-from analytics.combine.idm import causal_idm_series, idm_value, static_idm
+from analytics.combine.idm import (
+    causal_idm,
+    causal_idm_series,
+    idm_from_corr,
+    idm_value,
+    rolling_corr_matrix,
+    static_idm,
+)
 
 
 def test_idm_zero_corr_equal_weights() -> None:
@@ -93,3 +101,35 @@ def test_causal_idm_series_is_causal_no_lookahead() -> None:
     )
     # IDM at day t uses corr through t-1; a change at 400 cannot move IDM[:401]
     pd.testing.assert_series_equal(base.iloc[:401], after.iloc[:401], check_names=False)
+
+
+def test_idm_from_corr_matches_scalar_idm_value_per_weight_row() -> None:
+    corr = np.array([-1.0, -0.3, 0.0, 0.37, 0.9, np.nan])
+    mats = np.ones((len(corr), 2, 2))
+    mats[:, 0, 1] = mats[:, 1, 0] = corr
+    weights = np.array([[0.5, 0.5], [0.7, 0.3], [0.79, 0.21]])
+    grid = idm_from_corr(weights, mats, cap=2.5)
+    assert grid.shape == (3, len(corr))
+    for g, (w_xs, w_tr) in enumerate(weights):
+        expected = [idm_value(w_xs, w_tr, c, 2.5) for c in corr[:-1]]
+        assert grid[g, :-1].tolist() == expected
+    assert np.isnan(grid[:, -1]).all()
+
+
+def test_n_sleeve_idm_is_the_quadratic_form_of_the_rolling_corr() -> None:
+    rng = np.random.default_rng(5)
+    base = rng.standard_normal((500, 1))
+    returns = 0.6 * base + rng.standard_normal((500, 3))
+    returns[:50] = 0.0  # joint warm-up, masked
+    corr = rolling_corr_matrix(returns, window=200, min_periods=60)
+
+    live = pd.DataFrame(returns[50:])
+    ref = live.iloc[-200:].corr().to_numpy()
+    np.testing.assert_allclose(corr[-1], ref, rtol=1e-10)
+    assert np.isnan(corr[50 + 58, 0, 1]) and not np.isnan(corr[50 + 59, 0, 1])
+
+    weights = np.array([[1 / 3, 1 / 3, 1 / 3], [0.6, 0.3, 0.1]])
+    idm = causal_idm(corr, weights, cap=2.5)
+    for g, w in enumerate(weights):
+        assert idm[g, -1] == pytest.approx(1.0 / np.sqrt(w @ corr[-2] @ w))
+    assert (idm[:, : 50 + 60] == 1.0).all()
@@ -91,9 +91,9 @@ def _create_mock_client() -> MagicMock:
 def web_client() -> Generator[TestClient]:
     """TestClient with lifespan patched to avoid touching the real DB or Binance.
 
-    Patches duckdb.connect and create_client in web.api.main so the lifespan
-    never opens analytics.db (which may be locked by signal watch) or calls
-    the Binance API. get_db and require_token are overridden so route handlers
+    Patches duckdb.connect, create_client and create_position_feed in
+    web.api.main so the lifespan never opens analytics.db (which may be locked
+    by signal watch) or calls the Binance API. get_db and require_token are overridden so route handlers
     receive a mock connection and skip auth.
     """
     from web.api.deps import get_db, require_token, require_token_sse
@@ -108,6 +108,7 @@ def web_client() -> Generator[TestClient]:
     with (
         patch("web.api.main.duckdb.connect", return_value=mock_conn),
         patch("web.api.main.create_client", return_value=MagicMock()),
+        patch("web.api.main.create_position_feed", return_value=None),
         patch("web.api.main.init_schema"),
         TestClient(app, raise_server_exceptions=True) as client,
     ):
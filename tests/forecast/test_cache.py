@@ -0,0 +1,166 @@
+"""Tests for analytics.forecast.cache — cached array books vs the per-series path."""
+
+from __future__ import annotations
+
+import dataclasses
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analytics.forecast.book import forecast_book, instrument_returns
+from analytics.forecast.cache import build_forecast_cache
+from analytics.forecast.config import ForecastConfig
+from analytics.forecast.ewmac import combine_forecasts
+from analytics.forecast.panel import DailyPanel
+from analytics.forecast.vol import ew_return_vol
+from analytics.xsmom.book import xs_book, xs_forecasts
+from analytics.xsmom.execution import (
+    ExecutionCostConfig,
+    adv_grid,
+    dollar_adv,
+    turnover_cost_rate,
+    xs_book_with_costs,
+)
+
+
+def _inputs() -> tuple[dict[str, pd.Series], dict[str, pd.Series]]:
+    """Staggered listings, an own-index gap and a NaN-close prefix."""
+    rng = np.random.default_rng(7)
+    full = pd.date_range("2021-01-01", periods=520, freq="D")
+    closes: dict[str, pd.Series] = {}
+    fundings: dict[str, pd.Series] = {}
+    for i in range(5):
+        idx = full[40 * i :]
+        if i == 2:
+            idx = idx.delete([90, 91, 200])
+        close = pd.Series(
+            100.0 * np.exp(np.cumsum(rng.normal(0.0003, 0.03, len(idx)))), index=idx
+        )
+        if i == 3:
+            close.iloc[:30] = np.nan
+        closes[f"S{i}"] = close
+        fundings[f"S{i}"] = pd.Series(rng.normal(0.0, 1e-4, len(idx)), index=idx)
+    return closes, fundings
+
+
+def _governed(pre: pd.Series, cfg: ForecastConfig) -> np.ndarray:
+    ann = np.sqrt(cfg.annualization_days)
+    trailing = pre.rolling(cfg.gov_window, min_periods=cfg.gov_window).std().shift(1)
+    g = (cfg.vol_target_annual / (trailing * ann)).clip(cfg.g_min, cfg.g_max)
+    return np.asarray((g.fillna(0.0) * pre).to_numpy(), dtype=np.float64)
+
+
+def _reference_trend(
+    closes: dict[str, pd.Series], fundings: dict[str, pd.Series], cfg: ForecastConfig
+) -> np.ndarray:
+    nets = pd.concat(
+        {s: instrument_returns(c, fundings[s], cfg)["net"] for s, c in closes.items()},
+        axis=1,
+    ).sort_index()
+    return _governed(nets.mean(axis=1).fillna(0.0), cfg)
+
+
+def _reference_xs_leverage(
+    closes: dict[str, pd.Series], cfg: ForecastConfig
+) -> pd.DataFrame:
+    f = xs_forecasts(closes, cfg)
+    shifted = f.sub(f.mean(axis=1), axis=0).shift(1)
+    ann = np.sqrt(cfg.annualization_days)
+    vol = pd.DataFrame(
+        {s: ew_return_vol(c, cfg.vol_span).mul(ann) for s, c in closes.items()}
+    ).reindex(f.index)
+    lev = ((shifted / 10.0) * (cfg.vol_target_annual / vol)).replace(
+        [np.inf, -np.inf], np.nan
+    )
+    return lev.sub(lev.mean(axis=1), axis=0) if cfg.xs_dollar_neutral else lev
+
+
+def _reference_xs(
+    closes: dict[str, pd.Series],
+    fundings: dict[str, pd.Series],
+    cfg: ForecastConfig,
+    rate: pd.DataFrame | float,
+) -> np.ndarray:
+    lev = _reference_xs_leverage(closes, cfg)
+    union = lev.index
+    r = pd.DataFrame({s: c.pct_change() for s, c in closes.items()}).reindex(union)
+    fund = pd.DataFrame(fundings).reindex(union).fillna(0.0)
+    dlev = (lev - lev.shift(1).fillna(0.0)).abs()
+    net = lev * r - dlev * rate - lev * fund
+    return _governed(net.sum(axis=1), cfg)
+
+
+_CONFIGS = [
+    ForecastConfig(),
+    ForecastConfig(weights=(0.4, 0.3, 0.2, 0.1)),
+    ForecastConfig(xs_dollar_neutral=True, fdm=1.1, fee_pct=0.001),
+]
+
+
+def test_combined_forecast_matches_per_series() -> None:
+    closes, fundings = _inputs()
+    cfg = _CONFIGS[1]
+    cache = build_forecast_cache(DailyPanel.from_series(closes, fundings), cfg)
+    grid = cache.combined_forecast(cfg)
+    for i, close in enumerate(closes.values()):
+        expected = combine_forecasts(
+            close, cfg.speeds, cfg.fdm, cfg.vol_span, cfg.cap, weights=cfg.weights
+        ).reindex(cache.panel.daily_index)
+        np.testing.assert_array_equal(grid[:, i], expected.to_numpy())
+
+
+@pytest.mark.parametrize("cfg", _CONFIGS)
+def test_trial_family_from_one_cache_matches_reference(cfg: ForecastConfig) -> None:
+    closes, fundings = _inputs()
+    cache = build_forecast_cache(
+        DailyPanel.from_series(closes, fundings), ForecastConfig()
+    )
+    trials = [cfg] + [
+        dataclasses.replace(cfg, speeds=(speed,), weights=None) for speed in cfg.speeds
+    ]
+    for trial in trials:
+        np.testing.assert_array_equal(
+            forecast_book(cache, trial).portfolio_return,
+            _reference_trend(closes, fundings, trial),
+        )
+        np.testing.assert_allclose(
+            xs_book(cache, trial).portfolio_return,
+            _reference_xs(closes, fundings, trial, trial.fee_pct + trial.slippage_pct),
+            rtol=1e-12,
+            atol=1e-15,
+        )
+
+
+def test_capacity_book_matches_reference_cost_rate() -> None:
+    closes, fundings = _inputs()
+    cfg = ForecastConfig()
+    rng = np.random.default_rng(3)
+    dvol = {
+        s: pd.Series(rng.uniform(1e7, 2e9, len(c)), index=c.index)
+        for s, c in closes.items()
+    }
+    adv = dollar_adv(dvol, 30)
+    cache = build_forecast_cache(DailyPanel.from_series(closes, fundings), cfg)
+    for capital in (1e5, 1e9):
+        ec = ExecutionCostConfig(capital=capital, k=0.5)
+        rate = turnover_cost_rate(_reference_xs_leverage(closes, cfg), adv, ec)
+        np.testing.assert_allclose(
+            xs_book_with_costs(
+                cache, cfg, ec, adv_grid(adv, cache.panel)
+            ).portfolio_return,
+            _reference_xs(closes, fundings, cfg, rate),
+            rtol=1e-12,
+            atol=1e-15,
+        )
+
+
+def test_cache_rejects_uncached_inputs() -> None:
+    closes, fundings = _inputs()
+    cache = build_forecast_cache(
+        DailyPanel.from_series(closes, fundings), ForecastConfig()
+    )
+    with pytest.raises(ValueError, match="speeds"):
+        cache.combined_forecast(ForecastConfig(speeds=((4, 16, 7.5),)))
+    with pytest.raises(ValueError, match="cache built for"):
+        cache.combined_forecast(ForecastConfig(vol_span=25))
@@ -0,0 +1,101 @@
+"""Tests for analytics.forecast.panel and the bulk ``load_daily_panel`` loader."""
+
+from __future__ import annotations
+
+import duckdb
+import numpy as np
+import pandas as pd
+
+from analytics.forecast.panel import DailyPanel
+from analytics.forecast.replay import load_daily_panel
+from analytics.store import init_schema
+from analytics.store.market_data import upsert_funding_rates, upsert_ohlcv
+
+_DAY = 86_400_000
+_T0 = 1_600_000_000_000
+
+
+def _series() -> dict[str, pd.Series]:
+    full = pd.date_range("2022-01-01", periods=8, freq="D", tz="UTC")
+    return {
+        "A": pd.Series(np.arange(8.0), index=full),
+        "B": pd.Series([10.0, 11.0, 12.0], index=full[[2, 3, 6]]),  # own-index gap
+        "C": pd.Series([5.0, 6.0], index=full[5:7]),
+    }
+
+
+def test_compact_expand_round_trip_and_own_lag() -> None:
+    closes = _series()
+    panel = DailyPanel.from_series(closes)
+    assert panel.symbols == ("A", "B", "C")
+    assert panel.rows.shape == (8, 3)
+
+    compact = panel.compact(panel.close)
+    np.testing.assert_array_equal(compact[:3, 1], [10.0, 11.0, 12.0])
+    assert np.isnan(compact[3:, 1]).all()
+    np.testing.assert_array_equal(panel.expand(compact), panel.close)
+
+    lagged = panel.own_lag(panel.close)
+    for i, close in enumerate(closes.values()):
+        expected = close.shift(1).reindex(panel.daily_index).to_numpy()
+        np.testing.assert_array_equal(lagged[:, i], expected)
+
+
+def test_from_series_aligns_funding_to_close_days() -> None:
+    closes = _series()
+    fund = pd.Series(0.001, index=closes["B"].index[:2])  # day 6 missing
+    panel = DailyPanel.from_series(closes, {"B": fund})
+    np.testing.assert_array_equal(panel.fundings()["B"].to_numpy(), [0.001, 0.001, 0.0])
+    assert (panel.funding[:, [0, 2]] == 0.0).all()
+    pd.testing.assert_series_equal(panel.closes()["B"], closes["B"])
+
+
+def test_through_trims_days_and_drops_unlisted_symbols() -> None:
+    panel = DailyPanel.from_series(_series())
+    cut = panel.through(pd.Timestamp("2022-01-04", tz="UTC"))
+    assert cut.symbols == ("A", "B")
+    assert len(cut.daily_index) == 4
+    np.testing.assert_array_equal(cut.compact(cut.close)[:2, 1], [10.0, 11.0])
+
+
+def _bar(symbol: str, day: int, close: float, volume: float) -> dict[str, object]:
+    return {
+        "symbol": symbol,
+        "timeframe": "1d",
+        "open_time": _T0 + day * _DAY,
+        "open": close,
+        "high": close,
+        "low": close,
+        "close": close,
+        "volume": volume,
+        "taker_buy_volume": volume / 2,
+    }
+
+
+def test_load_daily_panel_matches_per_symbol_semantics() -> None:
+    conn = duckdb.connect(":memory:")
+    init_schema(conn)
+    bars = [_bar("BBBUSDT", d, 50.0 + d, 10.0) for d in (2, 3, 5)]
+    bars += [_bar("AAAUSDT", d, 100.0 + d, 2.0) for d in range(6)]
+    upsert_ohlcv(conn, pd.DataFrame(bars))
+    funding = [
+        {"symbol": "BBBUSDT", "funding_time": _T0 + i * (_DAY // 3), "funding_rate": r}
+        for i, r in ((6, 1e-4), (7, 2e-4), (12, 5e-4))  # days 2 and 4
+    ]
+    upsert_funding_rates(conn, pd.DataFrame(funding))
+
+    panel = load_daily_panel(conn, ["BBBUSDT", "NOPEUSDT", "AAAUSDT", "BBBUSDT"])
+    assert panel.symbols == ("BBBUSDT", "AAAUSDT")
+    assert len(panel.daily_index) == 6
+
+    b_close = panel.closes()["BBBUSDT"]
+    assert b_close.index[0] == pd.Timestamp(_T0 + 2 * _DAY, unit="ms", tz="UTC").floor(
+        "D"
+    )
+    np.testing.assert_array_equal(b_close.to_numpy(), [52.0, 53.0, 55.0])
+    # day 2 sums its two 8h rows; day 4 has no bar, so its funding is dropped
+    np.testing.assert_allclose(panel.fundings()["BBBUSDT"].to_numpy(), [3e-4, 0, 0])
+    np.testing.assert_array_equal(
+        panel.dollar_volumes()["AAAUSDT"].to_numpy(), 2.0 * (100.0 + np.arange(6))
+    )
+    assert not load_daily_panel(conn, ["NOPEUSDT"]).symbols
@@ -2063,3 +2063,34 @@ class TestRunBacktestCosts:
         )
         assert res.trades[0].outcome == "open"
         assert res.trades[0].funding_r == 0.0
+
+
+class TestFundingIndex:
+    """Prefix-sum funding windows vs slice sums over (start, end]."""
+
+    def test_window_matches_slice_sums(self) -> None:
+        from analytics.backtest.funding import FundingIndex
+
+        rng = np.random.default_rng(0)
+        times = np.sort(rng.choice(10_000, 200, replace=False)).astype(np.int64)
+        rates = rng.normal(0.0, 1e-4, 200)
+        index = FundingIndex.of(pd.Series(rates, index=times))
+        start = rng.integers(-10, 10_010, 500)
+        end = start + rng.integers(-50, 3_000, 500)
+        held, sums = index.window(start, end)
+        for a, b, n, total in zip(start, end, held, sums, strict=True):
+            window = rates[(times > a) & (times <= b)]
+            assert n == len(window)
+            assert total == pytest.approx(window.sum(), abs=1e-15)
+
+    def test_nan_rate_poisons_only_windows_holding_it(self) -> None:
+        from analytics.backtest.funding import FundingIndex
+
+        index = FundingIndex.from_series(
+            pd.Series([0.01, np.nan, 0.02, 0.03], index=[1, 2, 3, 4])
+        )
+        held, sums = index.window(np.array([0, 1, 2]), np.array([1, 3, 4]))
+        assert held.tolist() == [1, 2, 2]
+        assert sums[0] == pytest.approx(0.01)
+        assert np.isnan(sums[1])
+        assert sums[2] == pytest.approx(0.05)
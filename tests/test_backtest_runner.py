@@ -5,6 +5,7 @@ from __future__ import annotations
 from unittest.mock import patch
 
 import duckdb
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -15,9 +16,17 @@ from analytics.backtest_runner import (
     _apply_strategy_timeframes_directional_filter,
     _build_funding_series_by_symbol,
     _collect_sweep_results,
+    _detect_sweep_signals,
     format_sweep_table,
 )
-from analytics.data_store import init_schema, upsert_funding_rates, upsert_ohlcv
+from analytics.data_store import (
+    encode_signals,
+    init_schema,
+    upsert_funding_rates,
+    upsert_ohlcv,
+)
+from analytics.store.signal_cache import init_signal_cache_schema
+from analytics.store.sweep_cells import init_sweep_cell_schema
 
 
 def _make_result(
@@ -545,3 +554,151 @@ class TestCollectSweepResultsPlumbing:
             "funding_series was None — not threaded through"
         )
         assert 1_700_000_000_000 in funding_series.index
+
+    def test_sweep_cell_store_skips_computed_cells(self) -> None:
+        conn = _make_in_memory_conn()
+        upsert_ohlcv(conn, _make_ohlcv_df("BTCUSDT", "1h", n=20))
+        cells = duckdb.connect(":memory:")
+        init_sweep_cell_schema(cells)
+        cfg = BacktestSweepConfig(
+            symbols=["BTCUSDT"], timeframes=["1h"], strategies=["fvg"]
+        )
+        signals = pd.DataFrame(
+            {
+                "open_time": [1_700_000_000_000 + 3_600_000],
+                "direction": ["long"],
+                "sl_price": [99.0],
+            }
+        )
+
+        def _sweep(tp_r: float) -> list[BacktestResult]:
+            cfg.tp_r = tp_r
+            with patch(
+                "analytics.backtest_runner.detect_signals_for_strategy",
+                return_value=signals,
+            ):
+                results, _ = _collect_sweep_results(
+                    conn,
+                    cfg,
+                    tp_r,
+                    ["BTCUSDT"],
+                    ["fvg"],
+                    0,
+                    9_999_999_999_999,
+                    cells=cells,
+                )
+            return results
+
+        first = _sweep(2.0)
+        assert first[0].closed_trades
+        with patch(
+            "analytics.backtest_runner.run_backtest", side_effect=AssertionError
+        ):
+            again = _sweep(2.0)
+        assert again[0].trades == first[0].trades
+        # A new grid value is a new cell and is computed.
+        with patch(
+            "analytics.backtest_runner.run_backtest", return_value=first[0]
+        ) as mock_run_backtest:
+            _sweep(3.0)
+        assert mock_run_backtest.call_count == 1
+        stored = cells.execute("SELECT COUNT(*) FROM sweep_cells").fetchone()
+        assert stored == (2,)
+
+
+def _make_walk_ohlcv_df(symbol: str, timeframe: str, seed: int) -> pd.DataFrame:
+    """Random-walk OHLCV so the detectors find signals."""
+    rng = np.random.default_rng(seed)
+    n = 200
+    close = 100.0 + np.cumsum(rng.normal(0.0, 1.0, n))
+    return pd.DataFrame(
+        {
+            "symbol": [symbol] * n,
+            "timeframe": [timeframe] * n,
+            "open_time": [1_700_000_000_000 + i * 3_600_000 for i in range(n)],
+            "open": close + rng.normal(0.0, 0.5, n),
+            "high": close + 1.0 + rng.random(n),
+            "low": close - 1.0 - rng.random(n),
+            "close": close,
+            "volume": rng.random(n) * 1_000.0,
+            "taker_buy_volume": rng.random(n) * 500.0,
+        }
+    )
+
+
+class TestDetectSweepSignals:
+    """Detection stage: signal cache reuse and pooled == in-process detection."""
+
+    _STRATEGIES = ["fvg", "engulfing", "smt_divergence"]
+
+    def _conn(self) -> duckdb.DuckDBPyConnection:
+        conn = _make_in_memory_conn()
+        for seed, symbol in enumerate(["BTCUSDT", "ETHUSDT"]):
+            upsert_ohlcv(conn, _make_walk_ohlcv_df(symbol, "1h", seed))
+        return conn
+
+    def _cfg(self) -> BacktestSweepConfig:
+        return BacktestSweepConfig(
+            symbols=["BTCUSDT", "ETHUSDT"],
+            timeframes=["1h"],
+            strategies=self._STRATEGIES,
+            smt_pairs={"BTCUSDT": "ETHUSDT"},
+        )
+
+    def _detect(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        signal_cache: duckdb.DuckDBPyConnection | None = None,
+        workers: int = 1,
+    ) -> tuple:
+        return _detect_sweep_signals(
+            conn,
+            self._cfg(),
+            ["BTCUSDT", "ETHUSDT"],
+            self._STRATEGIES,
+            0,
+            9_999_999_999_999,
+            signal_cache=signal_cache,
+            workers=workers,
+        )
+
+    def _assert_same(self, got: tuple, want: tuple) -> None:
+        assert list(got[0]) == list(want[0])
+        assert got[1] == want[1]
+        for cell, (_, signals, secondary) in want[0].items():
+            pd.testing.assert_frame_equal(got[0][cell][1], signals)
+            assert got[0][cell][2] == secondary
+
+    def test_cached_signals_skip_detection(self) -> None:
+        conn = self._conn()
+        cache = duckdb.connect(":memory:")
+        init_signal_cache_schema(cache)
+
+        first = self._detect(conn, signal_cache=cache)
+        assert any(not signals.empty for _, signals, _ in first[0].values())
+        assert first[1] == ["ETHUSDT/1h/smt_divergence (no smt_pair configured)"]
+        stored = cache.execute("SELECT COUNT(*) FROM signal_cache").fetchone()
+        assert stored == (5,)
+
+        with patch(
+            "analytics.backtest_runner.detect_signals_for_strategy",
+            side_effect=AssertionError,
+        ):
+            again = self._detect(conn, signal_cache=cache)
+        self._assert_same(again, first)
+
+    def test_pooled_detection_matches_in_process(self) -> None:
+        conn = self._conn()
+        self._assert_same(self._detect(conn, workers=2), self._detect(conn))
+
+    def test_pooled_payloads_are_cached_without_reencoding(self) -> None:
+        conn = self._conn()
+        cache = duckdb.connect(":memory:")
+        init_signal_cache_schema(cache)
+        with patch(
+            "analytics.backtest_runner.encode_signals", wraps=encode_signals
+        ) as encode:  # workers encode in their own process
+            pooled = self._detect(conn, signal_cache=cache, workers=2)
+        encode.assert_not_called()
+        self._assert_same(pooled, self._detect(conn))
+        self._assert_same(self._detect(conn, signal_cache=cache), pooled)
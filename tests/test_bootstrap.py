@@ -1,10 +1,19 @@
 """Tests for analytics/research_guards/bootstrap.py."""
 
+from typing import Any
+
 import numpy as np
 import numpy.typing as npt
 import pytest
 
-from analytics.research_guards.bootstrap import block_bootstrap_ci
+from analytics.research_guards import bootstrap
+from analytics.research_guards.bootstrap import (
+    _stationary_index_matrix,
+    batch_mean,
+    batch_sharpe,
+    block_bootstrap_ci,
+    resample_mean_diffs,
+)
 
 
 def _mean(x: npt.NDArray[np.float64]) -> float:
@@ -60,3 +69,59 @@ class TestBlockBootstrapCI:
     def test_too_short_raises(self) -> None:
         with pytest.raises(ValueError):
             block_bootstrap_ci(np.array([1.0]), _mean)
+
+
+def _sequential_stationary(
+    n: int, block: int, rng: np.random.Generator
+) -> npt.NDArray[np.int64]:
+    """One-resample-at-a-time walk the index matrix replaces."""
+    idx = np.empty(n, dtype=np.int64)
+    idx[0] = rng.integers(0, n)
+    draws = rng.random(n)
+    restarts = rng.integers(0, n, size=n)
+    for t in range(1, n):
+        idx[t] = restarts[t] if draws[t] < 1.0 / block else (idx[t - 1] + 1) % n
+    return idx
+
+
+class TestBatchedResampling:
+    def test_stationary_matrix_matches_sequential_walk(self) -> None:
+        n, block, k = 37, 4, 25
+        expected_rng = np.random.default_rng(11)
+        expected = np.stack(
+            [_sequential_stationary(n, block, expected_rng) for _ in range(k)]
+        )
+        got = _stationary_index_matrix(k, n, block, np.random.default_rng(11))
+        np.testing.assert_array_equal(got, expected)
+
+    @pytest.mark.parametrize("method", ["stationary", "circular"])
+    def test_batch_stat_matches_stat_fn_across_chunks(
+        self, method: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(bootstrap, "_CHUNK_ELEMS", 1000)  # ~12 chunks
+        data = np.random.default_rng(8).normal(0.001, 0.02, size=90)
+        kwargs: dict[str, Any] = {"n_boot": 1000, "method": method, "seed": 3}
+        by_fn = block_bootstrap_ci(data, _mean, **kwargs)
+        by_batch = block_bootstrap_ci(data, batch_stat=batch_mean, **kwargs)
+        assert by_fn == by_batch
+
+    def test_batch_sharpe_zero_on_flat_resamples(self) -> None:
+        x = np.array([[1.0, 1.0, 1.0], [1.0, 2.0, 3.0]])
+        np.testing.assert_allclose(batch_sharpe(2.0)(x), [0.0, 4.0])
+
+    def test_resample_mean_diffs_matches_unchunked_draws(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        a = np.random.default_rng(1).normal(size=60)
+        b = np.random.default_rng(2).normal(size=45)
+        rng = np.random.default_rng(9)
+        ia = rng.integers(0, len(a), (500, len(a)))
+        ib = rng.integers(0, len(b), (500, len(b)))
+        expected = a[ia].mean(axis=1) - b[ib].mean(axis=1)
+        monkeypatch.setattr(bootstrap, "_CHUNK_ELEMS", 700)
+        got = resample_mean_diffs(a, b, 500, np.random.default_rng(9))
+        np.testing.assert_array_equal(got, expected)
+
+    def test_requires_a_statistic(self) -> None:
+        with pytest.raises(ValueError):
+            block_bootstrap_ci(np.arange(10.0))
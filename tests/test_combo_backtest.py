@@ -3,6 +3,7 @@
 import pandas as pd
 
 from analytics.backtest_lib import (
+    CofireIndex,
     ComboBacktestResult,
     _find_cofire_signals,
     run_combo_backtest,
@@ -126,6 +127,80 @@ def test_cofire_entry_uses_later_signal() -> None:
     assert int(result["open_time"].iloc[0]) == int(ohlcv["open_time"].iloc[6])
 
 
+def _pairwise_cofire(
+    signals_a: pd.DataFrame, signals_b: pd.DataFrame, ohlcv: pd.DataFrame, window: int
+) -> pd.DataFrame:
+    """Brute-force reference join: nearest unused same-direction B for each A."""
+    pos = {int(t): i for i, t in enumerate(ohlcv["open_time"])}
+    b_rows = signals_b.to_dict("records")
+    used: set[int] = set()
+    rows = []
+    for row_a in signals_a.to_dict("records"):
+        idx_a = pos[int(row_a["open_time"])]
+        best, best_dist = None, window + 1
+        for j, row_b in enumerate(b_rows):
+            dist = abs(pos[int(row_b["open_time"])] - idx_a)
+            same_side = row_b["direction"] == row_a["direction"]
+            if j not in used and same_side and dist < best_dist:
+                best, best_dist = j, dist
+        if best is None:
+            continue
+        used.add(best)
+        row_b = b_rows[best]
+        later = row_b if row_b["open_time"] >= row_a["open_time"] else row_a
+        rows.append(
+            {
+                "open_time": int(later["open_time"]),
+                "direction": row_a["direction"],
+                "reason": f"{row_a['reason']} ↔ {row_b['reason']}",
+                "sl_price": float(later["sl_price"]),
+                "context": f"combo|{row_a['context']}",
+                "low_volume": bool(later["low_volume"]),
+                "tp_price": float(later["tp_price"]),
+            }
+        )
+    return pd.DataFrame(rows, columns=SIGNAL_COLUMNS)
+
+
+def test_cofire_index_matches_pairwise_join_for_every_pair() -> None:
+    ohlcv = _make_ohlcv(40)
+    sigs = {
+        "a": pd.concat(
+            [
+                _make_signals([2, 9, 20], ohlcv=ohlcv),
+                _make_signals([30], direction="short", ohlcv=ohlcv),
+            ],
+            ignore_index=True,
+        ),
+        "b": _make_signals([3, 4, 21, 33], sl_price=97.0, ohlcv=ohlcv),
+        "c": _make_signals([8, 31, 32], direction="short", sl_price=103.0, ohlcv=ohlcv),
+    }
+    index = CofireIndex.build(ohlcv, sigs)
+    for x, y in [("a", "b"), ("b", "a"), ("a", "c"), ("c", "a"), ("b", "c")]:
+        expected = _pairwise_cofire(sigs[x], sigs[y], ohlcv, window=3)
+        got = index.cofire_signals((x, y), window=3, min_signals=1)
+        assert len(got) == len(expected), (x, y)
+        if not expected.empty:
+            pd.testing.assert_frame_equal(got, expected, check_dtype=False)
+
+
+def test_cofire_index_three_way_confluence() -> None:
+    """All three must fire within ±window of the anchor; entry at the latest."""
+    ohlcv = _make_ohlcv(30)
+    index = CofireIndex.build(
+        ohlcv,
+        {
+            "a": _make_signals([5, 15], ohlcv=ohlcv),
+            "b": _make_signals([6, 16], ohlcv=ohlcv),
+            "c": _make_signals([3, 25], ohlcv=ohlcv),
+        },
+    )
+    result = index.cofire_signals(("a", "b", "c"), window=2, min_signals=1)
+    assert len(result) == 1
+    assert int(result["open_time"].iloc[0]) == int(ohlcv["open_time"].iloc[6])
+    assert result["reason"].iloc[0].count("↔") == 2
+
+
 # ---------------------------------------------------------------------------
 # run_combo_backtest
 # ---------------------------------------------------------------------------
@@ -1,6 +1,7 @@
 """Tests for analytics/data_store.py."""
 
 import time
+from pathlib import Path
 from typing import Any
 
 import duckdb
@@ -17,11 +18,15 @@ from analytics.data_store import (
     get_latest_open_time,
     get_ohlcv,
     get_signals_history,
+    get_sweep_cells,
     get_win_rate_by_strategy,
     init_schema,
     list_backtest_runs,
+    open_sweep_cell_store,
     prune_backtest_cache,
     put_backtest_cache,
+    put_sweep_cell,
+    sweep_cell_key,
     upsert_backtest_run,
     upsert_backtest_trades,
     upsert_confidence_ratings,
@@ -31,6 +36,7 @@ from analytics.data_store import (
     upsert_signal_outcome,
     upsert_signals,
 )
+from analytics.store import sweep_cells
 
 _OHLCV_ROW: dict[str, object] = {
     "symbol": "BTCUSDT",
@@ -981,3 +987,67 @@ class TestBacktestCache:
         assert snap is not None
         assert bool(snap.closed_trades)
         assert not bool(snap.short_closed_trades)
+
+
+class TestSweepCells:
+    _OHLCV = pd.DataFrame(
+        {"open_time": [1_000, 2_000, 3_000], "close": [1.0, 2.0, 3.0]}
+    )
+    _SIGNALS = pd.DataFrame({"open_time": [1_000], "direction": ["long"]})
+
+    def _key(self, **params: Any) -> str:
+        return sweep_cell_key(
+            "BTCUSDT", "1h", "engulfing", self._OHLCV, self._SIGNALS, params
+        )
+
+    def test_key_covers_params_and_data(self) -> None:
+        base = self._key(tp_r=2.0, funding_series=pd.Series([0.1, 0.2]))
+        assert base == self._key(funding_series=pd.Series([0.1, 0.2]), tp_r=2.0)
+        assert base != self._key(tp_r=2.5, funding_series=pd.Series([0.1, 0.2]))
+        assert base != self._key(tp_r=2.0, funding_series=pd.Series([0.1, 0.3]))
+        shifted = self._OHLCV.assign(close=[1.0, 2.0, 3.5])
+        assert self._key(tp_r=2.0) != sweep_cell_key(
+            "BTCUSDT", "1h", "engulfing", shifted, self._SIGNALS, {"tp_r": 2.0}
+        )
+
+    def test_engine_version_covers_gates_outside_backtest(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        root = sweep_cells._ANALYTICS_DIR
+        for pattern in sweep_cells._ENGINE_SOURCES:
+            for path in root.glob(pattern):
+                copy = tmp_path / path.relative_to(root)
+                copy.parent.mkdir(parents=True, exist_ok=True)
+                copy.write_bytes(path.read_bytes())
+        monkeypatch.setattr(sweep_cells, "_ANALYTICS_DIR", tmp_path)
+        try:
+            sweep_cells.engine_version.cache_clear()
+            before = sweep_cells.engine_version()
+            with (tmp_path / "signal" / "gates.py").open("a") as f:
+                f.write("# touched\n")
+            sweep_cells.engine_version.cache_clear()
+            assert sweep_cells.engine_version() != before
+        finally:
+            sweep_cells.engine_version.cache_clear()
+
+    def test_round_trip_restores_trades(self, tmp_path: Path) -> None:
+        result = _make_result()
+        result.fee_pct = 0.0005
+        for t in result.trades:
+            t.fee_pct = 0.0005
+        key = self._key(tp_r=2.0)
+        with open_sweep_cell_store(tmp_path / "analytics.db") as cells:
+            assert cells is not None
+            assert get_sweep_cells(cells, [key]) == {}
+            put_sweep_cell(cells, key, result, self._OHLCV, {"tp_r": 2.0})
+        assert (tmp_path / "analytics.sweep_cells.db").exists()
+
+        with open_sweep_cell_store(tmp_path / "analytics.db") as cells:
+            assert cells is not None
+            back = get_sweep_cells(cells, [key, "missing"])[key]
+            r_values = cells.execute("SELECT r_values FROM sweep_cells").fetchone()
+        assert back.trades == result.trades
+        assert back.fee_pct == 0.0005
+        assert back.avg_r == pytest.approx(result.avg_r)
+        assert r_values is not None
+        assert r_values[0] == pytest.approx([t.pnl_r for t in result.closed_trades])
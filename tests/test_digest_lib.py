@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 import duckdb
 import pytest
 
 from analytics.data_store import init_schema
 from analytics.digest_lib import (
     QUERY_NAMES,
+    DigestScope,
+    clear_digest_cache,
     query_adr_ab,
     query_combos,
     query_consistency,
@@ -323,3 +327,59 @@ def test_recovery_factor_excludes_zero_rf() -> None:
     cols = result["columns"]
     rf_idx = cols.index("avg_rf")
     assert abs(result["rows"][0][rf_idx] - 2.5) < 0.01
+
+
+# ---------------------------------------------------------------------------
+# run_digest memo
+# ---------------------------------------------------------------------------
+
+
+def test_run_digest_memo_follows_backtest_runs_writes(tmp_path: Path) -> None:
+    clear_digest_cache()
+    conn = duckdb.connect(str(tmp_path / "digest.duckdb"))
+    init_schema(conn)
+    _seed_basic(conn)
+    scope = DigestScope(min_trades_per_tf={"15m": 30})
+
+    first = run_digest(conn, "symbol", scope=scope)
+    first["rows"][0][0] = "MUTATED"
+    again = run_digest(conn, "symbol", scope=scope)
+    assert again == run_digest(conn, "symbol", scope=DigestScope(**vars(scope)))
+    assert [r[0] for r in again["rows"]] == ["BTCUSDT", "ETHUSDT"]
+
+    _insert_run(conn, symbol="SOLUSDT", total_r=50.0)
+    assert run_digest(conn, "symbol", scope=scope)["rows"][0][0] == "SOLUSDT"
+    conn.execute("DELETE FROM backtest_runs WHERE symbol = 'SOLUSDT'")
+    assert run_digest(conn, "symbol", scope=scope) == again
+    conn.close()
+    clear_digest_cache()
+
+
+def _upsert_combo(
+    conn: duckdb.DuckDBPyConnection, avg_r: float, run_at_ms: int
+) -> None:
+    """Insert-or-replace one backtest_combos row (same combo_id each call)."""
+    conn.execute(
+        "INSERT OR REPLACE INTO backtest_combos (combo_id, symbol, timeframe, "
+        "strategy_a, strategy_b, window_candles, data_start_ms, data_end_ms, days, "
+        "sl_pct, tp_r, fee_pct, day_filter, total_signals, closed_trades, "
+        "win_count, win_rate, avg_r, total_r, max_drawdown_r, run_at_ms) VALUES "
+        "('c1', 'BTCUSDT', '1h', 'fvg', 'bos', 3, 0, 1, 90, 0.02, 2.0, 0.0, 'off', "
+        "10, 10, 5, 0.5, ?, ?, 0.0, ?)",
+        [avg_r, avg_r * 10, run_at_ms],
+    )
+
+
+def test_run_digest_memo_follows_the_tables_each_card_reads(tmp_path: Path) -> None:
+    clear_digest_cache()
+    conn = duckdb.connect(str(tmp_path / "digest.duckdb"))
+    init_schema(conn)
+    _upsert_combo(conn, 2.0, run_at_ms=1000)
+    avg_r_idx = run_digest(conn, "co_firing")["columns"].index("avg_r")
+    assert run_digest(conn, "co_firing")["rows"][0][avg_r_idx] == 2.0
+
+    # Re-running the combo replaces its row; backtest_runs is untouched.
+    _upsert_combo(conn, -1.0, run_at_ms=2000)
+    assert run_digest(conn, "co_firing")["rows"][0][avg_r_idx] == -1.0
+    conn.close()
+    clear_digest_cache()
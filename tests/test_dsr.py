@@ -2,7 +2,11 @@
 
 import pytest
 
-from analytics.research_guards.dsr import deflated_sharpe_ratio, expected_max_sharpe
+from analytics.research_guards.dsr import (
+    deflated_sharpe_ratio,
+    deflated_sharpe_ratios,
+    expected_max_sharpe,
+)
 from analytics.research_guards.psr import probabilistic_sharpe_ratio
 
 
@@ -46,3 +50,16 @@ class TestDeflatedSharpeRatio:
         srs = [0.1, 0.2, 0.3, 0.15, 0.25, 0.05]
         dsr = deflated_sharpe_ratio(0.6, 120, trial_srs=srs)
         assert 0.0 <= dsr <= 1.0
+
+
+class TestDeflatedSharpeRatios:
+    def test_matches_scalar_per_cell(self) -> None:
+        srs = [0.35, -0.1, 0.05, 0.2]
+        n_obs = [30, 45, 120, 31]
+        out = deflated_sharpe_ratios(srs, n_obs, trial_srs=srs, skew=-0.3)
+        for sr, n, dsr in zip(srs, n_obs, out, strict=True):
+            assert dsr == deflated_sharpe_ratio(sr, n, trial_srs=srs, skew=-0.3)
+
+    def test_rejects_short_samples(self) -> None:
+        with pytest.raises(ValueError, match="n_obs"):
+            deflated_sharpe_ratios([0.1, 0.2], [30, 1], trial_srs=[0.1, 0.2])
@@ -4,7 +4,12 @@ import numpy as np
 import pytest
 
 from analytics.exits.policies import ExitPolicyConfig, composite, fixed
-from analytics.exits.replay import ExitOutcome, replay_exits
+from analytics.exits.replay import (
+    ExitOutcome,
+    exit_paths,
+    replay_exits,
+    replay_exits_batch,
+)
 
 
 def _w(
@@ -118,3 +123,70 @@ class TestGuards:
     def test_empty_window_raises(self) -> None:
         with pytest.raises(ValueError):
             _run(_w([], [], []), fixed(tp_r=3.0, max_hold_bars=10))
+
+
+class TestBatch:
+    """`replay_exits_batch` is `replay_exits` row by row, bit for bit."""
+
+    def _alerts(self, n_alerts: int = 400, width: int = 12) -> tuple[np.ndarray, ...]:
+        rng = np.random.default_rng(7)
+        n_bars = rng.integers(1, width + 1, n_alerts)
+        mid = 100.0 + rng.integers(-2, 3, (n_alerts, width)).cumsum(axis=1)
+        highs = mid + rng.integers(0, 3, (n_alerts, width))
+        lows = mid - rng.integers(0, 3, (n_alerts, width))
+        closes = mid + rng.integers(-1, 2, (n_alerts, width))
+        past = np.arange(width) >= n_bars[:, None]
+        for m in (highs, lows, closes):
+            m[past] = np.nan
+        dirs = rng.choice(["long", "short"], n_alerts)
+        risk = rng.choice([1.0, 2.0], n_alerts)
+        sl = np.where(dirs == "long", 100.0 - risk, 100.0 + risk)
+        return highs, lows, closes, n_bars, dirs, sl
+
+    def test_matches_scalar_replay_for_every_policy(self) -> None:
+        highs, lows, closes, n_bars, dirs, sl = self._alerts()
+        grid = [
+            fixed(tp_r=2.0, max_hold_bars=12),
+            composite(tp_r=3.0, max_hold_bars=12, time_stop_bars=5),
+            ExitPolicyConfig("be", tp_r=1.5, max_hold_bars=12, breakeven_arm_r=0.5),
+        ]
+        paths = exit_paths(
+            highs,
+            lows,
+            closes,
+            n_bars=n_bars,
+            directions=list(dirs),
+            entries=np.full(len(sl), 100.0),
+            sl_prices=sl,
+        ).tile(len(grid))
+        batch = replay_exits_batch(paths, [p for p in grid for _ in sl])
+        outcomes = set()
+        for k, policy in enumerate(grid):
+            for i in range(len(sl)):
+                n = n_bars[i]
+                expected = replay_exits(
+                    highs[i, :n],
+                    lows[i, :n],
+                    closes[i, :n],
+                    direction=str(dirs[i]),
+                    entry=100.0,
+                    sl_price=float(sl[i]),
+                    policy=policy,
+                )
+                assert batch[k * len(sl) + i] == expected
+                outcomes.add(expected.outcome)
+        assert outcomes == {"win", "loss", "breakeven", "expired"}
+
+    def test_policy_count_must_match_rows(self) -> None:
+        highs, lows, closes, n_bars, dirs, sl = self._alerts(3)
+        paths = exit_paths(
+            highs,
+            lows,
+            closes,
+            n_bars=n_bars,
+            directions=list(dirs),
+            entries=np.full(3, 100.0),
+            sl_prices=sl,
+        )
+        with pytest.raises(ValueError):
+            replay_exits_batch(paths, [fixed(tp_r=2.0, max_hold_bars=12)])
@@ -0,0 +1,73 @@
+"""Tests for analytics.features — FeatureFrame vs the per-call reference helpers."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analytics.backtest.engine import _compute_atr14
+from analytics.backtest.gates import _is_low_volume, _is_volume_spike
+from analytics.features import FeatureFrame
+from analytics.regime import classify_series
+from analytics.strategies._shared import compute_ema, ema_cross_count, volume_confirm
+
+
+def _frame(seed: int, n: int) -> pd.DataFrame:
+    """Random bars with rounded closes (EMA ties), NaN and zero volumes."""
+    rng = np.random.default_rng(seed)
+    close = np.round(100.0 + np.cumsum(rng.normal(0.0, 1.0, n)))
+    volume = rng.random(n) * 100.0
+    volume[:25] = 0.0
+    volume[rng.integers(0, n, 6)] = np.nan
+    return pd.DataFrame(
+        {
+            "open_time": np.arange(n, dtype=np.int64) * 3_600_000,
+            "open": close,
+            "high": close + rng.random(n),
+            "low": close - rng.random(n),
+            "close": close,
+            "volume": volume,
+        }
+    )
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_features_match_per_call_helpers(seed: int) -> None:
+    df = _frame(seed, 150)
+    f = FeatureFrame.of(df)
+    highs, lows, closes = (
+        df[c].to_numpy(dtype=float) for c in ("high", "low", "close")
+    )
+    for span, lookback in ((9, 20), (3, 1)):
+        ema = compute_ema(df["close"], span)
+        pd.testing.assert_series_equal(f.ema(span), ema)
+        crosses = f.ema_crosses(span, lookback)
+        for i in range(len(df)):
+            assert crosses[i] == ema_cross_count(df["close"], ema, i, lookback)
+    for i in range(len(df)):
+        assert f.atr14_at(i) == _compute_atr14(highs, lows, closes, i)
+        assert f.low_volume(i) is _is_low_volume(df, i)
+        assert f.volume_spike(i) is _is_volume_spike(df, i)
+        assert f.volume_confirm(i) is volume_confirm(df, i)
+
+
+def test_volume_flags_fall_back_without_a_volume_column() -> None:
+    f = FeatureFrame.of(_frame(0, 30).drop(columns="volume"))
+    assert not f.low_volume(10) and not f.volume_spike(10)
+    assert f.volume_confirm(10)
+
+
+def test_regime_matches_classify_series() -> None:
+    df = _frame(4, 400)
+    pd.testing.assert_series_equal(
+        FeatureFrame.of(df).regime("1h"), classify_series(df, "1h")
+    )
+    with pytest.raises(ValueError, match="Unsupported timeframe"):
+        FeatureFrame.of(df).regime("7m")
+
+
+def test_of_shares_one_frame_per_dataframe() -> None:
+    df = _frame(0, 50)
+    f = FeatureFrame.of(df)
+    assert FeatureFrame.of(df) is f
+    assert FeatureFrame.of(df.copy()) is not f
+    assert f.ema(9) is FeatureFrame.of(df).ema(9)
@@ -0,0 +1,32 @@
+"""Tests for analytics._identity_cache — one derived value per live object."""
+
+import gc
+
+from analytics._identity_cache import IdentityCache
+
+
+class _Bag(list[float]):
+    """A weak-referenceable sized object."""
+
+
+def test_values_follow_object_identity_and_length() -> None:
+    cache: IdentityCache[_Bag, float] = IdentityCache()
+    calls: list[int] = []
+
+    def build(bag: _Bag) -> float:
+        calls.append(1)
+        return sum(bag)
+
+    bag = _Bag([1.0, 2.0])
+    assert cache.get(bag, build) == 3.0
+    assert cache.get(bag, build) == 3.0
+    assert cache.get(_Bag(bag), build) == 3.0  # equal but distinct → built
+    assert len(calls) == 2
+
+    bag.append(4.0)  # grown in place → rebuilt
+    assert cache.get(bag, build) == 7.0
+    assert len(calls) == 3
+
+    del bag
+    gc.collect()
+    assert cache._entries == {}
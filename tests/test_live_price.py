@@ -1,10 +1,16 @@
 """Tests for monitor/live_price.py."""
 
 import contextlib
+import io
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+from rich.console import Console
+from rich.table import Table
+from rich.text import Text
+
 from monitor.live_price import (
+    PriceTableModel,
     _build_table,
     _handle_ws_msg,
     _kline_refresh_loop,
@@ -12,6 +18,8 @@ from monitor.live_price import (
     _ws_watchdog,
     run,
 )
+from monitor.price_lib import format_pct_rich, sort_table_raw
+from utils.live_loop import run_live_loop
 from utils.live_store import LiveDataStore
 
 
@@ -157,6 +165,126 @@ class TestBuildTable:
         assert table.row_count == 3
 
 
+def _table_text(table: Table) -> str:
+    console = Console(width=160, record=True, file=io.StringIO())
+    console.print(table)
+    return console.export_text()
+
+
+def _reference_rows(
+    symbols: list[str], store: LiveDataStore, sort_col: str, sort_order: bool
+) -> list[list[Any]]:
+    """The pre-model algorithm: build, sort and format every row per frame."""
+    from monitor.live_price import _SORT_COL_MAP, _pct_change
+
+    result = store.snapshot(symbols)
+    raw_rows: list[list[Any]] = []
+    for sym in symbols:
+        snap = result.data[sym]
+        if snap.ticker is None:
+            raw_rows.append([sym, None, None, None, None, None, None])
+            continue
+        k = snap.klines
+        last = snap.ticker.last_price
+        raw_rows.append(
+            [
+                sym,
+                str(round(last, 4)),
+                _pct_change(last, k.open_15m if k else None),
+                _pct_change(last, k.open_1h if k else None),
+                _pct_change(last, k.open_4h if k else None),
+                _pct_change(last, k.asia_open if k else None),
+                snap.ticker.change_24h,
+            ]
+        )
+    if sort_col in _SORT_COL_MAP:
+        raw_rows = sort_table_raw(raw_rows, _SORT_COL_MAP[sort_col], sort_order)
+    out: list[list[Any]] = []
+    for row in raw_rows:
+        if row[1] is None:
+            out.append([row[0], "...", "", "", "", "", ""])
+        else:
+            out.append(
+                [row[0], row[1]]
+                + [
+                    format_pct_rich(v) if v is not None else Text("N/A")
+                    for v in row[2:]
+                ]
+            )
+    return out
+
+
+class TestPriceTableModel:
+    SYMBOLS = ["BTCUSDT", "ETHUSDT", "SOLUSDT", "XRPUSDT", "DOGEUSDT"]
+
+    def _store(self) -> LiveDataStore:
+        store = LiveDataStore()
+        for i, sym in enumerate(self.SYMBOLS[:-1]):
+            store.update_ticker(sym, last=100.0 + i, open_24h=100.0 - i)
+            if i % 2 == 0:
+                store.update_klines(sym, 99.0, 98.0 + i, 97.0, None)
+        return store
+
+    def test_matches_from_scratch_rendering_across_frames(self) -> None:
+        store = self._store()
+        for sort_col, order in [("change_24h", True), ("change_1h", False), ("", True)]:
+            model = PriceTableModel(self.SYMBOLS, sort_col, order)
+            for frame in range(4):
+                if frame:
+                    store.update_ticker("ETHUSDT", last=90.0 + frame * 7, open_24h=95.0)
+                    store.update_ticker("DOGEUSDT", last=0.1 * frame, open_24h=0.1)
+                cached = _build_table(self.SYMBOLS, store, model=model)
+                scratch = Table(title=cached.title, expand=True)
+                for col in cached.columns:
+                    scratch.add_column(str(col.header), justify="right")
+                for row in _reference_rows(self.SYMBOLS, store, sort_col, order):
+                    scratch.add_row(*row)
+                assert _table_text(cached) == _table_text(scratch)
+
+    def test_only_changed_cells_are_reformatted(self) -> None:
+        store = self._store()
+        model = PriceTableModel(self.SYMBOLS, "change_24h", True)
+        _build_table(self.SYMBOLS, store, model=model)
+        first = model.cells_formatted
+        assert first == 4 * 6
+
+        _build_table(self.SYMBOLS, store, model=model)
+        assert model.cells_formatted == first
+
+        # New last price moves price + every pct column that has a base.
+        store.update_ticker("ETHUSDT", last=200.0, open_24h=99.0)
+        _build_table(self.SYMBOLS, store, model=model)
+        assert model.cells_formatted == first + 2
+
+
+class TestRunLiveLoopVersion:
+    def test_repaints_only_when_version_changes(self) -> None:
+        versions = iter([1, 1, 1, 2, 2, 3])
+        renders: list[int] = []
+
+        def _render() -> str:
+            renders.append(1)
+            return "frame"
+
+        def _version() -> int:
+            try:
+                return next(versions)
+            except StopIteration:
+                raise KeyboardInterrupt from None
+
+        mock_live = MagicMock()
+        mock_live.__enter__ = MagicMock(return_value=mock_live)
+        mock_live.__exit__ = MagicMock(return_value=False)
+        with (
+            patch("utils.live_loop.Live", return_value=mock_live),
+            patch("utils.live_loop.Console"),
+            patch("utils.live_loop.time.sleep"),
+        ):
+            run_live_loop(_render, interval=3600.0, version=_version)
+        assert len(renders) == 3
+        assert mock_live.refresh.call_count == 3
+
+
 class TestWsWatchdog:
     def test_no_abort_while_messages_arrive(self) -> None:
         """Watchdog must not abort when last_update advances before timeout."""
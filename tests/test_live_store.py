@@ -88,6 +88,25 @@ class TestSetWsStatus:
         assert store.snapshot(["BTCUSDT"]).ws_connected is False
 
 
+class TestVersion:
+    def test_writes_bump_version(self) -> None:
+        store = LiveDataStore()
+        v0 = store.version
+        store.update_ticker("BTCUSDT", last=100.0, open_24h=90.0)
+        store.update_klines("BTCUSDT", 99.0, 98.0, 97.0, None)
+        assert store.version == v0 + 2
+        assert store.snapshot(["BTCUSDT"]).version == store.version
+
+    def test_unchanged_ws_status_keeps_version(self) -> None:
+        store = LiveDataStore()
+        store.set_ws_status(connected=False)
+        v = store.version
+        store.set_ws_status(connected=False)
+        assert store.version == v
+        store.set_ws_status(connected=True)
+        assert store.version == v + 1
+
+
 class TestThreadSafety:
     def test_concurrent_writes_do_not_corrupt(self) -> None:
         store = LiveDataStore()
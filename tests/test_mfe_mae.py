@@ -9,6 +9,7 @@ aggregation (reach fractions + min_n gate).
 
 import duckdb
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 from analytics.exits import aggregate_cohorts, compute_excursions
@@ -323,6 +324,23 @@ class TestAggregateCohorts:
         assert row["reach_10"] == pytest.approx(0.25)
         assert row["tp_r_p50"] == pytest.approx(2.0)
 
+    def test_nan_excursions_are_skipped(self) -> None:
+        exc = self._exc_df()
+        exc.loc[exc["signal_id"] == "e4", ["mfe_r", "mae_r"]] = float("nan")
+        for col in ("mfe_r", "mae_r"):  # Arrow-backed: NaN reaches DuckDB as NaN
+            exc[col] = pd.Series(
+                pa.array(exc[col].to_numpy(), from_pandas=False),
+                dtype=pd.ArrowDtype(pa.float64()),
+            )
+        row = aggregate_cohorts(exc, min_n=2).iloc[0]
+        assert row["n"] == 4
+        assert row["mfe_mean"] == pytest.approx((0.2 + 0.6 + 1.5) / 3)
+        assert row["mfe_p50"] == pytest.approx(0.6)
+        assert row["mae_mean"] == pytest.approx((0.3 + 0.5 + 0.4) / 3)
+        assert row["mae_p50"] == pytest.approx(0.4)
+        assert row["reach_05"] == pytest.approx(2 / 3)
+        assert row["reach_10"] == pytest.approx(1 / 3)
+
     def test_overall_rollup_groups_by_outcome_only(self) -> None:
         agg = aggregate_cohorts(self._exc_df(), by=(), min_n=1)
         assert set(agg["outcome"]) == {"expired", "loss"}
@@ -330,3 +348,7 @@ class TestAggregateCohorts:
 
     def test_empty_input_returns_empty(self) -> None:
         assert aggregate_cohorts(pd.DataFrame(), min_n=1).empty
+
+    def test_unknown_cohort_column_raises(self) -> None:
+        with pytest.raises(ValueError, match="unknown cohort"):
+            aggregate_cohorts(self._exc_df(), by=("tf; DROP",), min_n=1)
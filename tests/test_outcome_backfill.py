@@ -2,8 +2,8 @@
 
 Covers the four resolution branches (win / loss / expired / still-open),
 same-bar TP+SL tie-break, short direction, missing OHLCV, multi-row batching,
-and the eligibility gate (only rows with non-NULL tp_price / sl_price /
-entry_price / rr_ratio are inspected).
+the eligibility gate (only rows with non-NULL tp_price / sl_price /
+entry_price / rr_ratio are inspected) and the incremental resume cursor.
 """
 
 import duckdb
@@ -554,3 +554,132 @@ class TestCostParity:
         _, outcome_r, _ = _fetch_one(conn, "sig1")
         # drag 0.028 + funding 0.0002 × 100 / 5 = 0.004 → 2.0 − 0.032
         assert outcome_r == pytest.approx(2.0 - 0.032)
+
+
+def _cursor(conn: duckdb.DuckDBPyConnection, signal_id: str) -> tuple:
+    row = conn.execute(
+        "SELECT scanned_through_ms, scanned_bars, entry_bar_ms "
+        "FROM signal_alert_outcomes WHERE signal_id = ?",
+        [signal_id],
+    ).fetchone()
+    assert row is not None
+    return row
+
+
+class TestIncrementalCursor:
+    def test_cursor_advances_over_closed_bars_only(self) -> None:
+        conn = duckdb.connect(":memory:")
+        init_schema(conn)
+        _insert_signal(conn, candle_ts_ms=0, entry=100.0, sl=95.0, tp=110.0)
+        _insert_ohlcv(
+            conn,
+            "BTCUSDT",
+            "1h",
+            [
+                {"open_time": _HOUR, "high": 102.0, "low": 99.0, "close": 101.0},
+                {"open_time": 2 * _HOUR, "high": 103.0, "low": 98.0, "close": 102.0},
+            ],
+        )
+
+        # Bar 2 is still forming at 2.5h: walked, but not past the cursor.
+        counts = backfill_outcomes(conn, now_ms=2 * _HOUR + _HOUR // 2)
+        assert counts["open"] == 1
+        assert _cursor(conn, "sig1") == (_HOUR, 1, _HOUR)
+
+        counts = backfill_outcomes(conn, now_ms=3 * _HOUR)
+        assert counts["open"] == 1
+        assert _cursor(conn, "sig1") == (2 * _HOUR, 2, _HOUR)
+
+    def test_no_new_bars_keeps_walked_rows_open_and_others_no_ohlcv(self) -> None:
+        conn = duckdb.connect(":memory:")
+        init_schema(conn)
+        _insert_signal(conn, signal_id="walked", candle_ts_ms=0)
+        _insert_ohlcv(
+            conn,
+            "BTCUSDT",
+            "1h",
+            [
+                {"open_time": _HOUR, "high": 102.0, "low": 99.0, "close": 101.0},
+                {"open_time": 2 * _HOUR, "high": 103.0, "low": 98.0, "close": 102.0},
+            ],
+        )
+        backfill_outcomes(conn, now_ms=3 * _HOUR)
+        assert _cursor(conn, "walked") == (2 * _HOUR, 2, _HOUR)
+
+        # No bar after either row's resume point: the walked row stays open,
+        # the never-walked one has no OHLCV at all.
+        _insert_signal(conn, signal_id="fresh", candle_ts_ms=4 * _HOUR)
+        counts = backfill_outcomes(conn, now_ms=5 * _HOUR)
+        assert counts["open"] == 1
+        assert counts["no_ohlcv"] == 1
+
+    def test_resumed_walk_matches_full_walk(self) -> None:
+        bars = [
+            {"open_time": i * _HOUR, "high": 101.0, "low": 99.0, "close": 100.0}
+            for i in range(1, 6)
+        ] + [{"open_time": 6 * _HOUR, "high": 111.0, "low": 99.0, "close": 110.0}]
+        funding = [(3 * _HOUR, 0.0001), (6 * _HOUR, 0.0003)]
+
+        full = duckdb.connect(":memory:")
+        init_schema(full)
+        _insert_signal(full, candle_ts_ms=0)
+        _insert_ohlcv(full, "BTCUSDT", "1h", bars)
+        _insert_funding(full, funding)
+        backfill_outcomes(full, now_ms=7 * _HOUR, fee_pct=0.0005)
+
+        stepped = duckdb.connect(":memory:")
+        init_schema(stepped)
+        _insert_signal(stepped, candle_ts_ms=0)
+        _insert_funding(stepped, funding)
+        for bar in bars:
+            _insert_ohlcv(stepped, "BTCUSDT", "1h", [bar])
+            backfill_outcomes(
+                stepped, now_ms=int(bar["open_time"]) + _HOUR, fee_pct=0.0005
+            )
+
+        assert _fetch_one(stepped, "sig1") == _fetch_one(full, "sig1")
+        assert _fetch_one(full, "sig1")[0] == "win"
+
+    def test_reads_new_bars_from_the_candle_cache(self) -> None:
+        conn = duckdb.connect(":memory:")
+        init_schema(conn)
+        _insert_signal(conn, candle_ts_ms=0, entry=100.0, sl=95.0, tp=110.0)
+        # The DB has nothing after the signal; the daemon cache does.
+        cache = {
+            ("BTCUSDT", "1h"): pd.DataFrame(
+                {
+                    "open_time": [0, _HOUR],
+                    "open": [100.0, 100.0],
+                    "high": [100.0, 111.0],
+                    "low": [100.0, 99.0],
+                    "close": [100.0, 110.0],
+                }
+            )
+        }
+
+        counts = backfill_outcomes(conn, now_ms=2 * _HOUR, ohlcv_cache=cache)
+        assert counts["win"] == 1
+        assert _fetch_one(conn, "sig1")[2] == _HOUR
+
+    def test_lowered_hold_restarts_the_walk(self) -> None:
+        conn = duckdb.connect(":memory:")
+        init_schema(conn)
+        _insert_signal(conn, candle_ts_ms=0, entry=100.0, sl=95.0, tp=110.0)
+        _insert_ohlcv(
+            conn,
+            "BTCUSDT",
+            "1h",
+            [
+                {"open_time": i * _HOUR, "high": 101.0, "low": 99.0, "close": 100.0}
+                for i in range(1, 4)
+            ]
+            + [{"open_time": 4 * _HOUR, "high": 101.0, "low": 99.0, "close": 101.0}],
+        )
+        backfill_outcomes(conn, now_ms=5 * _HOUR, max_hold_bars_by_tf={"1h": 10})
+        assert _cursor(conn, "sig1")[1] == 4
+
+        counts = backfill_outcomes(
+            conn, now_ms=5 * _HOUR, max_hold_bars_by_tf={"1h": 2}
+        )
+        assert counts["expired"] == 1
+        assert _fetch_one(conn, "sig1") == ("expired", 0.0, 2 * _HOUR)
@@ -1,5 +1,9 @@
 """Tests for analytics/research_guards/pbo.py."""
 
+import math
+from collections.abc import Callable
+from itertools import combinations
+
 import numpy as np
 import numpy.typing as npt
 import pytest
@@ -54,3 +58,71 @@ class TestCscvPbo:
         res = cscv_pbo(mat, n_splits=8)
         assert res.n_combinations == 70  # C(8, 4)
         assert len(res.logits) == 70
+
+
+def _reference_cscv(
+    m: npt.NDArray[np.float64], n_splits: int, metric: Callable[..., float]
+) -> tuple[list[float], list[float], list[float]]:
+    """The per-partition loop cscv_pbo replaced: (logits, IS*, OOS*)."""
+    n_trials = m.shape[1]
+    bs = m.shape[0] // n_splits
+    blocks = [m[i * bs : (i + 1) * bs] for i in range(n_splits)]
+    logits: list[float] = []
+    is_perf: list[float] = []
+    oos_perf: list[float] = []
+    for train_ids in combinations(range(n_splits), n_splits // 2):
+        test_ids = [i for i in range(n_splits) if i not in train_ids]
+        train = np.vstack([blocks[i] for i in train_ids])
+        test = np.vstack([blocks[i] for i in test_ids])
+        is_m = np.array([metric(train[:, c]) for c in range(n_trials)])
+        oos_m = np.array([metric(test[:, c]) for c in range(n_trials)])
+        star = int(np.argmax(is_m))
+        v = oos_m[star]
+        rank = np.sum(oos_m < v) + (np.sum(oos_m == v) + 1) / 2.0
+        omega = min(
+            max(rank / (n_trials + 1), 1 / (n_trials + 1)), n_trials / (n_trials + 1)
+        )
+        logits.append(math.log(omega / (1.0 - omega)))
+        is_perf.append(float(is_m[star]))
+        oos_perf.append(float(oos_m[star]))
+    return logits, is_perf, oos_perf
+
+
+def _ddof1_sharpe(col: npt.NDArray[np.float64]) -> float:
+    sd = float(np.std(col, ddof=1))
+    return 0.0 if sd == 0.0 else float(np.mean(col)) / sd
+
+
+class TestCscvVectorised:
+    def test_moment_sharpe_matches_partition_loop(self) -> None:
+        rng = np.random.default_rng(5)
+        mat = rng.normal(0.001, 0.02, size=(203, 12))
+        mat[:, 3] = 0.25  # constant column -> Sharpe 0 everywhere
+        mat[:100, 7] = 0.0  # constant in some partitions only
+        res = cscv_pbo(mat, n_splits=10)
+        logits, _, _ = _reference_cscv(mat, 10, _ddof1_sharpe)
+        np.testing.assert_allclose(res.logits, logits)
+        assert res.pbo == sum(1 for lam in logits if lam <= 0) / len(logits)
+
+    def test_batch_metric_matches_column_metric(self) -> None:
+        rng = np.random.default_rng(6)
+        mat = rng.normal(size=(120, 5))
+        by_column = cscv_pbo(mat, n_splits=8, metric=_mean_metric)
+        batched = cscv_pbo(
+            mat, n_splits=8, batch_metric=lambda x: np.asarray(x.mean(axis=1))
+        )
+        logits, is_perf, oos_perf = _reference_cscv(mat, 8, _mean_metric)
+        assert by_column.logits == pytest.approx(logits)
+        assert batched.logits == pytest.approx(logits)
+        assert batched.degradation_slope == pytest.approx(
+            float(np.polyfit(is_perf, oos_perf, 1)[0])
+        )
+
+    def test_chunked_gather_spans_chunks(self) -> None:
+        # C(12, 6) = 924 partitions > one 512-partition chunk.
+        rng = np.random.default_rng(7)
+        mat = rng.normal(size=(96, 4))
+        res = cscv_pbo(mat, n_splits=12, metric=_mean_metric)
+        logits, _, _ = _reference_cscv(mat, 12, _mean_metric)
+        assert res.n_combinations == 924
+        assert res.logits == pytest.approx(logits)
@@ -303,3 +303,57 @@ def test_regime_high_vol_halves_size() -> None:
     # g_regime 0.5 -> r_eff = 0.0025 * 0.5 = 0.00125, rc_fixed = 12.5
     assert res.sized[0].g_regime == pytest.approx(0.5)
     assert res.sized[0].rc_fixed == pytest.approx(12.5)
+
+
+def test_overlapping_positions_mark_per_symbol_and_track_open_risk() -> None:
+    cfg = SizingConfig(clusters=())
+    grid = _grid(6)
+    close = {
+        "AAAUSDT": np.array([100, 102, 104, np.nan, 110, 110], dtype=np.float64),
+        "BBBUSDT": np.array([50, 50, 45, 40, 40, 40], dtype=np.float64),
+    }
+    trades = [
+        LedgerTrade(
+            "a", "AAAUSDT", "1h", "bos", "long", 1, 4 * _DAY, 100.0, 90.0, "win", 1.0
+        ),
+        LedgerTrade(
+            "b", "BBBUSDT", "1h", "bos", "short", _DAY, 3 * _DAY, 50.0, 55.0, "win", 2.0
+        ),
+        LedgerTrade(
+            "c",
+            "AAAUSDT",
+            "1h",
+            "fvg",
+            "long",
+            _DAY + 5,
+            _DAY + 9,
+            102.0,
+            101.0,
+            "loss",
+            -1.0,
+        ),
+    ]
+    # A fourth trade on a symbol with no close series books only its realized R.
+    trades.append(
+        LedgerTrade(
+            "d", "ZZZUSDT", "1h", "fvg", "long", _DAY, 2 * _DAY, 10.0, 9.0, "win", 3.0
+        )
+    )
+    res = PaperBook(cfg, grid, close, regime_by_signal=None).run(trades)
+    rc = 25.0
+    a = rc * (close["AAAUSDT"] - 100.0) / 10.0
+    b = -rc * (close["BBBUSDT"] - 50.0) / 5.0
+    expected = np.array(
+        [
+            a[0],
+            a[1] + b[1] - rc,
+            a[2] + b[2] - rc + 3 * rc,
+            0.0 + 2 * rc - rc + 3 * rc,  # day 3: AAA close missing -> marks at 0
+            rc + 2 * rc - rc + 3 * rc,
+            rc + 2 * rc - rc + 3 * rc,
+        ]
+    )
+    np.testing.assert_allclose(res.pnl_fixed, expected, rtol=0.0, atol=1e-9)
+    np.testing.assert_allclose(
+        res.open_risk, [0.0025, 0.01, 0.005, 0.0025, 0.0, 0.0], atol=1e-15
+    )
@@ -12,6 +12,7 @@ from portfolio.metrics import (
     annual_vol,
     attribution,
     calmar,
+    curve_metrics,
     max_drawdown,
     sharpe,
     sortino,
@@ -113,3 +114,16 @@ def test_attribution_groups_by_symbol() -> None:
     assert list(agg["symbol"]) == ["BTCUSDT", "ETHUSDT"]
     btc = agg[agg["symbol"] == "BTCUSDT"].iloc[0]
     assert btc["n"] == 2 and btc["total_r"] == pytest.approx(3.0)
+
+
+def test_curve_metrics_bundle_matches_single_metrics() -> None:
+    rng = np.random.default_rng(4)
+    curve = _curve(list(100.0 * np.cumprod(1.0 + rng.normal(0.0005, 0.02, 200))))
+    cm = curve_metrics(curve, 252.0)
+    assert cm.sharpe == sharpe(curve, 252.0)
+    assert cm.sortino == sortino(curve, 252.0)
+    assert cm.max_drawdown == max_drawdown(curve)
+    assert cm.calmar == calmar(curve, 252.0)
+    assert cm.annual_return == annual_return(curve, 252.0)
+    assert cm.annual_vol == annual_vol(curve, 252.0)
+    assert curve_metrics(_curve([100.0] * 30)).sharpe == 0.0
@@ -0,0 +1,269 @@
+"""Tests for the user-data-stream position state engine (monitor/position_state.py)."""
+
+import time
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from monitor.position_lib import fetch_open_positions
+from monitor.position_state import EventCallback, PositionFeed, PositionStateEngine
+from tests.conftest import SAMPLE_COIN_ORDER, SAMPLE_COINS_CONFIG, strip_ansi
+
+
+class RecordedEventSource:
+    """Local stub for the Binance sockets: replays recorded messages on demand."""
+
+    def __init__(self) -> None:
+        self.callback: EventCallback | None = None
+        self.stopped = False
+
+    def start(self, callback: EventCallback) -> None:
+        self.callback = callback
+
+    def stop(self) -> None:
+        self.stopped = True
+
+    def emit(self, *messages: Any) -> None:
+        assert self.callback is not None
+        for msg in messages:
+            self.callback(msg)
+
+
+def _client(
+    positions: list[dict[str, Any]],
+    balance: list[dict[str, Any]],
+    orders: list[dict[str, Any]] | None = None,
+) -> MagicMock:
+    client = MagicMock()
+    client.futures_position_information.return_value = positions
+    client.futures_account_balance.return_value = balance
+    client.futures_get_open_orders.return_value = orders or []
+    return client
+
+
+def _mark(symbol: str, price: float) -> dict[str, Any]:
+    return {"e": "markPriceUpdate", "s": symbol, "p": str(price)}
+
+
+def _account_update(
+    symbol: str, amt: str, entry: str, side: str = "BOTH", wallet: str | None = None
+) -> dict[str, Any]:
+    balances = [{"a": "USDT", "wb": wallet, "cw": wallet}] if wallet else []
+    return {
+        "e": "ACCOUNT_UPDATE",
+        "a": {
+            "m": "ORDER",
+            "B": balances,
+            "P": [
+                {
+                    "s": symbol,
+                    "pa": amt,
+                    "ep": entry,
+                    "up": "0",
+                    "mt": "cross",
+                    "iw": "0",
+                    "ps": side,
+                }
+            ],
+        },
+    }
+
+
+def _order_update(
+    order_id: int, symbol: str, status: str, side: str, stop: str
+) -> dict[str, Any]:
+    return {
+        "e": "ORDER_TRADE_UPDATE",
+        "o": {
+            "s": symbol,
+            "i": order_id,
+            "o": "STOP_MARKET",
+            "ot": "STOP_MARKET",
+            "X": status,
+            "ps": side,
+            "sp": stop,
+        },
+    }
+
+
+def _wait_for(cond: Callable[[], bool], timeout_s: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout_s
+    while not cond():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def _rows_by_symbol(snapshot: Any) -> dict[str, list[Any]]:
+    return {r[0]: r for r in snapshot[0] if r[1] != "-"}
+
+
+def test_reconciled_snapshot_matches_rest_fetch(
+    mock_positions_data: list[dict[str, Any]],
+    mock_futures_balance: list[dict[str, Any]],
+) -> None:
+    orders = [
+        {
+            "orderId": i,
+            "symbol": sym,
+            "type": "STOP_MARKET",
+            "positionSide": "SHORT",
+            "stopPrice": stop,
+        }
+        for i, (sym, stop) in enumerate([("BTCUSDT", "111000"), ("ETHUSDT", "2700")])
+    ]
+    client = _client(mock_positions_data, mock_futures_balance, orders)
+    engine = PositionStateEngine()
+    engine.reconcile(client)
+
+    expected = fetch_open_positions(client, SAMPLE_COINS_CONFIG, SAMPLE_COIN_ORDER)
+    assert engine.snapshot(SAMPLE_COINS_CONFIG, SAMPLE_COIN_ORDER) == expected
+
+
+def test_mark_tick_reprices_pnl_and_notional(
+    mock_positions_data: list[dict[str, Any]],
+    mock_futures_balance: list[dict[str, Any]],
+) -> None:
+    engine = PositionStateEngine()
+    engine.reconcile(_client(mock_positions_data, mock_futures_balance))
+    engine.apply_event([_mark("BTCUSDT", 108000.0), _mark("XRPUSDT", 0.5)])
+
+    _, _, _, unrealized, _ = engine.snapshot(SAMPLE_COINS_CONFIG, SAMPLE_COIN_ORDER)
+    btc_pnl = -0.135 * (108000.0 - 110032.0)
+    assert unrealized == pytest.approx(btc_pnl + 306.29)
+
+    btc = _rows_by_symbol(engine.snapshot(SAMPLE_COINS_CONFIG, SAMPLE_COIN_ORDER))[
+        "BTCUSDT"
+    ]
+    assert btc[4] == 108000.0
+    assert btc[6] == pytest.approx(0.135 * 108000.0, abs=0.01)
+
+
+def test_account_update_opens_and_closes_positions(
+    mock_positions_data: list[dict[str, Any]],
+    mock_futures_balance: list[dict[str, Any]],
+) -> None:
+    engine = PositionStateEngine()
+    engine.reconcile(_client(mock_positions_data, mock_futures_balance))
+
+    assert engine.apply_event(
+        _account_update("ETHUSDT", "0", "0", side="SHORT", wallet="1429.44")
+    )
+    assert engine.apply_event(_account_update("SOLUSDT", "10", "140.0"))
+    engine.apply_event(_mark("SOLUSDT", 143.0))
+
+    rows, _, wallet, unrealized, _ = engine.snapshot(
+        SAMPLE_COINS_CONFIG, SAMPLE_COIN_ORDER
+    )
+    open_rows = _rows_by_symbol((rows,))
+    assert set(open_rows) == {"BTCUSDT", "SOLUSDT"}
+    assert wallet == 1429.44
+    assert unrealized == pytest.approx(174.73 + 30.0)
+    assert strip_ansi(open_rows["SOLUSDT"][1]) == "LONG"
+
+
+def test_order_updates_track_stop_loss(
+    mock_positions_data: list[dict[str, Any]],
+    mock_futures_balance: list[dict[str, Any]],
+) -> None:
+    engine = PositionStateEngine()
+    engine.reconcile(_client(mock_positions_data, mock_futures_balance))
+
+    engine.apply_event(_order_update(7, "BTCUSDT", "NEW", "SHORT", "111000"))
+    btc = _rows_by_symbol(engine.snapshot(SAMPLE_COINS_CONFIG, SAMPLE_COIN_ORDER))[
+        "BTCUSDT"
+    ]
+    assert btc[10] == "111000.00000"
+    assert btc[14] > 0
+
+    engine.apply_event(_order_update(7, "BTCUSDT", "CANCELED", "SHORT", "111000"))
+    btc = _rows_by_symbol(engine.snapshot(SAMPLE_COINS_CONFIG, SAMPLE_COIN_ORDER))[
+        "BTCUSDT"
+    ]
+    assert btc[10] == "-"
+
+
+def test_events_racing_a_reconcile_are_replayed(
+    mock_positions_data: list[dict[str, Any]],
+    mock_futures_balance: list[dict[str, Any]],
+) -> None:
+    engine = PositionStateEngine()
+    client = _client(mock_positions_data, mock_futures_balance)
+
+    def _positions_then_fill() -> list[dict[str, Any]]:
+        # A fill closes BTC after REST captured it as open.
+        engine.apply_event(_account_update("BTCUSDT", "0", "0", side="SHORT"))
+        return mock_positions_data
+
+    client.futures_position_information.side_effect = _positions_then_fill
+    engine.reconcile(client)
+    assert set(
+        _rows_by_symbol(engine.snapshot(SAMPLE_COINS_CONFIG, SAMPLE_COIN_ORDER))
+    ) == {"ETHUSDT"}
+
+
+def test_feed_goes_stale_on_error_and_reconciles_after_reconnect(
+    mock_positions_data: list[dict[str, Any]],
+    mock_futures_balance: list[dict[str, Any]],
+) -> None:
+    source = RecordedEventSource()
+    client = _client(mock_positions_data, mock_futures_balance)
+    feed = PositionFeed(client, source, reconcile_interval_s=60, debounce_s=0.05)
+    feed.start()
+    try:
+        assert feed.live
+        assert client.futures_position_information.call_count == 1
+
+        source.emit({"e": "error", "m": "connection lost"})
+        assert not feed.live
+        _wait_for(lambda: client.futures_position_information.call_count >= 2)
+        _wait_for(lambda: feed.live)
+
+        # First message after the error means the socket reconnected: resync.
+        source.emit(_mark("BTCUSDT", 109000.0))
+        _wait_for(lambda: client.futures_position_information.call_count >= 3)
+    finally:
+        feed.stop()
+    assert source.stopped
+
+
+def test_feed_start_failure_stops_source() -> None:
+    source = RecordedEventSource()
+    client = MagicMock()
+    client.futures_position_information.side_effect = RuntimeError("no keys")
+    feed = PositionFeed(client, source)
+    with pytest.raises(RuntimeError):
+        feed.start()
+    assert source.stopped
+    assert not feed.live
+
+
+def test_positions_endpoint_reads_live_feed(
+    web_client: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+    mock_positions_data: list[dict[str, Any]],
+    mock_futures_balance: list[dict[str, Any]],
+) -> None:
+    from web.api.main import app
+
+    feed = PositionFeed(
+        _client(mock_positions_data, mock_futures_balance), RecordedEventSource()
+    )
+    feed.engine.reconcile(feed.client)
+    monkeypatch.setattr(app.state, "position_feed", feed)
+    monkeypatch.setattr(
+        "web.api.routers.positions.load_coins_config", lambda: SAMPLE_COINS_CONFIG
+    )
+
+    def _no_rest(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("REST fetch used while the feed is live")
+
+    monkeypatch.setattr("web.api.routers.positions.fetch_open_positions", _no_rest)
+
+    resp = web_client.get("/api/positions")
+    assert resp.status_code == 200
+    body = resp.json()
+    assert {p["symbol"] for p in body["positions"]} == {"BTCUSDT", "ETHUSDT"}
+    assert body["wallet_balance"] == 1123.15
@@ -12,6 +12,7 @@ from analytics.data_store import (
     init_schema,
 )
 from analytics.recalibrate_lib import (
+    clear_recalibration_cache,
     compute_directional_ratings,
     compute_dsr_ratings,
     compute_recalibrated_ratings,
@@ -992,3 +993,19 @@ class TestComputeDsrRatings:
         conn.close()
         assert "bos" in result
         assert "fvg" not in result
+
+    def test_file_db_results_are_cached_per_run_watermark(self, tmp_path: Path) -> None:
+        clear_recalibration_cache()
+        conn = duckdb.connect(str(tmp_path / "bt.duckdb"))
+        init_schema(conn)
+        _seed_cell(conn, "r1", "fvg", "1h", _POS_STREAM)
+        first = compute_dsr_ratings(conn)
+        first["fvg"]["1h"]["combined"] = -1.0  # callers get a copy, not the cache
+        cached = compute_dsr_ratings(conn)["fvg"]["1h"]["combined"]
+        assert cached is not None and cached > 0.9
+
+        # A new run moves the watermark, so the next pass reads it.
+        _seed_cell(conn, "r2", "bos", "4h", _POS_STREAM, run_at_ms=2000)
+        assert set(compute_dsr_ratings(conn)) == {"bos", "fvg"}
+        conn.close()
+        clear_recalibration_cache()
@@ -0,0 +1,16 @@
+"""Tests for analytics._rmq — sparse-table range extremes vs slice reductions."""
+
+import numpy as np
+
+from analytics._rmq import range_extreme, sparse_table
+
+
+def test_sparse_table_range_extremes_match_slices() -> None:
+    rng = np.random.default_rng(3)
+    values = rng.normal(size=37)
+    lo = rng.integers(0, 37, 200)
+    hi = lo + 1 + rng.integers(0, 37 - lo)
+    for op, ref in ((np.maximum, np.max), (np.minimum, np.min)):
+        got = range_extreme(sparse_table(values, op), op, lo, hi)
+        expected = [ref(values[a:b]) for a, b in zip(lo, hi, strict=True)]
+        np.testing.assert_array_equal(got, expected)
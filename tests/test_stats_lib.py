@@ -13,6 +13,7 @@ from analytics.stats_lib import (
     WeeklyFlipRiskConditioned,
     WeeklyP2Timing,
     WeeklyWickPercentile,
+    clear_live_reference_cache,
     compute_adr,
     compute_all,
     compute_daily_distance,
@@ -25,6 +26,9 @@ from analytics.stats_lib import (
     compute_weekly_p1p2,
     compute_weekly_p2_timing,
     compute_weekly_wick_percentile,
+    live_daily_distance,
+    live_weekly_current_state,
+    live_weekly_wick_percentile,
 )
 
 _SYMBOL = "TESTUSDT"
@@ -446,3 +450,56 @@ def test_compute_weekly_wick_percentile_zero_adr(
     assert result.current_wick_of_adr is None
     assert result.p1_direction is None
     assert result.sample_count == 0
+
+
+# ── Live fields: per-day cached references ────────────────────────────────────
+
+
+def _insert_current_week(conn: duckdb.DuckDBPyConnection) -> None:
+    week_start_ms = _current_week_ms()
+    _insert_candle(conn, week_start_ms, open_=40000.0, low=39000.0, close=40000.0)
+    _insert_candle(conn, week_start_ms + 3600_000, high=41500.0, close=41000.0)
+
+
+def test_live_fields_match_uncached(conn: duckdb.DuckDBPyConnection) -> None:
+    """Cached-reference live fields are identical to the full computations."""
+    clear_live_reference_cache()
+    _insert_current_week(conn)
+    adr = compute_adr(conn, _SYMBOL).adr_14
+
+    assert live_weekly_current_state(
+        conn, _SYMBOL, adr, 30, "d1"
+    ) == compute_weekly_current_state(conn, _SYMBOL, adr, 30)
+    assert live_daily_distance(conn, _SYMBOL, adr, 30, "d1") == compute_daily_distance(
+        conn, _SYMBOL, adr, 30
+    )
+    assert live_weekly_wick_percentile(
+        conn, _SYMBOL, adr, 30, "d1"
+    ) == compute_weekly_wick_percentile(conn, _SYMBOL, adr, 30)
+
+
+def test_live_fields_reuse_reference_within_day(
+    conn: duckdb.DuckDBPyConnection,
+) -> None:
+    """Second call on the same date only re-reads the current week's candles."""
+    clear_live_reference_cache()
+    _insert_current_week(conn)
+    adr = compute_adr(conn, _SYMBOL).adr_14
+    first = live_weekly_wick_percentile(conn, _SYMBOL, adr, 30, "d1")
+
+    # Wipe history: a cached reference still ranks against the old distribution.
+    conn.execute("DELETE FROM ohlcv WHERE open_time < ?", [_current_week_ms()])
+    again = live_weekly_wick_percentile(conn, _SYMBOL, adr, 30, "d1")
+    assert again.sample_count == first.sample_count
+
+    # A new date rebuilds the reference from what is in the DB now.
+    rebuilt = live_weekly_wick_percentile(conn, _SYMBOL, adr, 30, "d2")
+    assert rebuilt.sample_count < first.sample_count
+
+
+def _current_week_ms() -> int:
+    now_myt = datetime.now(tz=UTC) + timedelta(hours=MYT_OFFSET_HOURS)
+    week_start_myt = (now_myt - timedelta(days=now_myt.weekday())).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    return int((week_start_myt - timedelta(hours=MYT_OFFSET_HOURS)).timestamp() * 1000)
@@ -3,6 +3,7 @@
 import datetime
 from collections.abc import Callable
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -22,6 +23,8 @@ from analytics.strategies import (
     detect_wick_fills,
     seasonality_stats,
 )
+from analytics.strategies.cvd_divergence import _last_two_runs
+from analytics.strategies.smt_divergence import _new_extremes
 from tests.conftest import _candle, _make_ohlcv
 
 # ---------------------------------------------------------------------------
@@ -891,6 +894,14 @@ class TestDetectSmtDivergence:
         short_signals = result[result["direction"] == "short"]
         assert len(short_signals) >= 1
 
+    def test_new_extremes_needs_a_strictly_higher_latest_swing(self) -> None:
+        swings = [1, 3, 5, 7]
+        values = np.array([0, 5.0, 0, 4.0, 0, 5.0, 0, 6.0])
+        # [0, 1]: one swing; [0, 5]: ties the first; [2, 5]: 5 > 4 with swing 1
+        # gone; [0, 7]: 6 beats all.
+        out = _new_extremes(swings, values, [0, 0, 2, 2], [1, 5, 5, 7])
+        assert out == [False, False, True, True]
+
 
 # ---------------------------------------------------------------------------
 # Bug fix tests (TDD — written before fixes)
@@ -2093,6 +2104,17 @@ class TestCvdDivergence:
         result = detect_cvd_divergence(df, lookback=self._LOOKBACK, cvd_lookback=n)
         _assert_signal_columns(result)
 
+    def test_last_two_runs_dedups_plateaus_within_each_window(self) -> None:
+        # Runs of swing candles at 2-4 and 7-8.
+        is_swing = np.zeros(10, dtype=bool)
+        is_swing[[2, 3, 4, 7, 8]] = True
+        c_start = np.array([0, 3, 5, 8])
+        c_end = np.array([10, 10, 10, 10])
+        first, second = _last_two_runs(is_swing, c_start, c_end)
+        # A run cut by the window start counts from the window start.
+        assert first.tolist() == [2, 3, -1, -1]
+        assert second.tolist() == [7, 7, 7, 8]
+
 
 # ---------------------------------------------------------------------------
 # Trend Day
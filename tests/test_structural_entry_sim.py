@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 import analytics.structural_entry_sim as ses
@@ -14,6 +15,7 @@ from analytics.structural_entry_sim import (
     build_touch_signals,
     evaluate_build,
     resolve_touch_trades,
+    simulate_grid,
     touch_sl_price,
 )
 from analytics.structural_touch import Touch, Zone
@@ -274,6 +276,80 @@ class TestSimulateCell:
         assert set(out["sl_model"]) == {"structural"}
 
 
+def _random_bars(n: int, seed: int) -> pd.DataFrame:
+    """Random-walk hourly bars with a few NaN highs / lows and a repeated bar."""
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.02, n)))
+    open_ = np.r_[close[0], close[:-1]] * (1.0 + rng.normal(0.0, 0.003, n))
+    bars = pd.DataFrame(
+        {
+            "open_time": np.arange(n, dtype=np.int64) * 3_600_000,
+            "open": open_,
+            "high": np.maximum(open_, close) * (1.0 + np.abs(rng.normal(0, 0.01, n))),
+            "low": np.minimum(open_, close) * (1.0 - np.abs(rng.normal(0, 0.01, n))),
+            "close": close,
+            "volume": 1000.0,
+        }
+    )
+    holes = rng.choice(np.arange(20, n), 4, replace=False)
+    bars.loc[holes, "high"] = np.nan
+    bars.loc[holes[:2], "low"] = np.nan
+    bars.loc[n // 2, "open_time"] = bars.loc[n // 2 - 1, "open_time"]
+    return bars
+
+
+class TestSimulateGrid:
+    def test_batched_grid_matches_per_cell_engine_resolution(self) -> None:
+        bars = _random_bars(400, seed=7)
+        rng = np.random.default_rng(7)
+        funding = pd.Series(
+            rng.normal(0.0, 1e-4, 60),
+            index=np.arange(60, dtype=np.int64) * 8 * 3_600_000 + 1,
+        )
+        zone_touches = ses.extract_zone_touches(bars, "fvg")
+        assert zone_touches
+        tp_r_grid, sl_models = [1.0, 2.5], ["structural", "atr_floor", "fixed_atr"]
+        costs: dict[str, Any] = {
+            "fee_pct": 0.0005,
+            "slippage_pct": 0.0002,
+            "funding_series": funding,
+        }
+
+        grid = simulate_grid(
+            bars,
+            "fvg",
+            symbol="BTCUSDT",
+            tf="1h",
+            tp_r_grid=tp_r_grid,
+            sl_models=sl_models,
+            zone_touches=zone_touches,
+            **costs,
+        )
+
+        cells = []
+        for tp_r in tp_r_grid:
+            for sl_model in sl_models:
+                signals = pd.concat(
+                    [
+                        build_touch_signals(z, ts, bars, sl_model=sl_model)
+                        for z, ts in zone_touches
+                    ],
+                    ignore_index=True,
+                )
+                trades = resolve_touch_trades(
+                    bars, signals, symbol="BTCUSDT", tf="1h", tp_r=tp_r, **costs
+                )
+                merged = _merge_touches_to_trades(signals, trades)
+                merged["symbol"] = "BTCUSDT"
+                merged["tf"] = "1h"
+                merged["zone_type"] = "fvg"
+                merged["tp_r"] = tp_r
+                merged["sl_model"] = sl_model
+                cells.append(merged[REALIZED_TABLE_COLUMNS])
+        expected = pd.concat(cells, ignore_index=True)
+        pd.testing.assert_frame_equal(grid, expected, check_exact=True)
+
+
 class TestBuildRealizedTable:
     def test_real_fvg_extraction_runs_and_keeps_schema(self) -> None:
         bars_by = {("BTCUSDT", "1d"): _staircase_then_drop()}
@@ -19,6 +19,7 @@ from analytics.structural_touch import (
     evaluate_touch_decay,
     extract_zones,
     index_touches,
+    index_zone_touches,
     touch_excursion,
     touch_held,
 )
@@ -141,37 +142,73 @@ def test_extract_zones_fvg_returns_normalized_zones() -> None:
 
 
 def test_extract_zones_fib_walks_forward_and_dedups(monkeypatch: object) -> None:
-    # Stub the single-zone fib extractor: it "discovers" zone A early, then a
-    # new zone B later. Walk-forward must collect both, once each (dedup).
-    calls = {"n": 0}
-
-    def fake_fib(df: pd.DataFrame, **kw: object) -> list[dict[str, object]]:
-        calls["n"] += 1
-        if len(df) < 30:
-            return [
-                {
-                    "zone_type": "fib_zone",
-                    "direction": "bull",
-                    "zone_low": 100.0,
-                    "zone_high": 105.0,
-                    "start_ms": 10,
-                }
-            ]
-        return [
-            {
-                "zone_type": "fib_zone",
-                "direction": "bear",
-                "zone_low": 200.0,
-                "zone_high": 205.0,
-                "start_ms": 50,
-            }
-        ]
+    # Stub the walk-forward history: zone A is confirmed twice (the second time
+    # with float noise in its bounds), then a new zone B. Both kept, once each.
+    def fake_history(df: pd.DataFrame, **kw: object) -> list[dict[str, object]]:
+        assert kw == {"step": 5}
+        zone_a = {
+            "zone_type": "fib_zone",
+            "direction": "bull",
+            "zone_low": 100.0,
+            "zone_high": 105.0,
+            "start_ms": 10,
+        }
+        zone_b = {
+            "zone_type": "fib_zone",
+            "direction": "bear",
+            "zone_low": 200.0,
+            "zone_high": 205.0,
+            "start_ms": 50,
+        }
+        return [zone_b, zone_a, {**zone_a, "zone_low": 100.0 + 1e-12}]
 
-    monkeypatch.setattr(zones_lib, "extract_fib_golden_zones", fake_fib)  # type: ignore[attr-defined]
+    monkeypatch.setattr(zones_lib, "extract_fib_golden_zone_history", fake_history)  # type: ignore[attr-defined]
     df = _bars([1.0] * 60, [0.5] * 60)
     zones = extract_zones(df, "fib", band_atr_frac=0.25, step=5)
-    keys = sorted((z.start_ms, z.bias) for z in zones)
-    assert keys == [(10, "long"), (50, "short")]
+    assert [(z.start_ms, z.bias) for z in zones] == [(10, "long"), (50, "short")]
+
+
+def test_index_zone_touches_matches_bar_by_bar_scan() -> None:
+    rng = np.random.default_rng(4)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, 400)))
+    close[200:] *= 0.8  # a gap straight through some bands
+    highs = close * (1 + rng.random(400) * 0.01)
+    lows = close * (1 - rng.random(400) * 0.01)
+    highs[[50, 51, 300]] = np.nan
+    bars = _bars(list(highs), list(lows))
+    zones = [
+        Zone("fvg", "long", float(lo), float(lo) + width, int(start))
+        for lo, width, start in zip(
+            rng.uniform(70.0, 120.0, 40),
+            rng.uniform(0.1, 4.0, 40),
+            rng.integers(0, 400 * 3_600_000, 40),
+            strict=True,
+        )
+    ]
+
+    def scan(zone: Zone, gap: int) -> list[int]:
+        out, prev_inside, outside_run = [], False, gap
+        for i, (t, hi, lo) in enumerate(
+            zip(bars["open_time"], bars["high"], bars["low"], strict=True)
+        ):
+            if t <= zone.start_ms:
+                continue
+            inside = lo <= zone.zone_high and hi >= zone.zone_low
+            if inside and not prev_inside and outside_run >= gap:
+                out.append(i)
+            outside_run = 0 if inside else outside_run + 1
+            prev_inside = inside
+        return out
+
+    for gap in (1, 3):
+        per_zone = index_zone_touches(zones, bars, min_gap_bars=gap)
+        assert [[t.bar_idx for t in ts] for ts in per_zone] == [
+            scan(z, gap) for z in zones
+        ]
+        assert all(
+            [t.touch_index for t in ts] == list(range(1, len(ts) + 1))
+            for ts in per_zone
+        )
 
 
 def test_touch_held_true_when_favorable_reaches_target_first() -> None:
@@ -0,0 +1,51 @@
+"""Tests for analytics.store.watermark — WatermarkMemo follows writes to watched tables."""
+
+from pathlib import Path
+
+import duckdb
+
+from analytics.store.schema import init_schema
+from analytics.store.watermark import WatermarkMemo, table_watermark
+
+
+def _file_conn(tmp_path: Path) -> duckdb.DuckDBPyConnection:
+    conn = duckdb.connect(str(tmp_path / "memo.duckdb"))
+    init_schema(conn)
+    return conn
+
+
+def test_in_memory_databases_are_not_memoised() -> None:
+    conn = duckdb.connect(":memory:")
+    init_schema(conn)
+    assert table_watermark(conn, ["backtest_runs"]) is None
+    calls: list[int] = []
+    memo = WatermarkMemo()
+    for _ in range(2):
+        memo.get(conn, ["backtest_runs"], ("k",), lambda: calls.append(1))
+    assert len(calls) == 2
+
+
+def test_only_watched_tables_invalidate(tmp_path: Path) -> None:
+    conn = _file_conn(tmp_path)
+    memo = WatermarkMemo()
+    calls: list[int] = []
+
+    def load() -> list[int]:
+        calls.append(1)
+        return [len(calls)]
+
+    first = memo.get(conn, ["backtest_trades"], ("k",), load)
+    first.append(99)  # callers get a copy, not the memo
+    assert memo.get(conn, ["backtest_trades"], ("k",), load) == [1]
+
+    conn.execute(
+        "INSERT INTO funding_rates VALUES ('BTCUSDT', 1000, 0.0001)"
+    )  # not watched
+    assert memo.get(conn, ["backtest_trades"], ("k",), load) == [1]
+    assert memo.get(conn, ["funding_rates"], ("k",), load) == [2]
+
+    conn.execute("DELETE FROM funding_rates")
+    assert memo.get(conn, ["funding_rates"], ("k",), load) == [3]
+    memo.clear()
+    assert memo.get(conn, ["backtest_trades"], ("k",), load) == [4]
+    conn.close()
@@ -26,6 +26,7 @@ def _no_auth_client() -> Generator[TestClient]:
     with (
         patch("web.api.main.duckdb.connect", return_value=mock_conn),
         patch("web.api.main.create_client", return_value=MagicMock()),
+        patch("web.api.main.create_position_feed", return_value=None),
         patch("web.api.main.init_schema"),
         TestClient(app, raise_server_exceptions=False) as client,
     ):
@@ -0,0 +1,232 @@
+"""Tests for the background job queue and its web endpoints."""
+
+import os
+import threading
+import time
+from concurrent.futures import BrokenExecutor, ThreadPoolExecutor
+from typing import Any
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+from web.api.jobs import (
+    JOB_DONE,
+    JOB_ERROR,
+    Job,
+    JobFailed,
+    JobManager,
+    request_key,
+)
+
+
+def _wait(job: Job, timeout_s: float = 5.0) -> Job:
+    deadline = time.monotonic() + timeout_s
+    while not job.finished and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert job.finished
+    return job
+
+
+def _double(x: int) -> int:
+    return x * 2
+
+
+def _raise_failed() -> None:
+    raise JobFailed(404, "no data")
+
+
+def _crash() -> None:
+    os._exit(1)
+
+
+def test_request_key_is_order_independent() -> None:
+    assert request_key("k", {"a": 1, "b": 2}) == request_key("k", {"b": 2, "a": 1})
+    assert request_key("k", {"a": 1}) != request_key("other", {"a": 1})
+
+
+def test_job_combines_task_results_in_order() -> None:
+    jobs = JobManager(executor=ThreadPoolExecutor(max_workers=2))
+    job = jobs.submit("sum", {"n": 3}, [(_double, (i,)) for i in range(3)], list)
+    _wait(job)
+    assert job.status == JOB_DONE
+    assert job.result == [0, 2, 4]
+    assert job.progress == 1.0
+    assert job.tasks_done == 3
+
+
+def test_identical_inflight_request_is_deduped() -> None:
+    gate = threading.Event()
+    calls: list[int] = []
+
+    def _blocking(x: int) -> int:
+        calls.append(x)
+        gate.wait(5)
+        return x
+
+    jobs = JobManager(executor=ThreadPoolExecutor(max_workers=2))
+    first = jobs.submit("k", {"x": 1}, [(_blocking, (1,))], list)
+    second = jobs.submit("k", {"x": 1}, [(_blocking, (1,))], list)
+    assert second is first
+    gate.set()
+    _wait(first)
+    assert calls == [1]
+
+
+def test_finished_result_is_served_from_cache_within_ttl() -> None:
+    jobs = JobManager(executor=ThreadPoolExecutor(max_workers=1))
+    first = _wait(jobs.submit("k", {"x": 2}, [(_double, (2,))], list))
+    again = jobs.submit("k", {"x": 2}, [(_double, (2,))], list)
+    assert again is first
+    assert again.cached
+
+
+def test_expired_result_is_recomputed() -> None:
+    jobs = JobManager(executor=ThreadPoolExecutor(max_workers=1), result_ttl_s=0.0)
+    first = _wait(jobs.submit("k", {"x": 2}, [(_double, (2,))], list))
+    time.sleep(0.01)
+    again = jobs.submit("k", {"x": 2}, [(_double, (2,))], list)
+    assert again is not first
+
+
+def test_failed_job_reports_status_and_releases_key() -> None:
+    jobs = JobManager(executor=ThreadPoolExecutor(max_workers=1))
+    job = _wait(jobs.submit("k", {}, [(_raise_failed, ())], list))
+    assert job.status == JOB_ERROR
+    assert job.error == "no data"
+    assert job.error_status == 404
+    retry = jobs.submit("k", {}, [(_double, (1,))], list)
+    assert retry is not job
+
+
+def test_crashed_worker_does_not_wedge_the_pool() -> None:
+    jobs = JobManager(max_workers=1)
+    try:
+        crashed = _wait(jobs.submit("crash", {}, [(_crash, ())], list), 60.0)
+        assert crashed.status == JOB_ERROR
+        job = _wait(jobs.submit("k", {"x": 3}, [(_double, (3,))], list), 60.0)
+        assert job.status == JOB_DONE
+        assert job.result == [6]
+    finally:
+        jobs.shutdown()
+
+
+def test_submit_failure_fails_the_job_and_releases_key() -> None:
+    executor = MagicMock()
+    executor.submit.side_effect = BrokenExecutor("pool broken")
+    jobs = JobManager(executor=executor)
+    job = jobs.submit("k", {}, [(_double, (1,))], list)
+    assert job.status == JOB_ERROR
+    assert job.error_status == 500
+    assert jobs.submit("k", {}, [(_double, (1,))], list) is not job
+
+
+def test_finished_jobs_are_evicted_beyond_max_jobs() -> None:
+    jobs = JobManager(executor=ThreadPoolExecutor(max_workers=1), max_jobs=2)
+    ids = [
+        _wait(jobs.submit("k", {"i": i}, [(_double, (i,))], list)).job_id
+        for i in range(4)
+    ]
+    assert jobs.get(ids[0]) is None
+    assert jobs.get(ids[-1]) is not None
+
+
+# --- Endpoints ---
+
+
+@pytest.fixture()
+def thread_jobs(web_client: TestClient) -> JobManager:
+    """Swap the app's process pool for a thread pool so monkeypatches apply."""
+    from web.api.main import app
+
+    jobs = JobManager(executor=ThreadPoolExecutor(max_workers=2))
+    app.state.job_manager = jobs
+    return jobs
+
+
+def _poll_result(web_client: TestClient, job_id: str) -> Any:
+    deadline = time.monotonic() + 5.0
+    while time.monotonic() < deadline:
+        status = web_client.get(f"/api/jobs/{job_id}").json()
+        if status["status"] in (JOB_DONE, JOB_ERROR):
+            return web_client.get(f"/api/jobs/{job_id}/result")
+        time.sleep(0.01)
+    raise AssertionError("job did not finish")
+
+
+def test_signals_job_returns_merged_signals(
+    web_client: TestClient,
+    thread_jobs: JobManager,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    ohlcv = pd.DataFrame({"open_time": [1_700_000_000_000], "close": [1.0]})
+    sigs = pd.DataFrame(
+        {"open_time": [1_700_000_000_000], "direction": ["long"], "sl_price": [0.9]}
+    )
+    monkeypatch.setattr("web.api.routers.signals.duckdb.connect", MagicMock())
+    monkeypatch.setattr("web.api.routers.signals.get_ohlcv", lambda *a, **kw: ohlcv)
+    monkeypatch.setattr(
+        "web.api.routers.signals.detect_signals_for_strategy", lambda *a, **kw: sigs
+    )
+    body = {
+        "symbol": "BTCUSDT",
+        "timeframe": "1h",
+        "start_ms": 0,
+        "end_ms": 9_999_999_999_999,
+        "strategies": ["fvg", "engulfing"],
+    }
+    resp = web_client.post("/api/jobs/signals", json=body)
+    assert resp.status_code == 202
+    assert resp.json()["tasks_total"] == 2
+
+    result = _poll_result(web_client, resp.json()["job_id"])
+    assert result.status_code == 200
+    assert sorted(s["strategy"] for s in result.json()["signals"]) == [
+        "engulfing",
+        "fvg",
+    ]
+
+
+def test_backtest_job_no_data_surfaces_404(
+    web_client: TestClient,
+    thread_jobs: JobManager,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("web.api.routers.backtest.duckdb.connect", MagicMock())
+    monkeypatch.setattr(
+        "web.api.routers.backtest.get_ohlcv", lambda *a, **kw: pd.DataFrame()
+    )
+    resp = web_client.post(
+        "/api/jobs/backtest",
+        json={"symbol": "BTCUSDT", "timeframe": "1h", "strategy": "fvg"},
+    )
+    assert resp.status_code == 202
+    result = _poll_result(web_client, resp.json()["job_id"])
+    assert result.status_code == 404
+
+
+def test_backtest_job_unknown_strategy_rejected_before_queueing(
+    web_client: TestClient, thread_jobs: JobManager
+) -> None:
+    resp = web_client.post(
+        "/api/jobs/backtest",
+        json={"symbol": "BTCUSDT", "timeframe": "1h", "strategy": "nope"},
+    )
+    assert resp.status_code == 422
+
+
+def test_unknown_job_returns_404(
+    web_client: TestClient, thread_jobs: JobManager
+) -> None:
+    assert web_client.get("/api/jobs/deadbeef").status_code == 404
+
+
+def test_stream_job_ends_with_terminal_frame(
+    web_client: TestClient, thread_jobs: JobManager
+) -> None:
+    job = _wait(thread_jobs.submit("k", {}, [(_double, (1,))], list))
+    with web_client.stream("GET", f"/api/stream/jobs/{job.job_id}") as resp:
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        body = resp.read().decode()
+    assert '"status": "done"' in body
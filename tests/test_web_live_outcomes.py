@@ -29,6 +29,7 @@ def _client_for(conn: duckdb.DuckDBPyConnection) -> Generator[TestClient]:
     with (
         patch("web.api.main.duckdb.connect", return_value=MagicMock()),
         patch("web.api.main.create_client", return_value=MagicMock()),
+        patch("web.api.main.create_position_feed", return_value=None),
         patch("web.api.main.init_schema"),
         TestClient(app) as client,
     ):
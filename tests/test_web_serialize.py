@@ -0,0 +1,143 @@
+"""Tests for the bulk JSON serializers behind the signals/backtest endpoints."""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+from analytics.backtest_lib import Trade
+from web.api.models.backtest import TradeModel
+from web.api.models.signals import SignalRow
+from web.api.serialize import json_bytes, nullable_floats, signal_rows, trade_rows
+
+
+def _trades() -> list[Trade]:
+    return [
+        Trade(1, 2, 100.0, "long", 95.0, 110.0, 3, 110.0, "win", fee_pct=0.0004),
+        Trade(4, 5, 0.00001234, "short", 0.0000125, 0.0000118, 6, 0.0000125, "loss"),
+        Trade(7, 8, 50.0, "long", 50.0, 60.0, 9, 60.0, "win"),  # zero risk
+        Trade(10, 11, 200.0, "short", 210.0, 180.0, funding_r=0.03),  # still open
+    ]
+
+
+def test_trade_rows_match_trade_model() -> None:
+    trades = _trades()
+    trades[0].slippage_pct = 0.0002
+    expected = [
+        TradeModel.model_validate(t, from_attributes=True).model_dump() for t in trades
+    ]
+    assert trade_rows(trades) == expected
+
+
+def test_trade_rows_pnl_r_bit_identical() -> None:
+    rng = np.random.default_rng(7)
+    trades = [
+        Trade(
+            i,
+            i + 1,
+            float(rng.uniform(1, 100)),
+            "long" if i % 2 else "short",
+            float(rng.uniform(1, 100)),
+            0.0,
+            i + 2,
+            float(rng.uniform(1, 100)),
+            "win",
+            fee_pct=0.0005,
+            slippage_pct=0.0001,
+            funding_r=float(rng.uniform(-0.1, 0.1)),
+        )
+        for i in range(200)
+    ]
+    assert [r["pnl_r"] for r in trade_rows(trades)] == [t.pnl_r for t in trades]
+
+
+def test_trade_rows_empty() -> None:
+    assert trade_rows([]) == []
+
+
+def test_signal_rows_apply_defaults() -> None:
+    df = pd.DataFrame(
+        {
+            "open_time": [2, 1],
+            "direction": ["long", "short"],
+            "strategy": ["fvg", "bos"],
+            "reason": [None, "break"],
+            "sl_price": [None, 9.5],
+            "entry_price": [np.nan, 10.0],
+            "confidence": [None, 4.0],
+        }
+    )
+    rows = signal_rows(df)
+    assert rows == [
+        {
+            "open_time": 2,
+            "direction": "long",
+            "strategy": "fvg",
+            "reason": "fvg",
+            "sl_price": 0.0,
+            "entry_price": None,
+            "confidence": 3,
+            "context": "",
+        },
+        {
+            "open_time": 1,
+            "direction": "short",
+            "strategy": "bos",
+            "reason": "break",
+            "sl_price": 9.5,
+            "entry_price": 10.0,
+            "confidence": 4,
+            "context": "",
+        },
+    ]
+    for row in rows:
+        SignalRow.model_validate(row)
+
+
+def test_nullable_floats_maps_nan_and_none() -> None:
+    assert nullable_floats([1.5, None, np.nan, "x"]) == [1.5, None, None, None]
+
+
+def test_json_bytes_preserves_float_precision() -> None:
+    price = 0.000012345678901234
+    assert json.loads(json_bytes({"p": price}))["p"] == price
+
+
+def test_json_bytes_rejects_nan() -> None:
+    with pytest.raises(ValueError):
+        json_bytes({"p": float("nan")})
+
+
+def test_signals_history_endpoint_serializes_nulls(
+    web_client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    df = pd.DataFrame(
+        {
+            "symbol": ["BTCUSDT"],
+            "timeframe": ["1h"],
+            "strategy": ["fvg"],
+            "open_time": [1_700_000_000_000],
+            "direction": ["long"],
+            "entry_price": [None],
+            "sl_price": [29000.0],
+            "reason": [None],
+            "confidence": [None],
+            "fired_at": [1_700_000_000_500],
+        }
+    )
+    monkeypatch.setattr(
+        "web.api.routers.signals.get_signals_history", lambda *a, **kw: df
+    )
+    resp = web_client.get(
+        "/api/signals/history",
+        params={"symbol": "BTCUSDT", "timeframe": "1h", "start_ms": 0, "end_ms": 1},
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/json"
+    [row] = resp.json()["signals"]
+    assert row["reason"] == "fvg"
+    assert row["entry_price"] is None
+    assert row["confidence"] == 3
+    assert row["context"] == ""
@@ -23,7 +23,7 @@ async def _one_price_event(client: Any) -> AsyncGenerator[str]:
     yield f"data: {json.dumps(data)}\n\n"
 
 
-async def _one_positions_event(client: Any) -> AsyncGenerator[str]:
+async def _one_positions_event(client: Any, feed: Any = None) -> AsyncGenerator[str]:
     data = {
         "positions": [
             {
@@ -8,9 +8,15 @@ ever formed (including mitigated ones). Default behaviour is unchanged.
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
+import pytest
 
-from analytics.zones_lib import extract_fvg_zones
+from analytics.zones_lib import (
+    extract_fib_golden_zone_history,
+    extract_fib_golden_zones,
+    extract_fvg_zones,
+)
 
 
 def _staircase_then_drop() -> pd.DataFrame:
@@ -52,3 +58,29 @@ def test_extract_fvg_zones_default_unchanged() -> None:
     df = _staircase_then_drop()
     # Default call (max_zones omitted): 1 active bearish + last-5 inactive = 6.
     assert len(extract_fvg_zones(df)) == 6
+
+
+@pytest.mark.parametrize(("step", "swing", "bos"), [(1, 20, 5), (3, 20, 5), (1, 4, 2)])
+def test_fib_history_matches_expanding_window_walk(
+    step: int, swing: int, bos: int
+) -> None:
+    rng = np.random.default_rng(step + swing)
+    close = np.round(100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, 300))), 1)
+    df = pd.DataFrame(
+        {
+            "open_time": [60_000 * i for i in range(300)],
+            "open": close,
+            "high": close * (1 + rng.random(300) * 0.01),
+            "low": close * (1 - rng.random(300) * 0.01),
+            "close": close,
+        }
+    )
+    expected: dict[tuple[int, float, float], dict[str, object]] = {}
+    for end in range(swing + bos + 2, len(df) + 1, step):
+        for z in extract_fib_golden_zones(df.iloc[:end], swing, bos):
+            key = (int(z["start_ms"]), z["zone_low"], z["zone_high"])
+            expected.setdefault(key, z)
+
+    history = extract_fib_golden_zone_history(df, swing, bos, step)
+    assert history == list(expected.values())
+    assert len(history) > 1
@@ -364,3 +364,51 @@ def test_missing_mark_forces_steady_state_cap(tmp_path: Path) -> None:
     assert res.verdict.allowed is False and any(
         "turnover" in a.lower() for a in res.verdict.aborts
     )
+
+
+def test_run_once_streams_the_book_and_reconciles(tmp_path: Path) -> None:
+    conn = duckdb.connect(":memory:")
+    init_schema(conn)
+    syms = _seed(conn)
+    stream_path = tmp_path / "target_stream_dry_run.json"
+    kwargs: dict[str, Any] = {
+        "no_trade_band_frac": 0.0,
+        "exchange_leverage": 5,
+        "state_path": tmp_path / "state.json",
+        "stream_state_path": stream_path,
+    }
+
+    def _run(now: str, **kw: Any) -> Any:
+        adapter = _FakeAdapter(equity=10_000.0, positions={}, marks={})
+        return run_once(
+            conn,
+            adapter,
+            ForecastConfig(),
+            syms,
+            _limits(),
+            now=pd.Timestamp(now, tz="UTC"),
+            **kwargs,
+            **kw,
+        )
+
+    first = _run("2022-01-20", reconcile_stream=True)
+    assert stream_path.exists()
+    assert load_state(tmp_path / "state.json")["last_run"]["stream_drift"] < 1e-12
+
+    second = _run("2022-02-05")
+    full = run_once(
+        conn,
+        _FakeAdapter(equity=10_000.0, positions={}, marks={}),
+        ForecastConfig(),
+        syms,
+        _limits(),
+        no_trade_band_frac=0.0,
+        exchange_leverage=5,
+        state_path=tmp_path / "full.json",
+        now=pd.Timestamp("2022-02-05", tz="UTC"),
+    )
+    assert second.book.as_of_date > first.book.as_of_date
+    assert second.book.as_of_date == full.book.as_of_date
+    for got, want in zip(second.book.positions, full.book.positions, strict=True):
+        assert got.symbol == want.symbol
+        assert abs(got.leverage - want.leverage) < 1e-12
@@ -0,0 +1,226 @@
+"""Tests for analytics.xsmom.stream — the one-bar XS target book vs full replays."""
+
+from __future__ import annotations
+
+import json
+
+import duckdb
+import numpy as np
+import pandas as pd
+import pytest
+
+from analytics.forecast.config import ForecastConfig
+from analytics.forecast.panel import DailyPanel
+from analytics.store.market_data import upsert_funding_rates, upsert_ohlcv
+from analytics.store.schema import init_schema
+from analytics.xsmom.book import run_xs_backtest
+from analytics.xsmom.live import build_target_book
+from analytics.xsmom.replay import replay_target_stream, replay_targets
+from analytics.xsmom.stream import (
+    XSStreamState,
+    advance_panel,
+    stream_state_from_dict,
+    stream_state_to_dict,
+    stream_target_book,
+    target_book_drift,
+)
+
+_DAY = 86_400_000
+_START = 1_609_459_200_000  # 2021-01-01 UTC
+
+
+def _inputs() -> tuple[dict[str, pd.Series], dict[str, pd.Series]]:
+    """Staggered listings, an own-index gap, a NaN-close prefix and a NaN bar."""
+    rng = np.random.default_rng(11)
+    full = pd.date_range("2021-01-01", periods=600, freq="D", tz="UTC")
+    closes: dict[str, pd.Series] = {}
+    fundings: dict[str, pd.Series] = {}
+    for i in range(6):
+        idx = full[40 * i :]
+        if i == 2:
+            idx = idx.delete([90, 91, 300])
+        close = pd.Series(
+            100.0 * np.exp(np.cumsum(rng.normal(0.0003, 0.03, len(idx)))), index=idx
+        )
+        if i == 3:
+            close.iloc[:30] = np.nan
+        if i == 4:
+            close.iloc[100] = np.nan
+        closes[f"S{i}"] = close
+        fundings[f"S{i}"] = pd.Series(rng.normal(0.0, 1e-4, len(idx)), index=idx)
+    return closes, fundings
+
+
+def _through(
+    series: dict[str, pd.Series], cutoff: pd.Timestamp
+) -> dict[str, pd.Series]:
+    return {
+        s: v[v.index <= cutoff] for s, v in series.items() if (v.index <= cutoff).any()
+    }
+
+
+@pytest.mark.parametrize(
+    "cfg",
+    [
+        ForecastConfig(g_min=0.0, g_max=1e6, vol_target_annual=0.05),
+        ForecastConfig(weights=(0.4, 0.3, 0.2, 0.1), xs_dollar_neutral=True),
+    ],
+)
+def test_streamed_book_matches_full_replay(cfg: ForecastConfig) -> None:
+    closes, fundings = _inputs()
+    panel = DailyPanel.from_series(closes, fundings)
+    state = advance_panel(XSStreamState.empty([*closes, "LATEUSDT"], cfg), panel, cfg)
+
+    res = run_xs_backtest(closes, fundings, cfg)
+    np.testing.assert_array_equal(
+        state.pre_window, res.pre_governor_return[-cfg.gov_window :]
+    )
+    streamed = stream_target_book(state, cfg, 10_000.0)
+    full = build_target_book(closes, fundings, cfg, 10_000.0)
+    assert streamed.as_of_date == full.as_of_date
+    assert streamed.active_count == full.active_count
+    assert target_book_drift(streamed, full) < 1e-12
+
+
+def test_advancing_a_seeded_state_equals_seeding_through() -> None:
+    closes, fundings = _inputs()
+    cfg = ForecastConfig()
+    panel = DailyPanel.from_series(closes, fundings)
+    cutoff = panel.daily_index[450]
+    seeded = advance_panel(
+        XSStreamState.empty(list(closes), cfg),
+        DailyPanel.from_series(_through(closes, cutoff), _through(fundings, cutoff)),
+        cfg,
+    )
+    rest = {s: v[v.index > cutoff] for s, v in closes.items()}
+    rest_f = {s: v[v.index > cutoff] for s, v in fundings.items()}
+    advanced = advance_panel(seeded, DailyPanel.from_series(rest, rest_f), cfg)
+    whole = advance_panel(XSStreamState.empty(list(closes), cfg), panel, cfg)
+
+    assert json.dumps(stream_state_to_dict(advanced)) == json.dumps(
+        stream_state_to_dict(whole)
+    )
+    with pytest.raises(ValueError, match="cannot apply"):
+        advance_panel(advanced, DailyPanel.from_series(rest, rest_f), cfg)
+
+
+def test_state_survives_a_json_round_trip() -> None:
+    closes, fundings = _inputs()
+    cfg = ForecastConfig()
+    state = advance_panel(
+        XSStreamState.empty(list(closes), cfg),
+        DailyPanel.from_series(closes, fundings),
+        cfg,
+    )
+    back = stream_state_from_dict(json.loads(json.dumps(stream_state_to_dict(state))))
+    assert back.matches(list(closes), cfg)
+    assert not back.matches(list(closes), ForecastConfig(vol_span=25))
+    assert stream_target_book(back, cfg, 1.0) == stream_target_book(state, cfg, 1.0)
+
+
+def _seed_db(conn: duckdb.DuckDBPyConnection, days: range) -> list[str]:
+    rng = np.random.default_rng(3)
+    syms = ["AAAUSDT", "BBBUSDT", "CCCUSDT"]
+    for i, sym in enumerate(syms):
+        close = 100.0 * np.exp(np.cumsum(rng.normal(0.0005 * (i - 1), 0.02, 500)))
+        rows = pd.DataFrame(
+            {
+                "symbol": sym,
+                "timeframe": "1d",
+                "open_time": [_START + k * _DAY for k in days],
+                "open": close[list(days)],
+                "high": close[list(days)],
+                "low": close[list(days)],
+                "close": close[list(days)],
+                "volume": 1000.0,
+                "taker_buy_volume": 500.0,
+            }
+        )
+        upsert_ohlcv(conn, rows)
+        upsert_funding_rates(
+            conn,
+            pd.DataFrame(
+                {
+                    "symbol": sym,
+                    "funding_time": [_START + k * (_DAY // 3) for k in range(3 * 500)],
+                    "funding_rate": rng.normal(0.0, 1e-4, 3 * 500),
+                }
+            ),
+        )
+    return syms
+
+
+def test_replay_target_stream_advances_on_new_bars_only() -> None:
+    conn = duckdb.connect(":memory:")
+    init_schema(conn)
+    syms = _seed_db(conn, range(400))
+    cfg = ForecastConfig()
+    now = pd.Timestamp(_START + 400 * _DAY, unit="ms", tz="UTC")
+
+    book, state = replay_target_stream(conn, cfg, 1e4, None, symbols=syms, now=now)
+    full = replay_targets(conn, cfg, 1e4, symbols=syms, now=now)
+    assert target_book_drift(book, full) < 1e-12
+
+    # Two new bars land (plus a still-forming one that must be ignored).
+    for sym in syms:
+        upsert_ohlcv(
+            conn,
+            pd.DataFrame(
+                {
+                    "symbol": sym,
+                    "timeframe": "1d",
+                    "open_time": [_START + k * _DAY for k in (400, 401, 402)],
+                    "open": [101.0, 99.0, 150.0],
+                    "high": [101.0, 99.0, 150.0],
+                    "low": [101.0, 99.0, 150.0],
+                    "close": [101.0, 99.0, 150.0],
+                    "volume": 1000.0,
+                    "taker_buy_volume": 500.0,
+                }
+            ),
+        )
+    later = now + pd.Timedelta(days=2, hours=6)
+    book2, state2 = replay_target_stream(conn, cfg, 1e4, state, symbols=syms, now=later)
+    full2 = replay_targets(conn, cfg, 1e4, symbols=syms, now=later)
+    assert state.as_of is not None
+    assert state2.as_of == state.as_of + pd.Timedelta(days=2)
+    assert book2.as_of_date == full2.as_of_date
+    assert target_book_drift(book2, full2) < 1e-12
+
+    # A state built for another universe is re-seeded, not advanced.
+    book3, state3 = replay_target_stream(
+        conn, cfg, 1e4, state2, symbols=syms[:2], now=later
+    )
+    assert state3.symbols == tuple(syms[:2])
+    full3 = replay_targets(conn, cfg, 1e4, symbols=syms[:2], now=later)
+    assert target_book_drift(book3, full3) < 1e-12
+
+
+def test_replay_target_stream_picks_up_late_bars_inside_the_window() -> None:
+    conn = duckdb.connect(":memory:")
+    init_schema(conn)
+    syms = _seed_db(conn, range(400))
+    cfg = ForecastConfig()
+    now = pd.Timestamp(_START + 400 * _DAY, unit="ms", tz="UTC")
+    late = conn.execute(
+        "SELECT * FROM ohlcv WHERE symbol = ? AND open_time = ?",
+        [syms[0], _START + 397 * _DAY],
+    ).df()
+    conn.execute(
+        "DELETE FROM ohlcv WHERE symbol = ? AND open_time = ?",
+        [syms[0], _START + 397 * _DAY],
+    )
+
+    _, state = replay_target_stream(conn, cfg, 1e4, None, symbols=syms, now=now)
+    _, unwindowed = replay_target_stream(
+        conn, cfg, 1e4, None, symbols=syms, now=now, restream_days=0
+    )
+    upsert_ohlcv(conn, late)  # the bar for a day the stream already passed
+
+    full = replay_targets(conn, cfg, 1e4, symbols=syms, now=now)
+    book, _ = replay_target_stream(conn, cfg, 1e4, state, symbols=syms, now=now)
+    assert target_book_drift(book, full) < 1e-12
+    stale, _ = replay_target_stream(
+        conn, cfg, 1e4, unwindowed, symbols=syms, now=now, restream_days=0
+    )
+    assert target_book_drift(stale, full) > 1e-9
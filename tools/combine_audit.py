@@ -4,8 +4,10 @@ Replays the two validated sleeves over the N3 universe (1d), combines them in
 book-return space with a causal-rolling Carver IDM, and prints: the gate verdict
 ({trend, XS, combined} headline + DSR/PBO/bootstrap-CI/MinTRL + PASS/FAIL), a
 diversification read (correlation, realized IDM, vol reduction, sleeve
-contribution), and sensitivity panels — sleeve weights, IDM mode (causal vs
-static), and cost (with the combined cost-drag check) — plus a breadth contrast.
+contribution), and sensitivity panels — sleeve weights × IDM window, IDM mode
+(causal vs static), and cost (with the combined cost-drag check) — plus a breadth
+contrast. Settings over the same sleeves share one replay and one batched IDM
+computation.
 
 Read-only — no writes, no schema changes.
 
@@ -30,7 +32,7 @@ from analytics.combine import (
     evaluate_combined,
     load_sleeves,
 )
-from analytics.combine.book import combine_books
+from analytics.combine.book import combine_book_grid
 from analytics.forecast.config import ForecastConfig
 from analytics.store import DEFAULT_DB_PATH
 from analytics.universe import load_universe
@@ -43,13 +45,66 @@ def _cfg(
     w_xs: float = 0.5,
     w_trend: float = 0.5,
     idm_mode: str = "causal",
+    idm_window: int = 365,
 ) -> CombineConfig:
     sleeve = dataclasses.replace(ForecastConfig(), slippage_pct=slippage_bps / 10_000.0)
     return CombineConfig(
-        sleeve_cfg=sleeve, w_xs=w_xs, w_trend=w_trend, idm_mode=idm_mode
+        sleeve_cfg=sleeve,
+        w_xs=w_xs,
+        w_trend=w_trend,
+        idm_mode=idm_mode,
+        idm_window=idm_window,
     )
 
 
+def build_combine_report_rows(
+    conn: duckdb.DuckDBPyConnection,
+    symbols: list[str],
+    slippage_bps: float,
+    settings: list[tuple[str, float, float, str, int]],
+) -> list[dict[str, object]]:
+    """One report row per `(label, w_xs, w_trend, idm_mode, idm_window)` setting.
+
+    The sleeves are replayed once; every setting's combine comes out of one
+    batched `combine_book_grid` call.
+    """
+    cfgs = [_cfg(slippage_bps, w, wt, mode, win) for _, w, wt, mode, win in settings]
+    xs, trend = load_sleeves(conn, cfgs[0], symbols=symbols)
+    rows: list[dict[str, object]] = []
+    for (label, *_), cfg, combined in zip(
+        settings, cfgs, combine_book_grid(xs, trend, cfgs), strict=True
+    ):
+        trials = {
+            "trend": trend.portfolio_return,
+            "xs": xs.portfolio_return,
+            "combined": combined.portfolio_return,
+        }
+        rep = evaluate_combined(
+            combined, cfg, trials, xs.portfolio_return, trend.portfolio_return
+        )
+        rows.append(
+            {
+                "label": label,
+                "days": rep.n_obs,
+                "sharpe": rep.sharpe_annual,
+                "sharpe_xs": rep.sharpe_xs,
+                "sharpe_trend": rep.sharpe_trend,
+                "max_dd": rep.max_dd,
+                "ann_vol": rep.annual_vol,
+                "dsr": rep.dsr,
+                "pbo": rep.pbo,
+                "boot_lo": rep.boot_lo,
+                "boot_hi": rep.boot_hi,
+                "min_trl": rep.min_trl,
+                "corr_xs_trend": rep.corr_xs_trend,
+                "realized_idm": rep.realized_idm,
+                "div_mult": rep.diversification_mult,
+                "gate": "PASS" if combine_gate_verdict(rep) else "FAIL",
+            }
+        )
+    return rows
+
+
 def build_combine_report_row(
     conn: duckdb.DuckDBPyConnection,
     label: str,
@@ -59,35 +114,8 @@ def build_combine_report_row(
     w_trend: float = 0.5,
     idm_mode: str = "causal",
 ) -> dict[str, object]:
-    cfg = _cfg(slippage_bps, w_xs, w_trend, idm_mode)
-    xs, trend = load_sleeves(conn, cfg, symbols=symbols)
-    combined = combine_books(xs, trend, cfg)
-    trials = {
-        "trend": trend.portfolio_return,
-        "xs": xs.portfolio_return,
-        "combined": combined.portfolio_return,
-    }
-    rep = evaluate_combined(
-        combined, cfg, trials, xs.portfolio_return, trend.portfolio_return
-    )
-    return {
-        "label": label,
-        "days": rep.n_obs,
-        "sharpe": rep.sharpe_annual,
-        "sharpe_xs": rep.sharpe_xs,
-        "sharpe_trend": rep.sharpe_trend,
-        "max_dd": rep.max_dd,
-        "ann_vol": rep.annual_vol,
-        "dsr": rep.dsr,
-        "pbo": rep.pbo,
-        "boot_lo": rep.boot_lo,
-        "boot_hi": rep.boot_hi,
-        "min_trl": rep.min_trl,
-        "corr_xs_trend": rep.corr_xs_trend,
-        "realized_idm": rep.realized_idm,
-        "div_mult": rep.diversification_mult,
-        "gate": "PASS" if combine_gate_verdict(rep) else "FAIL",
-    }
+    setting = (label, w_xs, w_trend, idm_mode, 365)
+    return build_combine_report_rows(conn, symbols, slippage_bps, [setting])[0]
 
 
 def _print_df(title: str, df: pd.DataFrame) -> None:
@@ -115,46 +143,34 @@ def main() -> None:
     universe = load_universe()
     majors = [s.strip().upper() for s in args.majors.split(",") if s.strip()]
 
+    # Everything on the universe @2bps shares one sleeve replay + IDM batch.
+    weights = [("equal", 0.5, 0.5), ("xs-heavy", 0.7, 0.3), ("xs-heavy", 0.79, 0.21)]
+    settings = [("universe @2bps", 0.5, 0.5, "causal", 365)]
+    settings += [
+        (f"{name} {w:g}/{wt:g} · {win}d", w, wt, "causal", win)
+        for name, w, wt in weights
+        for win in (180, 365, 730)
+    ]
+    settings += [
+        ("causal", 0.5, 0.5, "causal", 365),
+        ("static", 0.5, 0.5, "static", 365),
+    ]
+    rows = build_combine_report_rows(conn, universe, 2.0, settings)
+    n_grid = 1 + len(weights) * 3
+
     _print_df(
         "Gate — trend×XS combine (universe vs majors @2bps)",
         pd.DataFrame(
-            [
-                build_combine_report_row(conn, "universe @2bps", universe, 2.0),
-                build_combine_report_row(conn, "majors @2bps", majors, 2.0),
-            ]
+            [rows[0], build_combine_report_row(conn, "majors @2bps", majors, 2.0)]
         ),
     )
 
     _print_df(
-        "Weights sensitivity (universe @2bps)",
-        pd.DataFrame(
-            [
-                build_combine_report_row(
-                    conn, "equal 0.5/0.5", universe, 2.0, 0.5, 0.5
-                ),
-                build_combine_report_row(
-                    conn, "xs-heavy 0.7/0.3", universe, 2.0, 0.7, 0.3
-                ),
-                build_combine_report_row(
-                    conn, "xs-heavy 0.79/0.21", universe, 2.0, 0.79, 0.21
-                ),
-            ]
-        ),
+        "Weights × IDM-window sensitivity (universe @2bps)",
+        pd.DataFrame(rows[1:n_grid]),
     )
 
-    _print_df(
-        "IDM-mode sensitivity (universe @2bps)",
-        pd.DataFrame(
-            [
-                build_combine_report_row(
-                    conn, "causal", universe, 2.0, idm_mode="causal"
-                ),
-                build_combine_report_row(
-                    conn, "static", universe, 2.0, idm_mode="static"
-                ),
-            ]
-        ),
-    )
+    _print_df("IDM-mode sensitivity (universe @2bps)", pd.DataFrame(rows[n_grid:]))
 
     _print_df(
         "Cost sensitivity (universe)",
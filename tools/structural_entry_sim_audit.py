@@ -53,9 +53,7 @@ DEFAULT_ZONE_TYPES = [
     "eqh_eql",
     "bos",
 ]  # ob / fib opt-in (family / walk-forward cost)
-DEFAULT_TFS = [
-    "1d"
-]  # 4h is O(n^2) in the extractors — pass explicitly for the robustness run
+DEFAULT_TFS = ["1d"]  # 4h / 15m — pass explicitly for the robustness run
 DEFAULT_TP_R = [1.0, 1.5, 2.0, 3.0]
 DEFAULT_OUT = (
     REPO_ROOT / "docs" / "audits" / "2026-06-26-structural-entry-sim-harness.md"
@@ -329,8 +327,8 @@ def main() -> int:
         f"{len(args.tp_r_grid)}×{len(args.sl_models)}) ...",
         flush=True,
     )
-    # Build per (symbol, tf) so progress is observable (extraction is O(n^2) on
-    # higher-frequency tfs); per-frame tables concat to the single-call result.
+    # Build per (symbol, tf) so progress is observable on long multi-year
+    # frames; per-frame tables concat to the single-call result.
     parts: list[pd.DataFrame] = []
     for i, ((symbol, tf), df) in enumerate(bars.items(), start=1):
         part = build_realized_table(
@@ -266,9 +266,9 @@ def main() -> int:
         f"(zone_types={args.zone_types}) ...",
         flush=True,
     )
-    # Build per (symbol, tf) so progress is observable (extraction is O(n^2) on
-    # higher-frequency tfs); the per-frame tables are independent and concat to
-    # exactly the single-call result.
+    # Build per (symbol, tf) so progress is observable on long multi-year
+    # frames; the per-frame tables are independent and concat to exactly the
+    # single-call result.
     parts: list[pd.DataFrame] = []
     for i, ((symbol, tf), df) in enumerate(bars.items(), start=1):
         part = build_touch_table(
@@ -5,6 +5,12 @@ live Binance account state and either prints it (dry-run, the default) or submit
 it on testnet. Mainnet (`--mode live`) is double-gated by `--i-understand-live`
 AND `BINANCE_ALLOW_LIVE=1`. `--kill` / `--resume` toggle the kill-switch.
 
+The target book is streamed: a persisted per-mode XS stream checkpoint is
+advanced by the new daily bars instead of replaying the full history, and the
+trailing `STREAM_RESTREAM_DAYS` are re-read every run so late-synced bars still
+land. `--reconcile` also runs the full replay and falls back to it (re-seeding
+the stream) on drift; `--full-replay` skips the stream entirely.
+
 Run `buibui analytics sync --universe` first to refresh the 1d bars.
 
 Usage::
@@ -265,6 +271,16 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--kill", action="store_true")
     parser.add_argument("--resume", action="store_true")
     parser.add_argument("--state-dir", type=Path, default=_DEFAULT_STATE_DIR)
+    parser.add_argument(
+        "--reconcile",
+        action="store_true",
+        help="Check the streamed book against a full replay (fall back on drift)",
+    )
+    parser.add_argument(
+        "--full-replay",
+        action="store_true",
+        help="Rebuild the book from the full daily history (no stream state)",
+    )
     return parser
 
 
@@ -272,6 +288,9 @@ def main() -> None:
     args = build_parser().parse_args()
 
     state_path = args.state_dir / f"execution_state_{args.mode}.json"
+    stream_path = (
+        None if args.full_replay else args.state_dir / f"target_stream_{args.mode}.json"
+    )
 
     if args.kill or args.resume:
         state = load_state(state_path)
@@ -312,6 +331,8 @@ def main() -> None:
             exchange_leverage=args.exchange_leverage,
             state_path=state_path,
             capital_override=args.capital,
+            stream_state_path=stream_path,
+            reconcile_stream=args.reconcile,
         )
     print(format_result(res))
 
@@ -1,10 +1,11 @@
 """Orchestrator for the XS-solo executor: state -> book -> plan -> overlay -> submit.
 
 The only stateful module: reads/writes a small gitignored JSON state file
-(peak equity high-water mark + kill-switch + last-run summary). Sizes the target
-book off live account equity, runs the fail-closed overlay before any write, and
-isolates per-order submission failures. Reads the analytics DB read-only via
-`replay_targets`; never writes it.
+(peak equity high-water mark + kill-switch + last-run summary) and, when
+streaming, the persisted XS stream state. Sizes the target book off live
+account equity, runs the fail-closed overlay before any write, and isolates
+per-order submission failures. Reads the analytics DB read-only via
+`replay_targets` / `replay_target_stream`; never writes it.
 """
 
 from __future__ import annotations
@@ -19,7 +20,13 @@ import pandas as pd
 
 from analytics.forecast.config import ForecastConfig
 from analytics.xsmom.live import TargetBook
-from analytics.xsmom.replay import replay_targets
+from analytics.xsmom.replay import replay_target_stream, replay_targets
+from analytics.xsmom.stream import (
+    XSStreamState,
+    stream_state_from_dict,
+    stream_state_to_dict,
+    target_book_drift,
+)
 from trade.overlay import AccountState, OverlayVerdict, RiskLimits, evaluate_overlay
 from trade.routing import ExchangeFilters, OrderIntent, OrderPlan, build_order_plan
 
@@ -63,6 +70,55 @@ def save_state(path: Path, state: dict[str, Any]) -> None:
     path.write_text(json.dumps(state, indent=2))
 
 
+def load_stream_state(path: Path) -> XSStreamState | None:
+    if not path.exists():
+        return None
+    return stream_state_from_dict(json.loads(path.read_text()))
+
+
+def save_stream_state(path: Path, state: XSStreamState) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(stream_state_to_dict(state)))
+
+
+# Max leverage / governor gap a streamed book may show against the full replay.
+STREAM_DRIFT_TOLERANCE = 1e-9
+
+
+def _target_book(
+    conn: Any,
+    cfg: ForecastConfig,
+    equity: float,
+    symbols: list[str],
+    now: pd.Timestamp,
+    stream_state_path: Path | None,
+    reconcile_stream: bool,
+) -> tuple[TargetBook, float | None]:
+    """Today's book, streamed when a state path is given: ``(book, drift)``.
+
+    ``drift`` is the streamed-vs-full-replay gap in reconcile mode (else None).
+    A stream that drifts past ``STREAM_DRIFT_TOLERANCE`` is discarded: the full
+    replay's book is used and the stream re-seeded from history.
+    """
+    if stream_state_path is None:
+        return replay_targets(conn, cfg, equity, symbols=symbols, now=now), None
+    prior = load_stream_state(stream_state_path)
+    book, stream = replay_target_stream(
+        conn, cfg, equity, prior, symbols=symbols, now=now
+    )
+    drift: float | None = None
+    if reconcile_stream:
+        full = replay_targets(conn, cfg, equity, symbols=symbols, now=now)
+        drift = target_book_drift(book, full)
+        if drift > STREAM_DRIFT_TOLERANCE:
+            book = full
+            _, stream = replay_target_stream(
+                conn, cfg, equity, None, symbols=symbols, now=now
+            )
+    save_stream_state(stream_state_path, stream)
+    return book, drift
+
+
 def _data_age_hours(as_of_date: str, now: pd.Timestamp) -> float:
     # The 1d bar labelled `as_of_date` closes at the end of that UTC day.
     close = pd.Timestamp(as_of_date, tz="UTC") + pd.Timedelta(days=1)
@@ -81,6 +137,8 @@ def run_once(
     state_path: Path,
     now: pd.Timestamp | None = None,
     capital_override: float | None = None,
+    stream_state_path: Path | None = None,
+    reconcile_stream: bool = False,
 ) -> ExecutionResult:
     now = now if now is not None else pd.Timestamp(datetime.now(UTC))
     state = load_state(state_path)
@@ -91,7 +149,13 @@ def run_once(
     # equity) instead of the live account balance — used for a capital-matched
     # testnet vs real-account A/B. Default keeps the live-equity behavior.
     equity = capital_override if capital_override is not None else adapter.get_equity()
-    book = replay_targets(conn, cfg, equity, symbols=symbols, now=now)
+    # `stream_state_path` advances a persisted XS stream checkpoint by the new
+    # daily bars (re-reading the trailing window for late syncs) instead of
+    # replaying the full history; `reconcile_stream` also runs the full replay
+    # and falls back to it on drift.
+    book, drift = _target_book(
+        conn, cfg, equity, symbols, now, stream_state_path, reconcile_stream
+    )
     data_age = _data_age_hours(book.as_of_date, now)
 
     positions = adapter.get_positions()
@@ -151,6 +215,8 @@ def run_once(
         "failed": len(failed),
         "aborts": verdict.aborts,
     }
+    if drift is not None:
+        state["last_run"]["stream_drift"] = drift
     save_state(state_path, state)
 
     return ExecutionResult(
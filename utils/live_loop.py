@@ -7,12 +7,25 @@ from collections.abc import Callable
 from rich.console import Console, RenderableType
 from rich.live import Live
 
+# Upper bound on repaints per second when rendering is change-driven. Each
+# repaint rewrites the whole table to the terminal, so on a small VPS with 100+
+# symbols the frame rate — not the tick rate — is what bounds CPU.
+DEFAULT_MAX_FPS = 4.0
+
 
 def run_live_loop(
     render: Callable[[], RenderableType],
     interval: float = 1.0,
+    version: Callable[[], int] | None = None,
+    max_fps: float = DEFAULT_MAX_FPS,
 ) -> None:
-    """Run a Rich Live loop until Ctrl-C, calling `render()` every `interval` seconds."""
+    """Run a Rich Live loop until Ctrl-C.
+
+    Without `version`, call `render()` every `interval` seconds. With it, poll
+    `version()` at up to `max_fps` and repaint only when it changed — or when
+    `interval` seconds have passed since the last repaint, so time-based parts
+    of the panel (titles, staleness banners) still advance.
+    """
     console = Console()
     # Suppress INFO-level console logging during Live rendering.
     # Any log write to the terminal inside a Live context corrupts Rich's
@@ -20,16 +33,29 @@ def run_live_loop(
     root_logger = logging.getLogger()
     saved_level = root_logger.level
     root_logger.setLevel(logging.WARNING)
+    frame_s = 1.0 / max_fps if max_fps > 0 else interval
     try:
         # auto_refresh=False disables the background refresh thread.
         # Without it, that thread races with live.update() from a slow render()
         # call and writes to the terminal at the same time, causing a duplicate
         # panel header on screen. We drive every repaint manually with refresh().
         with Live(console=console, auto_refresh=False) as live:
+            if version is None:
+                while True:
+                    live.update(render())
+                    live.refresh()
+                    time.sleep(interval)
+            last_version: int | None = None
+            last_paint = 0.0
             while True:
-                live.update(render())
-                live.refresh()
-                time.sleep(interval)
+                current = version()
+                now = time.monotonic()
+                if current != last_version or now - last_paint >= interval:
+                    last_version = current
+                    last_paint = now
+                    live.update(render())
+                    live.refresh()
+                time.sleep(frame_s)
     except KeyboardInterrupt:
         pass
     finally:
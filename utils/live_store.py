@@ -30,6 +30,7 @@ class SnapshotResult:
     data: dict[str, StoreSnapshot]
     ws_connected: bool
     last_update: datetime | None
+    version: int = 0
 
 
 class LiveDataStore:
@@ -39,6 +40,12 @@ class LiveDataStore:
         self._klines: dict[str, KlineData] = {}
         self._ws_connected: bool = False
         self._last_update: datetime | None = None
+        # Bumped on every write so renderers can skip unchanged frames.
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
 
     def update_ticker(self, symbol: str, last: float, open_24h: float) -> None:
         change_24h = ((last - open_24h) / open_24h * 100) if open_24h else 0.0
@@ -46,6 +53,7 @@ class LiveDataStore:
             self._tickers[symbol] = TickerData(last_price=last, change_24h=change_24h)
             self._last_update = datetime.now()
             self._ws_connected = True
+            self._version += 1
 
     def update_klines(
         self,
@@ -62,10 +70,13 @@ class LiveDataStore:
                 open_4h=open_4h,
                 asia_open=asia_open,
             )
+            self._version += 1
 
     def set_ws_status(self, connected: bool) -> None:
         with self._lock:
-            self._ws_connected = connected
+            if self._ws_connected != connected:
+                self._ws_connected = connected
+                self._version += 1
 
     def snapshot(self, symbols: list[str]) -> SnapshotResult:
         with self._lock:
@@ -79,4 +90,5 @@ class LiveDataStore:
                 },
                 ws_connected=self._ws_connected,
                 last_update=self._last_update,
+                version=self._version,
             )
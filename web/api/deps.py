@@ -1,4 +1,4 @@
-"""FastAPI dependency factories: get_db, get_client, require_token."""
+"""FastAPI dependency factories: get_db, get_client, get_position_feed, get_job_manager, require_token."""
 
 import os
 import secrets
@@ -9,6 +9,9 @@ from binance.client import Client
 from fastapi import HTTPException, Query, Request, Security, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
+from monitor.position_state import PositionFeed
+from web.api.jobs import JobManager
+
 _bearer = HTTPBearer()
 
 
@@ -34,6 +37,18 @@ def get_client(request: Request) -> Client:
     return client
 
 
+def get_position_feed(request: Request) -> PositionFeed | None:
+    """Return the user-data-stream PositionFeed, or None when REST polling is used."""
+    feed: PositionFeed | None = getattr(request.app.state, "position_feed", None)
+    return feed
+
+
+def get_job_manager(request: Request) -> JobManager:
+    """Return the background JobManager from app state."""
+    jobs: JobManager = request.app.state.job_manager
+    return jobs
+
+
 def require_token(
     creds: HTTPAuthorizationCredentials = Security(_bearer),
 ) -> None:
@@ -0,0 +1,321 @@
+"""Background job queue for heavy web requests (backtests, multi-strategy signal scans).
+
+Detection and backtesting are CPU-bound pandas/NumPy work. Running them inside a
+request handler parks one of FastAPI's threadpool workers for the whole run, and
+a multi-strategy request over long history can starve the price/position SSE
+streams. Jobs run in a separate process pool instead:
+
+- ``submit`` hashes (kind, payload) into a request key. An identical request that
+  is still in flight joins the existing job; a finished one inside the TTL is
+  served from the result cache without touching the pool.
+- A job is a list of independent tasks (one per strategy for signal scans).
+  Progress is ``tasks_done / tasks_total`` and is exposed via ``Job.snapshot``
+  for polling and the SSE stream.
+- Task results are combined in the parent process once every task has finished.
+  The web routers combine straight to JSON bytes (``web.api.serialize``) so a
+  cached result is served without re-encoding.
+
+Task callables must be top-level functions so the process pool can pickle them.
+Tasks signal expected failures (missing data, bad input) by raising ``JobFailed``;
+anything else is reported as an internal error.
+"""
+
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_ERROR = "error"
+TERMINAL_STATES = frozenset({JOB_DONE, JOB_ERROR})
+
+_DEFAULT_RESULT_TTL_S = 300.0
+_DEFAULT_MAX_JOBS = 256
+
+type JobTask = tuple[Callable[..., Any], tuple[Any, ...]]
+
+
+class JobFailed(Exception):
+    """Expected task failure carrying the HTTP status the API should report.
+
+    Both values are passed to ``Exception.__init__`` so the exception survives
+    the pickle round-trip out of a worker process.
+    """
+
+    def __init__(self, status_code: int, detail: str) -> None:
+        super().__init__(status_code, detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+def request_key(kind: str, payload: dict[str, Any]) -> str:
+    """Stable hash of a job request — identical requests map to the same key."""
+    blob = json.dumps({"kind": kind, "payload": payload}, sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode()).hexdigest()[:24]
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+@dataclass
+class Job:
+    """One submitted job. Mutated only under the owning JobManager's lock."""
+
+    job_id: str
+    kind: str
+    key: str
+    tasks_total: int
+    status: str = JOB_QUEUED
+    tasks_done: int = 0
+    created_ms: int = field(default_factory=_now_ms)
+    finished_ms: int | None = None
+    cached: bool = False
+    result: Any = None
+    error: str | None = None
+    error_status: int | None = None
+    version: int = 0
+    partials: list[Any] = field(default_factory=list, repr=False)
+
+    @property
+    def progress(self) -> float:
+        if self.tasks_total == 0:
+            return 1.0
+        return self.tasks_done / self.tasks_total
+
+    @property
+    def finished(self) -> bool:
+        return self.status in TERMINAL_STATES
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-safe status view (no result payload)."""
+        return {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "status": self.status,
+            "progress": round(self.progress, 4),
+            "tasks_done": self.tasks_done,
+            "tasks_total": self.tasks_total,
+            "cached": self.cached,
+            "created_ms": self.created_ms,
+            "finished_ms": self.finished_ms,
+            "error": self.error,
+        }
+
+
+def default_workers() -> int:
+    """Pool size: BUIBUI_JOB_WORKERS, else min(2, cpu_count - 1).
+
+    Kept small on purpose — the web server shares the box with signal-watch and
+    the pool must never take every core away from the request threads.
+    """
+    env = os.environ.get("BUIBUI_JOB_WORKERS")
+    if env:
+        return max(1, int(env))
+    return min(2, max(1, (os.cpu_count() or 1) - 1))
+
+
+class JobManager:
+    """Process-pool job runner with in-flight dedupe and a TTL result cache.
+
+    ``executor`` is injectable so tests can run tasks on a thread pool (where
+    monkeypatches are visible); by default a spawn-context ProcessPoolExecutor
+    is created lazily on first submit. Spawn rather than fork: the server
+    process holds uvicorn threads and DuckDB handles that must not be forked.
+    """
+
+    def __init__(
+        self,
+        executor: Executor | None = None,
+        max_workers: int | None = None,
+        result_ttl_s: float = _DEFAULT_RESULT_TTL_S,
+        max_jobs: int = _DEFAULT_MAX_JOBS,
+    ) -> None:
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._max_workers = max_workers or default_workers()
+        self._result_ttl_s = result_ttl_s
+        self._max_jobs = max_jobs
+        self._lock = threading.Lock()
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._by_key: dict[str, str] = {}
+
+    def _get_executor(self) -> Executor:
+        """The pool, rebuilt when owned and broken by a worker that died.
+
+        A broken ProcessPoolExecutor rejects every later submit. The stale pool
+        is released outside ``_lock``: its cleanup takes the pool's own shutdown
+        lock, which its management thread holds while running our callbacks.
+        """
+        stale: Executor | None = None
+        with self._lock:
+            if self._owns_executor and getattr(self._executor, "_broken", False):
+                logger.warning("Job pool broken by a dead worker; rebuilding it")
+                stale, self._executor = self._executor, None
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            executor = self._executor
+        if stale is not None:
+            stale.shutdown(wait=False, cancel_futures=True)
+        return executor
+
+    def get(self, job_id: str) -> Job | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def submit(
+        self,
+        kind: str,
+        payload: dict[str, Any],
+        tasks: Sequence[JobTask],
+        combine: Callable[[list[Any]], Any],
+    ) -> Job:
+        """Queue a job, or return the in-flight/cached job for an identical request.
+
+        ``combine`` receives the task results in submission order and runs in
+        the parent process; its return value becomes ``Job.result``.
+        """
+        key = request_key(kind, payload)
+        with self._lock:
+            existing = self._lookup(key)
+            if existing is not None:
+                return existing
+            job = Job(
+                job_id=uuid.uuid4().hex[:12],
+                kind=kind,
+                key=key,
+                tasks_total=len(tasks),
+                partials=[None] * len(tasks),
+            )
+            self._jobs[job.job_id] = job
+            self._by_key[key] = job.job_id
+            self._evict()
+
+        if not tasks:
+            self._finish(job, combine)
+            return job
+
+        executor = self._get_executor()
+        futures: list[Future[Any]] = []
+        try:
+            for idx, (fn, args) in enumerate(tasks):
+                fut = executor.submit(fn, *args)
+                futures.append(fut)
+                with self._lock:
+                    if job.status == JOB_QUEUED:
+                        job.status = JOB_RUNNING
+                        job.version += 1
+                fut.add_done_callback(partial(self._on_task_done, job, idx, combine))
+        except Exception as exc:
+            with self._lock:
+                self._fail(job, exc)
+            for fut in futures:
+                fut.cancel()
+        return job
+
+    def _lookup(self, key: str) -> Job | None:
+        """Return the live or fresh-cached job for key. Caller holds the lock."""
+        job_id = self._by_key.get(key)
+        job = self._jobs.get(job_id) if job_id is not None else None
+        if job is None:
+            return None
+        if not job.finished:
+            return job
+        fresh = (
+            job.status == JOB_DONE
+            and job.finished_ms is not None
+            and _now_ms() - job.finished_ms <= self._result_ttl_s * 1000
+        )
+        if not fresh:
+            del self._by_key[key]
+            return None
+        job.cached = True
+        return job
+
+    def _evict(self) -> None:
+        """Drop the oldest finished jobs beyond max_jobs. Caller holds the lock."""
+        if len(self._jobs) <= self._max_jobs:
+            return
+        for job_id in list(self._jobs):
+            if len(self._jobs) <= self._max_jobs:
+                break
+            old = self._jobs[job_id]
+            if not old.finished:
+                continue
+            del self._jobs[job_id]
+            if self._by_key.get(old.key) == job_id:
+                del self._by_key[old.key]
+
+    def _on_task_done(
+        self,
+        job: Job,
+        idx: int,
+        combine: Callable[[list[Any]], Any],
+        fut: Future[Any],
+    ) -> None:
+        if fut.cancelled():
+            return
+        exc = fut.exception()
+        with self._lock:
+            if job.finished:
+                return
+            if exc is not None:
+                self._fail(job, exc)
+                return
+            job.partials[idx] = fut.result()
+            job.tasks_done += 1
+            job.version += 1
+            if job.tasks_done < job.tasks_total:
+                return
+        self._finish(job, combine)
+
+    def _finish(self, job: Job, combine: Callable[[list[Any]], Any]) -> None:
+        try:
+            result = combine(job.partials)
+        except Exception as exc:
+            with self._lock:
+                self._fail(job, exc)
+            return
+        with self._lock:
+            job.result = result
+            job.partials = []
+            job.status = JOB_DONE
+            job.finished_ms = _now_ms()
+            job.version += 1
+
+    def _fail(self, job: Job, exc: BaseException) -> None:
+        """Mark job failed and release its dedupe key. Caller holds the lock."""
+        if isinstance(exc, JobFailed):
+            job.error, job.error_status = exc.detail, exc.status_code
+        else:
+            logger.error("Job %s (%s) failed", job.job_id, job.kind, exc_info=exc)
+            job.error, job.error_status = f"{type(exc).__name__}: {exc}", 500
+        job.partials = []
+        job.status = JOB_ERROR
+        job.finished_ms = _now_ms()
+        job.version += 1
+        if self._by_key.get(job.key) == job.job_id:
+            del self._by_key[job.key]
+
+    def shutdown(self) -> None:
+        """Stop the pool without waiting for queued work (server is going down)."""
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
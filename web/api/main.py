@@ -14,11 +14,14 @@ from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 
 from analytics.data_store import DEFAULT_DB_PATH, init_schema
+from monitor.position_state import create_position_feed
 from utils.binance_client import create_client
+from web.api.jobs import JobManager
 from web.api.routers import (
     backtest,
     config,
     fib,
+    jobs,
     live_outcomes,
     ohlcv,
     positions,
@@ -77,7 +80,7 @@ def _load_active_config(config_path: str) -> None:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
-    """Open DB (brief RW for schema, then read-only) and Binance client on startup."""
+    """Open DB (brief RW for schema, then read-only), Binance client, position feed and job pool on startup."""
     # Brief RW open to ensure schema is initialised. Skip gracefully if the
     # signal-watch daemon already holds the write lock (schema must exist).
     try:
@@ -91,10 +94,19 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     app.state.config_name = None
     app.state.active_config = None
 
+    # User-data stream position state; None means positions poll REST instead.
+    app.state.position_feed = create_position_feed(app.state.binance_client)
+    app.state.job_manager = JobManager()
+
     config_path = os.environ.get("BUIBUI_CONFIG")
     if config_path:
         _load_active_config(config_path)
-    yield
+    try:
+        yield
+    finally:
+        app.state.job_manager.shutdown()
+        if app.state.position_feed is not None:
+            app.state.position_feed.stop()
 
 
 app = FastAPI(title="Buibui Web API", version="1.0.0", lifespan=lifespan)
@@ -124,6 +136,7 @@ for module in (
     stream,
     zones,
     live_outcomes,
+    jobs,
 ):
     app.include_router(module.router, prefix="/api")
 
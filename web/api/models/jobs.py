@@ -0,0 +1,16 @@
+"""Pydantic models for the background job endpoints."""
+
+from pydantic import BaseModel
+
+
+class JobStatusResponse(BaseModel):
+    job_id: str
+    kind: str
+    status: str
+    progress: float
+    tasks_done: int
+    tasks_total: int
+    cached: bool
+    created_ms: int
+    finished_ms: int | None = None
+    error: str | None = None
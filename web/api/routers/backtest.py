@@ -1,10 +1,10 @@
-"""Backtest router — POST /api/backtest."""
+"""Backtest router — POST /api/backtest, POST /api/jobs/backtest, runs and analysis."""
 
 import datetime
 from typing import Any
 
 import duckdb
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
 from analytics.backtest_lib import BacktestResult, run_backtest
 from analytics.backtest_runner import detect_signals_for_strategy
@@ -17,13 +17,15 @@ from analytics.data_store import (
 from analytics.digest_lib import QUERY_NAMES, DigestScope, run_digest
 from analytics.strategies import KNOWN_STRATEGIES
 from utils.binance_client import load_coins_config
-from web.api.deps import get_db, require_token
+from web.api.deps import get_db, get_job_manager, require_token
+from web.api.jobs import JobFailed, JobManager
 from web.api.models.backtest import (
     BacktestRequest,
     BacktestResponse,
     BacktestRunSummary,
-    TradeModel,
 )
+from web.api.models.jobs import JobStatusResponse
+from web.api.serialize import json_bytes, json_response, trade_rows
 
 router = APIRouter(dependencies=[Depends(require_token)])
 
@@ -57,35 +59,36 @@ def _resolve_smt_secondary(body: BacktestRequest) -> str:
     return secondary
 
 
-def _result_to_response(result: BacktestResult) -> BacktestResponse:
-    """BacktestResult uses cached_property, so build the response explicitly."""
-    return BacktestResponse(
-        symbol=result.symbol,
-        timeframe=result.timeframe,
-        strategy=result.strategy,
-        total_trades=len(result.trades),
-        closed_trades=len(result.closed_trades),
-        win_count=result.win_count,
-        loss_count=result.loss_count,
-        win_rate=result.win_rate,
-        avg_r=result.avg_r,
-        total_r=result.total_r,
-        max_drawdown_r=result.max_drawdown_r,
-        recovery_factor=result.recovery_factor,
-        long_closed_trades=len(result.long_closed_trades),
-        long_win_count=result.long_win_count,
-        long_win_rate=result.long_win_rate,
-        long_avg_r=result.long_avg_r,
-        long_total_r=result.long_total_r,
-        short_closed_trades=len(result.short_closed_trades),
-        short_win_count=result.short_win_count,
-        short_win_rate=result.short_win_rate,
-        short_avg_r=result.short_avg_r,
-        short_total_r=result.short_total_r,
-        trades=[
-            TradeModel.model_validate(t, from_attributes=True) for t in result.trades
-        ],
-    )
+def _result_to_payload(result: BacktestResult) -> dict[str, Any]:
+    """BacktestResponse-shaped dict; BacktestResult uses cached_property, so build explicitly.
+
+    Trades go through the bulk serializer instead of one TradeModel per trade.
+    """
+    return {
+        "symbol": result.symbol,
+        "timeframe": result.timeframe,
+        "strategy": result.strategy,
+        "total_trades": len(result.trades),
+        "closed_trades": len(result.closed_trades),
+        "win_count": result.win_count,
+        "loss_count": result.loss_count,
+        "win_rate": result.win_rate,
+        "avg_r": result.avg_r,
+        "total_r": result.total_r,
+        "max_drawdown_r": result.max_drawdown_r,
+        "recovery_factor": result.recovery_factor,
+        "long_closed_trades": len(result.long_closed_trades),
+        "long_win_count": result.long_win_count,
+        "long_win_rate": result.long_win_rate,
+        "long_avg_r": result.long_avg_r,
+        "long_total_r": result.long_total_r,
+        "short_closed_trades": len(result.short_closed_trades),
+        "short_win_count": result.short_win_count,
+        "short_win_rate": result.short_win_rate,
+        "short_avg_r": result.short_avg_r,
+        "short_total_r": result.short_total_r,
+        "trades": trade_rows(result.trades),
+    }
 
 
 @router.get("/backtest/runs", response_model=list[BacktestRunSummary])
@@ -131,18 +134,22 @@ def get_backtest_analysis(
     return run_digest(db, query, min_trades=min_trades, top_n=top_n, scope=scope)
 
 
-@router.post("/backtest", response_model=BacktestResponse)
-def run_backtest_endpoint(
-    body: BacktestRequest,
-    db: duckdb.DuckDBPyConnection = Depends(get_db),
-) -> BacktestResponse:
-    """Run a backtest for a symbol/timeframe/strategy combination."""
+def _validate_backtest_request(body: BacktestRequest) -> str | None:
+    """Reject unsupported strategies; return the SMT secondary symbol if needed."""
     if body.strategy not in KNOWN_STRATEGIES or body.strategy == "seasonality":
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail=f"Unknown or unsupported strategy '{body.strategy}'.",
         )
+    return _resolve_smt_secondary(body) if body.strategy == "smt_divergence" else None
 
+
+def _compute_backtest(
+    db: duckdb.DuckDBPyConnection,
+    body: BacktestRequest,
+    secondary_symbol: str | None,
+) -> tuple[BacktestResult, int, int]:
+    """Load OHLCV, detect signals and run the backtest. Returns (result, start_ms, end_ms)."""
     start_ms, end_ms = _resolve_window_ms(body)
     ohlcv = get_ohlcv(db, body.symbol, body.timeframe, start_ms, end_ms)
     if ohlcv.empty:
@@ -151,10 +158,6 @@ def run_backtest_endpoint(
             detail=f"No OHLCV data for {body.symbol} {body.timeframe}. Run 'analytics backfill' first.",
         )
 
-    secondary_symbol = (
-        _resolve_smt_secondary(body) if body.strategy == "smt_divergence" else None
-    )
-
     signals = detect_signals_for_strategy(
         db,
         ohlcv,
@@ -181,7 +184,17 @@ def run_backtest_endpoint(
         body.tp_r,
         body.fee_pct,
     )
+    return result, start_ms, end_ms
 
+
+def _persist_backtest(
+    db: duckdb.DuckDBPyConnection,
+    body: BacktestRequest,
+    result: BacktestResult,
+    start_ms: int,
+    end_ms: int,
+    secondary_symbol: str | None,
+) -> None:
     run_id = upsert_backtest_run(
         db,
         result,
@@ -197,4 +210,65 @@ def run_backtest_endpoint(
         volume_suppress=None,
     )
     upsert_backtest_trades(db, result, run_id)
-    return _result_to_response(result)
+
+
+def backtest_job_task(
+    db_path: str, body_data: dict[str, Any], secondary_symbol: str | None
+) -> bytes:
+    """Job-queue worker: run one backtest in a pool process and return the response JSON.
+
+    Computes on a read-only connection, then persists through a brief RW open —
+    skipped when signal-watch holds the write lock, same as the server lifespan.
+    """
+    body = BacktestRequest.model_validate(body_data)
+    with duckdb.connect(db_path, read_only=True) as ro_conn:
+        try:
+            result, start_ms, end_ms = _compute_backtest(
+                ro_conn, body, secondary_symbol
+            )
+        except HTTPException as exc:
+            raise JobFailed(exc.status_code, str(exc.detail)) from None
+    try:
+        with duckdb.connect(db_path) as rw_conn:
+            _persist_backtest(rw_conn, body, result, start_ms, end_ms, secondary_symbol)
+    except duckdb.IOException:
+        pass
+    return json_bytes(_result_to_payload(result))
+
+
+def _first_result(results: list[Any]) -> Any:
+    return results[0]
+
+
+@router.post("/backtest", response_model=BacktestResponse)
+def run_backtest_endpoint(
+    body: BacktestRequest,
+    db: duckdb.DuckDBPyConnection = Depends(get_db),
+) -> Response:
+    """Run a backtest for a symbol/timeframe/strategy combination."""
+    secondary_symbol = _validate_backtest_request(body)
+    result, start_ms, end_ms = _compute_backtest(db, body, secondary_symbol)
+    _persist_backtest(db, body, result, start_ms, end_ms, secondary_symbol)
+    return json_response(_result_to_payload(result))
+
+
+@router.post(
+    "/jobs/backtest",
+    response_model=JobStatusResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def submit_backtest_job(
+    body: BacktestRequest,
+    request: Request,
+    jobs: JobManager = Depends(get_job_manager),
+) -> JobStatusResponse:
+    """Queue a backtest on the job pool; poll /api/jobs/{id} or stream its progress."""
+    secondary_symbol = _validate_backtest_request(body)
+    payload = body.model_dump()
+    job = jobs.submit(
+        "backtest",
+        payload,
+        [(backtest_job_task, (request.app.state.db_path, payload, secondary_symbol))],
+        _first_result,
+    )
+    return JobStatusResponse.model_validate(job.snapshot())
@@ -0,0 +1,93 @@
+"""Jobs router — GET /api/jobs/{id}, /api/jobs/{id}/result, /api/stream/jobs/{id}.
+
+Jobs are submitted by the owning routers (POST /api/jobs/backtest,
+POST /api/jobs/signals); this router only reports on them.
+"""
+
+import asyncio
+import json
+from collections.abc import AsyncGenerator
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import Response, StreamingResponse
+
+from web.api.deps import get_job_manager, require_token, require_token_sse
+from web.api.jobs import JOB_DONE, Job, JobManager
+from web.api.models.jobs import JobStatusResponse
+from web.api.serialize import json_response
+
+router = APIRouter()
+
+_STREAM_POLL_S = 0.5
+
+
+def _require_job(jobs: JobManager, job_id: str) -> Job:
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown job '{job_id}'.",
+        )
+    return job
+
+
+async def _job_event_generator(job: Job) -> AsyncGenerator[str]:
+    """Yield an SSE status frame on every job change; stop after the terminal frame."""
+    last_version = -1
+    try:
+        while True:
+            version, snapshot, finished = job.version, job.snapshot(), job.finished
+            if version != last_version:
+                last_version = version
+                yield f"data: {json.dumps(snapshot)}\n\n"
+            if finished:
+                return
+            await asyncio.sleep(_STREAM_POLL_S)
+    except asyncio.CancelledError:
+        return
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=JobStatusResponse,
+    dependencies=[Depends(require_token)],
+)
+def get_job(
+    job_id: str, jobs: JobManager = Depends(get_job_manager)
+) -> JobStatusResponse:
+    """Return the job's status and progress."""
+    return JobStatusResponse.model_validate(_require_job(jobs, job_id).snapshot())
+
+
+@router.get("/jobs/{job_id}/result", dependencies=[Depends(require_token)])
+def get_job_result(
+    job_id: str, jobs: JobManager = Depends(get_job_manager)
+) -> Response:
+    """Return the finished job's result (same body as the synchronous endpoint).
+
+    409 while the job is still running; a failed job re-raises its original
+    HTTP status and detail.
+    """
+    job = _require_job(jobs, job_id)
+    if job.status == JOB_DONE:
+        return json_response(job.result)
+    if job.error is not None:
+        raise HTTPException(
+            status_code=job.error_status or status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=job.error,
+        )
+    raise HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail=f"Job '{job_id}' is still {job.status}.",
+    )
+
+
+@router.get("/stream/jobs/{job_id}", dependencies=[Depends(require_token_sse)])
+def stream_job(
+    job_id: str, jobs: JobManager = Depends(get_job_manager)
+) -> StreamingResponse:
+    """Stream job status/progress as Server-Sent Events until it finishes."""
+    return StreamingResponse(
+        _job_event_generator(_require_job(jobs, job_id)),
+        media_type="text/event-stream",
+    )
@@ -6,9 +6,10 @@ from typing import Any
 from binance.client import Client
 from fastapi import APIRouter, Depends, HTTPException, status
 
-from monitor.position_lib import fetch_open_positions
+from monitor.position_lib import PositionSnapshot, fetch_open_positions
+from monitor.position_state import PositionFeed
 from utils.binance_client import load_coins_config
-from web.api.deps import get_client, require_token
+from web.api.deps import get_client, get_position_feed, require_token
 from web.api.models.positions import PositionRow, PositionsResponse
 
 router = APIRouter(dependencies=[Depends(require_token)])
@@ -83,8 +84,25 @@ def row_to_position(row: Any) -> PositionRow:
     )
 
 
+def current_positions(
+    feed: PositionFeed | None,
+    client: Client,
+    coins: dict[str, Any],
+    hide_empty: bool = False,
+) -> PositionSnapshot:
+    """Read positions from the stream state when live, else fetch them over REST."""
+    if feed is not None and feed.live:
+        return feed.snapshot(coins, list(coins.keys()), hide_empty=hide_empty)
+    return fetch_open_positions(
+        client, coins, list(coins.keys()), hide_empty=hide_empty
+    )
+
+
 @router.get("/positions", response_model=PositionsResponse)
-def get_positions(client: Client = Depends(get_client)) -> PositionsResponse:
+def get_positions(
+    client: Client = Depends(get_client),
+    feed: PositionFeed | None = Depends(get_position_feed),
+) -> PositionsResponse:
     """Fetch and return open futures positions."""
     try:
         coins = load_coins_config()
@@ -96,7 +114,7 @@ def get_positions(client: Client = Depends(get_client)) -> PositionsResponse:
 
     try:
         rows, total_risk_usd, wallet_balance, unrealized_pnl, available_balance = (
-            fetch_open_positions(client, coins, list(coins.keys()), hide_empty=True)
+            current_positions(feed, client, coins, hide_empty=True)
         )
     except RuntimeError as exc:
         raise HTTPException(
@@ -1,51 +1,132 @@
-"""Signals router — POST /api/signals and GET /api/signals/history."""
+"""Signals router — POST /api/signals, POST /api/jobs/signals and GET /api/signals/history."""
 
-import math
 from typing import Any
 
 import duckdb
 import pandas as pd
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
 from analytics.backtest_runner import detect_signals_for_strategy
 from analytics.data_store import get_ohlcv, get_signals_history
 from analytics.strategies import KNOWN_STRATEGIES, STRATEGY_REGISTRY
 from utils.binance_client import load_coins_config
-from web.api.deps import get_db, require_token
-from web.api.models.signals import SignalRow, SignalsRequest, SignalsResponse
+from web.api.deps import get_db, get_job_manager, require_token
+from web.api.jobs import JobFailed, JobManager
+from web.api.models.jobs import JobStatusResponse
+from web.api.models.signals import SignalsRequest, SignalsResponse
+from web.api.serialize import json_bytes, json_response, signal_rows
 
 router = APIRouter(dependencies=[Depends(require_token)])
 
 
-def _float_or_none(val: Any) -> float | None:
-    """Coerce a value to float, returning None for None/NaN."""
-    if val is None:
-        return None
+def _validate_strategies(strategies: list[str]) -> None:
+    for strat in strategies:
+        if strat not in KNOWN_STRATEGIES or strat == "seasonality":
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Unknown or unsupported strategy '{strat}'.",
+            )
+
+
+def _smt_secondary(symbol: str) -> str | None:
     try:
-        f = float(val)
-    except (TypeError, ValueError):
+        coins = load_coins_config()
+    except Exception:
+        coins = {}
+    secondary: str | None = coins.get(symbol, {}).get("smt_secondary")
+    return secondary
+
+
+def _runnable_strategies(body: SignalsRequest) -> list[tuple[str, str | None]]:
+    """Pair each strategy with its secondary symbol, dropping SMT when none is configured."""
+    secondary = (
+        _smt_secondary(body.symbol) if "smt_divergence" in body.strategies else None
+    )
+    runnable: list[tuple[str, str | None]] = []
+    for strat in body.strategies:
+        if strat == "smt_divergence":
+            if secondary is None:
+                continue  # skip silently — no secondary configured
+            runnable.append((strat, secondary))
+        else:
+            runnable.append((strat, None))
+    return runnable
+
+
+def _detect_one(
+    db: duckdb.DuckDBPyConnection,
+    ohlcv: pd.DataFrame,
+    body: SignalsRequest,
+    strat: str,
+    secondary_symbol: str | None,
+) -> pd.DataFrame | None:
+    """Run one detector and attach the strategy/confidence/default columns."""
+    signals_df = detect_signals_for_strategy(
+        db,
+        ohlcv,
+        body.symbol,
+        body.timeframe,
+        strat,
+        body.start_ms,
+        body.end_ms,
+        secondary_symbol,
+    )
+    if signals_df is None or signals_df.empty:
         return None
-    return None if math.isnan(f) else f
+
+    signals_df = signals_df.copy()
+    signals_df["strategy"] = strat
+    spec = STRATEGY_REGISTRY.get(strat)
+    signals_df["confidence"] = spec.get_confidence(body.timeframe) if spec else 3
+    for col, default in (
+        ("reason", strat),
+        ("context", ""),
+        ("sl_price", 0.0),
+        ("entry_price", None),
+    ):
+        if col not in signals_df.columns:
+            signals_df[col] = default
+    return signals_df
+
+
+def _merge_signals(frames: list[pd.DataFrame | None]) -> dict[str, Any]:
+    """SignalsResponse-shaped payload from per-strategy frames, sorted by open_time."""
+    all_signals = [f for f in frames if f is not None]
+    if not all_signals:
+        return {"signals": []}
+    merged = pd.concat(all_signals, ignore_index=True).sort_values("open_time")
+    return {"signals": signal_rows(merged)}
+
+
+def signals_job_task(
+    db_path: str,
+    body_data: dict[str, Any],
+    strat: str,
+    secondary_symbol: str | None,
+) -> pd.DataFrame | None:
+    """Job-queue worker: detect one strategy in a pool process."""
+    body = SignalsRequest.model_validate(body_data)
+    with duckdb.connect(db_path, read_only=True) as conn:
+        ohlcv = get_ohlcv(conn, body.symbol, body.timeframe, body.start_ms, body.end_ms)
+        if ohlcv.empty:
+            raise JobFailed(
+                status.HTTP_404_NOT_FOUND,
+                f"No OHLCV data for {body.symbol} {body.timeframe}.",
+            )
+        return _detect_one(conn, ohlcv, body, strat, secondary_symbol)
 
 
-def _confidence_or_default(val: Any) -> int:
-    """Coerce confidence to int, defaulting to 3 for None/NaN/non-numeric."""
-    f = _float_or_none(val)
-    return 3 if f is None else int(f)
+def _merge_signals_job(frames: list[pd.DataFrame | None]) -> bytes:
+    return json_bytes(_merge_signals(frames))
 
 
 @router.post("/signals", response_model=SignalsResponse)
 def run_signals(
     body: SignalsRequest,
     db: duckdb.DuckDBPyConnection = Depends(get_db),
-) -> SignalsResponse:
+) -> Response:
     """Run one or more signal detectors on historical OHLCV data."""
-    for strat in body.strategies:
-        if strat not in KNOWN_STRATEGIES or strat == "seasonality":
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail=f"Unknown or unsupported strategy '{strat}'.",
-            )
+    _validate_strategies(body.strategies)
 
     ohlcv = get_ohlcv(db, body.symbol, body.timeframe, body.start_ms, body.end_ms)
     if ohlcv.empty:
@@ -54,66 +135,40 @@ def run_signals(
             detail=f"No OHLCV data for {body.symbol} {body.timeframe}.",
         )
 
-    try:
-        coins = load_coins_config()
-    except Exception:
-        coins = {}
-
-    all_signals: list[pd.DataFrame] = []
-    for strat in body.strategies:
-        secondary_symbol: str | None = None
-        if strat == "smt_divergence":
-            secondary_symbol = coins.get(body.symbol, {}).get("smt_secondary")
-            if secondary_symbol is None:
-                continue  # skip silently — no secondary configured
-
-        signals_df = detect_signals_for_strategy(
-            db,
-            ohlcv,
-            body.symbol,
-            body.timeframe,
-            strat,
-            body.start_ms,
-            body.end_ms,
-            secondary_symbol,
+    return json_response(
+        _merge_signals(
+            [
+                _detect_one(db, ohlcv, body, strat, secondary)
+                for strat, secondary in _runnable_strategies(body)
+            ]
         )
-        if signals_df is None or signals_df.empty:
-            continue
-
-        signals_df = signals_df.copy()
-        signals_df["strategy"] = strat
-        spec = STRATEGY_REGISTRY.get(strat)
-        signals_df["confidence"] = spec.get_confidence(body.timeframe) if spec else 3
-        for col, default in (
-            ("reason", strat),
-            ("context", ""),
-            ("sl_price", 0.0),
-            ("entry_price", None),
-        ):
-            if col not in signals_df.columns:
-                signals_df[col] = default
-
-        all_signals.append(signals_df)
+    )
 
-    if not all_signals:
-        return SignalsResponse(signals=[])
 
-    merged = pd.concat(all_signals, ignore_index=True).sort_values("open_time")
-
-    rows = [
-        SignalRow(
-            open_time=int(sig["open_time"]),
-            direction=str(sig["direction"]),
-            strategy=str(sig["strategy"]),
-            reason=str(sig.get("reason", sig["strategy"])),
-            sl_price=float(sig.get("sl_price", 0.0)),
-            entry_price=_float_or_none(sig.get("entry_price")),
-            confidence=_confidence_or_default(sig.get("confidence")),
-            context=str(sig.get("context", "")),
-        )
-        for _, sig in merged.iterrows()
-    ]
-    return SignalsResponse(signals=rows)
+@router.post(
+    "/jobs/signals",
+    response_model=JobStatusResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def submit_signals_job(
+    body: SignalsRequest,
+    request: Request,
+    jobs: JobManager = Depends(get_job_manager),
+) -> JobStatusResponse:
+    """Queue a signal scan on the job pool — one task per strategy."""
+    _validate_strategies(body.strategies)
+    payload = body.model_dump()
+    db_path: str = request.app.state.db_path
+    job = jobs.submit(
+        "signals",
+        payload,
+        [
+            (signals_job_task, (db_path, payload, strat, secondary))
+            for strat, secondary in _runnable_strategies(body)
+        ],
+        _merge_signals_job,
+    )
+    return JobStatusResponse.model_validate(job.snapshot())
 
 
 @router.get("/signals/history", response_model=SignalsResponse)
@@ -123,29 +178,14 @@ def get_signals_history_endpoint(
     start_ms: int = Query(...),
     end_ms: int = Query(...),
     db: duckdb.DuckDBPyConnection = Depends(get_db),
-) -> SignalsResponse:
+) -> Response:
     """Return persisted signals from DB for a given symbol/timeframe window.
 
     Reads from the signals table populated by the signal-watch daemon.
-    No live scan is performed — returns instantly from DB.
+    No live scan is performed — returns instantly from DB. The persisted
+    rows carry no context, so it is always "".
     """
     df = get_signals_history(db, symbol, timeframe, start_ms, end_ms)
-    if df.empty:
-        return SignalsResponse(signals=[])
-
-    rows = [
-        SignalRow(
-            open_time=int(sig["open_time"]),
-            direction=str(sig["direction"]),
-            strategy=str(sig["strategy"]),
-            reason=str(sig["reason"])
-            if sig["reason"] is not None
-            else str(sig["strategy"]),
-            sl_price=float(sig["sl_price"]) if sig["sl_price"] is not None else 0.0,
-            entry_price=_float_or_none(sig.get("entry_price")),
-            confidence=int(sig["confidence"]) if sig["confidence"] is not None else 3,
-            context="",
-        )
-        for _, sig in df.iterrows()
-    ]
-    return SignalsResponse(signals=rows)
+    return json_response(
+        {"signals": signal_rows(df.drop(columns="context", errors="ignore"))}
+    )
@@ -11,9 +11,9 @@ from analytics.stats_lib import (
     WeeklyCurrentState,
     WeeklyWickPercentile,
     compute_all,
-    compute_daily_distance,
-    compute_weekly_current_state,
-    compute_weekly_wick_percentile,
+    live_daily_distance,
+    live_weekly_current_state,
+    live_weekly_wick_percentile,
 )
 from web.api.deps import get_db, require_token
 from web.api.models.stats import (
@@ -179,7 +179,7 @@ def get_stats(
         try:
             response = StatsResponse.model_validate_json(cached)
             # Still inject live fields even on cache hit
-            _inject_live_fields(db, symbol, days, response)
+            _inject_live_fields(db, symbol, days, date_str, response)
             return response
         except Exception:
             pass  # corrupted cache — fall through to recompute
@@ -204,7 +204,7 @@ def get_stats(
     except Exception:
         pass  # never fail the response due to cache write failure
 
-    _inject_live_fields(db, symbol, days, response)
+    _inject_live_fields(db, symbol, days, date_str, response)
     return response
 
 
@@ -212,14 +212,20 @@ def _inject_live_fields(
     db: duckdb.DuckDBPyConnection,
     symbol: str,
     days: int,
+    date_str: str,
     response: StatsResponse,
 ) -> None:
-    """Inject live (never-cached) fields into a StatsResponse in-place."""
+    """Inject live fields into a StatsResponse in-place.
+
+    The historical distributions behind them are cached per MYT date
+    (analytics.stats.live_fields); only the current day/week position is
+    queried per request.
+    """
     adr_14 = response.adr.adr_14
 
     # Weekly current state
     try:
-        wcs = compute_weekly_current_state(db, symbol, adr_14, days)
+        wcs = live_weekly_current_state(db, symbol, adr_14, days, date_str)
         if wcs is not None:
             response.weekly_current_state = _wcs_to_response(wcs)
     except Exception:
@@ -227,7 +233,7 @@ def _inject_live_fields(
 
     # Daily distance — empirical CDF for today's move vs history
     try:
-        dd = compute_daily_distance(db, symbol, adr_14, days)
+        dd = live_daily_distance(db, symbol, adr_14, days, date_str)
         if dd is not None:
             response.daily_distance = DailyDistanceResponse(
                 exceedance_pct=dd.exceedance_pct,
@@ -240,7 +246,7 @@ def _inject_live_fields(
 
     # Weekly P1 wick percentile — current week's wick rank vs history
     try:
-        wwp = compute_weekly_wick_percentile(db, symbol, adr_14, days)
+        wwp = live_weekly_wick_percentile(db, symbol, adr_14, days, date_str)
         response.weekly_wick_percentile = _wwp_to_response(wwp)
     except Exception:
         pass
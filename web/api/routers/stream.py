@@ -9,17 +9,19 @@ from binance.client import Client
 from fastapi import APIRouter, Depends
 from fastapi.responses import StreamingResponse
 
-from monitor.position_lib import fetch_open_positions
+from monitor.position_state import PositionFeed
 from monitor.price_lib import get_price_changes
 from utils.binance_client import load_coins_config
-from web.api.deps import get_client, require_token_sse
+from web.api.deps import get_client, get_position_feed, require_token_sse
 from web.api.models.positions import PositionsResponse
-from web.api.routers.positions import row_to_position
+from web.api.routers.positions import current_positions, row_to_position
 
 router = APIRouter()
 
 _PRICE_INTERVAL_S = 5
 _POSITIONS_INTERVAL_S = 10
+# Change-check cadence while positions come from the user-data stream state.
+_POSITIONS_LIVE_POLL_S = 1
 
 
 def _safe_load_symbols() -> tuple[list[str], dict[str, Any]]:
@@ -59,23 +61,31 @@ async def _price_event_generator(client: Client) -> AsyncGenerator[str]:
         return
 
 
-async def _positions_event_generator(client: Client) -> AsyncGenerator[str]:
-    """Yield SSE position events every 10 seconds."""
+async def _positions_event_generator(
+    client: Client, feed: PositionFeed | None = None
+) -> AsyncGenerator[str]:
+    """Yield SSE position events.
+
+    With a live user-data stream feed, an event goes out whenever the in-memory
+    state changes (checked every second, no REST calls). Otherwise positions
+    are fetched over REST every 10 seconds.
+    """
     loop = asyncio.get_running_loop()
+    last_version = -1
     try:
         while True:
-            symbols, coins = _safe_load_symbols()
-            if coins:
+            live = feed if feed is not None and feed.live else None
+            _, coins = _safe_load_symbols()
+            if coins and (live is None or live.version != last_version):
                 try:
-                    (
-                        rows,
-                        total_risk_usd,
-                        wallet,
-                        unrealized,
-                        available,
-                    ) = await loop.run_in_executor(
-                        None, fetch_open_positions, client, coins, symbols
-                    )
+                    if live is not None:
+                        last_version = live.version
+                        snapshot = current_positions(live, client, coins)
+                    else:
+                        snapshot = await loop.run_in_executor(
+                            None, current_positions, None, client, coins
+                        )
+                    rows, total_risk_usd, wallet, unrealized, available = snapshot
                     payload = PositionsResponse(
                         positions=[row_to_position(row) for row in rows],
                         wallet_balance=wallet,
@@ -86,7 +96,9 @@ async def _positions_event_generator(client: Client) -> AsyncGenerator[str]:
                     yield f"data: {json.dumps(payload)}\n\n"
                 except Exception:
                     pass
-            await asyncio.sleep(_POSITIONS_INTERVAL_S)
+            await asyncio.sleep(
+                _POSITIONS_LIVE_POLL_S if live is not None else _POSITIONS_INTERVAL_S
+            )
     except asyncio.CancelledError:
         return
 
@@ -101,9 +113,12 @@ def stream_prices(client: Client = Depends(get_client)) -> StreamingResponse:
 
 
 @router.get("/stream/positions", dependencies=[Depends(require_token_sse)])
-def stream_positions(client: Client = Depends(get_client)) -> StreamingResponse:
-    """Stream live position data as Server-Sent Events (every 10s)."""
+def stream_positions(
+    client: Client = Depends(get_client),
+    feed: PositionFeed | None = Depends(get_position_feed),
+) -> StreamingResponse:
+    """Stream live position data as Server-Sent Events (on change, or every 10s)."""
     return StreamingResponse(
-        _positions_event_generator(client),
+        _positions_event_generator(client, feed),
         media_type="text/event-stream",
     )
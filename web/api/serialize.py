@@ -0,0 +1,157 @@
+"""Bulk JSON serialization for large list responses (signals, backtest trades).
+
+Building thousands of per-row Pydantic models from ``df.iterrows()`` costs
+hundreds of milliseconds: every row allocates a Series, runs scalar coercions
+and then a full model validation — on data the server produced itself.
+
+Here coercion happens once per column with pandas/NumPy, rows are zipped into
+plain dicts and the whole payload is encoded by the C json encoder in one call.
+Handlers return ``json_response(...)`` directly, which FastAPI passes through
+without re-validating against ``response_model`` (that model still documents
+the schema in OpenAPI).
+
+The stdlib encoder is used rather than ``DataFrame.to_json`` because the latter
+rounds floats (``double_precision``) — unacceptable for sub-cent coin prices.
+"""
+
+import json
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from fastapi import Response
+
+from analytics.backtest_lib import Trade
+
+
+def json_bytes(payload: Any) -> bytes:
+    """Encode payload compactly, matching FastAPI's JSONResponse output."""
+    return json.dumps(
+        payload, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def json_response(payload: Any) -> Response:
+    """Wrap an already-JSON-safe payload (or pre-encoded bytes) in a Response."""
+    content = payload if isinstance(payload, bytes) else json_bytes(payload)
+    return Response(content=content, media_type="application/json")
+
+
+def nullable_floats(values: Any) -> list[float | None]:
+    """Coerce to float, mapping None/NaN/non-numeric to None."""
+    arr = pd.to_numeric(pd.Series(values, dtype=object), errors="coerce").to_numpy(
+        dtype=np.float64
+    )
+    out: list[float | None] = arr.tolist()
+    for i in np.flatnonzero(np.isnan(arr)).tolist():
+        out[i] = None
+    return out
+
+
+def records(columns: Mapping[str, Sequence[Any]]) -> list[dict[str, Any]]:
+    """Zip equal-length column lists into row dicts."""
+    names = list(columns)
+    return [
+        dict(zip(names, row, strict=True))
+        for row in zip(*columns.values(), strict=True)
+    ]
+
+
+def _str_column(df: pd.DataFrame, col: str, fallback: pd.Series | str) -> list[str]:
+    if col not in df.columns:
+        series = (
+            fallback
+            if isinstance(fallback, pd.Series)
+            else pd.Series(fallback, df.index)
+        )
+    else:
+        series = df[col].where(df[col].notna(), fallback)
+    values: list[str] = series.astype(str).tolist()
+    return values
+
+
+def _float_column(df: pd.DataFrame, col: str, default: float) -> list[float]:
+    if col not in df.columns:
+        return [default] * len(df)
+    arr = pd.to_numeric(df[col], errors="coerce").fillna(default)
+    values: list[float] = arr.astype(np.float64).tolist()
+    return values
+
+
+def signal_rows(df: pd.DataFrame) -> list[dict[str, Any]]:
+    """SignalRow-shaped dicts from a signals DataFrame, one pass per column.
+
+    Missing/null reason falls back to the strategy name, sl_price to 0.0,
+    confidence to 3 and context to "" — the same defaults SignalRow callers
+    applied row by row.
+    """
+    if df.empty:
+        return []
+    strategy = df["strategy"].astype(str)
+    confidence = (
+        pd.to_numeric(df["confidence"], errors="coerce").fillna(3)
+        if "confidence" in df.columns
+        else pd.Series(3, df.index)
+    )
+    return records(
+        {
+            "open_time": df["open_time"].astype(np.int64).tolist(),
+            "direction": df["direction"].astype(str).tolist(),
+            "strategy": strategy.tolist(),
+            "reason": _str_column(df, "reason", strategy),
+            "sl_price": _float_column(df, "sl_price", 0.0),
+            "entry_price": nullable_floats(df["entry_price"])
+            if "entry_price" in df.columns
+            else [None] * len(df),
+            "confidence": confidence.astype(np.int64).tolist(),
+            "context": _str_column(df, "context", ""),
+        }
+    )
+
+
+def trade_rows(trades: Sequence[Trade]) -> list[dict[str, Any]]:
+    """TradeModel-shaped dicts for a trade list, with pnl_r computed column-wise.
+
+    pnl_r replicates ``Trade.pnl_r`` element-wise in float64 (same operation
+    order, so results are bit-identical): None while open or when risk is zero.
+    """
+    n = len(trades)
+    if n == 0:
+        return []
+    entry = np.fromiter((t.entry_price for t in trades), np.float64, n)
+    sl = np.fromiter((t.sl_price for t in trades), np.float64, n)
+    exit_arr = np.fromiter(
+        (np.nan if t.exit_price is None else t.exit_price for t in trades),
+        np.float64,
+        n,
+    )
+    is_long = np.fromiter((t.direction == "long" for t in trades), bool, n)
+    fee = np.fromiter((t.fee_pct for t in trades), np.float64, n)
+    slip = np.fromiter((t.slippage_pct for t in trades), np.float64, n)
+    funding = np.fromiter((t.funding_r for t in trades), np.float64, n)
+
+    risk = np.abs(entry - sl)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        raw_r = np.where(is_long, exit_arr - entry, entry - exit_arr) / risk
+        pnl = raw_r - 2.0 * fee * entry / risk - 2.0 * slip * entry / risk - funding
+    pnl_r: list[float | None] = pnl.tolist()
+    for i in np.flatnonzero(np.isnan(exit_arr) | (risk == 0.0)).tolist():
+        pnl_r[i] = None
+
+    return records(
+        {
+            "signal_time": [int(t.signal_time) for t in trades],
+            "entry_time": [int(t.entry_time) for t in trades],
+            "entry_price": entry.tolist(),
+            "direction": [t.direction for t in trades],
+            "sl_price": sl.tolist(),
+            "tp_price": [float(t.tp_price) for t in trades],
+            "exit_time": [
+                None if t.exit_time is None else int(t.exit_time) for t in trades
+            ],
+            "exit_price": nullable_floats(exit_arr),
+            "outcome": [t.outcome for t in trades],
+            "pnl_r": pnl_r,
+        }
+    )
@@ -251,6 +251,60 @@ export async function apiFetch<T>(
   return res.json() as Promise<T>;
 }
 
+// ── Background jobs ───────────────────────────────────────────────────────────
+
+export interface JobStatus {
+  job_id: string;
+  kind: string;
+  status: "queued" | "running" | "done" | "error";
+  progress: number; // 0..1
+  tasks_done: number;
+  tasks_total: number;
+  cached: boolean;
+  created_ms: number;
+  finished_ms: number | null;
+  error: string | null;
+}
+
+export const getJob = (jobId: string) => apiFetch<JobStatus>(`/api/jobs/${jobId}`);
+
+export const getJobResult = <T>(jobId: string) =>
+  apiFetch<T>(`/api/jobs/${jobId}/result`);
+
+// Submit a job, follow its SSE progress stream, then fetch the result.
+// Identical in-flight requests share one job; finished ones come back cached.
+export async function runJob<T>(
+  submitPath: string,
+  params: unknown,
+  onProgress?: (status: JobStatus) => void
+): Promise<T> {
+  const job = await apiFetch<JobStatus>(submitPath, {
+    method: "POST",
+    body: JSON.stringify(params),
+  });
+  onProgress?.(job);
+  if (job.status !== "done" && job.status !== "error") {
+    await new Promise<void>((resolve) => {
+      const close = createSSEStream<JobStatus>(
+        `/api/stream/jobs/${job.job_id}`,
+        (status) => {
+          onProgress?.(status);
+          if (status.status === "done" || status.status === "error") {
+            close();
+            resolve();
+          }
+        },
+        () => {
+          // Stream dropped — fall through and let the result call report the state.
+          close();
+          resolve();
+        }
+      );
+    });
+  }
+  return getJobResult<T>(job.job_id);
+}
+
 // ── Named helpers ─────────────────────────────────────────────────────────────
 
 // ── Active Config ─────────────────────────────────────────────────────────────
@@ -309,13 +363,15 @@ export const getLiveCandle = (params: { symbol: string; timeframe: string }) =>
   return apiFetch<CandleRow>(`/api/ohlcv/live?${q}`);
 };
 
+// Runs on the background job pool so heavy multi-strategy scans never block
+// the request threads serving price/position streams.
 export const getSignals = (params: {
   symbol: string;
   timeframe: string;
   start_ms: number;
   end_ms: number;
   strategies: string[];
-}) => apiFetch<SignalsResponse>("/api/signals", { method: "POST", body: JSON.stringify(params) });
+}) => runJob<SignalsResponse>("/api/jobs/signals", params);
 
 export const getSignalsHistory = (params: {
   symbol: string;
@@ -366,10 +422,7 @@ export const runBacktest = (params: {
   secondary_symbol?: string;
   [key: string]: unknown;
 }) =>
-  apiFetch<BacktestResponse>("/api/backtest", {
-    method: "POST",
-    body: JSON.stringify(params),
-  });
+  runJob<BacktestResponse>("/api/jobs/backtest", params);
 
 export const getFib = (params: {
   symbol: string;